@@ -11,6 +11,7 @@ from artificial_u.api.routers.departments import router as departments_router
 # Import routers
 from artificial_u.api.routers.health import router as health_router
 from artificial_u.api.routers.index import router as index_router
+from artificial_u.api.routers.jobs import router as jobs_router
 from artificial_u.api.routers.lectures import router as lectures_router
 from artificial_u.api.routers.professors import router as professors_router
 from artificial_u.api.routers.topics import router as topics_router
@@ -61,6 +62,7 @@ def create_application() -> FastAPI:
     app.include_router(courses_router, prefix="/api/v1")
     app.include_router(lectures_router, prefix="/api/v1")
     app.include_router(topics_router, prefix="/api/v1")
+    app.include_router(jobs_router, prefix="/api/v1")
     app.include_router(router_for_course_topics, prefix="/api/v1")
 
     # Include the new voice router
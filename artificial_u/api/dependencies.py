@@ -7,6 +7,7 @@ services are properly initialized and reused across requests.
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import Depends
@@ -15,12 +16,13 @@ from artificial_u.api.config import get_settings
 from artificial_u.api.services import (
     CourseApiService,
     DepartmentApiService,
+    JobApiService,
     LectureApiService,
     ProfessorApiService,
     TopicApiService,
 )
 from artificial_u.integrations import elevenlabs
-from artificial_u.models.repositories import RepositoryFactory
+from artificial_u.models.repositories import AsyncRepositoryFactory, RepositoryFactory
 from artificial_u.services import (
     ContentService,
     CourseService,
@@ -34,29 +36,66 @@ from artificial_u.services import (
 )
 
 
+@lru_cache
+def _get_shared_repository_factory(db_url: str) -> RepositoryFactory:
+    """Create one repository factory per database URL for the whole process."""
+    return RepositoryFactory(db_url=db_url)
+
+
 def get_repository_factory() -> RepositoryFactory:
     """
-    Get a repository factory instance.
+    Get the shared repository factory instance.
+
+    Repositories are stateless apart from their engine, so a single factory
+    is reused across requests instead of building new pools per request.
 
     Returns:
         RepositoryFactory instance
     """
     settings = get_settings()
-    return RepositoryFactory(db_url=settings.DATABASE_URL)
+    return _get_shared_repository_factory(settings.DATABASE_URL)
 
 
-def get_content_service() -> ContentService:
+@lru_cache
+def _get_shared_async_repository_factory(db_url: str) -> AsyncRepositoryFactory:
+    """Create one async repository factory per database URL for the whole process."""
+    return AsyncRepositoryFactory(db_url=db_url)
+
+
+def get_async_repository_factory() -> AsyncRepositoryFactory:
     """
-    Get a content service instance.
+    Get the shared async repository factory instance.
+
+    Used by endpoints that await database I/O instead of blocking the event loop.
 
     Returns:
-        ContentService instance
+        AsyncRepositoryFactory instance
     """
+    settings = get_settings()
+    return _get_shared_async_repository_factory(settings.DATABASE_URL)
+
+
+@lru_cache
+def _get_shared_content_service() -> ContentService:
+    """Create one content service for the whole process."""
     return ContentService(
         logger=logging.getLogger("artificial_u.services.content_service"),
     )
 
 
+def get_content_service() -> ContentService:
+    """
+    Get the shared content service instance.
+
+    The service holds the response cache, so it is reused across requests
+    instead of reopening the cache for every request.
+
+    Returns:
+        ContentService instance
+    """
+    return _get_shared_content_service()
+
+
 def get_storage_service() -> StorageService:
     """
     Get a storage service instance.
@@ -102,6 +141,34 @@ def get_elevenlabs_client() -> Optional[elevenlabs.ElevenLabsClient]:
     )
 
 
+@lru_cache
+def _get_shared_async_elevenlabs_client(api_key: str) -> elevenlabs.AsyncElevenLabsClient:
+    """Create one async ElevenLabs client per API key for the whole process."""
+    settings = get_settings()
+    return elevenlabs.AsyncElevenLabsClient(
+        api_key=api_key,
+        max_retries=settings.TTS_CHUNK_RETRIES,
+        retry_backoff=settings.TTS_RETRY_BACKOFF,
+        logger=logging.getLogger("artificial_u.integrations.elevenlabs.async_client"),
+    )
+
+
+def get_async_elevenlabs_client() -> Optional[elevenlabs.AsyncElevenLabsClient]:
+    """
+    Get the shared async ElevenLabs client if configured.
+
+    The client holds a keep-alive connection pool, so it is reused across
+    requests instead of reconnecting to ElevenLabs for every request.
+
+    Returns:
+        AsyncElevenLabsClient instance if configured, None otherwise
+    """
+    settings = get_settings()
+    if not settings.ELEVENLABS_API_KEY:
+        return None
+    return _get_shared_async_elevenlabs_client(settings.ELEVENLABS_API_KEY)
+
+
 def get_voice_mapper() -> elevenlabs.VoiceMapper:
     """
     Get a voice mapper instance
@@ -117,6 +184,9 @@ def get_voice_mapper() -> elevenlabs.VoiceMapper:
 def get_voice_service(
     repository_factory: RepositoryFactory = Depends(get_repository_factory),
     elevenlabs_client: Optional[elevenlabs.ElevenLabsClient] = Depends(get_elevenlabs_client),
+    async_elevenlabs_client: Optional[elevenlabs.AsyncElevenLabsClient] = Depends(
+        get_async_elevenlabs_client
+    ),
 ) -> VoiceService:
     """
     Get a voice service instance.
@@ -124,6 +194,7 @@ def get_voice_service(
     Args:
         repository_factory: Repository factory instance
         elevenlabs_client: ElevenLabs client (optional)
+        async_elevenlabs_client: Async ElevenLabs client (optional)
 
     Returns:
         VoiceService instance
@@ -131,6 +202,7 @@ def get_voice_service(
     return VoiceService(
         repository_factory=repository_factory,
         client=elevenlabs_client,
+        async_client=async_elevenlabs_client,
         logger=logging.getLogger("artificial_u.services.voice_service"),
     )
 
@@ -272,6 +344,7 @@ def get_professor_api_service(
     image_service: ImageService = Depends(get_image_service),
     voice_service: VoiceService = Depends(get_voice_service),
     storage_service: StorageService = Depends(get_storage_service),
+    async_repository_factory: AsyncRepositoryFactory = Depends(get_async_repository_factory),
     logger=logging.getLogger("artificial_u.api.services.lecture_service"),
 ) -> ProfessorApiService:
     """
@@ -283,6 +356,7 @@ def get_professor_api_service(
         image_service: Image service
         voice_service: Voice service
         storage_service: Storage service
+        async_repository_factory: Async repository factory
         logger: Logger for the service
 
     Returns:
@@ -293,6 +367,7 @@ def get_professor_api_service(
         content_service=content_service,
         image_service=image_service,
         voice_service=voice_service,
+        async_repository_factory=async_repository_factory,
         logger=logger,
     )
 
@@ -301,6 +376,7 @@ def get_course_api_service(
     repository_factory: RepositoryFactory = Depends(get_repository_factory),
     content_service: ContentService = Depends(get_content_service),
     professor_service: ProfessorService = Depends(get_professor_service),
+    async_repository_factory: AsyncRepositoryFactory = Depends(get_async_repository_factory),
 ) -> CourseApiService:
     """
     Get a course API service instance.
@@ -308,6 +384,7 @@ def get_course_api_service(
     Args:
         repository_factory: Repository factory
         professor_service: Professor service
+        async_repository_factory: Async repository factory
 
     Returns:
         CourseApiService instance
@@ -316,6 +393,7 @@ def get_course_api_service(
         repository_factory=repository_factory,
         content_service=content_service,
         professor_service=professor_service,
+        async_repository_factory=async_repository_factory,
         logger=logging.getLogger("artificial_u.api.services.course_service"),
     )
 
@@ -325,6 +403,7 @@ def get_department_api_service(
     professor_service: ProfessorService = Depends(get_professor_service),
     course_service: CourseService = Depends(get_course_service),
     content_service: ContentService = Depends(get_content_service),
+    async_repository_factory: AsyncRepositoryFactory = Depends(get_async_repository_factory),
 ) -> DepartmentApiService:
     """
     Get a department API service instance.
@@ -334,6 +413,7 @@ def get_department_api_service(
         professor_service: Professor service
         course_service: Course service
         content_service: Content service
+        async_repository_factory: Async repository factory
 
     Returns:
         DepartmentApiService instance
@@ -343,6 +423,7 @@ def get_department_api_service(
         professor_service=professor_service,
         course_service=course_service,
         content_service=content_service,
+        async_repository_factory=async_repository_factory,
         logger=logging.getLogger("artificial_u.api.services.department_service"),
     )
 
@@ -353,6 +434,7 @@ def get_lecture_api_service(
     course_service: CourseService = Depends(get_course_service),
     content_service: ContentService = Depends(get_content_service),
     storage_service: StorageService = Depends(get_storage_service),
+    async_repository_factory: AsyncRepositoryFactory = Depends(get_async_repository_factory),
 ) -> LectureApiService:
     """
     Get a lecture API service instance.
@@ -363,6 +445,7 @@ def get_lecture_api_service(
         content_service: Content service
         course_service: Course service
         storage_service: Storage service
+        async_repository_factory: Async repository factory
 
     Returns:
         LectureApiService instance
@@ -373,6 +456,7 @@ def get_lecture_api_service(
         course_service=course_service,
         content_service=content_service,
         storage_service=storage_service,
+        async_repository_factory=async_repository_factory,
         logger=logging.getLogger("artificial_u.api.services.lecture_service"),
     )
 
@@ -380,6 +464,7 @@ def get_lecture_api_service(
 def get_topic_api_service(
     core_topic_service: TopicService = Depends(get_topic_service),
     repository_factory: RepositoryFactory = Depends(get_repository_factory),
+    async_repository_factory: AsyncRepositoryFactory = Depends(get_async_repository_factory),
 ) -> TopicApiService:
     """
     Get a Topic API service instance.
@@ -387,6 +472,7 @@ def get_topic_api_service(
     Args:
         core_topic_service: Core TopicService instance
         repository_factory: Repository factory
+        async_repository_factory: Async repository factory
 
     Returns:
         TopicApiService instance
@@ -394,5 +480,27 @@ def get_topic_api_service(
     return TopicApiService(
         core_topic_service=core_topic_service,
         repository_factory=repository_factory,
+        async_repository_factory=async_repository_factory,
         logger=logging.getLogger("artificial_u.api.services.topic_service"),
     )
+
+
+def get_job_api_service(
+    repository_factory: RepositoryFactory = Depends(get_repository_factory),
+    async_repository_factory: AsyncRepositoryFactory = Depends(get_async_repository_factory),
+) -> JobApiService:
+    """
+    Get a job API service instance.
+
+    Args:
+        repository_factory: Repository factory
+        async_repository_factory: Async repository factory
+
+    Returns:
+        JobApiService instance
+    """
+    return JobApiService(
+        repository_factory=repository_factory,
+        async_repository_factory=async_repository_factory,
+        logger=logging.getLogger("artificial_u.api.services.job_service"),
+    )
@@ -44,9 +44,13 @@ from artificial_u.api.models.errors import (
     ErrorResponse,
 )
 
+# Job model
+from artificial_u.api.models.jobs import JobResponse
+
 # Lecture model
 from artificial_u.api.models.lectures import (
     Lecture,
+    LectureBatchGenerate,
     LectureCreate,
     LectureGenerate,
     LectureList,
@@ -103,11 +107,14 @@ __all__ = [
     "ProfessorLectureBrief",
     "ProfessorCoursesResponse",
     "ProfessorLecturesResponse",
+    # Job model
+    "JobResponse",
     # Lecture model
     "LectureCreate",
     "LectureUpdate",
     "Lecture",
     "LectureGenerate",
+    "LectureBatchGenerate",
     "LectureList",
     # Error codes
     "ErrorDetail",
@@ -0,0 +1,24 @@
+"""
+Job API models for request and response validation.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+
+class JobResponse(BaseModel):
+    """Background job status"""
+
+    id: int = Field(..., description="Unique job identifier")
+    kind: str = Field(..., description="Job kind, e.g. lecture.generate")
+    status: str = Field(..., description="One of queued, running, succeeded or failed")
+    attempts: int = Field(..., description="Attempts started so far")
+    max_attempts: int = Field(..., description="Attempts made before the job is marked failed")
+    result: Optional[Dict[str, Any]] = Field(None, description="Job result once succeeded")
+    error: Optional[str] = Field(None, description="Error of the latest failed attempt")
+    run_at: Optional[datetime] = Field(None, description="When the job is next due")
+    created_at: Optional[datetime] = Field(None, description="When the job was queued")
+    updated_at: Optional[datetime] = Field(None, description="When the job last changed")
+    finished_at: Optional[datetime] = Field(None, description="When the job succeeded or failed")
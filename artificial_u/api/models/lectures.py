@@ -48,6 +48,12 @@ class Lecture(BaseModel):
     content: str = Field(..., description="Full lecture content text")
     summary: Optional[str] = Field(None, description="Brief summary of the lecture content")
     audio_url: Optional[str] = Field(None, description="URL to audio file if available")
+    audio_playlist_url: Optional[str] = Field(
+        None, description="URL to the HLS playlist of the audio, for streamed playback"
+    )
+    audio_manifest_url: Optional[str] = Field(
+        None, description="URL to the manifest of the audio's chunks, for seeking by paragraph"
+    )
     transcript_url: Optional[str] = Field(None, description="URL to transcript file if available")
 
 
@@ -70,3 +76,18 @@ class LectureGenerate(BaseModel):
     freeform_prompt: Optional[str] = Field(
         None, description="Optional freeform text prompt for additional guidance."
     )
+
+
+# Model for generating every lecture of a course
+class LectureBatchGenerate(BaseModel):
+    """Model for requesting generation of a course's missing lectures."""
+
+    partial_attributes: Optional[Dict[str, Any]] = Field(
+        None, description="Optional attributes applied to every generated lecture."
+    )
+    freeform_prompt: Optional[str] = Field(
+        None, description="Optional freeform text prompt for additional guidance."
+    )
+    concurrency: Optional[int] = Field(
+        None, gt=0, description="Lectures generated at the same time (server default if omitted)."
+    )
@@ -1,9 +1,13 @@
 import time
+from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
 from artificial_u.api.config import Settings, get_settings
+from artificial_u.api.dependencies import get_content_service, get_repository_factory
+from artificial_u.models.repositories import RepositoryFactory
+from artificial_u.services import ContentService
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
@@ -16,9 +20,56 @@ class HealthResponse(BaseModel):
     timestamp: float
 
 
+class DatabasePoolResponse(BaseModel):
+    """Response model for database connection pool statistics"""
+
+    pools: Dict[str, Dict[str, Any]]
+    timestamp: float
+
+
+class ContentMetricsResponse(BaseModel):
+    """Response model for content generation metrics"""
+
+    usage: Dict[str, Any]
+    cache: Optional[Dict[str, Any]]
+    coalescing: Dict[str, Any]
+    rate_limits: Dict[str, Dict[str, Any]]
+    routing: Dict[str, Any]
+    continuation: Dict[str, Any]
+    logs: Dict[str, Any]
+    timestamp: float
+
+
 @router.get("", response_model=HealthResponse)
 async def health_check(settings: Settings = Depends(get_settings)):
     """
     Health check endpoint to verify API is running
     """
     return {"status": "ok", "api_version": "v1", "timestamp": time.time()}
+
+
+@router.get("/database", response_model=DatabasePoolResponse)
+async def database_pool_stats(
+    repository_factory: RepositoryFactory = Depends(get_repository_factory),
+):
+    """
+    Connection pool statistics for the shared database engine
+    """
+    return {"pools": repository_factory.pool_stats(), "timestamp": time.time()}
+
+
+@router.get("/content", response_model=ContentMetricsResponse)
+async def content_metrics(content_service: ContentService = Depends(get_content_service)):
+    """
+    Token, latency and cost metrics for content generation since the process started
+    """
+    return {
+        "usage": content_service.usage_stats(),
+        "cache": content_service.cache_stats(),
+        "coalescing": content_service.single_flight_stats(),
+        "rate_limits": content_service.rate_limit_stats(),
+        "routing": content_service.routing_stats(),
+        "continuation": content_service.continuation_stats(),
+        "logs": content_service.log_stats(),
+        "timestamp": time.time(),
+    }
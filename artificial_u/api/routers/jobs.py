@@ -0,0 +1,103 @@
+"""
+Job router for queuing background generation and polling its status.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Path, status
+
+from artificial_u.api.dependencies import get_job_api_service
+from artificial_u.api.models import JobResponse, LectureGenerate
+from artificial_u.api.services import JobApiService
+
+router = APIRouter(
+    prefix="/jobs",
+    tags=["jobs"],
+    responses={404: {"description": "Not found"}},
+)
+
+IDEMPOTENCY_KEY_DESCRIPTION = (
+    "Optional key identifying the request; repeating it returns the job already queued"
+)
+
+
+@router.post(
+    "/lectures/generate",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue lecture generation",
+    description="Queues the generation of lecture data for a worker to run.",
+)
+async def enqueue_lecture_generation(
+    generation_data: LectureGenerate,
+    idempotency_key: Optional[str] = Header(
+        None, alias="Idempotency-Key", description=IDEMPOTENCY_KEY_DESCRIPTION
+    ),
+    job_service: JobApiService = Depends(get_job_api_service),
+):
+    """
+    Queue lecture generation.
+
+    The generated lecture data (not saved to the database) is the job's result.
+    """
+    return await job_service.enqueue_lecture_generation(generation_data, idempotency_key)
+
+
+@router.post(
+    "/lectures/{lecture_id}/audio",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue lecture audio",
+    description="Queues the text-to-speech synthesis of a saved lecture.",
+)
+async def enqueue_lecture_audio(
+    lecture_id: int = Path(..., description="The ID of the lecture"),
+    idempotency_key: Optional[str] = Header(
+        None, alias="Idempotency-Key", description=IDEMPOTENCY_KEY_DESCRIPTION
+    ),
+    job_service: JobApiService = Depends(get_job_api_service),
+):
+    """
+    Queue lecture audio synthesis.
+
+    The job's result holds the lecture's new audio URL.
+    """
+    return await job_service.enqueue_lecture_audio(lecture_id, idempotency_key)
+
+
+@router.post(
+    "/professors/{professor_id}/image",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue professor image generation",
+    description="Queues the generation of a professor's profile image.",
+)
+async def enqueue_professor_image(
+    professor_id: int = Path(..., description="The ID of the professor"),
+    idempotency_key: Optional[str] = Header(
+        None, alias="Idempotency-Key", description=IDEMPOTENCY_KEY_DESCRIPTION
+    ),
+    job_service: JobApiService = Depends(get_job_api_service),
+):
+    """
+    Queue professor image generation.
+
+    The job's result holds the professor's new image URL.
+    """
+    return await job_service.enqueue_professor_image(professor_id, idempotency_key)
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobResponse,
+    summary="Get job status",
+    description="Retrieves the status and, once finished, the result or error of a job.",
+)
+async def get_job(
+    job_id: int = Path(..., description="The ID of the job"),
+    job_service: JobApiService = Depends(get_job_api_service),
+):
+    """
+    Get a job's status.
+    """
+    return await job_service.get_job(job_id)
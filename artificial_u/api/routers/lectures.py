@@ -4,18 +4,20 @@ Lecture router for handling lecture-related API endpoints.
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Path, Query, status
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 
 from artificial_u.api.dependencies import get_lecture_api_service
 from artificial_u.api.models import (
     Lecture,
+    LectureBatchGenerate,
     LectureCreate,
     LectureGenerate,
     LectureList,
     LectureUpdate,
 )
 from artificial_u.api.services import LectureApiService
+from artificial_u.services import LectureService as CoreLectureService
 
 # Create the router with dependencies that will be applied to all routes
 router = APIRouter(
@@ -49,7 +51,7 @@ async def list_lectures(
     - **professor_id**: Filter by professor ID
     - **search**: Search in title and description
     """
-    return lecture_service.list_lectures(
+    return await lecture_service.list_lectures(
         page=page,
         size=size,
         course_id=course_id,
@@ -74,7 +76,7 @@ async def get_lecture(
 
     - **lecture_id**: The unique identifier of the lecture
     """
-    lecture = lecture_service.get_lecture(lecture_id)
+    lecture = await lecture_service.get_lecture(lecture_id)
     if not lecture:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -97,7 +99,7 @@ async def get_lecture_content(
     """
     Get the full text content of a specific lecture.
     """
-    content = lecture_service.get_lecture_content(lecture_id)
+    content = await lecture_service.get_lecture_content(lecture_id)
     if content is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -125,7 +127,7 @@ async def get_lecture_audio(
     - **lecture_id**: The unique identifier of the lecture
     - Returns a redirect to the storage URL where the audio file is stored
     """
-    audio_url = lecture_service.get_lecture_audio_url(lecture_id)
+    audio_url = await lecture_service.get_lecture_audio_url(lecture_id)
     if not audio_url:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -156,6 +158,7 @@ async def get_lecture_audio(
 )
 async def create_lecture(
     lecture_data: LectureCreate,
+    background_tasks: BackgroundTasks,
     lecture_service: LectureApiService = Depends(get_lecture_api_service),
 ):
     """
@@ -163,8 +166,10 @@ async def create_lecture(
 
     - Request body contains all required lecture information
     - Returns the created lecture with its assigned ID
+    - The course's rolling lecture summary is updated after the response is sent
     """
-    lecture = lecture_service.create_lecture(lecture_data)
+    lecture = await lecture_service.create_lecture(lecture_data)
+    background_tasks.add_task(lecture_service.update_course_summary, lecture.id)
     return lecture
 
 
@@ -177,6 +182,7 @@ async def create_lecture(
 )
 async def update_lecture(
     lecture_data: LectureUpdate,
+    background_tasks: BackgroundTasks,
     lecture_id: int = Path(..., description="The ID of the lecture to update"),
     lecture_service: LectureApiService = Depends(get_lecture_api_service),
 ):
@@ -186,13 +192,29 @@ async def update_lecture(
     - **lecture_id**: The unique identifier of the lecture to update
     - Request body contains the updated lecture information (all fields optional)
     - Returns the updated lecture
+    - If the lecture's text, topic or course changed, the rolling lecture summaries of
+      its old and new course are rebuilt after the response is sent
     """
-    updated_lecture = lecture_service.update_lecture(lecture_id, lecture_data)
+    course_ids = set()
+    if lecture_data.model_fields_set & CoreLectureService.COURSE_SUMMARY_FIELDS:
+        # Moving a lecture to another course leaves the old course's summary out of date too
+        lecture = await lecture_service.get_lecture(lecture_id)
+        if not lecture:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Lecture with ID {lecture_id} not found",
+            )
+        course_ids.add(lecture.course_id)
+    updated_lecture = await lecture_service.update_lecture(lecture_id, lecture_data)
     if not updated_lecture:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Lecture with ID {lecture_id} not found",
         )
+    if course_ids:
+        course_ids.add(updated_lecture.course_id)
+    for course_id in sorted(course_ids):
+        background_tasks.add_task(lecture_service.rebuild_course_summary, course_id)
     return updated_lecture
 
 
@@ -207,6 +229,7 @@ async def update_lecture(
     },
 )
 async def delete_lecture(
+    background_tasks: BackgroundTasks,
     lecture_id: int = Path(..., description="The ID of the lecture to delete"),
     lecture_service: LectureApiService = Depends(get_lecture_api_service),
 ):
@@ -215,13 +238,16 @@ async def delete_lecture(
 
     - **lecture_id**: The unique identifier of the lecture to delete
     - Returns no content on successful deletion
+    - The course's rolling lecture summary is rebuilt after the response is sent
     """
-    success = lecture_service.delete_lecture(lecture_id)
+    lecture = await lecture_service.get_lecture(lecture_id)
+    success = await lecture_service.delete_lecture(lecture_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Lecture with ID {lecture_id} not found (delete operation failed).",
         )
+    background_tasks.add_task(lecture_service.rebuild_course_summary, lecture.course_id)
     return JSONResponse(status_code=status.HTTP_204_NO_CONTENT, content=None)
 
 
@@ -245,7 +271,7 @@ async def download_lecture_content(
     - **lecture_id**: The unique identifier of the lecture
     - Returns the lecture content as plain text
     """
-    content = lecture_service.get_lecture_content(lecture_id)
+    content = await lecture_service.get_lecture_content(lecture_id)
     if content is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -282,3 +308,67 @@ async def generate_lecture(
         The generated lecture data (not saved to the database).
     """
     return await lecture_service.generate_lecture(generation_data)
+
+
+@router.post(
+    "/generate/stream",
+    response_class=StreamingResponse,
+    summary="Stream lecture generation",
+    description="Generates lecture data using AI, streaming progress and content as SSE.",
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def generate_lecture_stream(
+    generation_data: LectureGenerate,
+    lecture_service: LectureApiService = Depends(get_lecture_api_service),
+):
+    """
+    Generate lecture data using AI, streamed as Server-Sent Events.
+
+    Events:
+    - **progress**: `{"stage": ...}` when loading context, generating and parsing
+    - **content**: `{"text": ...}` lecture text as it is produced
+    - **lecture**: the generated lecture (not saved to the database)
+    - **error**: `{"detail": ...}` if generation fails
+    """
+    return StreamingResponse(
+        lecture_service.generate_lecture_stream(generation_data),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/generate/course/{course_id}",
+    response_class=StreamingResponse,
+    summary="Generate all lectures of a course",
+    description=(
+        "Generates and saves every missing lecture of a course, week by week with the "
+        "lectures of each week in parallel, streaming progress as SSE."
+    ),
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def generate_course_lectures(
+    generation_data: LectureBatchGenerate,
+    course_id: int = Path(..., description="The ID of the course"),
+    lecture_service: LectureApiService = Depends(get_lecture_api_service),
+):
+    """
+    Generate and save a course's missing lectures, streamed as Server-Sent Events.
+
+    Topics that already have a lecture are skipped, so a batch can be re-run to
+    finish an interrupted one.
+
+    Events:
+    - **progress**: `{"stage": "scheduled", "total", "skipped", "weeks"}`, then
+      `{"stage": "week", "week", "lectures"}` as each week starts
+    - **lecture**: `{"lecture_id", "topic_id", "week", "order", "title", "completed", "total"}`
+      as each lecture is saved
+    - **error**: `{"topic_id", ..., "detail"}` for a failed lecture, or `{"detail"}` if
+      the batch cannot run
+    - **complete**: `{"generated", "failed", "skipped"}`
+    """
+    return StreamingResponse(
+        lecture_service.generate_course_lectures(course_id, generation_data),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
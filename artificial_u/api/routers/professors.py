@@ -40,7 +40,7 @@ async def get_featured_professors(
     Get up to 3 featured professors.
     The selection is random for this version.
     """
-    return service.get_featured_professors()
+    return await service.get_featured_professors()
 
 
 @router.get(
@@ -68,7 +68,7 @@ async def list_professors(
     - **name**: Filter by professor name (partial match)
     - **specialization**: Filter by specialization (partial match)
     """
-    return service.get_professors(
+    return await service.get_professors(
         page=page,
         size=size,
         department_id=department_id,
@@ -93,7 +93,7 @@ async def get_professor(
 
     - **professor_id**: The unique identifier of the professor
     """
-    professor = service.get_professor(professor_id)
+    professor = await service.get_professor(professor_id)
     if not professor:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -119,7 +119,7 @@ async def create_professor(
     - Request body contains all required professor information
     - Returns the created professor with its assigned ID
     """
-    return service.create_professor(professor_data)
+    return await service.create_professor(professor_data)
 
 
 @router.put(
@@ -141,7 +141,7 @@ async def update_professor(
     - Request body contains the updated professor information
     - Returns the updated professor
     """
-    updated_professor = service.update_professor(professor_id, professor_data)
+    updated_professor = await service.update_professor(professor_id, professor_data)
     if not updated_professor:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -170,7 +170,7 @@ async def delete_professor(
     - **professor_id**: The unique identifier of the professor to delete
     - Returns no content on successful deletion
     """
-    success = service.delete_professor(professor_id)
+    success = await service.delete_professor(professor_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -196,7 +196,7 @@ async def get_professor_courses(
     - **professor_id**: The unique identifier of the professor
     - Returns a list of courses taught by the professor
     """
-    response = service.get_professor_courses(professor_id)
+    response = await service.get_professor_courses(professor_id)
     if not response:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -222,7 +222,7 @@ async def get_professor_lectures(
     - **professor_id**: The unique identifier of the professor
     - Returns a list of lectures by the professor across all their courses
     """
-    response = service.get_professor_lectures(professor_id)
+    response = await service.get_professor_lectures(professor_id)
     if not response:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -260,7 +260,7 @@ async def generate_professor_image(
         # Re-fetch professor to check if it exists, if needed for 404 vs 500
 
         # Check if professor exists first to return 404 (NO await for sync get_professor)
-        existing_professor = service.get_professor(professor_id)
+        existing_professor = await service.get_professor(professor_id)
         if not existing_professor:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -31,12 +31,12 @@ router = APIRouter(
     summary="Create topic",
     description="Create a new topic.",
 )
-def create_topic(
+async def create_topic(
     topic_data: TopicCreate,
     topic_service: TopicApiService = Depends(get_topic_api_service),
 ):
     """Create a new topic for a course."""
-    return topic_service.create_topic(topic_data)
+    return await topic_service.create_topic(topic_data)
 
 
 @router.get(
@@ -45,12 +45,12 @@ def create_topic(
     summary="Get topic by ID",
     description="Get detailed information about a specific topic.",
 )
-def get_topic(
+async def get_topic(
     topic_id: int = Path(..., description="The ID of the topic to retrieve"),
     topic_service: TopicApiService = Depends(get_topic_api_service),
 ):
     """Get a specific topic by its ID."""
-    return topic_service.get_topic(topic_id)
+    return await topic_service.get_topic(topic_id)
 
 
 @router.get(
@@ -59,14 +59,14 @@ def get_topic(
     summary="List topics by course",
     description="Get a paginated list of topics, primarily filtered by course ID.",
 )
-def list_topics_by_course(
+async def list_topics_by_course(
     course_id: int = Query(..., description="Filter topics by this course ID"),
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Items per page"),
     topic_service: TopicApiService = Depends(get_topic_api_service),
 ):
     """Retrieve topics for a given course with pagination."""
-    return topic_service.list_topics_by_course(course_id=course_id, page=page, size=size)
+    return await topic_service.list_topics_by_course(course_id=course_id, page=page, size=size)
 
 
 @router.patch(
@@ -75,13 +75,13 @@ def list_topics_by_course(
     summary="Update topic",
     description="Update an existing topic.",
 )
-def update_topic(
+async def update_topic(
     topic_data: TopicUpdate,
     topic_id: int = Path(..., description="The ID of the topic to update"),
     topic_service: TopicApiService = Depends(get_topic_api_service),
 ):
     """Update an existing topic's information."""
-    return topic_service.update_topic(topic_id, topic_data)
+    return await topic_service.update_topic(topic_id, topic_data)
 
 
 @router.delete(
@@ -90,12 +90,12 @@ def update_topic(
     summary="Delete topic",
     description="Delete a topic by its ID.",
 )
-def delete_topic(
+async def delete_topic(
     topic_id: int = Path(..., description="The ID of the topic to delete"),
     topic_service: TopicApiService = Depends(get_topic_api_service),
 ):
     """Delete a specific topic."""
-    topic_service.delete_topic(topic_id)
+    await topic_service.delete_topic(topic_id)
     return JSONResponse(status_code=status.HTTP_204_NO_CONTENT, content=None)
 
 
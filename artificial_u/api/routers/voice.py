@@ -2,6 +2,7 @@
 API router for voice-related operations.
 """
 
+import asyncio
 from typing import Optional
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query
@@ -31,7 +32,7 @@ async def manual_assign_voice(
     Manually assign a voice to a professor.
     """
     try:
-        voice_service.manual_voice_assignment(professor_id, assignment_request.el_voice_id)
+        await voice_service.manual_voice_assignment(professor_id, assignment_request.el_voice_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     return
@@ -52,7 +53,7 @@ async def list_voices(
     """
     List available voices with optional filtering and pagination.
     """
-    voices_data = voice_service.list_available_voices(
+    voices_data = await voice_service.list_available_voices(
         gender=gender,
         accent=accent,
         age=age,
@@ -63,7 +64,8 @@ async def list_voices(
         offset=offset,
     )
 
-    total_count = voice_service.count_available_voices(
+    total_count = await asyncio.to_thread(
+        voice_service.count_available_voices,
         gender=gender,
         accent=accent,
         age=age,
@@ -88,7 +90,7 @@ async def get_voice(
     """
     Get a specific voice by its database ID.
     """
-    voice = voice_service.get_voice_by_id(voice_id)
+    voice = await asyncio.to_thread(voice_service.get_voice_by_id, voice_id)
     if not voice:
         raise HTTPException(status_code=404, detail="Voice not found")
     return VoiceResponse(**voice)
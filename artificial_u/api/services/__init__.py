@@ -4,6 +4,7 @@ API services for business logic.
 
 from artificial_u.api.services.course_service import CourseApiService
 from artificial_u.api.services.department_service import DepartmentApiService
+from artificial_u.api.services.job_service import JobApiService
 from artificial_u.api.services.lecture_service import LectureApiService
 from artificial_u.api.services.professor_service import ProfessorApiService
 from artificial_u.api.services.topic_service import TopicApiService
@@ -12,6 +13,7 @@ __all__ = [
     "ProfessorApiService",
     "CourseApiService",
     "DepartmentApiService",
+    "JobApiService",
     "LectureApiService",
     "TopicApiService",
 ]
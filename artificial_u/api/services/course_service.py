@@ -2,6 +2,7 @@
 Course service for handling business logic related to courses.
 """
 
+import asyncio
 import logging
 from math import ceil
 from typing import List, Optional
@@ -20,10 +21,11 @@ from artificial_u.api.models.courses import (
     LectureBrief,
     ProfessorBrief,
 )
+from artificial_u.models.core import Course
 from artificial_u.models.database import LectureModel
 
 # Import RepositoryFactory directly instead of legacy Repository wrapper
-from artificial_u.models.repositories import RepositoryFactory
+from artificial_u.models.repositories import AsyncRepositoryFactory, RepositoryFactory
 from artificial_u.services import (
     ContentService,
     CourseService,
@@ -46,6 +48,7 @@ class CourseApiService:
         content_service: ContentService,
         professor_service: ProfessorService,
         repository_factory: RepositoryFactory,
+        async_repository_factory: Optional[AsyncRepositoryFactory] = None,
         logger=None,
     ):
         """
@@ -55,9 +58,13 @@ class CourseApiService:
             repository_factory: RepositoryFactory instance.
             content_service: Content generation service instance.
             professor_service: Core ProfessorService instance.
+            async_repository_factory: Async repository factory used by read endpoints.
             logger: Optional logger instance.
         """
         self.repository_factory = repository_factory
+        self.async_repository_factory = async_repository_factory or AsyncRepositoryFactory(
+            db_url=repository_factory.db_url
+        )
         self.logger = logger or logging.getLogger(__name__)
 
         # Initialize core service with dependencies
@@ -70,7 +77,19 @@ class CourseApiService:
         # Keep reference to core professor service if needed for direct lookups
         self.professor_service = professor_service
 
-    def get_courses(
+    async def _get_course(self, course_id: int) -> Course:
+        """
+        Get a course by ID from the async repository.
+
+        Raises:
+            CourseNotFoundError: If the course does not exist.
+        """
+        course = await self.async_repository_factory.course.get(course_id)
+        if not course:
+            raise CourseNotFoundError(f"Course with ID {course_id} not found")
+        return course
+
+    async def get_courses(
         self,
         page: int = 1,
         size: int = 10,
@@ -81,34 +100,24 @@ class CourseApiService:
     ) -> CoursesListResponse:
         """
         Get a paginated list of courses with optional filtering.
-        Filters by department in the core service, others applied here.
+        Filters by department in the repository, others applied here.
         """
         try:
-            # Get courses from core service (only filters by department_id)
-            # Core service returns List[Dict[str, Any]] with 'course' and 'professor' keys
-            # The 'course' value is a dict representation from course_model_to_dict
-            core_courses_list = self.core_service.list_courses(department_id=department_id)
-
-            filtered_courses = core_courses_list
+            try:
+                filtered_courses = await self.async_repository_factory.course.list(
+                    department_id=department_id
+                )
+            except Exception as e:
+                raise DatabaseError(f"Failed to list courses: {str(e)}") from e
 
             # Apply additional filters manually
             if professor_id:
-                filtered_courses = [
-                    item
-                    for item in filtered_courses
-                    if item.get("course", {}).get("professor_id") == professor_id
-                ]
+                filtered_courses = [c for c in filtered_courses if c.professor_id == professor_id]
             if level:
-                filtered_courses = [
-                    item
-                    for item in filtered_courses
-                    if item.get("course", {}).get("level") == level
-                ]
+                filtered_courses = [c for c in filtered_courses if c.level == level]
             if title:
                 filtered_courses = [
-                    item
-                    for item in filtered_courses
-                    if title.lower() in item.get("course", {}).get("title", "").lower()
+                    c for c in filtered_courses if title.lower() in (c.title or "").lower()
                 ]
 
             # Count total after filtering
@@ -122,12 +131,8 @@ class CourseApiService:
             # Calculate total pages
             total_pages = ceil(total / size) if total > 0 else 1
 
-            # Convert the 'course' dictionary part to response models
-            course_responses = [
-                CourseResponse.model_validate(item["course"])
-                for item in paginated_items
-                if "course" in item
-            ]
+            # Convert the courses to response models
+            course_responses = [CourseResponse.model_validate(c) for c in paginated_items]
 
             return CoursesListResponse(
                 items=course_responses,
@@ -149,12 +154,12 @@ class CourseApiService:
                 detail="An unexpected error occurred while retrieving courses.",
             )
 
-    def get_course(self, course_id: int) -> CourseResponse:
+    async def get_course(self, course_id: int) -> CourseResponse:
         """
-        Get a course by ID using the core service.
+        Get a course by ID using the async repository.
         """
         try:
-            course_model = self.core_service.get_course(course_id)
+            course_model = await self._get_course(course_id)
             return CourseResponse.model_validate(course_model)  # Core returns CourseModel
         except CourseNotFoundError:
             raise HTTPException(
@@ -174,12 +179,14 @@ class CourseApiService:
                 detail=f"An unexpected error occurred retrieving course {course_id}.",
             )
 
-    def get_course_by_code(self, code: str) -> CourseResponse:
+    async def get_course_by_code(self, code: str) -> CourseResponse:
         """
-        Get a course by its course code using the core service.
+        Get a course by its course code using the async repository.
         """
         try:
-            course_model = self.core_service.get_course_by_code(code)
+            course_model = await self.async_repository_factory.course.get_by_code(code)
+            if not course_model:
+                raise CourseNotFoundError(f"Course with code {code} not found")
             return CourseResponse.model_validate(course_model)  # Core returns CourseModel
         except CourseNotFoundError:
             raise HTTPException(
@@ -199,7 +206,7 @@ class CourseApiService:
                 detail=f"An unexpected error occurred retrieving course code '{code}'.",
             )
 
-    def create_course(self, course_data: CourseCreate) -> CourseResponse:
+    async def create_course(self, course_data: CourseCreate) -> CourseResponse:
         """
         Create a new course using the core service.
         """
@@ -207,7 +214,8 @@ class CourseApiService:
             # Core service expects individual arguments
             # Department ID might need conversion if core expects int vs str
             # Professor ID might need conversion if core expects int vs str
-            created_course_model, _ = self.core_service.create_course(
+            created_course_model, _ = await asyncio.to_thread(
+                self.core_service.create_course,
                 title=course_data.title,
                 code=course_data.code,
                 department_id=str(course_data.department_id),  # Assuming core needs str
@@ -240,7 +248,7 @@ class CourseApiService:
                 detail=f"An unexpected error occurred creating the course: {e}",
             )
 
-    def update_course(self, course_id: int, course_data: CourseUpdate) -> CourseResponse:
+    async def update_course(self, course_id: int, course_data: CourseUpdate) -> CourseResponse:
         """
         Update an existing course using the core service.
         """
@@ -254,7 +262,9 @@ class CourseApiService:
             if "professor_id" in update_data:
                 update_data["professor_id"] = str(update_data["professor_id"])
 
-            updated_course_model = self.core_service.update_course(course_id, update_data)
+            updated_course_model = await asyncio.to_thread(
+                self.core_service.update_course, course_id, update_data
+            )
 
             # Convert the returned CourseModel to the API response model
             return CourseResponse.model_validate(updated_course_model)
@@ -283,13 +293,13 @@ class CourseApiService:
                 detail=f"An unexpected error occurred updating course {course_id}.",
             )
 
-    def delete_course(self, course_id: int) -> bool:
+    async def delete_course(self, course_id: int) -> bool:
         """
         Delete a course using the core service.
         """
         try:
             # Core service returns True on success
-            deleted = self.core_service.delete_course(course_id)
+            deleted = await asyncio.to_thread(self.core_service.delete_course, course_id)
             if not deleted:  # Should not happen if core raises CourseNotFound, but check anyway
                 raise CourseNotFoundError(
                     f"Course {course_id} not found for deletion (core returned False)."
@@ -322,17 +332,14 @@ class CourseApiService:
                 detail=f"An unexpected error occurred deleting course {course_id}.",
             )
 
-    def get_course_professor(self, course_id: int) -> ProfessorBrief:
+    async def get_course_professor(self, course_id: int) -> ProfessorBrief:
         """
         Get the professor who teaches a course.
-        Fetches course via core service, then professor via repository factory.
+        Fetches course, then professor via the async repository factory.
         """
         try:
-            # Get the course using the core service
-            course = self.core_service.get_course(course_id)
-
-            # Get the professor using the repository factory directly
-            professor = self.repository_factory.professor.get(course.professor_id)
+            course = await self._get_course(course_id)
+            professor = await self.async_repository_factory.professor.get(course.professor_id)
             if not professor:
                 # This case implies data inconsistency if course exists but professor doesn't
                 self.logger.error(
@@ -375,14 +382,13 @@ class CourseApiService:
                 detail=f"An unexpected error occurred retrieving professor for course {course_id}.",
             )
 
-    def get_course_department(self, course_id: int) -> DepartmentBrief:
+    async def get_course_department(self, course_id: int) -> DepartmentBrief:
         """
         Get the department of a course.
-        Fetches course via core service, then department via repository factory.
+        Fetches course, then department via the async repository factory.
         """
         try:
-            # Get the course using the core service
-            course = self.core_service.get_course(course_id)
+            course = await self._get_course(course_id)
 
             if not course.department_id:
                 self.logger.warning(f"Course {course_id} has no associated department ID.")
@@ -391,8 +397,7 @@ class CourseApiService:
                     detail=f"Department information not available for course {course_id}.",
                 )
 
-            # Get the department using the repository factory directly
-            department = self.repository_factory.department.get(course.department_id)
+            department = await self.async_repository_factory.department.get(course.department_id)
             if not department:
                 # This case implies data inconsistency
                 self.logger.error(
@@ -437,16 +442,17 @@ class CourseApiService:
                 ),
             )
 
-    def get_course_lectures(self, course_id: int) -> CourseLecturesResponse:
+    async def get_course_lectures(self, course_id: int) -> CourseLecturesResponse:
         """
-        Get lectures for a course using the repository factory.
+        Get lectures for a course using the async repository factory.
         """
         try:
-            # First check if course exists using the core service
-            self.core_service.get_course(course_id)
+            # First check if course exists
+            await self._get_course(course_id)
 
-            # Get lectures for the course using the repository factory
-            lectures: List[LectureModel] = self.repository_factory.lecture.list(course_id=course_id)
+            lectures: List[LectureModel] = await self.async_repository_factory.lecture.list(
+                course_id=course_id
+            )
 
             # Convert LectureModel instances to LectureBrief API models
             lecture_briefs = [
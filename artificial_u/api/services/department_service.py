@@ -2,6 +2,7 @@
 Department service for handling business logic related to departments.
 """
 
+import asyncio
 import logging
 from math import ceil
 from typing import Optional
@@ -19,7 +20,7 @@ from artificial_u.api.models.departments import (
     DepartmentUpdate,
     ProfessorBrief,
 )
-from artificial_u.models.repositories import RepositoryFactory
+from artificial_u.models.repositories import AsyncRepositoryFactory, RepositoryFactory
 from artificial_u.services import ContentService, CourseService, DepartmentService, ProfessorService
 from artificial_u.utils import (
     ContentGenerationError,
@@ -36,6 +37,7 @@ class DepartmentApiService:
         professor_service: ProfessorService,
         repository_factory: RepositoryFactory,
         content_service: ContentService,
+        async_repository_factory: Optional[AsyncRepositoryFactory] = None,
         logger=None,
     ):
         """
@@ -46,9 +48,13 @@ class DepartmentApiService:
             professor_service: Professor service for professor-related operations
             course_service: Course service for course-related operations
             content_service: Content generation service
+            async_repository_factory: Async repository factory used by read endpoints
             logger: Optional logger instance
         """
         self.repository_factory = repository_factory
+        self.async_repository_factory = async_repository_factory or AsyncRepositoryFactory(
+            db_url=repository_factory.db_url
+        )
         self.logger = logger or logging.getLogger(__name__)
 
         # Initialize core service with dependencies
@@ -60,7 +66,7 @@ class DepartmentApiService:
             logger=self.logger,
         )
 
-    def get_departments(
+    async def get_departments(
         self,
         page: int = 1,
         size: int = 10,
@@ -79,8 +85,12 @@ class DepartmentApiService:
         Returns:
             DepartmentsListResponse with paginated departments
         """
-        # Get all departments from core service
-        departments = self.core_service.list_departments(faculty)
+        try:
+            departments = await self.async_repository_factory.department.list(faculty)
+        except Exception as e:
+            error_msg = f"Failed to list departments: {str(e)}"
+            self.logger.error(error_msg)
+            raise DatabaseError(error_msg) from e
 
         # Apply name filter if provided
         if name:
@@ -110,7 +120,7 @@ class DepartmentApiService:
             pages=total_pages,
         )
 
-    def get_department(self, department_id: int) -> Optional[DepartmentResponse]:
+    async def get_department(self, department_id: int) -> Optional[DepartmentResponse]:
         """
         Get a department by ID.
 
@@ -121,12 +131,14 @@ class DepartmentApiService:
             DepartmentResponse or None if not found
         """
         try:
-            department = self.core_service.get_department(department_id)
-            return DepartmentResponse.model_validate(department.model_dump())
+            department = await self.async_repository_factory.department.get(department_id)
         except Exception:
             return None
+        if not department:
+            return None
+        return DepartmentResponse.model_validate(department.model_dump())
 
-    def get_department_by_code(self, code: str) -> Optional[DepartmentResponse]:
+    async def get_department_by_code(self, code: str) -> Optional[DepartmentResponse]:
         """
         Get a department by its code.
 
@@ -137,12 +149,14 @@ class DepartmentApiService:
             DepartmentResponse or None if not found
         """
         try:
-            department = self.core_service.get_department_by_code(code)
-            return DepartmentResponse.model_validate(department.model_dump())
+            department = await self.async_repository_factory.department.get_by_code(code)
         except Exception:
             return None
+        if not department:
+            return None
+        return DepartmentResponse.model_validate(department.model_dump())
 
-    def create_department(self, department_data: DepartmentCreate) -> DepartmentResponse:
+    async def create_department(self, department_data: DepartmentCreate) -> DepartmentResponse:
         """
         Create a new department.
 
@@ -153,7 +167,8 @@ class DepartmentApiService:
             Created department with ID
         """
         # Create department using core service
-        department = self.core_service.create_department(
+        department = await asyncio.to_thread(
+            self.core_service.create_department,
             name=department_data.name,
             code=department_data.code,
             faculty=department_data.faculty,
@@ -163,7 +178,7 @@ class DepartmentApiService:
         # Convert to response model
         return DepartmentResponse.model_validate(department.model_dump())
 
-    def update_department(
+    async def update_department(
         self, department_id: int, department_data: DepartmentUpdate
     ) -> Optional[DepartmentResponse]:
         """
@@ -178,7 +193,8 @@ class DepartmentApiService:
         """
         try:
             # Update department using core service
-            department = self.core_service.update_department(
+            department = await asyncio.to_thread(
+                self.core_service.update_department,
                 department_id=department_id,
                 update_data=department_data.model_dump(exclude_unset=True),
             )
@@ -186,7 +202,7 @@ class DepartmentApiService:
         except Exception:
             return None
 
-    def delete_department(self, department_id: int) -> bool:
+    async def delete_department(self, department_id: int) -> bool:
         """
         Delete a department, checking for dependencies first.
 
@@ -200,7 +216,7 @@ class DepartmentApiService:
             HTTPException 409 Conflict if dependencies exist.
         """
         try:
-            return self.core_service.delete_department(department_id)
+            return await asyncio.to_thread(self.core_service.delete_department, department_id)
         except Exception as e:
             if "dependencies" in str(e).lower():
                 raise HTTPException(
@@ -209,7 +225,7 @@ class DepartmentApiService:
                 )
             return False
 
-    def get_department_professors(
+    async def get_department_professors(
         self, department_id: int
     ) -> Optional[DepartmentProfessorsResponse]:
         """
@@ -222,8 +238,11 @@ class DepartmentApiService:
             DepartmentProfessorsResponse or None if department not found
         """
         try:
-            # Get professors using core service
-            professors = self.core_service.get_department_professors(department_id)
+            if not await self.async_repository_factory.department.get(department_id):
+                return None
+            professors = await self.async_repository_factory.professor.list_by_department(
+                department_id
+            )
 
             # Convert to brief format
             professor_briefs = [
@@ -244,7 +263,9 @@ class DepartmentApiService:
         except Exception:
             return None
 
-    def get_department_courses(self, department_id: int) -> Optional[DepartmentCoursesResponse]:
+    async def get_department_courses(
+        self, department_id: int
+    ) -> Optional[DepartmentCoursesResponse]:
         """
         Get courses in a department.
 
@@ -255,8 +276,9 @@ class DepartmentApiService:
             DepartmentCoursesResponse or None if department not found
         """
         try:
-            # Get courses using core service
-            courses = self.core_service.get_department_courses(department_id)
+            if not await self.async_repository_factory.department.get(department_id):
+                return None
+            courses = await self.async_repository_factory.course.list(department_id=department_id)
 
             # Convert to brief format
             course_briefs = [
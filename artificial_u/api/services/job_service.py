@@ -0,0 +1,146 @@
+"""
+Job API service for queuing background generation and reporting its status.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from fastapi import HTTPException, status
+
+from artificial_u.api.models.jobs import JobResponse
+from artificial_u.api.models.lectures import LectureGenerate
+from artificial_u.config import get_settings
+from artificial_u.jobs import GENERATE_LECTURE, LECTURE_AUDIO, PROFESSOR_IMAGE
+from artificial_u.models.core import Job
+from artificial_u.models.repositories import AsyncRepositoryFactory, RepositoryFactory
+
+
+class JobApiService:
+    """Service for handling background job API operations."""
+
+    def __init__(
+        self,
+        repository_factory: RepositoryFactory,
+        async_repository_factory: Optional[AsyncRepositoryFactory] = None,
+        logger=None,
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            repository_factory: Repository factory instance
+            async_repository_factory: Async repository factory used for existence checks
+            logger: Optional logger instance
+        """
+        self.repository_factory = repository_factory
+        self.async_repository_factory = async_repository_factory or AsyncRepositoryFactory(
+            db_url=repository_factory.db_url
+        )
+        self.logger = logger or logging.getLogger(__name__)
+
+    @staticmethod
+    def _to_response(job: Job) -> JobResponse:
+        """Convert a core job to its API response."""
+        return JobResponse.model_validate(job.model_dump())
+
+    async def _enqueue(
+        self, kind: str, payload: Dict[str, Any], idempotency_key: Optional[str]
+    ) -> JobResponse:
+        """Queue a job, or return the job already queued under the idempotency key."""
+        job = await asyncio.to_thread(
+            self.repository_factory.job.enqueue,
+            kind,
+            payload,
+            idempotency_key=idempotency_key,
+            max_attempts=get_settings().JOB_MAX_ATTEMPTS,
+        )
+        self.logger.info(f"Queued job {job.id} ({kind})")
+        return self._to_response(job)
+
+    async def enqueue_lecture_generation(
+        self, generation_data: LectureGenerate, idempotency_key: Optional[str] = None
+    ) -> JobResponse:
+        """
+        Queue the generation of lecture content.
+
+        Args:
+            generation_data: Partial attributes and freeform prompt for the lecture
+            idempotency_key: Optional key identifying the request across retries
+
+        Returns:
+            JobResponse: The queued job
+        """
+        partial_attrs = dict(generation_data.partial_attributes or {})
+        if generation_data.freeform_prompt:
+            partial_attrs["freeform_prompt"] = generation_data.freeform_prompt
+        return await self._enqueue(
+            GENERATE_LECTURE, {"partial_attributes": partial_attrs}, idempotency_key
+        )
+
+    async def enqueue_lecture_audio(
+        self, lecture_id: int, idempotency_key: Optional[str] = None
+    ) -> JobResponse:
+        """
+        Queue the audio synthesis of a lecture.
+
+        Args:
+            lecture_id: ID of the lecture
+            idempotency_key: Optional key identifying the request across retries
+
+        Returns:
+            JobResponse: The queued job
+
+        Raises:
+            HTTPException: If the lecture is not found
+        """
+        if not await self.async_repository_factory.lecture.get(lecture_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Lecture with ID {lecture_id} not found",
+            )
+        return await self._enqueue(LECTURE_AUDIO, {"lecture_id": lecture_id}, idempotency_key)
+
+    async def enqueue_professor_image(
+        self, professor_id: int, idempotency_key: Optional[str] = None
+    ) -> JobResponse:
+        """
+        Queue the generation of a professor's profile image.
+
+        Args:
+            professor_id: ID of the professor
+            idempotency_key: Optional key identifying the request across retries
+
+        Returns:
+            JobResponse: The queued job
+
+        Raises:
+            HTTPException: If the professor is not found
+        """
+        if not await self.async_repository_factory.professor.get(professor_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Professor with ID {professor_id} not found",
+            )
+        return await self._enqueue(PROFESSOR_IMAGE, {"professor_id": professor_id}, idempotency_key)
+
+    async def get_job(self, job_id: int) -> JobResponse:
+        """
+        Get the status of a job.
+
+        Args:
+            job_id: ID of the job
+
+        Returns:
+            JobResponse: The job
+
+        Raises:
+            HTTPException: If the job is not found
+        """
+        job = await asyncio.to_thread(self.repository_factory.job.get, job_id)
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Job with ID {job_id} not found",
+            )
+        return self._to_response(job)
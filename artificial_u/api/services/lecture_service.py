@@ -2,20 +2,23 @@
 Lecture API service for handling lecture operations in the API layer.
 """
 
+import asyncio
+import json
 import logging
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 from fastapi import HTTPException, status
 
 # Import API models directly
 from artificial_u.api.models.lectures import (
     Lecture,
+    LectureBatchGenerate,
     LectureCreate,
     LectureGenerate,
     LectureList,
     LectureUpdate,
 )
-from artificial_u.models.repositories import RepositoryFactory
+from artificial_u.models.repositories import AsyncRepositoryFactory, RepositoryFactory
 from artificial_u.services import (
     StorageService,  # Keep even if not used directly now, matches dependency injection
 )
@@ -29,6 +32,23 @@ from artificial_u.services import (
 )
 from artificial_u.utils import ContentGenerationError, DatabaseError, LectureNotFoundError
 
+# Seconds of silence after which an SSE comment is sent to keep proxies from timing out
+SSE_HEARTBEAT_INTERVAL = 15.0
+
+
+def format_sse(event: str, data: Any) -> str:
+    """
+    Format a Server-Sent Events message.
+
+    Args:
+        event: Event name
+        data: JSON-serializable payload
+
+    Returns:
+        str: The encoded SSE message
+    """
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
 
 class LectureApiService:
     """Service for handling lecture API operations."""
@@ -40,6 +60,7 @@ class LectureApiService:
         professor_service: ProfessorService,
         repository_factory: RepositoryFactory,
         storage_service: StorageService,
+        async_repository_factory: Optional[AsyncRepositoryFactory] = None,
         logger=None,
     ):
         """
@@ -51,9 +72,13 @@ class LectureApiService:
             course_service: Course service for course-related operations
             content_service: Content service for content-related operations
             storage_service: Storage service for file operations (dependency injection)
+            async_repository_factory: Async repository factory used by read endpoints
             logger: Optional logger instance
         """
         self.repository_factory = repository_factory  # Keep repository factory
+        self.async_repository_factory = async_repository_factory or AsyncRepositoryFactory(
+            db_url=repository_factory.db_url
+        )
         self.logger = logger or logging.getLogger(__name__)
 
         # Initialize core service with dependencies it requires
@@ -71,7 +96,7 @@ class LectureApiService:
         self.content_service = content_service
         self.storage_service = storage_service
 
-    def list_lectures(
+    async def list_lectures(
         self,
         page: int = 1,
         size: int = 10,
@@ -80,7 +105,7 @@ class LectureApiService:
         search: Optional[str] = None,
     ) -> LectureList:
         """
-        List lectures with filtering and pagination using the core service and repository.
+        List lectures with filtering and pagination using the async repository.
 
         Args:
             page: Page number (1-indexed)
@@ -96,8 +121,7 @@ class LectureApiService:
             HTTPException: If there's an error retrieving data.
         """
         try:
-            # Get lectures using the core service list method (delegates to repository)
-            core_lectures = self.core_service.list_lectures(
+            core_lectures = await self.async_repository_factory.lecture.list(
                 page=page,
                 size=size,
                 course_id=course_id,
@@ -111,8 +135,7 @@ class LectureApiService:
                 for lecture in core_lectures
             ]
 
-            # Get total count using the repository directly
-            total_count = self.repository_factory.lecture.count(
+            total_count = await self.async_repository_factory.lecture.count(
                 course_id=course_id,
                 professor_id=professor_id,
                 search_query=search,
@@ -137,9 +160,9 @@ class LectureApiService:
                 detail=f"Failed to retrieve lectures: {e}",
             )
 
-    def get_lecture(self, lecture_id: int) -> Lecture:
+    async def get_lecture(self, lecture_id: int) -> Lecture:
         """
-        Get detailed information about a specific lecture using the core service.
+        Get detailed information about a specific lecture using the async repository.
 
         Args:
             lecture_id: The unique identifier of the lecture
@@ -151,7 +174,9 @@ class LectureApiService:
             HTTPException: 404 if not found, 500 for other errors.
         """
         try:
-            core_lecture = self.core_service.get_lecture(lecture_id)
+            core_lecture = await self.async_repository_factory.lecture.get(lecture_id)
+            if not core_lecture:
+                raise LectureNotFoundError(f"Lecture with ID {lecture_id} not found")
             return Lecture.model_validate(core_lecture)
         except LectureNotFoundError:
             raise HTTPException(
@@ -173,7 +198,7 @@ class LectureApiService:
                 detail=f"Failed to retrieve lecture {lecture_id}: {e}",
             )
 
-    def create_lecture(self, lecture_data: LectureCreate) -> Lecture:
+    async def create_lecture(self, lecture_data: LectureCreate) -> Lecture:
         """
         Create a new lecture using the core service.
 
@@ -191,7 +216,8 @@ class LectureApiService:
             # Create lecture using core service, passing individual args
             # Core service create_lecture expects: course_id, topic_id, content, summary,
             # audio_url, transcript_url, revision
-            core_lecture = self.core_service.create_lecture(
+            core_lecture = await asyncio.to_thread(
+                self.core_service.create_lecture,
                 course_id=lecture_data.course_id,
                 topic_id=lecture_data.topic_id,
                 content=lecture_data.content,
@@ -215,7 +241,42 @@ class LectureApiService:
                 detail=f"An unexpected error occurred during lecture creation: {e}",
             )
 
-    def update_lecture(self, lecture_id: int, lecture_data: LectureUpdate) -> Lecture:
+    async def update_course_summary(self, lecture_id: int) -> None:
+        """
+        Fold a newly created lecture into its course's rolling summary.
+
+        Meant to run after the response is sent; errors are logged, not raised.
+
+        Args:
+            lecture_id: The unique identifier of the created lecture
+        """
+        try:
+            core_lecture = await self.async_repository_factory.lecture.get(lecture_id)
+            if not core_lecture:
+                raise LectureNotFoundError(f"Lecture with ID {lecture_id} not found")
+            await self.core_service.update_course_summary(core_lecture)
+        except Exception as e:
+            self.logger.error(
+                f"Error updating course summary for lecture {lecture_id}: {str(e)}", exc_info=True
+            )
+
+    async def rebuild_course_summary(self, course_id: int) -> None:
+        """
+        Rebuild a course's rolling summary after one of its lectures changed.
+
+        Meant to run after the response is sent; errors are logged, not raised.
+
+        Args:
+            course_id: The unique identifier of the course
+        """
+        try:
+            await self.core_service.rebuild_course_summary(course_id)
+        except Exception as e:
+            self.logger.error(
+                f"Error rebuilding course summary for course {course_id}: {str(e)}", exc_info=True
+            )
+
+    async def update_lecture(self, lecture_id: int, lecture_data: LectureUpdate) -> Lecture:
         """
         Update an existing lecture using the core service.
 
@@ -233,7 +294,8 @@ class LectureApiService:
         try:
             # Update lecture using core service
             update_dict = lecture_data.model_dump(exclude_unset=True)
-            core_lecture = self.core_service.update_lecture(
+            core_lecture = await asyncio.to_thread(
+                self.core_service.update_lecture,
                 lecture_id=lecture_id,
                 update_data=update_dict,
             )
@@ -258,7 +320,7 @@ class LectureApiService:
                 detail=f"An unexpected error occurred during lecture update: {e}",
             )
 
-    def delete_lecture(self, lecture_id: int) -> bool:
+    async def delete_lecture(self, lecture_id: int) -> bool:
         """
         Delete a lecture using the core service.
 
@@ -273,7 +335,7 @@ class LectureApiService:
                            500 for unexpected errors.
         """
         try:
-            deleted = self.core_service.delete_lecture(lecture_id)
+            deleted = await asyncio.to_thread(self.core_service.delete_lecture, lecture_id)
             return deleted  # Core service raises LectureNotFound if it doesn't exist initially
         except LectureNotFoundError:
             # This case should ideally be caught by the core service,
@@ -298,7 +360,7 @@ class LectureApiService:
                 detail=f"An unexpected error occurred during lecture deletion: {e}",
             )
 
-    def get_lecture_content(self, lecture_id: int) -> Optional[str]:
+    async def get_lecture_content(self, lecture_id: int) -> Optional[str]:
         """
         Get the content of a specific lecture using the repository.
 
@@ -313,7 +375,7 @@ class LectureApiService:
         """
         try:
             # Use repository directly for simple field retrieval
-            content = self.repository_factory.lecture.get_content(lecture_id)
+            content = await self.async_repository_factory.lecture.get_content(lecture_id)
             # Note: Repository returns None if lecture not found or content is NULL
             return content
         except Exception as e:
@@ -325,7 +387,7 @@ class LectureApiService:
                 detail=f"Failed to retrieve lecture content for {lecture_id}: {e}",
             )
 
-    def get_lecture_audio_url(self, lecture_id: int) -> Optional[str]:
+    async def get_lecture_audio_url(self, lecture_id: int) -> Optional[str]:
         """
         Get the audio URL of a specific lecture using the repository.
 
@@ -340,7 +402,7 @@ class LectureApiService:
         """
         try:
             # Use repository directly for simple field retrieval
-            audio_url = self.repository_factory.lecture.get_audio_url(lecture_id)
+            audio_url = await self.async_repository_factory.lecture.get_audio_url(lecture_id)
             # Note: Repository returns None if lecture not found or audio_url is NULL
             return audio_url
         except Exception as e:
@@ -352,6 +414,58 @@ class LectureApiService:
                 detail=f"Failed to retrieve lecture audio URL for {lecture_id}: {e}",
             )
 
+    @staticmethod
+    def _generation_attributes(generation_data: LectureGenerate) -> Dict[str, Any]:
+        """Build the core service partial attributes from an API generation request."""
+        partial_attrs = generation_data.partial_attributes or {}  # Start with partial attrs
+        if generation_data.freeform_prompt:  # Add prompt if provided
+            partial_attrs["freeform_prompt"] = generation_data.freeform_prompt
+        return partial_attrs
+
+    @staticmethod
+    def _batch_attributes(generation_data: LectureBatchGenerate) -> Dict[str, Any]:
+        """Build the core service batch attributes from an API batch request."""
+        partial_attrs = dict(generation_data.partial_attributes or {})
+        if generation_data.freeform_prompt:
+            partial_attrs["freeform_prompt"] = generation_data.freeform_prompt
+        return partial_attrs
+
+    @staticmethod
+    def _generated_to_api_lecture(generated_dict: Dict[str, Any]) -> Lecture:
+        """Convert generated lecture attributes to an unsaved API Lecture."""
+        # Convert the dictionary to the API response model
+        # Add placeholder ID and validate if necessary,
+        # or ensure core service provides all needed fields
+        # The core LectureService.generate_lecture returns a dict like:
+        # {"course_id": ..., "topic_id": ..., "revision": ..., "content": ..., "summary": ...}
+        # This dict is used to populate api_lecture_data for validation.
+        # For Lecture.model_validate, all required fields of API Lecture model must be present.
+        # The core service returns generated attributes; not a full Lecture object.
+        # We must ensure all fields for API Lecture model are present,
+        # using placeholders if needed.
+
+        # Placeholder for ID, as generation doesn't assign one.
+        # Revision should come from generated_dict if available.
+        # Content and summary must be in generated_dict.
+        # course_id and topic_id are in partial_attributes and should be in generated_dict.
+
+        # Ensure generated_dict has all keys required by the API Lecture model,
+        # using placeholders for fields not directly produced by generation (like id).
+        api_lecture_data = {
+            "id": -1,  # Placeholder ID for a non-saved generated lecture
+            "course_id": generated_dict.get("course_id"),
+            "topic_id": generated_dict.get("topic_id"),
+            "revision": generated_dict.get("revision"),  # Assumes core service provides this
+            "content": generated_dict.get("content"),
+            "summary": generated_dict.get("summary"),
+            "audio_url": generated_dict.get("audio_url"),  # Allow passthrough
+            "transcript_url": generated_dict.get("transcript_url"),  # Allow passthrough
+        }
+
+        # Validate and convert using the standard response model
+        response = Lecture.model_validate(api_lecture_data)
+        return response
+
     async def generate_lecture(self, generation_data: LectureGenerate) -> Lecture:
         """
         Generate lecture content using AI based on partial data.
@@ -376,9 +490,7 @@ class LectureApiService:
         )
         try:
             # Prepare attributes for the core service
-            partial_attrs = generation_data.partial_attributes or {}  # Start with partial attrs
-            if generation_data.freeform_prompt:  # Add prompt if provided
-                partial_attrs["freeform_prompt"] = generation_data.freeform_prompt
+            partial_attrs = self._generation_attributes(generation_data)
 
             # Call the core service to generate the lecture content dictionary
             # The core service generate_lecture returns a dict
@@ -386,37 +498,7 @@ class LectureApiService:
                 partial_attributes=partial_attrs
             )
 
-            # Convert the dictionary to the API response model
-            # Add placeholder ID and validate if necessary,
-            # or ensure core service provides all needed fields
-            # The core LectureService.generate_lecture returns a dict like:
-            # {"course_id": ..., "topic_id": ..., "revision": ..., "content": ..., "summary": ...}
-            # This dict is used to populate api_lecture_data for validation.
-            # For Lecture.model_validate, all required fields of API Lecture model must be present.
-            # The core service returns generated attributes; not a full Lecture object.
-            # We must ensure all fields for API Lecture model are present,
-            # using placeholders if needed.
-
-            # Placeholder for ID, as generation doesn't assign one.
-            # Revision should come from generated_dict if available.
-            # Content and summary must be in generated_dict.
-            # course_id and topic_id are in partial_attributes and should be in generated_dict.
-
-            # Ensure generated_dict has all keys required by the API Lecture model,
-            # using placeholders for fields not directly produced by generation (like id).
-            api_lecture_data = {
-                "id": -1,  # Placeholder ID for a non-saved generated lecture
-                "course_id": generated_dict.get("course_id"),
-                "topic_id": generated_dict.get("topic_id"),
-                "revision": generated_dict.get("revision"),  # Assumes core service provides this
-                "content": generated_dict.get("content"),
-                "summary": generated_dict.get("summary"),
-                "audio_url": generated_dict.get("audio_url"),  # Allow passthrough
-                "transcript_url": generated_dict.get("transcript_url"),  # Allow passthrough
-            }
-
-            # Validate and convert using the standard response model
-            response = Lecture.model_validate(api_lecture_data)
+            response = self._generated_to_api_lecture(generated_dict)
 
             self.logger.info(f"Successfully generated lecture data for topic {response.topic_id}")
             return response
@@ -434,3 +516,112 @@ class LectureApiService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=("An unexpected error occurred during lecture generation."),
             )
+
+    async def generate_lecture_stream(self, generation_data: LectureGenerate) -> AsyncIterator[str]:
+        """
+        Generate lecture content, yielding Server-Sent Events as it is produced.
+
+        Emits progress events for each generation stage, content events with the
+        lecture text as it streams from the model, and a final lecture event with
+        the generated lecture (API model JSON, not saved). Failures are reported as
+        an error event since the response status has already been sent.
+
+        Args:
+            generation_data: Input data containing optional partial attributes and prompt.
+
+        Yields:
+            str: Encoded SSE messages.
+        """
+        partial_attrs = self._generation_attributes(generation_data)
+        self.logger.info(
+            f"Received request to stream lecture generation with attributes: "
+            f"{list(partial_attrs.keys())}"
+        )
+        events = self.core_service.generate_lecture_stream(partial_attributes=partial_attrs)
+        try:
+            async for message in self._with_heartbeat(events):
+                if message is None:
+                    yield ": keep-alive\n\n"
+                elif message["event"] == "lecture":
+                    lecture = self._generated_to_api_lecture(message["data"])
+                    yield format_sse("lecture", lecture.model_dump(mode="json"))
+                else:
+                    yield format_sse(message["event"], message["data"])
+        except (ContentGenerationError, DatabaseError, ValueError) as e:
+            self.logger.error(f"Streaming lecture generation failed: {e}", exc_info=True)
+            yield format_sse("error", {"detail": f"Failed to generate lecture data: {e}"})
+        except Exception as e:
+            self.logger.error(f"Unexpected error during lecture generation: {e}", exc_info=True)
+            yield format_sse(
+                "error", {"detail": "An unexpected error occurred during lecture generation."}
+            )
+        finally:
+            await events.aclose()
+
+    async def generate_course_lectures(
+        self, course_id: int, generation_data: LectureBatchGenerate
+    ) -> AsyncIterator[str]:
+        """
+        Generate and save a course's missing lectures, yielding Server-Sent Events.
+
+        Relays the core service's batch events (progress, lecture, error and
+        complete). A failure to start the batch is reported as an error event
+        since the response status has already been sent.
+
+        Args:
+            course_id: ID of the course to generate lectures for
+            generation_data: Shared attributes, prompt and concurrency for the batch
+
+        Yields:
+            str: Encoded SSE messages.
+        """
+        self.logger.info(f"Received request to generate all lectures of course {course_id}")
+        events = self.core_service.generate_course_lectures(
+            course_id,
+            partial_attributes=self._batch_attributes(generation_data),
+            concurrency=generation_data.concurrency,
+        )
+        try:
+            async for message in self._with_heartbeat(events):
+                if message is None:
+                    yield ": keep-alive\n\n"
+                else:
+                    yield format_sse(message["event"], message["data"])
+        except (ContentGenerationError, DatabaseError, ValueError) as e:
+            self.logger.error(f"Lecture batch for course {course_id} failed: {e}", exc_info=True)
+            yield format_sse("error", {"detail": f"Failed to generate course lectures: {e}"})
+        except Exception as e:
+            self.logger.error(f"Unexpected error during lecture batch: {e}", exc_info=True)
+            yield format_sse(
+                "error", {"detail": "An unexpected error occurred during lecture generation."}
+            )
+        finally:
+            await events.aclose()
+
+    @staticmethod
+    async def _with_heartbeat(
+        events: AsyncIterator[Dict[str, Any]],
+        interval: Optional[float] = None,
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """Re-yield events, yielding None whenever the source is silent for interval seconds."""
+        interval = SSE_HEARTBEAT_INTERVAL if interval is None else interval
+        pending = None
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(anext(events))
+                done, _ = await asyncio.wait({pending}, timeout=interval)
+                if not done:
+                    yield None
+                    continue
+                task, pending = pending, None
+                try:
+                    event = task.result()
+                except StopAsyncIteration:
+                    return
+                yield event
+        finally:
+            if pending is not None:
+                pending.cancel()
+                # Let the cancellation settle so the source can be closed afterwards
+                await asyncio.gather(pending, return_exceptions=True)
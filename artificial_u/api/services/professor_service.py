@@ -2,6 +2,7 @@
 Professor service for handling business logic related to professors.
 """
 
+import asyncio
 import logging
 import random
 from math import ceil
@@ -21,7 +22,7 @@ from artificial_u.api.models.professors import (
     ProfessorUpdate,
 )
 from artificial_u.models.core import Professor
-from artificial_u.models.repositories import RepositoryFactory
+from artificial_u.models.repositories import AsyncRepositoryFactory, RepositoryFactory
 from artificial_u.services import (
     ContentService,
     ImageService,
@@ -45,6 +46,7 @@ class ProfessorApiService:
         image_service: ImageService,
         repository_factory: RepositoryFactory,
         voice_service: VoiceService,
+        async_repository_factory: Optional[AsyncRepositoryFactory] = None,
         logger=None,
     ):
         """
@@ -55,9 +57,13 @@ class ProfessorApiService:
             content_service: Content generation service
             image_service: Image generation service
             voice_service: Voice service
+            async_repository_factory: Async repository factory used by read endpoints
             logger: Optional logger instance
         """
         self.repository_factory = repository_factory
+        self.async_repository_factory = async_repository_factory or AsyncRepositoryFactory(
+            db_url=repository_factory.db_url
+        )
         self.logger = logger or logging.getLogger(__name__)
 
         # Initialize core service with all required dependencies
@@ -69,7 +75,20 @@ class ProfessorApiService:
             logger=self.logger,
         )
 
-    def get_professors(
+    async def _list_professors(self) -> List[Professor]:
+        """
+        List all professors from the async repository.
+
+        Raises:
+            DatabaseError: If the professors cannot be retrieved.
+        """
+        try:
+            return await self.async_repository_factory.professor.list()
+        except Exception as e:
+            self.logger.error(f"Failed to list professors from repository: {e}", exc_info=True)
+            raise DatabaseError("Failed to retrieve professors.") from e
+
+    async def get_professors(
         self,
         page: int = 1,
         size: int = 10,
@@ -90,25 +109,19 @@ class ProfessorApiService:
         Returns:
             ProfessorsListResponse with paginated professors
         """
-        # Create filters dictionary for the core service
-        filters = {}
-        if department_id is not None:
-            filters["department_id"] = department_id
-        if name:
-            filters["name"] = name
-        if specialization:
-            filters["specialization"] = specialization
-
-        # Get all professors with filters
-        all_professors = self.core_service.list_professors(filters=filters)
-
-        # Count total before pagination
-        total = len(all_professors)
-
-        # Apply pagination
-        paginated_professors = self.core_service.list_professors(
-            filters=filters, page=page, size=size
-        )
+        filters = {
+            "department_id": department_id,
+            "name": name,
+            "specialization": specialization,
+        }
+        try:
+            paginated_professors = await self.async_repository_factory.professor.list(
+                **filters, page=page, size=size
+            )
+            total = await self.async_repository_factory.professor.count(**filters)
+        except Exception as e:
+            self.logger.error(f"Failed to list professors from repository: {e}", exc_info=True)
+            raise DatabaseError("Failed to retrieve professors.") from e
 
         # Calculate total pages
         total_pages = ceil(total / size) if total > 0 else 1
@@ -126,7 +139,7 @@ class ProfessorApiService:
             pages=total_pages,
         )
 
-    def get_professor(self, professor_id: int) -> Optional[ProfessorResponse]:
+    async def get_professor(self, professor_id: int) -> Optional[ProfessorResponse]:
         """
         Get a professor by ID.
 
@@ -136,13 +149,12 @@ class ProfessorApiService:
         Returns:
             ProfessorResponse or None if not found
         """
-        try:
-            professor = self.core_service.get_professor(str(professor_id))
-            return ProfessorResponse.model_validate(professor.model_dump())
-        except ProfessorNotFoundError:
+        professor = await self.async_repository_factory.professor.get(professor_id)
+        if not professor:
             return None
+        return ProfessorResponse.model_validate(professor.model_dump())
 
-    def create_professor(self, professor_data: ProfessorCreate) -> ProfessorResponse:
+    async def create_professor(self, professor_data: ProfessorCreate) -> ProfessorResponse:
         """
         Create a new professor.
 
@@ -164,10 +176,10 @@ class ProfessorApiService:
             # Instantiate the core Professor model
             professor_to_create = Professor(**data)
 
-            # Pass the Professor instance to the core service method
-            # Note: core_service.create_professor is currently sync, but we await it.
-            # This works but might block. Ideally, core service/repo would be async too.
-            created_professor = self.core_service.create_professor(professor_to_create)
+            # Run the sync core service off the event loop
+            created_professor = await asyncio.to_thread(
+                self.core_service.create_professor, professor_to_create
+            )
 
             # Convert to API response model
             return ProfessorResponse.model_validate(created_professor.model_dump())
@@ -179,7 +191,7 @@ class ProfessorApiService:
                 detail=f"Failed to create professor: {e}",
             )
 
-    def update_professor(
+    async def update_professor(
         self, professor_id: int, professor_data: ProfessorUpdate
     ) -> Optional[ProfessorResponse]:
         """
@@ -197,7 +209,9 @@ class ProfessorApiService:
             update_data = {k: v for k, v in professor_data.model_dump().items() if v is not None}
 
             # Use core service to update
-            updated_professor = self.core_service.update_professor(str(professor_id), update_data)
+            updated_professor = await asyncio.to_thread(
+                self.core_service.update_professor, str(professor_id), update_data
+            )
 
             # Convert to response model
             return ProfessorResponse.model_validate(updated_professor.model_dump())
@@ -206,7 +220,7 @@ class ProfessorApiService:
         except DatabaseError:
             return None
 
-    def delete_professor(self, professor_id: int) -> bool:
+    async def delete_professor(self, professor_id: int) -> bool:
         """
         Delete a professor.
 
@@ -217,11 +231,11 @@ class ProfessorApiService:
             True if deleted successfully, False otherwise
         """
         try:
-            return self.core_service.delete_professor(professor_id)
+            return await asyncio.to_thread(self.core_service.delete_professor, professor_id)
         except (ProfessorNotFoundError, DatabaseError):
             return False
 
-    def get_professor_courses(self, professor_id: int) -> Optional[ProfessorCoursesResponse]:
+    async def get_professor_courses(self, professor_id: int) -> Optional[ProfessorCoursesResponse]:
         """
         Get courses taught by a professor.
 
@@ -232,8 +246,10 @@ class ProfessorApiService:
             ProfessorCoursesResponse or None if professor not found
         """
         try:
-            # Use core service to get courses
-            courses = self.core_service.list_professor_courses(professor_id)
+            if not await self.async_repository_factory.professor.get(professor_id):
+                raise ProfessorNotFoundError(f"Professor with ID {professor_id} not found.")
+            all_courses = await self.async_repository_factory.course.list()
+            courses = [c for c in all_courses if c.professor_id == professor_id]
 
             # Convert to brief format
             course_briefs = [
@@ -256,7 +272,9 @@ class ProfessorApiService:
         except ProfessorNotFoundError:
             return None
 
-    def get_professor_lectures(self, professor_id: int) -> Optional[ProfessorLecturesResponse]:
+    async def get_professor_lectures(
+        self, professor_id: int
+    ) -> Optional[ProfessorLecturesResponse]:
         """
         Get lectures by a professor.
 
@@ -267,8 +285,9 @@ class ProfessorApiService:
             ProfessorLecturesResponse or None if professor not found
         """
         try:
-            # Use core service to get lectures
-            lectures = self.core_service.list_professor_lectures(str(professor_id))
+            if not await self.async_repository_factory.professor.get(professor_id):
+                raise ProfessorNotFoundError(f"Professor with ID {professor_id} not found.")
+            lectures = await self.async_repository_factory.lecture.list(professor_id=professor_id)
 
             # Convert to brief format
             lecture_briefs = [
@@ -375,12 +394,12 @@ class ProfessorApiService:
                 detail=("An unexpected error occurred during profile generation."),
             )
 
-    def get_featured_professors(self) -> List[ProfessorResponse]:
+    async def get_featured_professors(self) -> List[ProfessorResponse]:
         """
         Get a list of up to 3 random featured professors.
         """
         try:
-            all_professors_core = self.core_service.list_professors(filters=None)  # Get all
+            all_professors_core = await self._list_professors()
 
             if not all_professors_core:
                 return []
@@ -398,7 +417,7 @@ class ProfessorApiService:
             self.logger.error(f"Error fetching featured professors: {e}", exc_info=True)
             # For a "featured" endpoint, returning an empty list on error might be acceptable
             # rather than a 500, depending on requirements. For now, let it raise if not handled.
-            # If it's a DatabaseError from list_professors, it will already be a 500.
+            # If it's a DatabaseError from _list_professors, it will already be a 500.
             # If it's a random.sample error (e.g. k > n), that's a logic bug.
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -2,6 +2,7 @@
 Topic API service for handling topic operations in the API layer.
 """
 
+import asyncio
 import logging
 from typing import List, Optional
 
@@ -15,7 +16,7 @@ from artificial_u.api.models.topics import (
     TopicUpdate,
 )
 from artificial_u.models.core import Topic as CoreTopic
-from artificial_u.models.repositories import RepositoryFactory
+from artificial_u.models.repositories import AsyncRepositoryFactory, RepositoryFactory
 from artificial_u.services import TopicService as CoreTopicService
 from artificial_u.utils import (
     ContentGenerationError,
@@ -32,16 +33,20 @@ class TopicApiService:
         self,
         core_topic_service: CoreTopicService,
         repository_factory: RepositoryFactory,  # For potential direct use, e.g. counts if added
+        async_repository_factory: Optional[AsyncRepositoryFactory] = None,
         logger: Optional[logging.Logger] = None,
     ):
         self.core_topic_service = core_topic_service
         self.repository_factory = repository_factory
+        self.async_repository_factory = async_repository_factory or AsyncRepositoryFactory(
+            db_url=repository_factory.db_url
+        )
         self.logger = logger or logging.getLogger(__name__)
 
-    def get_topic(self, topic_id: int) -> Topic:
+    async def get_topic(self, topic_id: int) -> Topic:
         """Get a topic by its ID."""
         try:
-            core_topic = self.core_topic_service.get_topic(topic_id)
+            core_topic = await self.async_repository_factory.topic.get(topic_id)
             if not core_topic:
                 raise TopicNotFoundError(f"Topic with ID {topic_id} not found")
             return Topic.model_validate(core_topic)
@@ -54,11 +59,17 @@ class TopicApiService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
             )
 
-    def list_topics_by_course(self, course_id: int, page: int = 1, size: int = 10) -> TopicList:
+    async def list_topics_by_course(
+        self, course_id: int, page: int = 1, size: int = 10
+    ) -> TopicList:
         """List topics for a course with pagination."""
         try:
-            # Core service currently returns all topics for the course
-            all_core_topics = self.core_topic_service.list_topics_by_course(course_id)
+            try:
+                all_core_topics = await self.async_repository_factory.topic.list_by_course(
+                    course_id
+                )
+            except Exception as e:
+                raise DatabaseError(f"Failed to list topics: {str(e)}") from e
 
             total_count = len(all_core_topics)
             start = (page - 1) * size
@@ -84,10 +95,11 @@ class TopicApiService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
             )
 
-    def create_topic(self, topic_data: TopicCreate) -> Topic:
+    async def create_topic(self, topic_data: TopicCreate) -> Topic:
         """Create a new topic."""
         try:
-            core_topic = self.core_topic_service.create_topic(
+            core_topic = await asyncio.to_thread(
+                self.core_topic_service.create_topic,
                 title=topic_data.title,
                 course_id=topic_data.course_id,
                 week=topic_data.week,
@@ -107,11 +119,11 @@ class TopicApiService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error"
             )
 
-    def update_topic(self, topic_id: int, topic_data: TopicUpdate) -> Topic:
+    async def update_topic(self, topic_id: int, topic_data: TopicUpdate) -> Topic:
         """Update an existing topic."""
         try:
             # Get existing core topic to update
-            core_topic_to_update = self.core_topic_service.get_topic(topic_id)
+            core_topic_to_update = await self.async_repository_factory.topic.get(topic_id)
             if not core_topic_to_update:
                 raise TopicNotFoundError(f"Topic with ID {topic_id} not found for update.")
 
@@ -127,7 +139,9 @@ class TopicApiService:
             )
 
             # Call core service update method
-            persisted_topic = self.core_topic_service.update_topic(updated_core_topic)
+            persisted_topic = await asyncio.to_thread(
+                self.core_topic_service.update_topic, updated_core_topic
+            )
             return Topic.model_validate(persisted_topic)
         except TopicNotFoundError as e:
             self.logger.warning(f"Topic not found for update: {e}")
@@ -143,10 +157,10 @@ class TopicApiService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error"
             )
 
-    def delete_topic(self, topic_id: int) -> bool:
+    async def delete_topic(self, topic_id: int) -> bool:
         """Delete a topic."""
         try:
-            deleted = self.core_topic_service.delete_topic(topic_id)
+            deleted = await asyncio.to_thread(self.core_topic_service.delete_topic, topic_id)
             if not deleted:
                 # Core service delete_topic returns False if not found,
                 # but doesn't raise TopicNotFound.
@@ -0,0 +1,205 @@
+"""
+Content-addressed cache for synthesized TTS chunks.
+
+Chunks are keyed by a hash of everything that affects the rendered audio
+(enhanced text, voice, model and voice settings), so re-generating audio for an
+edited lecture only sends the chunks whose text actually changed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class ChunkAudioCache:
+    """Disk-backed LRU cache of synthesized audio chunks."""
+
+    FILE_EXTENSION = ".mp3"
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int = 500 * 1024 * 1024,
+        logger=None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cached chunk files
+            max_bytes: Total size above which least recently used chunks are evicted
+            logger: Optional logger instance
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        # key -> size in bytes, least recently used first
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._size_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.characters_saved = 0
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def make_key(
+        text: str,
+        el_voice_id: str,
+        model_id: str,
+        voice_settings: Optional[Dict[str, float]],
+    ) -> str:
+        """
+        Build the cache key for a chunk.
+
+        Args:
+            text: Enhanced chunk text as sent to ElevenLabs
+            el_voice_id: ElevenLabs Voice ID
+            model_id: ElevenLabs model ID
+            voice_settings: Voice settings used for synthesis
+
+        Returns:
+            Hex SHA-256 digest identifying the rendered audio
+        """
+        payload = json.dumps(
+            [text, el_voice_id, model_id, voice_settings or {}],
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """Get the file path for a key, sharded by its first two characters."""
+        return os.path.join(self.cache_dir, key[:2], f"{key}{self.FILE_EXTENSION}")
+
+    def _load_index(self) -> None:
+        """Rebuild the LRU index from files on disk, oldest access first."""
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(self.FILE_EXTENSION):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, name[: -len(self.FILE_EXTENSION)], stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._size_bytes += size
+
+        if entries:
+            self.logger.debug(f"Loaded {len(entries)} cached TTS chunks ({self._size_bytes} bytes)")
+
+    def get(self, key: str, text_length: int = 0) -> Optional[bytes]:
+        """
+        Look up a chunk.
+
+        Args:
+            key: Cache key from make_key()
+            text_length: Characters in the chunk, counted as saved on a hit
+
+        Returns:
+            Cached audio bytes, or None on a miss
+        """
+        path = self._path(key)
+        with self._lock:
+            if key not in self._index:
+                self.misses += 1
+                return None
+
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                # Touch the file so access order survives restarts
+                os.utime(path)
+            except OSError as e:
+                self.logger.warning(f"Dropping unreadable cached chunk {key}: {e}")
+                self._size_bytes -= self._index.pop(key)
+                self.misses += 1
+                return None
+
+            self._index.move_to_end(key)
+            self.hits += 1
+            self.characters_saved += text_length
+            return data
+
+    def put(self, key: str, audio_data: bytes) -> None:
+        """
+        Store a chunk, evicting least recently used chunks if over the size limit.
+
+        Args:
+            key: Cache key from make_key()
+            audio_data: Synthesized audio bytes
+        """
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(audio_data)
+            # Atomic rename so concurrent readers never see a partial file
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Failed to cache TTS chunk {key}: {e}")
+            return
+
+        with self._lock:
+            if key in self._index:
+                self._size_bytes -= self._index.pop(key)
+            self._index[key] = len(audio_data)
+            self._size_bytes += len(audio_data)
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used chunks until the cache fits max_bytes."""
+        while self._size_bytes > self.max_bytes and self._index:
+            key, size = self._index.popitem(last=False)
+            self._size_bytes -= size
+            self.evictions += 1
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Remove every cached chunk."""
+        with self._lock:
+            for key in list(self._index):
+                try:
+                    os.remove(self._path(key))
+                except OSError:
+                    pass
+            self._index.clear()
+            self._size_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache metrics.
+
+        Returns:
+            Dictionary of hit/miss counters, eviction count and current size
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._index),
+                "size_bytes": self._size_bytes,
+                "max_bytes": self.max_bytes,
+                "characters_saved": self.characters_saved,
+            }
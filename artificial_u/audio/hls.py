@@ -0,0 +1,263 @@
+"""
+HLS packaging of lecture audio.
+
+Synthesized MP3 is cut at frame boundaries into segments of a fixed duration
+and listed in a VOD playlist, so players can start after the first segment and
+seek by fetching only the segment they need. Segments are HLS packed audio:
+raw MPEG audio frames behind an ID3 tag carrying the segment's timestamp.
+Stray ID3 tags and Xing/Info header frames left by concatenating per-chunk MP3
+files are dropped on the way.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+PLAYLIST_NAME = "playlist.m3u8"
+PLAYLIST_CONTENT_TYPE = "application/vnd.apple.mpegurl"
+SEGMENT_CONTENT_TYPE = "audio/mpeg"
+
+# Sample rates by MPEG version bits (2.5, reserved, 2, 1)
+SAMPLE_RATES = {0: (11025, 12000, 8000), 2: (22050, 24000, 16000), 3: (44100, 48000, 32000)}
+
+# Bitrates in kbps by (MPEG-1, layer) and (MPEG-2/2.5, layer); layer bits 3=I, 2=II, 1=III
+BITRATES = {
+    (True, 3): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 1): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 3): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 1): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+# Offsets of a Xing/Info tag: after the header and the side info of a mono or stereo frame
+INFO_TAG_OFFSETS = (13, 21, 36)
+
+# HLS packed audio timestamps use the 90 kHz MPEG-2 transport stream clock
+TIMESTAMP_OWNER = b"com.apple.streaming.transportStreamTimestamp"
+TIMESTAMP_CLOCK = 90000
+
+
+@dataclass
+class HlsSegment:
+    """A packaged segment of audio."""
+
+    sequence: int
+    start: float
+    duration: float
+    data: bytes
+
+    @property
+    def name(self) -> str:
+        """File name of the segment, relative to the playlist."""
+        return segment_name(self.sequence)
+
+
+def segment_name(sequence: int) -> str:
+    """Get the file name of a segment, relative to the playlist."""
+    return f"segment{sequence:05d}.mp3"
+
+
+def parse_frame_header(header: bytes) -> Optional[Tuple[int, int, int]]:
+    """
+    Parse an MPEG audio frame header.
+
+    Args:
+        header: The first four bytes of a candidate frame
+
+    Returns:
+        Tuple of (frame length in bytes, samples in the frame, sample rate), or
+        None if the bytes are not a valid frame header
+    """
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version = (header[1] >> 3) & 0x03
+    layer = (header[1] >> 1) & 0x03
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0x03
+    if version == 1 or layer == 0 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    mpeg1 = version == 3
+    bitrate = BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+    sample_rate = SAMPLE_RATES[version][sample_rate_index]
+    padding = (header[2] >> 1) & 0x01
+    if layer == 3:
+        return (12 * bitrate // sample_rate + padding) * 4, 384, sample_rate
+    samples = 576 if layer == 1 and not mpeg1 else 1152
+    return samples // 8 * bitrate // sample_rate + padding, samples, sample_rate
+
+
+def _syncsafe(value: int) -> bytes:
+    """Encode an ID3v2 size as a 4-byte syncsafe integer."""
+    return bytes((value >> shift) & 0x7F for shift in (21, 14, 7, 0))
+
+
+def _syncsafe_value(data: bytes) -> int:
+    """Decode a 4-byte syncsafe integer."""
+    return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+
+def timestamp_tag(start: float) -> bytes:
+    """
+    Build the ID3 tag that starts an HLS packed audio segment.
+
+    Args:
+        start: Presentation time of the segment's first sample, in seconds
+
+    Returns:
+        ID3v2.4 tag with a PRIV frame holding the 33-bit 90 kHz timestamp
+    """
+    timestamp = round(start * TIMESTAMP_CLOCK) & (2**33 - 1)
+    payload = TIMESTAMP_OWNER + b"\x00" + timestamp.to_bytes(8, "big")
+    frame = b"PRIV" + _syncsafe(len(payload)) + b"\x00\x00" + payload
+    return b"ID3\x04\x00\x00" + _syncsafe(len(frame)) + frame
+
+
+def _is_info_frame(frame: bytes) -> bool:
+    """Whether a frame is a Xing/Info header frame rather than audio."""
+    return any(frame[offset : offset + 4] in (b"Xing", b"Info") for offset in INFO_TAG_OFFSETS)
+
+
+def read_frames(buffer: bytearray) -> Iterator[Tuple[bytes, float]]:
+    """
+    Read the complete audio frames at the start of a buffer of MP3 data.
+
+    ID3 tags, Xing/Info header frames and bytes between frames are skipped.
+    Once the generator is exhausted, everything read is removed from the
+    buffer, leaving any incomplete frame or tag at its end.
+
+    Args:
+        buffer: MP3 data, consumed as it is read
+
+    Yields:
+        Tuple of (frame bytes, frame duration in seconds)
+    """
+    position = 0
+    while len(buffer) - position >= 10:
+        if buffer[position : position + 3] == b"ID3":
+            # An ID3v2 tag from the start of a concatenated file
+            size = 10 + _syncsafe_value(buffer[position + 6 : position + 10])
+            if buffer[position + 5] & 0x10:
+                size += 10  # footer
+            if len(buffer) - position < size:
+                break
+            position += size
+            continue
+
+        header = parse_frame_header(bytes(buffer[position : position + 4]))
+        if header is None:
+            position += 1  # resynchronize on the next frame header
+            continue
+        length, samples, sample_rate = header
+        if len(buffer) - position < length:
+            break
+        frame = bytes(buffer[position : position + length])
+        position += length
+        if not _is_info_frame(frame):
+            yield frame, samples / sample_rate
+    del buffer[:position]
+
+
+def mp3_duration(data: bytes) -> float:
+    """
+    Get the playing time of MP3 data.
+
+    Args:
+        data: MP3 data, e.g. one synthesized chunk
+
+    Returns:
+        Duration in seconds of the audio frames in the data
+    """
+    return sum(duration for _, duration in read_frames(bytearray(data)))
+
+
+class HlsSegmenter:
+    """
+    Cut a stream of MP3 data into HLS segments.
+
+    Data may arrive in pieces of any size: frames are cut at their boundaries,
+    and a segment is released once it holds target_duration seconds of audio.
+    """
+
+    def __init__(self, target_duration: float = 6.0):
+        """
+        Initialize the segmenter.
+
+        Args:
+            target_duration: Seconds of audio per segment (the last may be shorter)
+        """
+        self.target_duration = target_duration
+        self._buffer = bytearray()
+        self._frames: List[bytes] = []
+        self._frames_duration = 0.0
+        self._sequence = 0
+        self._position = 0.0
+
+    def feed(self, data: bytes) -> List[HlsSegment]:
+        """
+        Add MP3 data and return the segments it completes.
+
+        Args:
+            data: The next piece of MP3 data
+
+        Returns:
+            List of completed segments, possibly empty
+        """
+        self._buffer.extend(data)
+        segments = []
+        for frame, duration in read_frames(self._buffer):
+            self._frames.append(frame)
+            self._frames_duration += duration
+            if self._frames_duration >= self.target_duration - 1e-9:
+                segments.append(self._release())
+        return segments
+
+    def flush(self) -> List[HlsSegment]:
+        """
+        Return the last, possibly shorter, segment once the stream has ended.
+
+        Returns:
+            List holding the final segment, or empty if no audio is left
+        """
+        self._buffer.clear()
+        return [self._release()] if self._frames else []
+
+    def _release(self) -> HlsSegment:
+        """Package the buffered frames as the next segment."""
+        segment = HlsSegment(
+            sequence=self._sequence,
+            start=self._position,
+            duration=self._frames_duration,
+            data=timestamp_tag(self._position) + b"".join(self._frames),
+        )
+        self._sequence += 1
+        self._position += self._frames_duration
+        self._frames = []
+        self._frames_duration = 0.0
+        return segment
+
+
+def build_playlist(durations: List[float]) -> str:
+    """
+    Build the VOD playlist of a lecture's segments.
+
+    Args:
+        durations: Duration of every segment of the lecture, in order
+
+    Returns:
+        M3U8 playlist text, with segment URIs relative to the playlist
+    """
+    target_duration = max((math.ceil(duration) for duration in durations), default=1)
+    lines = [
+        "#EXTM3U",
+        "#EXT-X-VERSION:3",
+        "#EXT-X-PLAYLIST-TYPE:VOD",
+        f"#EXT-X-TARGETDURATION:{target_duration}",
+        "#EXT-X-MEDIA-SEQUENCE:0",
+    ]
+    for sequence, duration in enumerate(durations):
+        lines.append(f"#EXTINF:{duration:.3f},")
+        lines.append(segment_name(sequence))
+    lines.append("#EXT-X-ENDLIST")
+    return "\n".join(lines) + "\n"
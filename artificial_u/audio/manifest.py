@@ -0,0 +1,177 @@
+"""
+Segment manifest of lecture audio.
+
+A lecture's MP3 is the synthesized audio of its text chunks, one after the
+other. The manifest records, for each chunk, the span of lecture text it
+speaks, the byte range it occupies in the file and when it plays, so players
+can seek by paragraph, ranges of the file can be served per chunk, and a
+regenerated chunk can be spliced into the file in place of the old one.
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from artificial_u.audio.hls import mp3_duration
+
+MANIFEST_EXTENSION = "json"
+MANIFEST_CONTENT_TYPE = "application/json"
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class ManifestEntry:
+    """Where one chunk of lecture text sits in the lecture's audio."""
+
+    index: int
+    byte_offset: int
+    byte_length: int
+    start: float
+    duration: float
+    text_start: Optional[int] = None
+    text_end: Optional[int] = None
+    # Source text of the chunk, used to locate its span; not stored
+    text: str = field(default="", repr=False, compare=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the stored form of the entry."""
+        return {
+            "index": self.index,
+            "text_start": self.text_start,
+            "text_end": self.text_end,
+            "byte_offset": self.byte_offset,
+            "byte_length": self.byte_length,
+            "start": round(self.start, 3),
+            "duration": round(self.duration, 3),
+        }
+
+
+class AudioManifest:
+    """Byte ranges, timings and text spans of the chunks of a lecture's audio."""
+
+    def __init__(self, entries: Optional[List[ManifestEntry]] = None):
+        """
+        Initialize the manifest.
+
+        Args:
+            entries: Entries of chunks already in the audio, in order
+        """
+        self.entries: List[ManifestEntry] = entries or []
+
+    @property
+    def byte_length(self) -> int:
+        """Size of the whole audio file in bytes."""
+        return sum(entry.byte_length for entry in self.entries)
+
+    @property
+    def duration(self) -> float:
+        """Playing time of the whole audio file in seconds."""
+        return sum(entry.duration for entry in self.entries)
+
+    def add(self, text: str, audio_data: bytes) -> ManifestEntry:
+        """
+        Record the audio of the next chunk.
+
+        Args:
+            text: Source text of the chunk, before speech markup enhancement
+            audio_data: Synthesized audio of the chunk
+
+        Returns:
+            The new entry
+        """
+        entry = ManifestEntry(
+            index=len(self.entries),
+            byte_offset=self.byte_length,
+            byte_length=len(audio_data),
+            start=self.duration,
+            duration=mp3_duration(audio_data),
+            text=text,
+        )
+        self.entries.append(entry)
+        return entry
+
+    def locate(self, content: str) -> None:
+        """
+        Set each entry's span of the lecture text.
+
+        Chunks are found in order, ignoring differences in whitespace; a chunk
+        that cannot be found keeps an empty span.
+
+        Args:
+            content: The lecture text the chunks were cut from
+        """
+        position = 0
+        for entry in self.entries:
+            words = entry.text.split()
+            if not words:
+                continue
+            match = re.compile(r"\s+".join(map(re.escape, words))).search(content, position)
+            if match:
+                entry.text_start, entry.text_end = match.span()
+                position = match.end()
+
+    def entry_at(self, seconds: float) -> Optional[ManifestEntry]:
+        """
+        Get the entry playing at a point in the audio.
+
+        Args:
+            seconds: Time from the start of the audio
+
+        Returns:
+            The entry, or None if the time is outside the audio
+        """
+        for entry in self.entries:
+            if entry.start <= seconds < entry.start + entry.duration:
+                return entry
+        return None
+
+    def replace(self, index: int, audio_data: bytes) -> ManifestEntry:
+        """
+        Record new audio for a chunk, moving the chunks after it.
+
+        The file is patched by writing audio_data over the old entry's byte
+        range; later chunks keep their bytes at shifted offsets.
+
+        Args:
+            index: Index of the regenerated chunk
+            audio_data: New audio of the chunk
+
+        Returns:
+            The updated entry
+        """
+        entry = self.entries[index]
+        byte_shift = len(audio_data) - entry.byte_length
+        time_shift = mp3_duration(audio_data) - entry.duration
+        entry.byte_length += byte_shift
+        entry.duration += time_shift
+        for later in self.entries[index + 1 :]:
+            later.byte_offset += byte_shift
+            later.start += time_shift
+        return entry
+
+    def to_json(self) -> str:
+        """Serialize the manifest for storage."""
+        return json.dumps(
+            {
+                "version": MANIFEST_VERSION,
+                "byte_length": self.byte_length,
+                "duration": round(self.duration, 3),
+                "chunks": [entry.to_dict() for entry in self.entries],
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, data: str) -> "AudioManifest":
+        """
+        Load a stored manifest.
+
+        Args:
+            data: Manifest JSON, as written by to_json
+
+        Returns:
+            The manifest
+        """
+        chunks = json.loads(data)["chunks"]
+        return cls([ManifestEntry(**chunk) for chunk in chunks])
@@ -5,9 +5,14 @@ This module provides utilities for processing text to improve TTS quality,
 including special handling for technical terms, stage directions, and mathematical notation.
 """
 
+import hashlib
 import logging
 import re
-from typing import List
+from functools import lru_cache
+from typing import Callable, Dict, List, Match, Optional, Pattern, Tuple
+
+# A compiled rewrite phase: one alternation pattern and its dispatching replacement
+RewritePhase = Tuple[Pattern, Callable[[Match], str]]
 
 
 class SpeechProcessor:
@@ -60,6 +65,68 @@ class SpeechProcessor:
         "∪": "union",
     }
 
+    # Code syntax replacements, applied in order
+    CODE_SYNTAX_REPLACEMENTS = {
+        # Variable declarations
+        r"\bvar\b": "variable",
+        r"\blet\b": "let",
+        r"\bconst\b": "constant",
+        # Operators
+        r"===": "strictly equals",
+        r"!==": "strictly not equals",
+        r"==": "equals",
+        r"!=": "not equals",
+        r"<=": "less than or equal to",
+        r">=": "greater than or equal to",
+        r"->": "arrow",
+        r"=>": "fat arrow",
+        # Common syntax
+        r"\bfunction\b": "function",
+        r"\breturn\b": "return",
+        r"\bif\b": "if",
+        r"\belse\b": "else",
+        r"\bfor\b": "for",
+        r"\bwhile\b": "while",
+    }
+
+    # Equation replacements, applied in order
+    EQUATION_REPLACEMENTS = {
+        # Basic operators
+        r"\*\*": " to the power of ",
+        r"\*": " times ",
+        r"/": " divided by ",
+        r"\+": " plus ",
+        r"-": " minus ",
+        # Functions
+        r"\bsin\b": "sine",
+        r"\bcos\b": "cosine",
+        r"\btan\b": "tangent",
+        r"\blog\b": "logarithm",
+        r"\bln\b": "natural logarithm",
+        r"\bexp\b": "exponential",
+        r"\bsqrt\b": "square root",
+        r"\blim\b": "limit",
+    }
+
+    # Chemical formulas (H2O -> "H 2 O")
+    CHEMICAL_FORMULA_PATTERN = r"([A-Z][a-z]?)(\d+)"
+
+    # Scientific unit replacements, applied in order after chemical formulas
+    SCIENTIFIC_UNIT_REPLACEMENTS = {
+        # SI units
+        r"m/s": "meters per second",
+        r"km/h": "kilometers per hour",
+        r"kg/m³": "kilograms per cubic meter",
+        r"mol/L": "moles per liter",
+        # Common units
+        r"°C": "degrees Celsius",
+        r"°F": "degrees Fahrenheit",
+        r"K\b": "Kelvin",
+    }
+
+    # About one in this many paragraphs ends a chunk wherever it falls in the text
+    CHUNK_BOUNDARY_DIVISOR = 4
+
     def __init__(self, logger=None):
         """
         Initialize the speech processor.
@@ -68,11 +135,33 @@ class SpeechProcessor:
             logger: Optional logger instance
         """
         self.logger = logger or logging.getLogger(__name__)
+        self._rewrite_phases = self._compile_rewrite_phases()
 
     def enhance_speech_markup(self, text: str) -> str:
         """
         Enhance text with speech markup for better pronunciation.
 
+        Runs the precompiled rewrite phases, producing the same output as
+        applying every rule in turn but scanning the text only once per phase.
+
+        Args:
+            text: The text to enhance
+
+        Returns:
+            Enhanced text with speech markup
+        """
+        enhanced_text = text
+        for pattern, replace in self._rewrite_phases:
+            enhanced_text = pattern.sub(replace, enhanced_text)
+        return enhanced_text
+
+    def _enhance_speech_markup_sequential(self, text: str) -> str:
+        """
+        Enhance text by applying each rule as its own pass.
+
+        This is the reference behaviour the compiled phases must reproduce;
+        it is kept for equivalence tests and benchmarks.
+
         Args:
             text: The text to enhance
 
@@ -103,6 +192,163 @@ class SpeechProcessor:
 
         return enhanced_text
 
+    def _compile_rewrite_phases(self) -> List[RewritePhase]:
+        """
+        Merge the rule tables into three alternation patterns with dispatch.
+
+        Rules are grouped so that no rule in a phase can see the output of
+        another rule in the same phase, which lets each phase run as a single
+        re.sub while matching the sequential passes exactly:
+
+        1. Title prefix, pronunciation terms and math symbols.
+        2. Code syntax.
+        3. Equations, chemical formulas and scientific units.
+
+        Returns:
+            List of (compiled pattern, replacement function) pairs
+        """
+        return [
+            self._compile_markup_phase(),
+            self._compile_code_phase(),
+            self._compile_science_phase(),
+        ]
+
+    @staticmethod
+    def _split_rules(rules: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Split a rule table into whole-word rules and literal symbol rules.
+
+        Args:
+            rules: Mapping of regex pattern to replacement
+
+        Returns:
+            Tuple of (word -> replacement, literal symbol -> replacement)
+        """
+        words, symbols = {}, {}
+        for pattern, replacement in rules.items():
+            word = re.fullmatch(r"\\b(\w+)\\b", pattern)
+            if word:
+                # Rules that replace a word with itself are no-ops
+                if word.group(1) != replacement:
+                    words[word.group(1)] = replacement
+            else:
+                symbols[re.sub(r"\\(.)", r"\1", pattern)] = replacement
+        return words, symbols
+
+    @staticmethod
+    def _alternation(literals, whole_words: bool = False) -> str:
+        """Build a regex alternation of escaped literals, in rule order."""
+        pattern = "|".join(re.escape(literal) for literal in literals)
+        return rf"\b(?:{pattern})\b" if whole_words else pattern
+
+    def _compile_markup_phase(self) -> RewritePhase:
+        """
+        Compile the title, pronunciation and math notation rules.
+
+        Math symbols inside the phoneme replacements are pre-translated, since
+        the sequential passes rewrite them after the pronunciation pass.
+        """
+        terms = {}
+        for term, pronunciation in self.PRONUNCIATION_DICT.items():
+            markup = f'<phoneme alphabet="ipa" ph="{pronunciation}">{term}</phoneme>'
+            for symbol, spoken_form in self.MATH_NOTATION.items():
+                markup = markup.replace(symbol, spoken_form)
+            terms[term] = markup
+
+        pattern = re.compile(
+            r"(?P<title>\A#\s+)"
+            rf"|(?P<term>{self._alternation(terms, whole_words=True)})"
+            rf"|(?P<math>{self._alternation(self.MATH_NOTATION)})"
+        )
+
+        def replace(match: Match) -> str:
+            if match.lastgroup == "term":
+                return terms[match.group()]
+            if match.lastgroup == "math":
+                return self.MATH_NOTATION[match.group()]
+            return ""
+
+        return pattern, replace
+
+    def _compile_code_phase(self) -> RewritePhase:
+        """
+        Compile the code syntax rules.
+
+        Operator rules only involve symbol characters and emit letters, so each
+        maximal run of those symbols is rewritten by replaying the operator
+        rules on just that run.
+        """
+        words, symbols = self._split_rules(self.CODE_SYNTAX_REPLACEMENTS)
+        symbol_chars = "".join(sorted({char for symbol in symbols for char in symbol}))
+
+        @lru_cache(maxsize=256)
+        def replace_run(run: str) -> str:
+            for symbol, replacement in symbols.items():
+                run = run.replace(symbol, replacement)
+            return run
+
+        pattern = re.compile(
+            rf"(?P<word>{self._alternation(words, whole_words=True)})"
+            rf"|(?P<symbols>[{re.escape(symbol_chars)}]+)"
+        )
+
+        def replace(match: Match) -> str:
+            if match.lastgroup == "word":
+                return words[match.group()]
+            return replace_run(match.group())
+
+        return pattern, replace
+
+    def _compile_science_phase(self) -> RewritePhase:
+        """
+        Compile the equation, chemical formula and scientific unit rules.
+
+        Equation rules emit space-padded lowercase words, so they never touch
+        formula or unit matches. Unit rules are replayed on each formula's
+        rewrite so cascades like "K2" -> "K 2" -> "Kelvin 2" are preserved.
+        Slash units can never match because every "/" is rewritten as an
+        equation operator first.
+        """
+        words, symbols = self._split_rules(self.EQUATION_REPLACEMENTS)
+
+        units = {}
+        rewritten_units = []
+        for unit, replacement in self.SCIENTIFIC_UNIT_REPLACEMENTS.items():
+            if "/" in unit:
+                continue
+            if unit.endswith(r"\b") and rewritten_units:
+                # An earlier unit rewrite starting with a letter removes this boundary
+                unit = f"{unit[:-2]}(?!{'|'.join(rewritten_units)})\\b"
+            units[unit] = replacement
+            if replacement[:1].isalnum():
+                rewritten_units.append(unit)
+
+        unit_patterns = [(re.compile(unit), replacement) for unit, replacement in units.items()]
+        unit_replacements = list(units.values())
+        chemical = re.compile(self.CHEMICAL_FORMULA_PATTERN)
+
+        pattern = re.compile(
+            rf"(?P<operator>{self._alternation(symbols)})"
+            rf"|(?P<function>{self._alternation(words, whole_words=True)})"
+            rf"|(?P<formula>°?{self.CHEMICAL_FORMULA_PATTERN})"
+            + "".join(f"|(?P<unit{i}>{unit})" for i, unit in enumerate(units))
+        )
+
+        def replace(match: Match) -> str:
+            kind = match.lastgroup
+            if kind == "operator":
+                return symbols[match.group()]
+            if kind == "function":
+                return words[match.group()]
+            if kind == "formula":
+                value = chemical.sub(r"\1 \2", match.group())
+                for unit_pattern, replacement in unit_patterns:
+                    value = unit_pattern.sub(replacement, value)
+                return value
+            return unit_replacements[int(kind[len("unit") :])]
+
+        return pattern, replace
+
     def _enhance_code_syntax(self, text: str) -> str:
         """
         Enhance code syntax for better speech rendering.
@@ -113,32 +359,7 @@ class SpeechProcessor:
         Returns:
             Text with enhanced code syntax
         """
-        # Replace common code syntax elements
-        replacements = {
-            # Variable declarations
-            r"\bvar\b": "variable",
-            r"\blet\b": "let",
-            r"\bconst\b": "constant",
-            # Operators
-            r"===": "strictly equals",
-            r"!==": "strictly not equals",
-            r"==": "equals",
-            r"!=": "not equals",
-            r"<=": "less than or equal to",
-            r">=": "greater than or equal to",
-            r"->": "arrow",
-            r"=>": "fat arrow",
-            # Common syntax
-            r"\bfunction\b": "function",
-            r"\breturn\b": "return",
-            r"\bif\b": "if",
-            r"\belse\b": "else",
-            r"\bfor\b": "for",
-            r"\bwhile\b": "while",
-        }
-
-        # Apply replacements
-        for pattern, replacement in replacements.items():
+        for pattern, replacement in self.CODE_SYNTAX_REPLACEMENTS.items():
             text = re.sub(pattern, replacement, text)
 
         return text
@@ -153,28 +374,9 @@ class SpeechProcessor:
         Returns:
             Text with enhanced equations
         """
-        # Replace common equation syntax
-        replacements = {
-            # Basic operators
-            r"\*\*": " to the power of ",
-            r"\*": " times ",
-            r"/": " divided by ",
-            r"\+": " plus ",
-            r"-": " minus ",
-            # Functions
-            r"\bsin\b": "sine",
-            r"\bcos\b": "cosine",
-            r"\btan\b": "tangent",
-            r"\blog\b": "logarithm",
-            r"\bln\b": "natural logarithm",
-            r"\bexp\b": "exponential",
-            r"\bsqrt\b": "square root",
-            r"\blim\b": "limit",
-        }
-
         # Apply replacements only within equation contexts
         # This is a simplified approach - a more complex implementation would parse equations
-        for pattern, replacement in replacements.items():
+        for pattern, replacement in self.EQUATION_REPLACEMENTS.items():
             text = re.sub(pattern, replacement, text)
 
         return text
@@ -190,34 +392,31 @@ class SpeechProcessor:
             Text with enhanced scientific notation
         """
         # Enhance chemical formulas (H2O -> "H 2 O")
-        text = re.sub(r"([A-Z][a-z]?)(\d+)", r"\1 \2", text)
+        text = re.sub(self.CHEMICAL_FORMULA_PATTERN, r"\1 \2", text)
 
         # Enhance scientific units
-        replacements = {
-            # SI units
-            r"m/s": "meters per second",
-            r"km/h": "kilometers per hour",
-            r"kg/m³": "kilograms per cubic meter",
-            r"mol/L": "moles per liter",
-            # Common units
-            r"°C": "degrees Celsius",
-            r"°F": "degrees Fahrenheit",
-            r"K\b": "Kelvin",
-        }
-
-        # Apply replacements
-        for pattern, replacement in replacements.items():
+        for pattern, replacement in self.SCIENTIFIC_UNIT_REPLACEMENTS.items():
             text = re.sub(pattern, replacement, text)
 
         return text
 
-    def split_into_chunks(self, text: str, max_chunk_size: int = 4000) -> List[str]:
+    def split_into_chunks(
+        self, text: str, max_chunk_size: int = 4000, content_defined: bool = False
+    ) -> List[str]:
         """
         Split text into smaller chunks for processing.
 
+        Whole paragraphs are packed into chunks of up to max_chunk_size
+        characters. With content_defined, a chunk also ends after any paragraph
+        whose content hash marks it as a boundary. Boundaries thus depend on the
+        text around them rather than on its position, so editing one paragraph
+        changes its own chunk and leaves later chunks, and their cached audio,
+        as they were. Chunks too short to synthesize are merged into a neighbour.
+
         Args:
             text: The text to split
             max_chunk_size: Maximum characters per chunk
+            content_defined: Whether to also cut chunks at content-defined boundaries
 
         Returns:
             List of text chunks
@@ -226,19 +425,21 @@ class SpeechProcessor:
         if len(text) <= max_chunk_size:
             return [text]
 
-        # Split by paragraphs first
+        # Split by paragraphs first, keeping each paragraph's trailing break
+        parts = re.split(r"(\n\s*\n)", text)
         chunks = []
-        paragraphs = re.split(r"(\n\s*\n)", text)
-
         current_chunk = ""
 
-        for i, paragraph in enumerate(paragraphs):
+        for paragraph, separator in zip(parts[0::2], parts[1::2] + [""]):
+            unit = paragraph + separator
             # If adding this paragraph would exceed the chunk size and we already have content
-            if len(current_chunk) + len(paragraph) > max_chunk_size and current_chunk:
+            if len(current_chunk) + len(unit) > max_chunk_size and current_chunk:
                 chunks.append(current_chunk)
-                current_chunk = paragraph
-            else:
-                current_chunk += paragraph
+                current_chunk = ""
+            current_chunk += unit
+            if content_defined and self._is_chunk_boundary(paragraph):
+                chunks.append(current_chunk)
+                current_chunk = ""
 
         # Add the last chunk if it has content
         if current_chunk:
@@ -253,7 +454,59 @@ class SpeechProcessor:
             else:
                 final_chunks.append(chunk)
 
-        return final_chunks
+        return self._merge_short_chunks(final_chunks, max_chunk_size)
+
+    def _merge_short_chunks(self, chunks: List[str], max_chunk_size: int) -> List[str]:
+        """
+        Merge chunks too short to synthesize into their neighbours.
+
+        A short chunk is appended to the one before it when that stays within
+        max_chunk_size, and otherwise carried forward onto the start of the
+        next chunk, so no text is dropped as invalid and no chunk grows past
+        the limit. A short chunk with no room on either side stays on its own.
+
+        Args:
+            chunks: Text chunks in order
+            max_chunk_size: Maximum characters per chunk
+
+        Returns:
+            List of text chunks, each valid unless the text around it leaves no room
+        """
+        merged: List[str] = []
+        pending = ""
+        for chunk in chunks:
+            if pending:
+                carried = self._join_chunks(pending, chunk)
+                if len(carried) <= max_chunk_size:
+                    chunk = carried
+                else:
+                    merged.append(pending)
+                pending = ""
+
+            if self.is_valid_chunk(chunk):
+                merged.append(chunk)
+            elif merged and len(self._join_chunks(merged[-1], chunk)) <= max_chunk_size:
+                merged[-1] = self._join_chunks(merged[-1], chunk)
+            else:
+                pending = chunk
+
+        if pending:
+            merged.append(pending)
+        return merged
+
+    @staticmethod
+    def _join_chunks(previous: str, chunk: str) -> str:
+        """Join two chunks, adding a space unless the first ends in whitespace."""
+        separator = "" if not previous or previous[-1].isspace() else " "
+        return previous + separator + chunk
+
+    @classmethod
+    def _is_chunk_boundary(cls, paragraph: str) -> bool:
+        """Whether a chunk ends after this paragraph, judged by its content alone."""
+        if not paragraph.strip():
+            return False
+        digest = hashlib.sha1(paragraph.strip().encode("utf-8")).digest()
+        return digest[0] % cls.CHUNK_BOUNDARY_DIVISOR == 0
 
     def _split_by_sentences(self, text: str, max_chunk_size: int) -> List[str]:
         """
@@ -312,3 +565,114 @@ class SpeechProcessor:
             return False
 
         return True
+
+
+class StreamingChunker:
+    """
+    Cut streamed text into speakable chunks as paragraphs complete.
+
+    Chunks are packed as by SpeechProcessor.split_into_chunks, without its
+    content-defined boundaries: whole paragraphs are packed into chunks of up to
+    max_chunk_size characters, and a paragraph too long for one chunk is split by
+    sentences. A chunk is released once the next complete
+    paragraph no longer fits, so text can be synthesized while the rest is still
+    being generated. The first chunk is released as soon as its paragraphs reach
+    first_chunk_size, to start audio sooner. A paragraph too short to synthesize
+    on its own always joins the chunk before it, so it is never released alone.
+    """
+
+    PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+    def __init__(
+        self,
+        speech_processor: SpeechProcessor,
+        max_chunk_size: int = 4000,
+        first_chunk_size: Optional[int] = None,
+    ):
+        """
+        Initialize the chunker.
+
+        Args:
+            speech_processor: Speech processor used to split oversized paragraphs
+            max_chunk_size: Maximum characters per chunk
+            first_chunk_size: Characters after which the first chunk is released
+                (defaults to max_chunk_size)
+        """
+        self.speech_processor = speech_processor
+        self.max_chunk_size = max_chunk_size
+        self.first_chunk_size = min(first_chunk_size or max_chunk_size, max_chunk_size)
+        self._partial = ""  # text of the paragraph still being streamed
+        self._chunk = ""  # complete paragraphs not yet released
+        self._released = 0
+
+    def feed(self, text: str) -> List[str]:
+        """
+        Add streamed text and return the chunks it completes.
+
+        Args:
+            text: The next piece of streamed text
+
+        Returns:
+            List of chunks that are ready, possibly empty
+        """
+        self._partial += text
+        last_break = None
+        for last_break in self.PARAGRAPH_BREAK.finditer(self._partial):
+            pass
+        if last_break is None:
+            return []
+
+        complete = self._partial[: last_break.end()]
+        self._partial = self._partial[last_break.end() :]
+        chunks = []
+        for paragraph in self.PARAGRAPH_BREAK.split(complete):
+            chunks.extend(self._add_paragraph(paragraph))
+        return chunks
+
+    def flush(self) -> List[str]:
+        """
+        Return the remaining text as chunks once the stream has ended.
+
+        Returns:
+            List of the remaining chunks, possibly empty
+        """
+        chunks = self._add_paragraph(self._partial)
+        self._partial = ""
+        if self._chunk.strip():
+            chunks.extend(self._release(final=True))
+        self._chunk = ""
+        return chunks
+
+    def _add_paragraph(self, paragraph: str) -> List[str]:
+        """Pack a complete paragraph, returning any chunks it pushes out."""
+        if not paragraph.strip():
+            return []
+        chunks = []
+        if (
+            self._chunk
+            and len(self._chunk) + len(paragraph) + 2 > self.max_chunk_size
+            and self.speech_processor.is_valid_chunk(paragraph)
+        ):
+            chunks.extend(self._release())
+        self._chunk = f"{self._chunk}\n\n{paragraph}" if self._chunk else paragraph
+        if self._released == 0 and len(self._chunk) >= self.first_chunk_size:
+            chunks.extend(self._release())
+        return chunks
+
+    def _release(self, final: bool = False) -> List[str]:
+        """
+        Release the packed paragraphs, splitting them by sentences if too long.
+
+        Until the stream ends, packed text too short to synthesize is held back
+        to be released with the next paragraphs.
+        """
+        if not final and not self.speech_processor.is_valid_chunk(self._chunk):
+            return []
+        chunk, self._chunk = self._chunk, ""
+        self._released += 1
+        if len(chunk) > self.max_chunk_size:
+            return self.speech_processor._merge_short_chunks(
+                self.speech_processor._split_by_sentences(chunk, self.max_chunk_size),
+                self.max_chunk_size,
+            )
+        return [chunk]
@@ -7,6 +7,8 @@ A simplified CLI providing access to core system functionality.
 
 import asyncio
 import os
+import signal
+import sys
 import traceback
 
 import click
@@ -18,7 +20,11 @@ from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeEl
 from rich.prompt import Confirm
 from rich.table import Table
 
+from artificial_u.config import get_settings
 from artificial_u.config.defaults import DEPARTMENTS
+from artificial_u.content.log_writer import iter_content_logs
+from artificial_u.content.usage import summarize_logs
+from artificial_u.jobs import JobWorker, build_handlers
 from artificial_u.system import UniversitySystem
 
 # Load environment variables
@@ -412,5 +418,228 @@ def show_lecture(course_code, week, number):
         console.print(f"[red]Error displaying lecture:[/red] {str(e)}")
 
 
+async def _run_lecture_batch(lecture_service, course_id, attributes, concurrency):
+    """Run a course lecture batch, showing its progress."""
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[bold blue]{task.description}"),
+        BarColumn(),
+        TextColumn("{task.completed}/{task.total}"),
+        TimeElapsedColumn(),
+        console=console,
+    ) as progress:
+        task = progress.add_task("Scheduling lectures...", total=None)
+        async for message in lecture_service.generate_course_lectures(
+            course_id, partial_attributes=attributes, concurrency=concurrency
+        ):
+            event, data = message["event"], message["data"]
+            if event == "progress" and data["stage"] == "scheduled":
+                progress.update(task, total=data["total"])
+                if data["skipped"]:
+                    console.print(f"Skipping {data['skipped']} topics that already have lectures")
+            elif event == "progress":
+                progress.update(task, description=f"Week {data['week']}")
+            elif event == "lecture":
+                progress.advance(task)
+                console.print(
+                    f"[green]✓[/green] Week {data['week']}.{data['order']}: {data['title']} "
+                    f"(lecture {data['lecture_id']})"
+                )
+            elif event == "error":
+                progress.advance(task)
+                console.print(
+                    f"[red]✗[/red] Week {data['week']}.{data['order']}: {data['title']} "
+                    f"- {data['detail']}"
+                )
+            elif event == "complete":
+                return data
+
+
+async def _run_lecture_with_audio(audio_service, attributes):
+    """Generate a lecture with its audio, showing when text and audio arrive."""
+    first_audio = None
+    chunks = 0
+    lecture = None
+    with console.status("Loading course context...") as status:
+        async for message in audio_service.generate_lecture_with_audio(attributes):
+            event, data = message["event"], message["data"]
+            if event == "progress":
+                status.update(f"Lecture {data['stage'].replace('_', ' ')}...")
+            elif event == "audio":
+                chunks += 1
+                if first_audio is None:
+                    first_audio = data["elapsed"]
+                    console.print(f"First audio after [bold]{first_audio:.1f}s[/bold]")
+                status.update(f"Synthesized {chunks} audio chunks...")
+            elif event == "lecture":
+                lecture = data
+        status.update("Updating course summary...")
+        await audio_service.wait_for_background_tasks()
+    return lecture
+
+
+@cli.command()
+@click.option("--course-id", "-c", required=True, type=int, help="Course ID")
+@click.option(
+    "--concurrency",
+    "-j",
+    type=int,
+    help="Lectures generated at the same time (defaults to LECTURE_BATCH_CONCURRENCY)",
+)
+@click.option("--word-count", "-w", type=int, help="Approximate words per lecture")
+@click.option("--prompt", "-p", help="Additional guidance for every lecture")
+def generate_course_lectures(course_id, concurrency, word_count, prompt):
+    """Generate and save every missing lecture of a course."""
+    try:
+        system = get_system()
+        attributes = {}
+        if word_count:
+            attributes["word_count"] = word_count
+        if prompt:
+            attributes["freeform_prompt"] = prompt
+
+        console.print(Panel(f"Generating lectures for course [bold]{course_id}[/bold]"))
+        result = asyncio.run(
+            _run_lecture_batch(system.lecture_service, course_id, attributes, concurrency)
+        )
+        console.print(
+            f"[green]Generated {result['generated']} lectures[/green] "
+            f"({result['failed']} failed, {result['skipped']} already generated)"
+        )
+        if result["failed"]:
+            console.print("[dim]Run the command again to retry the failed lectures.[/dim]")
+
+    except Exception as e:
+        console.print(f"[red]Error generating lectures:[/red] {str(e)}")
+
+
+@cli.command()
+@click.option("--course-id", "-c", required=True, type=int, help="Course ID")
+@click.option("--topic-id", "-t", required=True, type=int, help="Topic ID")
+@click.option("--word-count", "-w", type=int, help="Approximate words in the lecture")
+@click.option("--prompt", "-p", help="Additional guidance for the lecture")
+def generate_lecture_audio(course_id, topic_id, word_count, prompt):
+    """Generate and save a lecture, synthesizing its audio while the text is written."""
+    try:
+        system = get_system()
+        attributes = {"course_id": course_id, "topic_id": topic_id}
+        if word_count:
+            attributes["word_count"] = word_count
+        if prompt:
+            attributes["freeform_prompt"] = prompt
+
+        console.print(Panel(f"Generating lecture for topic [bold]{topic_id}[/bold] with audio"))
+        lecture = asyncio.run(_run_lecture_with_audio(system.audio_service, attributes))
+        console.print(f"[green]Saved lecture {lecture['id']}[/green] with audio at:")
+        console.print(lecture["audio_url"])
+
+    except Exception as e:
+        console.print(f"[red]Error generating lecture:[/red] {str(e)}")
+
+
+@cli.command()
+@click.option("--logs-path", help="Content logs directory (defaults to CONTENT_LOGS_PATH)")
+@click.option("--purpose", help="Only include calls for this purpose (e.g. 'lecture')")
+@click.option("--limit", "-l", default=20, help="Maximum number of rows to show")
+def usage_report(logs_path, purpose, limit):
+    """Report token usage, latency and estimated cost from the content logs."""
+    try:
+        settings = get_settings()
+        records = iter_content_logs(logs_path or settings.CONTENT_LOGS_PATH)
+        if purpose:
+            records = (r for r in records if r.get("metadata", {}).get("purpose") == purpose)
+        summary = summarize_logs(records, settings.CONTENT_MODEL_PRICES)
+
+        if not summary["groups"]:
+            console.print("[yellow]No logged generation calls found.[/yellow]")
+            return
+
+        table = Table(
+            "Purpose",
+            "Model",
+            "Calls",
+            "Input tokens",
+            "Cached",
+            "Output tokens",
+            "p95 latency",
+            "Cost",
+        )
+        for group in summary["groups"][:limit]:
+            p95 = group["p95_latency"]
+            table.add_row(
+                group["purpose"],
+                group["model"],
+                str(group["calls"]),
+                f"{group['input_tokens']:,}",
+                f"{group['prompt_cache_hit_rate']:.0%}",
+                f"{group['output_tokens']:,}",
+                f"{p95:.1f}s" if p95 is not None else "-",
+                f"${group['cost']:.4f}" + ("*" if group["unpriced_calls"] else ""),
+            )
+
+        totals = summary["totals"]
+        console.print(Panel("Content Generation Usage", subtitle="Artificial University"))
+        console.print(table)
+        console.print(
+            f"Total: {totals['calls']} calls, {totals['input_tokens']:,} input / "
+            f"{totals['output_tokens']:,} output tokens, ~${totals['cost']:.2f}"
+        )
+        console.print(
+            "[dim]* includes unpriced models. Logs may be sampled "
+            "(CONTENT_LOG_SAMPLE_RATE).[/dim]"
+        )
+
+    except Exception as e:
+        console.print(f"[red]Error building usage report:[/red] {str(e)}")
+
+
+async def _run_worker(job_worker, burst):
+    """Run a job worker until interrupted, finishing its running jobs first."""
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, job_worker.stop)
+    return await job_worker.run(burst=burst)
+
+
+@cli.command()
+@click.option(
+    "--concurrency",
+    "-j",
+    type=int,
+    help="Jobs run at the same time (defaults to JOB_WORKER_CONCURRENCY)",
+)
+@click.option(
+    "--kind", "-k", "kinds", multiple=True, help="Only run jobs of this kind (repeatable)"
+)
+@click.option("--burst", is_flag=True, help="Exit once no job is due")
+def worker(concurrency, kinds, burst):
+    """Run queued background jobs. Start one per process or node to scale out."""
+    try:
+        settings = get_settings()
+        system = get_system()
+        job_worker = JobWorker(
+            system.repository_factory.job,
+            build_handlers(system),
+            concurrency=concurrency or settings.JOB_WORKER_CONCURRENCY,
+            kinds=list(kinds) or None,
+            poll_interval=settings.JOB_POLL_INTERVAL,
+            lease_seconds=settings.JOB_LEASE_SECONDS,
+            retry_backoff=settings.JOB_RETRY_BACKOFF,
+            max_retry_backoff=settings.JOB_MAX_RETRY_BACKOFF,
+        )
+
+        console.print(Panel(f"Worker [bold]{job_worker.worker_id}[/bold] waiting for jobs"))
+        stats = asyncio.run(_run_worker(job_worker, burst))
+        console.print(
+            f"[green]{stats['succeeded']} jobs succeeded[/green] "
+            f"({stats['retried']} retried, {stats['failed']} failed)"
+        )
+
+    except Exception as e:
+        console.print(f"[red]Error running worker:[/red] {str(e)}")
+        # Exit non-zero so a supervisor restarts the worker
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     cli()
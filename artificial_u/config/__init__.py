@@ -5,8 +5,48 @@ Configuration modules for the ArtificialU system.
 # Re-export defaults for direct import from artificial_u.config
 from artificial_u.config.defaults import (
     DEFAULT_CONTENT_BACKEND,
+    DEFAULT_CONTENT_CACHE_ENABLED,
+    DEFAULT_CONTENT_CACHE_MAX_BYTES,
+    DEFAULT_CONTENT_CACHE_MEMORY_ENTRIES,
+    DEFAULT_CONTENT_CACHE_PATH,
+    DEFAULT_CONTENT_CACHE_TTL,
+    DEFAULT_CONTENT_CIRCUIT_FAILURES,
+    DEFAULT_CONTENT_CIRCUIT_RESET,
+    DEFAULT_CONTENT_FALLBACK_MODELS,
+    DEFAULT_CONTENT_HEDGE_AFTER,
+    DEFAULT_CONTENT_LOG_QUEUE_SIZE,
+    DEFAULT_CONTENT_LOG_SAMPLE_RATE,
+    DEFAULT_CONTENT_LOG_SEGMENT_MAX_BYTES,
     DEFAULT_CONTENT_LOGS_PATH,
+    DEFAULT_CONTENT_MAX_CONTINUATIONS,
+    DEFAULT_CONTENT_MAX_TOKENS,
+    DEFAULT_CONTENT_MODEL_PRICES,
+    DEFAULT_CONTENT_RATE_LIMIT_BACKOFF,
+    DEFAULT_CONTENT_RATE_LIMIT_MAX_BACKOFF,
+    DEFAULT_CONTENT_RATE_LIMIT_RETRIES,
+    DEFAULT_CONTENT_RATE_LIMITS,
+    DEFAULT_CONTENT_REPLAY_LATENCY,
+    DEFAULT_CONTENT_REPLAY_PATH,
+    DEFAULT_CONTENT_REPLAY_TOKENS_PER_SECOND,
+    DEFAULT_CONTENT_ROUTE_BY_LATENCY,
+    DEFAULT_CONTENT_TOKEN_BUDGETS,
+    DEFAULT_COURSE_SUMMARY_WORDS,
+    DEFAULT_DB_MAX_OVERFLOW,
+    DEFAULT_DB_POOL_PRE_PING,
+    DEFAULT_DB_POOL_RECYCLE,
+    DEFAULT_DB_POOL_SIZE,
+    DEFAULT_DB_POOL_TIMEOUT,
+    DEFAULT_DB_STATEMENT_TIMEOUT_MS,
     DEFAULT_DB_URL,
+    DEFAULT_HLS_SEGMENT_DURATION,
+    DEFAULT_JOB_LEASE_SECONDS,
+    DEFAULT_JOB_MAX_ATTEMPTS,
+    DEFAULT_JOB_MAX_RETRY_BACKOFF,
+    DEFAULT_JOB_POLL_INTERVAL,
+    DEFAULT_JOB_RETRY_BACKOFF,
+    DEFAULT_JOB_WORKER_CONCURRENCY,
+    DEFAULT_LECTURE_BATCH_CONCURRENCY,
+    DEFAULT_LECTURE_PROMPT_TOKEN_BUDGET,
     DEFAULT_LECTURE_WORD_COUNT,
     DEFAULT_LOG_LEVEL,
     DEFAULT_OLLAMA_MODEL,
@@ -15,11 +55,18 @@ from artificial_u.config.defaults import (
     DEFAULT_STORAGE_ENDPOINT_URL,
     DEFAULT_STORAGE_IMAGES_BUCKET,
     DEFAULT_STORAGE_LECTURES_BUCKET,
+    DEFAULT_STORAGE_MULTIPART_PART_SIZE,
     DEFAULT_STORAGE_PUBLIC_URL,
     DEFAULT_STORAGE_REGION,
     DEFAULT_STORAGE_SECRET_KEY,
     DEFAULT_STORAGE_TYPE,
     DEFAULT_TEMP_AUDIO_PATH,
+    DEFAULT_TTS_CACHE_ENABLED,
+    DEFAULT_TTS_CACHE_MAX_BYTES,
+    DEFAULT_TTS_CACHE_PATH,
+    DEFAULT_TTS_CHUNK_RETRIES,
+    DEFAULT_TTS_MAX_CONCURRENCY,
+    DEFAULT_TTS_RETRY_BACKOFF,
     DEPARTMENTS,
 )
 
@@ -39,6 +86,12 @@ __all__ = [
     "Environment",
     # Default paths and storage
     "DEFAULT_DB_URL",
+    "DEFAULT_DB_POOL_SIZE",
+    "DEFAULT_DB_MAX_OVERFLOW",
+    "DEFAULT_DB_POOL_TIMEOUT",
+    "DEFAULT_DB_POOL_RECYCLE",
+    "DEFAULT_DB_POOL_PRE_PING",
+    "DEFAULT_DB_STATEMENT_TIMEOUT_MS",
     "DEFAULT_TEMP_AUDIO_PATH",
     "DEFAULT_CONTENT_LOGS_PATH",
     "DEFAULT_STORAGE_TYPE",
@@ -50,11 +103,63 @@ __all__ = [
     "DEFAULT_STORAGE_AUDIO_BUCKET",
     "DEFAULT_STORAGE_LECTURES_BUCKET",
     "DEFAULT_STORAGE_IMAGES_BUCKET",
+    "DEFAULT_STORAGE_MULTIPART_PART_SIZE",
     # Content generation defaults
     "DEFAULT_CONTENT_BACKEND",
     "DEFAULT_OLLAMA_MODEL",
     # Course and lecture defaults
     "DEFAULT_LECTURE_WORD_COUNT",
+    # Text-to-speech synthesis defaults
+    "DEFAULT_TTS_MAX_CONCURRENCY",
+    "DEFAULT_TTS_CHUNK_RETRIES",
+    "DEFAULT_TTS_RETRY_BACKOFF",
+    "DEFAULT_TTS_CACHE_ENABLED",
+    "DEFAULT_TTS_CACHE_PATH",
+    "DEFAULT_TTS_CACHE_MAX_BYTES",
+    "DEFAULT_HLS_SEGMENT_DURATION",
+    # Content response cache defaults
+    "DEFAULT_CONTENT_CACHE_ENABLED",
+    "DEFAULT_CONTENT_CACHE_PATH",
+    "DEFAULT_CONTENT_CACHE_TTL",
+    "DEFAULT_CONTENT_CACHE_MEMORY_ENTRIES",
+    "DEFAULT_CONTENT_CACHE_MAX_BYTES",
+    # Content generation admission control defaults
+    "DEFAULT_CONTENT_RATE_LIMITS",
+    "DEFAULT_CONTENT_RATE_LIMIT_RETRIES",
+    "DEFAULT_CONTENT_RATE_LIMIT_BACKOFF",
+    "DEFAULT_CONTENT_RATE_LIMIT_MAX_BACKOFF",
+    # Content log writer defaults
+    "DEFAULT_CONTENT_LOG_SAMPLE_RATE",
+    "DEFAULT_CONTENT_LOG_SEGMENT_MAX_BYTES",
+    "DEFAULT_CONTENT_LOG_QUEUE_SIZE",
+    # Replay backend defaults
+    "DEFAULT_CONTENT_REPLAY_PATH",
+    "DEFAULT_CONTENT_REPLAY_LATENCY",
+    "DEFAULT_CONTENT_REPLAY_TOKENS_PER_SECOND",
+    # Content model routing defaults
+    "DEFAULT_CONTENT_FALLBACK_MODELS",
+    "DEFAULT_CONTENT_CIRCUIT_FAILURES",
+    "DEFAULT_CONTENT_CIRCUIT_RESET",
+    "DEFAULT_CONTENT_ROUTE_BY_LATENCY",
+    "DEFAULT_CONTENT_HEDGE_AFTER",
+    # Content usage accounting defaults
+    "DEFAULT_CONTENT_MODEL_PRICES",
+    # Content continuation defaults
+    "DEFAULT_CONTENT_MAX_TOKENS",
+    "DEFAULT_CONTENT_TOKEN_BUDGETS",
+    "DEFAULT_CONTENT_MAX_CONTINUATIONS",
+    # Lecture batch generation defaults
+    "DEFAULT_LECTURE_BATCH_CONCURRENCY",
+    # Lecture prompt context defaults
+    "DEFAULT_LECTURE_PROMPT_TOKEN_BUDGET",
+    "DEFAULT_COURSE_SUMMARY_WORDS",
+    # Background job defaults
+    "DEFAULT_JOB_MAX_ATTEMPTS",
+    "DEFAULT_JOB_RETRY_BACKOFF",
+    "DEFAULT_JOB_MAX_RETRY_BACKOFF",
+    "DEFAULT_JOB_LEASE_SECONDS",
+    "DEFAULT_JOB_POLL_INTERVAL",
+    "DEFAULT_JOB_WORKER_CONCURRENCY",
     # System defaults
     "DEFAULT_LOG_LEVEL",
     "DEPARTMENTS",
@@ -17,8 +17,48 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from artificial_u.config.defaults import (
     DEFAULT_CONTENT_BACKEND,
+    DEFAULT_CONTENT_CACHE_ENABLED,
+    DEFAULT_CONTENT_CACHE_MAX_BYTES,
+    DEFAULT_CONTENT_CACHE_MEMORY_ENTRIES,
+    DEFAULT_CONTENT_CACHE_PATH,
+    DEFAULT_CONTENT_CACHE_TTL,
+    DEFAULT_CONTENT_CIRCUIT_FAILURES,
+    DEFAULT_CONTENT_CIRCUIT_RESET,
+    DEFAULT_CONTENT_FALLBACK_MODELS,
+    DEFAULT_CONTENT_HEDGE_AFTER,
+    DEFAULT_CONTENT_LOG_QUEUE_SIZE,
+    DEFAULT_CONTENT_LOG_SAMPLE_RATE,
+    DEFAULT_CONTENT_LOG_SEGMENT_MAX_BYTES,
     DEFAULT_CONTENT_LOGS_PATH,
+    DEFAULT_CONTENT_MAX_CONTINUATIONS,
+    DEFAULT_CONTENT_MAX_TOKENS,
+    DEFAULT_CONTENT_MODEL_PRICES,
+    DEFAULT_CONTENT_RATE_LIMIT_BACKOFF,
+    DEFAULT_CONTENT_RATE_LIMIT_MAX_BACKOFF,
+    DEFAULT_CONTENT_RATE_LIMIT_RETRIES,
+    DEFAULT_CONTENT_RATE_LIMITS,
+    DEFAULT_CONTENT_REPLAY_LATENCY,
+    DEFAULT_CONTENT_REPLAY_PATH,
+    DEFAULT_CONTENT_REPLAY_TOKENS_PER_SECOND,
+    DEFAULT_CONTENT_ROUTE_BY_LATENCY,
+    DEFAULT_CONTENT_TOKEN_BUDGETS,
+    DEFAULT_COURSE_SUMMARY_WORDS,
+    DEFAULT_DB_MAX_OVERFLOW,
+    DEFAULT_DB_POOL_PRE_PING,
+    DEFAULT_DB_POOL_RECYCLE,
+    DEFAULT_DB_POOL_SIZE,
+    DEFAULT_DB_POOL_TIMEOUT,
+    DEFAULT_DB_STATEMENT_TIMEOUT_MS,
     DEFAULT_DB_URL,
+    DEFAULT_HLS_SEGMENT_DURATION,
+    DEFAULT_JOB_LEASE_SECONDS,
+    DEFAULT_JOB_MAX_ATTEMPTS,
+    DEFAULT_JOB_MAX_RETRY_BACKOFF,
+    DEFAULT_JOB_POLL_INTERVAL,
+    DEFAULT_JOB_RETRY_BACKOFF,
+    DEFAULT_JOB_WORKER_CONCURRENCY,
+    DEFAULT_LECTURE_BATCH_CONCURRENCY,
+    DEFAULT_LECTURE_PROMPT_TOKEN_BUDGET,
     DEFAULT_LOG_LEVEL,
     DEFAULT_OLLAMA_MODEL,
     DEFAULT_STORAGE_ACCESS_KEY,
@@ -26,11 +66,18 @@ from artificial_u.config.defaults import (
     DEFAULT_STORAGE_ENDPOINT_URL,
     DEFAULT_STORAGE_IMAGES_BUCKET,
     DEFAULT_STORAGE_LECTURES_BUCKET,
+    DEFAULT_STORAGE_MULTIPART_PART_SIZE,
     DEFAULT_STORAGE_PUBLIC_URL,
     DEFAULT_STORAGE_REGION,
     DEFAULT_STORAGE_SECRET_KEY,
     DEFAULT_STORAGE_TYPE,
     DEFAULT_TEMP_AUDIO_PATH,
+    DEFAULT_TTS_CACHE_ENABLED,
+    DEFAULT_TTS_CACHE_MAX_BYTES,
+    DEFAULT_TTS_CACHE_PATH,
+    DEFAULT_TTS_CHUNK_RETRIES,
+    DEFAULT_TTS_MAX_CONCURRENCY,
+    DEFAULT_TTS_RETRY_BACKOFF,
 )
 
 
@@ -71,6 +118,14 @@ class Settings(BaseSettings):
     # Database settings
     DATABASE_URL: str = DEFAULT_DB_URL
 
+    # Database connection pool settings (shared by all repositories in a process)
+    DB_POOL_SIZE: int = DEFAULT_DB_POOL_SIZE
+    DB_MAX_OVERFLOW: int = DEFAULT_DB_MAX_OVERFLOW
+    DB_POOL_TIMEOUT: int = DEFAULT_DB_POOL_TIMEOUT
+    DB_POOL_RECYCLE: int = DEFAULT_DB_POOL_RECYCLE
+    DB_POOL_PRE_PING: bool = DEFAULT_DB_POOL_PRE_PING
+    DB_STATEMENT_TIMEOUT_MS: int = DEFAULT_DB_STATEMENT_TIMEOUT_MS
+
     # Logging settings
     LOG_LEVEL: str = DEFAULT_LOG_LEVEL
 
@@ -96,11 +151,65 @@ class Settings(BaseSettings):
     STORAGE_AUDIO_BUCKET: str = DEFAULT_STORAGE_AUDIO_BUCKET
     STORAGE_LECTURES_BUCKET: str = DEFAULT_STORAGE_LECTURES_BUCKET
     STORAGE_IMAGES_BUCKET: str = DEFAULT_STORAGE_IMAGES_BUCKET
+    STORAGE_MULTIPART_PART_SIZE: int = DEFAULT_STORAGE_MULTIPART_PART_SIZE
 
     # Content generation settings
     content_backend: str = DEFAULT_CONTENT_BACKEND
     content_model: Optional[str] = None
 
+    # Opt-in cache of generated text responses
+    CONTENT_CACHE_ENABLED: bool = DEFAULT_CONTENT_CACHE_ENABLED
+    CONTENT_CACHE_PATH: str = DEFAULT_CONTENT_CACHE_PATH
+    CONTENT_CACHE_TTL: int = DEFAULT_CONTENT_CACHE_TTL
+    CONTENT_CACHE_MEMORY_ENTRIES: int = DEFAULT_CONTENT_CACHE_MEMORY_ENTRIES
+    CONTENT_CACHE_MAX_BYTES: int = DEFAULT_CONTENT_CACHE_MAX_BYTES
+
+    # Per-backend/per-model admission control (keys are backend or model names)
+    CONTENT_RATE_LIMITS: Dict[str, Dict[str, float]] = DEFAULT_CONTENT_RATE_LIMITS
+    CONTENT_RATE_LIMIT_RETRIES: int = DEFAULT_CONTENT_RATE_LIMIT_RETRIES
+    CONTENT_RATE_LIMIT_BACKOFF: float = DEFAULT_CONTENT_RATE_LIMIT_BACKOFF
+    CONTENT_RATE_LIMIT_MAX_BACKOFF: float = DEFAULT_CONTENT_RATE_LIMIT_MAX_BACKOFF
+
+    # Background content log writer (logs go to CONTENT_LOGS_PATH)
+    CONTENT_LOG_SAMPLE_RATE: float = DEFAULT_CONTENT_LOG_SAMPLE_RATE
+    CONTENT_LOG_SEGMENT_MAX_BYTES: int = DEFAULT_CONTENT_LOG_SEGMENT_MAX_BYTES
+    CONTENT_LOG_QUEUE_SIZE: int = DEFAULT_CONTENT_LOG_QUEUE_SIZE
+
+    # Replay backend (content_backend=replay) serving recorded content logs
+    CONTENT_REPLAY_PATH: Optional[str] = DEFAULT_CONTENT_REPLAY_PATH
+    CONTENT_REPLAY_LATENCY: float = DEFAULT_CONTENT_REPLAY_LATENCY
+    CONTENT_REPLAY_TOKENS_PER_SECOND: float = DEFAULT_CONTENT_REPLAY_TOKENS_PER_SECOND
+
+    # Failover, circuit breaking and hedging across equivalent models
+    CONTENT_FALLBACK_MODELS: Dict[str, List[str]] = DEFAULT_CONTENT_FALLBACK_MODELS
+    CONTENT_CIRCUIT_FAILURES: int = DEFAULT_CONTENT_CIRCUIT_FAILURES
+    CONTENT_CIRCUIT_RESET: float = DEFAULT_CONTENT_CIRCUIT_RESET
+    CONTENT_ROUTE_BY_LATENCY: bool = DEFAULT_CONTENT_ROUTE_BY_LATENCY
+    CONTENT_HEDGE_AFTER: float = DEFAULT_CONTENT_HEDGE_AFTER
+
+    # USD per million [input, output, cache read, cache write] tokens by model name prefix
+    CONTENT_MODEL_PRICES: Dict[str, List[float]] = DEFAULT_CONTENT_MODEL_PRICES
+
+    # Per-purpose output limits and continuation of responses truncated at max_tokens
+    CONTENT_MAX_TOKENS: Dict[str, int] = DEFAULT_CONTENT_MAX_TOKENS
+    CONTENT_TOKEN_BUDGETS: Dict[str, int] = DEFAULT_CONTENT_TOKEN_BUDGETS
+    CONTENT_MAX_CONTINUATIONS: int = DEFAULT_CONTENT_MAX_CONTINUATIONS
+
+    # Lectures of a course generated concurrently by a batch
+    LECTURE_BATCH_CONCURRENCY: int = DEFAULT_LECTURE_BATCH_CONCURRENCY
+
+    # Lecture prompt size and the rolling course summary that replaces older lectures
+    LECTURE_PROMPT_TOKEN_BUDGET: int = DEFAULT_LECTURE_PROMPT_TOKEN_BUDGET
+    COURSE_SUMMARY_WORDS: int = DEFAULT_COURSE_SUMMARY_WORDS
+
+    # Background job queue and workers
+    JOB_MAX_ATTEMPTS: int = DEFAULT_JOB_MAX_ATTEMPTS
+    JOB_RETRY_BACKOFF: float = DEFAULT_JOB_RETRY_BACKOFF
+    JOB_MAX_RETRY_BACKOFF: float = DEFAULT_JOB_MAX_RETRY_BACKOFF
+    JOB_LEASE_SECONDS: float = DEFAULT_JOB_LEASE_SECONDS
+    JOB_POLL_INTERVAL: float = DEFAULT_JOB_POLL_INTERVAL
+    JOB_WORKER_CONCURRENCY: int = DEFAULT_JOB_WORKER_CONCURRENCY
+
     # Integration service endpoints
     OLLAMA_HOST: str = "http://localhost:11434"
 
@@ -114,9 +223,22 @@ class Settings(BaseSettings):
     PROFESSOR_GENERATION_MODEL: str = "gpt-4.1-nano"
     # Topics generation model
     TOPICS_GENERATION_MODEL: str = "gemini-2.5-flash-preview-04-17"
+    # Rolling course summary model
+    COURSE_SUMMARY_MODEL: str = "gpt-4.1-nano"
     # Image generation model
     IMAGE_GENERATION_MODEL: str = "gpt-image-1"
 
+    # Text-to-speech synthesis settings
+    TTS_MAX_CONCURRENCY: int = DEFAULT_TTS_MAX_CONCURRENCY
+    TTS_CHUNK_RETRIES: int = DEFAULT_TTS_CHUNK_RETRIES
+    TTS_RETRY_BACKOFF: float = DEFAULT_TTS_RETRY_BACKOFF
+    # Content-addressed cache of synthesized chunks
+    TTS_CACHE_ENABLED: bool = DEFAULT_TTS_CACHE_ENABLED
+    TTS_CACHE_PATH: str = DEFAULT_TTS_CACHE_PATH
+    TTS_CACHE_MAX_BYTES: int = DEFAULT_TTS_CACHE_MAX_BYTES
+    # HLS packaging of lecture audio
+    HLS_SEGMENT_DURATION: float = DEFAULT_HLS_SEGMENT_DURATION
+
     # Configure Pydantic to use .env files
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -192,6 +314,12 @@ class Settings(BaseSettings):
         return {
             "environment": self.environment,
             "db_url": self.DATABASE_URL,
+            "db_pool_size": self.DB_POOL_SIZE,
+            "db_max_overflow": self.DB_MAX_OVERFLOW,
+            "db_pool_timeout": self.DB_POOL_TIMEOUT,
+            "db_pool_recycle": self.DB_POOL_RECYCLE,
+            "db_pool_pre_ping": self.DB_POOL_PRE_PING,
+            "db_statement_timeout_ms": self.DB_STATEMENT_TIMEOUT_MS,
             "content_backend": self.content_backend,
             "content_model": self.content_model,
             "temp_audio_path": self.TEMP_AUDIO_PATH,
@@ -202,6 +330,46 @@ class Settings(BaseSettings):
             "openai_api_key": self.OPENAI_API_KEY,
             "speech_key": self.SPEECH_KEY,
             "speech_region": self.SPEECH_REGION,
+            "tts_max_concurrency": self.TTS_MAX_CONCURRENCY,
+            "tts_chunk_retries": self.TTS_CHUNK_RETRIES,
+            "tts_retry_backoff": self.TTS_RETRY_BACKOFF,
+            "tts_cache_enabled": self.TTS_CACHE_ENABLED,
+            "tts_cache_path": self.TTS_CACHE_PATH,
+            "tts_cache_max_bytes": self.TTS_CACHE_MAX_BYTES,
+            "hls_segment_duration": self.HLS_SEGMENT_DURATION,
+            "content_cache_enabled": self.CONTENT_CACHE_ENABLED,
+            "content_cache_path": self.CONTENT_CACHE_PATH,
+            "content_cache_ttl": self.CONTENT_CACHE_TTL,
+            "content_cache_memory_entries": self.CONTENT_CACHE_MEMORY_ENTRIES,
+            "content_cache_max_bytes": self.CONTENT_CACHE_MAX_BYTES,
+            "content_rate_limits": self.CONTENT_RATE_LIMITS,
+            "content_rate_limit_retries": self.CONTENT_RATE_LIMIT_RETRIES,
+            "content_rate_limit_backoff": self.CONTENT_RATE_LIMIT_BACKOFF,
+            "content_rate_limit_max_backoff": self.CONTENT_RATE_LIMIT_MAX_BACKOFF,
+            "content_log_sample_rate": self.CONTENT_LOG_SAMPLE_RATE,
+            "content_log_segment_max_bytes": self.CONTENT_LOG_SEGMENT_MAX_BYTES,
+            "content_log_queue_size": self.CONTENT_LOG_QUEUE_SIZE,
+            "content_replay_path": self.CONTENT_REPLAY_PATH,
+            "content_replay_latency": self.CONTENT_REPLAY_LATENCY,
+            "content_replay_tokens_per_second": self.CONTENT_REPLAY_TOKENS_PER_SECOND,
+            "content_fallback_models": self.CONTENT_FALLBACK_MODELS,
+            "content_circuit_failures": self.CONTENT_CIRCUIT_FAILURES,
+            "content_circuit_reset": self.CONTENT_CIRCUIT_RESET,
+            "content_route_by_latency": self.CONTENT_ROUTE_BY_LATENCY,
+            "content_hedge_after": self.CONTENT_HEDGE_AFTER,
+            "content_model_prices": self.CONTENT_MODEL_PRICES,
+            "content_max_tokens": self.CONTENT_MAX_TOKENS,
+            "content_token_budgets": self.CONTENT_TOKEN_BUDGETS,
+            "content_max_continuations": self.CONTENT_MAX_CONTINUATIONS,
+            "lecture_batch_concurrency": self.LECTURE_BATCH_CONCURRENCY,
+            "lecture_prompt_token_budget": self.LECTURE_PROMPT_TOKEN_BUDGET,
+            "course_summary_words": self.COURSE_SUMMARY_WORDS,
+            "job_max_attempts": self.JOB_MAX_ATTEMPTS,
+            "job_retry_backoff": self.JOB_RETRY_BACKOFF,
+            "job_max_retry_backoff": self.JOB_MAX_RETRY_BACKOFF,
+            "job_lease_seconds": self.JOB_LEASE_SECONDS,
+            "job_poll_interval": self.JOB_POLL_INTERVAL,
+            "job_worker_concurrency": self.JOB_WORKER_CONCURRENCY,
             "storage_type": self.STORAGE_TYPE,
             "storage_endpoint_url": self.STORAGE_ENDPOINT_URL,
             "storage_public_url": self.STORAGE_PUBLIC_URL,
@@ -209,6 +377,7 @@ class Settings(BaseSettings):
             "storage_audio_bucket": self.STORAGE_AUDIO_BUCKET,
             "storage_lectures_bucket": self.STORAGE_LECTURES_BUCKET,
             "storage_images_bucket": self.STORAGE_IMAGES_BUCKET,
+            "storage_multipart_part_size": self.STORAGE_MULTIPART_PART_SIZE,
         }
 
     def log_configuration(self) -> None:
@@ -216,6 +385,10 @@ class Settings(BaseSettings):
         logger = logging.getLogger("artificial_u")
         logger.info(f"Environment: {self.environment}")
         logger.info(f"Using database: {self.DATABASE_URL}")
+        logger.info(
+            f"Database pool: size={self.DB_POOL_SIZE}, max_overflow={self.DB_MAX_OVERFLOW}, "
+            f"recycle={self.DB_POOL_RECYCLE}s, pre_ping={self.DB_POOL_PRE_PING}"
+        )
         logger.info(f"Content backend: {self.content_backend}")
         if self.content_model:
             logger.info(f"Content model: {self.content_model}")
@@ -0,0 +1 @@
+# Content generation support
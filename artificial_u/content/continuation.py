@@ -0,0 +1,227 @@
+"""
+Continuation of responses truncated at their output token limit.
+
+A response that stops because it reached max_tokens (rather than finishing) is
+resumed by asking the same model to continue from the partial output, and the
+pieces are stitched together, dropping any text the model repeated. Each
+generation purpose can have its own per-call output limit and a budget of
+output tokens spent across the first call and its continuations.
+"""
+
+import logging
+from typing import Any, AsyncIterator, Dict, Optional
+
+# Stop reasons reported when output hit the token limit, by backend
+TRUNCATION_STOP_REASONS = {
+    "anthropic": {"max_tokens"},
+    "openai": {"length"},
+    "gemini": {"MAX_TOKENS"},
+    "ollama": {"length"},
+}
+
+# Shortest repeated text that is treated as overlap when stitching
+MIN_OVERLAP = 16
+# Longest repeated text searched for when stitching (and held back when streaming)
+MAX_OVERLAP = 500
+
+CONTINUATION_INSTRUCTIONS = """
+
+<partial_response>
+{partial}
+</partial_response>
+
+Your response to the request above was cut off by the output length limit; the text \
+generated so far is in <partial_response>. Continue the response exactly where it stops, \
+mid-word or mid-tag if necessary. Do not repeat any of it, do not restart, and do not add \
+any commentary before continuing."""
+
+
+def is_truncated(backend: str, stop_reason: Optional[str]) -> bool:
+    """
+    Check whether a response stopped at its output token limit.
+
+    Args:
+        backend: Backend that produced the response
+        stop_reason: Stop reason reported by the backend
+
+    Returns:
+        bool: True if the response was cut off
+    """
+    return stop_reason in TRUNCATION_STOP_REASONS.get(backend, ())
+
+
+def continuation_prompt(prompt: str, partial: str) -> str:
+    """
+    Build the prompt asking a model to continue a truncated response.
+
+    The original prompt comes first, so it stays a cacheable prompt prefix.
+
+    Args:
+        prompt: The original prompt
+        partial: The response generated so far
+
+    Returns:
+        str: The continuation prompt
+    """
+    return prompt + CONTINUATION_INSTRUCTIONS.format(partial=partial)
+
+
+def overlap(partial: str, continuation: str) -> int:
+    """
+    Find how much of a continuation repeats the end of the partial response.
+
+    Args:
+        partial: The response generated so far
+        continuation: Text generated to continue it
+
+    Returns:
+        int: Number of leading characters of the continuation to drop
+    """
+    longest = min(len(partial), len(continuation), MAX_OVERLAP)
+    for size in range(longest, MIN_OVERLAP - 1, -1):
+        if partial.endswith(continuation[:size]):
+            return size
+    return 0
+
+
+def stitch(partial: str, continuation: str) -> str:
+    """
+    Join a partial response and its continuation, dropping repeated text.
+
+    Args:
+        partial: The response generated so far
+        continuation: Text generated to continue it
+
+    Returns:
+        str: The combined response
+    """
+    return partial + continuation[overlap(partial, continuation) :]
+
+
+async def trim_overlap(stream: AsyncIterator[Any], partial: str) -> AsyncIterator[Any]:
+    """
+    Drop the text a streamed continuation repeats from the partial response.
+
+    The first MAX_OVERLAP characters are held back until the overlap is known;
+    items that are not text are passed through unchanged.
+
+    Args:
+        stream: Stream of text deltas (and other items) continuing the response
+        partial: The response generated so far
+
+    Yields:
+        The stream's items with the repeated text removed
+    """
+    held: Optional[str] = ""
+    async for item in stream:
+        if held is None:
+            yield item
+            continue
+        if isinstance(item, str):
+            held += item
+            if len(held) < MAX_OVERLAP:
+                continue
+        trimmed, held = held[overlap(partial, held) :], None
+        if trimmed:
+            yield trimmed
+        if not isinstance(item, str):
+            yield item
+    if held and held[overlap(partial, held) :]:
+        yield held[overlap(partial, held) :]
+
+
+class ContinuationPolicy:
+    """Per-purpose output limits and budgets for continuing truncated responses."""
+
+    def __init__(
+        self,
+        max_tokens: Optional[Dict[str, int]] = None,
+        budgets: Optional[Dict[str, int]] = None,
+        max_continuations: int = 3,
+        default_max_tokens: int = 1024,
+        logger=None,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            max_tokens: Output token limit per call, keyed by generation purpose
+            budgets: Output tokens a purpose may spend on a response and its
+                continuations; purposes without one are limited by max_continuations
+            max_continuations: Follow-up calls allowed per response (0 disables)
+            default_max_tokens: Output token limit for purposes without one
+            logger: Optional logger instance
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.max_tokens = max_tokens or {}
+        self.budgets = budgets or {}
+        self.max_continuations = max_continuations
+        self.default_max_tokens = default_max_tokens
+
+        self.truncated = 0
+        self.continuations = 0
+        self.completed = 0
+        self.exhausted = 0
+
+    def call_max_tokens(self, purpose: Optional[str], max_tokens: Optional[int]) -> int:
+        """
+        Get the output token limit for a call.
+
+        Args:
+            purpose: Generation purpose, or None
+            max_tokens: Limit requested by the caller, if any
+
+        Returns:
+            int: The caller's limit, else the purpose's, else the default
+        """
+        if max_tokens is not None:
+            return max_tokens
+        return self.max_tokens.get(purpose or "", self.default_max_tokens)
+
+    def next_max_tokens(
+        self, purpose: Optional[str], call_max_tokens: int, used: int, continuations: int
+    ) -> Optional[int]:
+        """
+        Decide whether a truncated response may be continued.
+
+        Args:
+            purpose: Generation purpose, or None
+            call_max_tokens: Output token limit per call
+            used: Output tokens generated for the response so far
+            continuations: Continuations already made for the response
+
+        Returns:
+            Output token limit for the next continuation, or None to stop
+        """
+        if continuations == 0:
+            self.truncated += 1
+        budget = self.budgets.get(purpose) if purpose else None
+        remaining = call_max_tokens if budget is None else min(call_max_tokens, budget - used)
+        if continuations >= self.max_continuations or remaining <= 0:
+            self.exhausted += 1
+            self.logger.warning(
+                f"Response for {purpose or 'generation'} still truncated after "
+                f"{continuations} continuations and {used} output tokens; returning it as is"
+            )
+            return None
+        self.continuations += 1
+        return remaining
+
+    def record_completed(self) -> None:
+        """Count a truncated response that continuation finished."""
+        self.completed += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get continuation metrics.
+
+        Returns:
+            Dictionary of truncated, continued, completed and exhausted counts
+        """
+        return {
+            "truncated": self.truncated,
+            "continuations": self.continuations,
+            "completed": self.completed,
+            "budget_exhausted": self.exhausted,
+            "max_continuations": self.max_continuations,
+        }
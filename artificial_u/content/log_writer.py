@@ -0,0 +1,297 @@
+"""
+Background writer for content generation logs.
+
+Records are queued by the caller and written by a dedicated thread, which
+appends them in batches to gzip-compressed JSONL segments. Segments rotate at a
+size limit; each finished segment is described (time range, record count,
+backends and models) by a line in a small index.jsonl next to them. When the
+queue is full new records are dropped rather than slowing generation down.
+"""
+
+import atexit
+import glob
+import gzip
+import json
+import logging
+import os
+import queue
+import random
+import threading
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class ContentLogWriter:
+    """Queue-backed writer of rotating, compressed JSONL content logs."""
+
+    SEGMENT_PREFIX = "content-"
+    SEGMENT_SUFFIX = ".jsonl.gz"
+    INDEX_FILENAME = "index.jsonl"
+    BATCH_SIZE = 256
+
+    def __init__(
+        self,
+        log_dir: str,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+        sample_rate: float = 1.0,
+        max_queue: int = 1000,
+        flush_interval: float = 1.0,
+        logger=None,
+    ):
+        """
+        Initialize the writer. The writer thread starts on the first record.
+
+        Args:
+            log_dir: Directory holding log segments and the index
+            segment_max_bytes: Compressed size at which a new segment is started
+            sample_rate: Fraction of records to keep (0 disables logging)
+            max_queue: Records buffered before new ones are dropped
+            flush_interval: Seconds the writer waits to fill a batch
+            logger: Optional logger instance
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.log_dir = log_dir
+        self.segment_max_bytes = segment_max_bytes
+        self.sample_rate = sample_rate
+        self.flush_interval = flush_interval
+
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._segment: Optional[str] = None
+        self._segment_info: Dict[str, Any] = {}
+        self.segments = 0
+
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.sampled_out = 0
+        self.errors = 0
+
+    def write(self, record: Dict[str, Any]) -> bool:
+        """
+        Queue a record for writing without blocking.
+
+        Args:
+            record: JSON-serializable log record
+
+        Returns:
+            bool: True if the record was queued, False if sampled out or dropped
+        """
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            self.sampled_out += 1
+            return False
+
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                self.logger.warning(f"Content log queue full; dropped {self.dropped} records")
+            return False
+        self.enqueued += 1
+        return True
+
+    def flush(self) -> None:
+        """Block until every queued record has been written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Write outstanding records and stop the writer thread.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish
+        """
+        with self._start_lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join(timeout)
+        self._finish_segment()
+
+    def _ensure_started(self) -> None:
+        """Start the writer thread if it is not running."""
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                os.makedirs(self.log_dir, exist_ok=True)
+                self._thread = threading.Thread(
+                    target=self._run, name="content-log-writer", daemon=True
+                )
+                self._thread.start()
+                # Write whatever is still queued when the process exits
+                atexit.register(self.close)
+
+    def _run(self) -> None:
+        """Writer thread: collect batches from the queue and append them."""
+        stopping = False
+        while not stopping:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            items = [first] + self._drain(self.BATCH_SIZE - 1)
+            stopping = None in items
+            batch = [item for item in items if item is not None]
+            if batch:
+                self._write_batch(batch)
+            for _ in items:
+                self._queue.task_done()
+
+    def _drain(self, limit: int) -> List[Optional[Dict[str, Any]]]:
+        """Take up to limit queued items without waiting."""
+        items: List[Optional[Dict[str, Any]]] = []
+        while len(items) < limit:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Append a batch as one gzip member and update the index."""
+        lines = "".join(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n" for record in batch
+        )
+        try:
+            path = self._current_segment()
+            # Each batch is a separate gzip member; readers see one continuous stream
+            with open(path, "ab") as f:
+                f.write(gzip.compress(lines.encode("utf-8")))
+            self._record_batch(path, batch)
+            self.written += len(batch)
+        except OSError as e:
+            self.errors += 1
+            self.logger.error(f"Failed to write {len(batch)} content log records: {e}")
+
+    def _current_segment(self) -> str:
+        """Get the segment to append to, starting a new one past the size limit."""
+        if self._segment and os.path.exists(self._segment):
+            if os.path.getsize(self._segment) < self.segment_max_bytes:
+                return self._segment
+        self._finish_segment()
+
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        self._segment = os.path.join(
+            self.log_dir, f"{self.SEGMENT_PREFIX}{stamp}{self.SEGMENT_SUFFIX}"
+        )
+        self._segment_info = {
+            "segment": os.path.basename(self._segment),
+            "records": 0,
+            "first_timestamp": None,
+            "last_timestamp": None,
+            "backends": [],
+            "models": [],
+        }
+        self.segments += 1
+        return self._segment
+
+    def _record_batch(self, path: str, batch: List[Dict[str, Any]]) -> None:
+        """Add a written batch to the current segment's index entry."""
+        info = self._segment_info
+        for record in batch:
+            metadata = record.get("metadata", {})
+            timestamp = metadata.get("timestamp")
+            info["first_timestamp"] = info["first_timestamp"] or timestamp
+            info["last_timestamp"] = timestamp or info["last_timestamp"]
+            for field, key in (("backends", "backend"), ("models", "model")):
+                value = metadata.get(key)
+                if value and value not in info[field]:
+                    info[field].append(value)
+        info["records"] += len(batch)
+        info["bytes"] = os.path.getsize(path)
+
+    def _finish_segment(self) -> None:
+        """Append the finished segment's entry to the index."""
+        if not self._segment_info.get("records"):
+            return
+        line = json.dumps(self._segment_info, ensure_ascii=False, separators=(",", ":"))
+        try:
+            # A single short append, so concurrent writers don't interleave entries
+            with open(os.path.join(self.log_dir, self.INDEX_FILENAME), "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError as e:
+            self.logger.error(f"Failed to update content log index: {e}")
+        self._segment_info = {}
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get writer metrics.
+
+        Returns:
+            Dictionary of queued, written, dropped and sampled-out counts
+        """
+        return {
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+            "errors": self.errors,
+            "queue_depth": self._queue.qsize(),
+            "segments": self.segments,
+            "sample_rate": self.sample_rate,
+        }
+
+
+def iter_content_logs(log_dir: str) -> Iterator[Dict[str, Any]]:
+    """
+    Read every content log record in a directory, oldest segment first.
+
+    Reads both compressed JSONL segments and the per-call JSON files written by
+    earlier versions.
+
+    Args:
+        log_dir: Content logs directory
+
+    Yields:
+        Dict[str, Any]: Log records with "metadata" and "content" sections
+    """
+    pattern = f"{ContentLogWriter.SEGMENT_PREFIX}*{ContentLogWriter.SEGMENT_SUFFIX}"
+    for path in sorted(glob.glob(os.path.join(log_dir, pattern))):
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+        except (OSError, EOFError, ValueError) as e:
+            logging.getLogger(__name__).warning(f"Skipping unreadable log segment {path}: {e}")
+
+    for path in sorted(glob.glob(os.path.join(log_dir, "*.json"))):
+        try:
+            with open(path, encoding="utf-8") as f:
+                yield json.load(f)
+        except (OSError, ValueError) as e:
+            logging.getLogger(__name__).warning(f"Skipping unreadable log file {path}: {e}")
+
+
+@lru_cache
+def get_content_log_writer(
+    log_dir: str,
+    segment_max_bytes: int = 64 * 1024 * 1024,
+    sample_rate: float = 1.0,
+    max_queue: int = 1000,
+) -> ContentLogWriter:
+    """
+    Get the process-wide writer for a log directory, so services share one thread.
+
+    Args:
+        log_dir: Directory holding log segments and the index
+        segment_max_bytes: Compressed size at which a new segment is started
+        sample_rate: Fraction of records to keep
+        max_queue: Records buffered before new ones are dropped
+
+    Returns:
+        ContentLogWriter instance
+    """
+    return ContentLogWriter(
+        log_dir,
+        segment_max_bytes=segment_max_bytes,
+        sample_rate=sample_rate,
+        max_queue=max_queue,
+    )
@@ -0,0 +1,364 @@
+"""
+Admission control for LLM backends.
+
+Each configured backend or model gets a limiter combining a concurrency cap,
+a requests-per-minute bucket and a tokens-per-minute bucket. When a provider
+throttles a request, the limiter pauses new admissions for the Retry-After
+period (or an exponentially growing backoff) and the request is retried.
+"""
+
+import asyncio
+import email.utils
+import logging
+import random
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+# HTTP statuses providers use for rate limiting and overload (529 is Anthropic's)
+THROTTLE_STATUS_CODES = {429, 503, 529}
+
+
+@dataclass
+class RateLimit:
+    """Limits for one backend or model; None means unlimited."""
+
+    concurrency: Optional[int] = None
+    rpm: Optional[float] = None
+    tpm: Optional[float] = None
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate."""
+
+    def __init__(self, per_minute: float):
+        """
+        Initialize a full bucket.
+
+        Args:
+            per_minute: Refill rate, which is also the bucket capacity
+        """
+        self.capacity = float(per_minute)
+        self.tokens = self.capacity
+        self._rate = self.capacity / 60.0
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """
+        Take tokens from the bucket, waiting in FIFO order until they are available.
+
+        Args:
+            amount: Tokens to take; clamped to the bucket capacity
+        """
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self.tokens < amount:
+                await asyncio.sleep((amount - self.tokens) / self._rate)
+                self._refill()
+            self.tokens -= amount
+
+
+class Limiter:
+    """Admission state and metrics for one backend or model."""
+
+    def __init__(self, name: str, limit: RateLimit):
+        """
+        Initialize the limiter.
+
+        Args:
+            name: Backend or model name the limits apply to
+            limit: Concurrency, request and token limits
+        """
+        self.name = name
+        self.limit = limit
+        self._semaphore = asyncio.Semaphore(int(limit.concurrency)) if limit.concurrency else None
+        self._requests = TokenBucket(limit.rpm) if limit.rpm else None
+        self._tokens = TokenBucket(limit.tpm) if limit.tpm else None
+        self.blocked_until = 0.0
+        self.consecutive_throttles = 0
+
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.in_flight = 0
+        self.admitted = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @asynccontextmanager
+    async def admit(self, tokens: float) -> AsyncIterator[None]:
+        """
+        Hold a slot for one request, waiting for backoff, concurrency and rate limits.
+
+        Args:
+            tokens: Estimated tokens the request will consume
+        """
+        started = time.monotonic()
+        self.queue_depth += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        acquired = False
+        try:
+            if self._semaphore:
+                await self._semaphore.acquire()
+                acquired = True
+            # Re-check after sleeping, since another request may have been throttled
+            while self.blocked_until > time.monotonic():
+                await asyncio.sleep(self.blocked_until - time.monotonic())
+            if self._requests:
+                await self._requests.acquire(1)
+            if self._tokens:
+                await self._tokens.acquire(tokens)
+        except BaseException:
+            if acquired:
+                self._semaphore.release()
+            raise
+        finally:
+            self.queue_depth -= 1
+
+        waited = time.monotonic() - started
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        self.admitted += 1
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            if self._semaphore:
+                self._semaphore.release()
+
+    def throttle(self, delay: float) -> None:
+        """
+        Pause admissions after the provider rejected a request.
+
+        Args:
+            delay: Seconds to wait before admitting further requests
+        """
+        self.throttled += 1
+        self.consecutive_throttles += 1
+        self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+
+    def succeeded(self) -> None:
+        """Reset the adaptive backoff after a request goes through."""
+        self.consecutive_throttles = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get limiter metrics.
+
+        Returns:
+            Dictionary of queue depth, wait times, throttling counts and limits
+        """
+        return {
+            "concurrency": self.limit.concurrency,
+            "rpm": self.limit.rpm,
+            "tpm": self.limit.tpm,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "in_flight": self.in_flight,
+            "admitted": self.admitted,
+            "throttled": self.throttled,
+            "avg_wait": self.total_wait / self.admitted if self.admitted else 0.0,
+            "max_wait": self.max_wait,
+            "backoff_remaining": max(0.0, self.blocked_until - time.monotonic()),
+        }
+
+
+def retry_after(error: Exception) -> Optional[float]:
+    """
+    Read the provider's requested delay from a rate limit error.
+
+    Args:
+        error: Exception raised by a provider client
+
+    Returns:
+        Seconds to wait, or None if the error carries no Retry-After header
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000.0
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        parsed = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, parsed.timestamp() - time.time())
+
+
+def is_throttle_error(error: Exception) -> bool:
+    """
+    Check whether an exception is a provider rate limit or overload response.
+
+    Args:
+        error: Exception raised by a provider client
+
+    Returns:
+        True if the request should be retried after backing off
+    """
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    return status in THROTTLE_STATUS_CODES
+
+
+class AdmissionController:
+    """Applies backend and model limits to generation requests and retries throttling."""
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Dict[str, float]]] = None,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        logger=None,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            limits: Limits keyed by backend name (e.g. "anthropic") or model name,
+                each a dict with optional "concurrency", "rpm" and "tpm" entries
+            max_retries: Retries for a throttled request before giving up
+            backoff: Base seconds to back off when no Retry-After is given,
+                doubled for each consecutive throttle
+            max_backoff: Upper bound on the backoff delay
+            logger: Optional logger instance
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._limiters: Dict[str, Limiter] = {
+            name: Limiter(name, RateLimit(**limit)) for name, limit in (limits or {}).items()
+        }
+
+    def _limiters_for(self, backend: str, model: str) -> List[Limiter]:
+        """Get the limiters that apply to a request, backend first."""
+        # Every backend gets a limiter, even unlimited, so throttling backoff applies
+        if backend not in self._limiters:
+            self._limiters[backend] = Limiter(backend, RateLimit())
+        limiters = [self._limiters[backend]]
+        if model != backend and model in self._limiters:
+            limiters.append(self._limiters[model])
+        return limiters
+
+    def _backoff_delay(self, error: Exception, limiters: List[Limiter]) -> float:
+        """Pick the delay after a throttle: Retry-After if given, else jittered exponential."""
+        delay = retry_after(error)
+        if delay is not None:
+            return min(delay, self.max_backoff)
+        streak = max((limiter.consecutive_throttles for limiter in limiters), default=0)
+        delay = min(self.backoff * (2**streak), self.max_backoff)
+        return delay * random.uniform(0.5, 1.0)
+
+    @asynccontextmanager
+    async def admit(self, backend: str, model: str, tokens: float) -> AsyncIterator[List[Limiter]]:
+        """
+        Hold admission for one request under every applicable limiter.
+
+        Args:
+            backend: Backend the request goes to
+            model: Model the request uses
+            tokens: Estimated tokens the request will consume
+
+        Yields:
+            The limiters holding the request
+        """
+        limiters = self._limiters_for(backend, model)
+        async with AsyncExitStack() as stack:
+            for limiter in limiters:
+                await stack.enter_async_context(limiter.admit(tokens))
+            yield limiters
+
+    def record_throttle(self, error: Exception, limiters: List[Limiter]) -> float:
+        """
+        Back off the given limiters after a throttled request.
+
+        Args:
+            error: The provider's rate limit error
+            limiters: Limiters the request was admitted under
+
+        Returns:
+            Seconds until the next attempt may be admitted
+        """
+        delay = self._backoff_delay(error, limiters)
+        for limiter in limiters:
+            limiter.throttle(delay)
+        return delay
+
+    def record_success(self, limiters: List[Limiter]) -> None:
+        """
+        Reset the adaptive backoff of the given limiters after a request succeeds.
+
+        Args:
+            limiters: Limiters the request was admitted under
+        """
+        for limiter in limiters:
+            limiter.succeeded()
+
+    async def call(
+        self,
+        backend: str,
+        model: str,
+        tokens: float,
+        fn: Callable[[], Awaitable[T]],
+    ) -> T:
+        """
+        Run fn under admission control, retrying when the provider throttles it.
+
+        Args:
+            backend: Backend the request goes to
+            model: Model the request uses
+            tokens: Estimated tokens the request will consume
+            fn: Zero-argument coroutine function making the request
+
+        Returns:
+            The result of fn
+        """
+        for attempt in range(self.max_retries + 1):
+            async with self.admit(backend, model, tokens) as limiters:
+                try:
+                    result = await fn()
+                except Exception as e:
+                    if not is_throttle_error(e) or attempt == self.max_retries:
+                        raise
+                    delay = self.record_throttle(e, limiters)
+                    self.logger.warning(
+                        f"{backend}/{model} throttled ({e}); retrying in {delay:.1f}s "
+                        f"(attempt {attempt + 1}/{self.max_retries})"
+                    )
+                    continue
+            self.record_success(limiters)
+            return result
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get metrics for every configured limiter.
+
+        Returns:
+            Limiter statistics keyed by backend or model name
+        """
+        return {name: limiter.stats() for name, limiter in self._limiters.items()}
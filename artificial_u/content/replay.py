@@ -0,0 +1,219 @@
+"""
+Replay backend serving responses from recorded content logs.
+
+Requests are answered from the logs ContentService writes: a logged call with the
+same model, system prompt and prompt if there is one, otherwise the logged
+response for the same model whose prompt shares the most words with the request
+(falling back to every model when the requested one was never recorded). Latency
+and output token rate are simulated, so generation pipelines can be benchmarked
+offline, deterministically and without paying for model calls.
+"""
+
+import asyncio
+import logging
+import re
+from typing import Any, AsyncIterator, Dict, FrozenSet, List, Optional, Tuple
+
+from artificial_u.content.log_writer import iter_content_logs
+from artificial_u.content.usage import estimate_tokens
+from artificial_u.utils import ContentGenerationError
+
+WORD_PATTERN = re.compile(r"\w+")
+# Deltas are words with their trailing whitespace, roughly the size of a token
+DELTA_PATTERN = re.compile(r"\s*\S+\s*|\s+")
+
+
+def _words(*texts: str) -> FrozenSet[str]:
+    """Get the lowercased words of the given texts."""
+    return frozenset(word for text in texts for word in WORD_PATTERN.findall(text.lower()))
+
+
+def _similarity(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two word sets."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class ReplayRecord:
+    """A recorded request and its response."""
+
+    __slots__ = ("model", "system_prompt", "prompt", "response", "words")
+
+    def __init__(self, model: str, system_prompt: Optional[str], prompt: str, response: str):
+        self.model = model
+        self.system_prompt = system_prompt or ""
+        self.prompt = prompt
+        self.response = response
+        self.words: FrozenSet[str] = _words(self.system_prompt, prompt)
+
+
+class ReplayBackend:
+    """Serves recorded responses with simulated latency and token rate."""
+
+    def __init__(
+        self,
+        log_dir: str,
+        latency: float = 0.0,
+        tokens_per_second: float = 0.0,
+        logger=None,
+    ):
+        """
+        Initialize the backend. Logs are loaded in a worker thread on the first request.
+
+        Args:
+            log_dir: Directory of recorded content logs
+            latency: Seconds to wait before the first token
+            tokens_per_second: Simulated output rate (0 returns the response at once)
+            logger: Optional logger instance
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.log_dir = log_dir
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+
+        self._records: Optional[List[ReplayRecord]] = None
+        # (model, system prompt, prompt) -> most recently logged record
+        self._exact: Dict[Tuple[str, str, str], ReplayRecord] = {}
+        self._by_model: Dict[str, List[ReplayRecord]] = {}
+        self._load_lock = asyncio.Lock()
+
+        self.exact_matches = 0
+        self.model_matches = 0
+        self.fallback_matches = 0
+
+    def load(self) -> int:
+        """
+        (Re)load the recorded logs.
+
+        Returns:
+            int: Number of usable records
+        """
+        records = []
+        for entry in iter_content_logs(self.log_dir):
+            metadata = entry.get("metadata", {})
+            content = entry.get("content", {})
+            if not content.get("response") or content.get("prompt") is None:
+                continue
+            records.append(
+                ReplayRecord(
+                    metadata.get("model", ""),
+                    content.get("system_prompt"),
+                    content["prompt"],
+                    content["response"],
+                )
+            )
+
+        self._exact = {(r.model, r.system_prompt, r.prompt): r for r in records}
+        self._by_model = {}
+        for record in records:
+            self._by_model.setdefault(record.model, []).append(record)
+        self._records = records
+        self.logger.info(f"Loaded {len(records)} recorded responses from {self.log_dir}")
+        return len(records)
+
+    async def _ensure_loaded(self) -> None:
+        """Load the logs off the event loop, once, if they are not loaded yet."""
+        if self._records is not None:
+            return
+        async with self._load_lock:
+            if self._records is None:
+                await asyncio.to_thread(self.load)
+
+    def lookup(self, prompt: str, model: str, system_prompt: Optional[str] = None) -> str:
+        """
+        Find the recorded response for a request.
+
+        Args:
+            prompt: The input prompt
+            model: Requested model name
+            system_prompt: Optional system prompt
+
+        Returns:
+            str: The recorded response
+
+        Raises:
+            ContentGenerationError: If there are no recorded responses
+        """
+        if self._records is None:
+            self.load()
+        if not self._records:
+            raise ContentGenerationError(f"No recorded responses to replay in {self.log_dir}")
+
+        record = self._exact.get((model, system_prompt or "", prompt))
+        if record is not None:
+            self.exact_matches += 1
+            return record.response
+
+        candidates = self._by_model.get(model)
+        if candidates:
+            self.model_matches += 1
+        else:
+            candidates = self._records
+            self.fallback_matches += 1
+
+        words = _words(system_prompt or "", prompt)
+        # max() keeps the first of equally similar records, so lookups are deterministic
+        nearest = max(candidates, key=lambda r: _similarity(words, r.words))
+        return nearest.response
+
+    async def generate(self, prompt: str, model: str, system_prompt: Optional[str] = None) -> str:
+        """
+        Replay the response to a request after the simulated generation time.
+
+        Args:
+            prompt: The input prompt
+            model: Requested model name
+            system_prompt: Optional system prompt
+
+        Returns:
+            str: The recorded response
+        """
+        await self._ensure_loaded()
+        response = self.lookup(prompt, model, system_prompt)
+        delay = self.latency
+        if self.tokens_per_second > 0:
+            delay += estimate_tokens(response) / self.tokens_per_second
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return response
+
+    async def stream(
+        self, prompt: str, model: str, system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Replay the response to a request as paced text deltas.
+
+        Args:
+            prompt: The input prompt
+            model: Requested model name
+            system_prompt: Optional system prompt
+
+        Yields:
+            str: Successive pieces of the recorded response
+        """
+        await self._ensure_loaded()
+        response = self.lookup(prompt, model, system_prompt)
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        for delta in DELTA_PATTERN.findall(response):
+            if self.tokens_per_second > 0:
+                await asyncio.sleep(estimate_tokens(delta) / self.tokens_per_second)
+            yield delta
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get replay metrics.
+
+        Returns:
+            Dictionary of loaded record count and match counts by kind
+        """
+        return {
+            "records": len(self._records) if self._records is not None else None,
+            "models": len(self._by_model),
+            "exact_matches": self.exact_matches,
+            "model_matches": self.model_matches,
+            "fallback_matches": self.fallback_matches,
+            "latency": self.latency,
+            "tokens_per_second": self.tokens_per_second,
+        }
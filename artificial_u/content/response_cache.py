@@ -0,0 +1,245 @@
+"""
+Two-tier cache of generated text responses.
+
+Responses are keyed by a hash of everything that determines the request sent to
+the model (backend, model, system prompt, prompt, temperature and max tokens).
+Recent entries are kept in an in-memory LRU; all entries are persisted to a
+SQLite database so they survive restarts and are shared between processes.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class ResponseCache:
+    """In-memory LRU in front of a size-bounded SQLite response store."""
+
+    DB_FILENAME = "responses.sqlite3"
+
+    def __init__(
+        self,
+        cache_dir: str,
+        ttl: int = 7 * 24 * 60 * 60,
+        memory_entries: int = 256,
+        max_bytes: int = 100 * 1024 * 1024,
+        logger=None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the SQLite database
+            ttl: Seconds an entry stays valid; 0 keeps entries until evicted
+            memory_entries: Number of responses kept in the in-memory tier
+            max_bytes: Total response size above which least recently used
+                entries are evicted from disk
+            logger: Optional logger instance
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.memory_entries = memory_entries
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        # key -> (response, created_at), least recently used first
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._conn = sqlite3.connect(
+            os.path.join(self.cache_dir, self.DB_FILENAME),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_responses_accessed_at ON responses (accessed_at)"
+        )
+        # Running total of the stored response sizes, so writes don't rescan the table.
+        # Entries other processes write later are not counted until the cache is reopened.
+        (self._size_bytes,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+
+    @staticmethod
+    def make_key(
+        backend: str,
+        model: str,
+        system_prompt: Optional[str],
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            backend: Backend name (anthropic, openai, etc.)
+            model: Model name
+            system_prompt: Optional system prompt
+            prompt: The input prompt
+            temperature: Effective sampling temperature
+            max_tokens: Effective maximum tokens to generate
+
+        Returns:
+            Hex SHA-256 digest identifying the request
+        """
+        payload = json.dumps(
+            [backend, model, system_prompt or "", prompt, temperature, max_tokens],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        """Check whether an entry created at created_at has outlived the TTL."""
+        return bool(self.ttl) and now - created_at > self.ttl
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a response, checking memory first and then disk.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached response text, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry and not self._is_expired(entry[1], now):
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return entry[0]
+
+            row = self._conn.execute(
+                "SELECT response, created_at, size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._memory.pop(key, None)
+                self.misses += 1
+                return None
+
+            response, created_at, size = row
+            if self._is_expired(created_at, now):
+                self._memory.pop(key, None)
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._size_bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._remember(key, response, created_at)
+            self.disk_hits += 1
+            return response
+
+    def put(self, key: str, response: str) -> None:
+        """
+        Store a response, evicting least recently used entries if over the size limit.
+
+        Args:
+            key: Cache key from make_key()
+            response: Generated response text
+        """
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        with self._lock:
+            try:
+                replaced = self._conn.execute(
+                    "SELECT size FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, size, created_at, "
+                    "accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, response, size, now, now),
+                )
+                self._size_bytes += size - (replaced[0] if replaced else 0)
+                self._evict()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Failed to cache response {key}: {e}")
+                return
+            self._remember(key, response, now)
+
+    def _remember(self, key: str, response: str, created_at: float) -> None:
+        """Add an entry to the in-memory tier, dropping the least recently used."""
+        self._memory[key] = (response, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self) -> None:
+        """Remove least recently used disk entries until the cache fits max_bytes."""
+        if self._size_bytes <= self.max_bytes:
+            return
+
+        # Read the oldest entries through the index only until enough are found
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at, created_at"
+        )
+        evicted = []
+        for key, size in rows:
+            if self._size_bytes <= self.max_bytes:
+                break
+            evicted.append((key,))
+            self._size_bytes -= size
+            self._memory.pop(key, None)
+        else:
+            # Every entry was read, so the table is now known to be empty
+            self._size_bytes = 0
+        rows.close()
+
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self.evictions += len(evicted)
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._memory.clear()
+            self._conn.execute("DELETE FROM responses")
+            self._size_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache metrics.
+
+        Returns:
+            Dictionary of hit/miss counters per tier, eviction counts and current size
+        """
+        with self._lock:
+            entries, size_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "hits": hits,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "expirations": self.expirations,
+                "evictions": self.evictions,
+                "entries": entries,
+                "memory_entries": len(self._memory),
+                "size_bytes": size_bytes,
+                "max_bytes": self.max_bytes,
+            }
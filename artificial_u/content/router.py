@@ -0,0 +1,347 @@
+"""
+Routing of generation requests across equivalent models.
+
+A generation purpose (lecture, course, topics, ...) may list fallback models,
+possibly on other backends, that can stand in for its primary model. Each model
+has a circuit breaker that opens after consecutive failures, so a failing
+provider is tried last until its reset timeout passes. Optionally, healthy
+candidates are ordered by their observed p95 latency, and a request still
+running after a threshold is hedged by starting the next candidate alongside it.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Latency samples needed before a model's p95 is trusted for routing
+MIN_LATENCY_SAMPLES = 5
+
+
+class CircuitBreaker:
+    """Tracks consecutive failures of one model."""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize a closed breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds an open circuit waits before allowing a trial request
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.failures = 0
+        self.successes = 0
+        self.opened = 0
+
+    @property
+    def state(self) -> str:
+        """Circuit state: "closed", "open" or "half_open" (open, but due a trial)."""
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def available(self) -> bool:
+        """Check whether requests should be sent to the model."""
+        return self.state != "open"
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        self.successes += 1
+        self.consecutive_failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failure, opening (or re-opening after a failed trial) the circuit."""
+        self.failures += 1
+        self.consecutive_failures += 1
+        if self.opened_at is not None or self.consecutive_failures >= self.failure_threshold:
+            if self.state != "open":
+                self.opened += 1
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get breaker metrics.
+
+        Returns:
+            Dictionary of state and success/failure counts
+        """
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failures": self.failures,
+            "successes": self.successes,
+            "opened": self.opened,
+        }
+
+
+class LatencyTracker:
+    """Sliding window of request latencies."""
+
+    def __init__(self, window: int = 100):
+        """
+        Initialize an empty window.
+
+        Args:
+            window: Number of most recent samples kept
+        """
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, latency: float) -> None:
+        """Add a latency sample in seconds."""
+        self.samples.append(latency)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        Get a latency percentile over the window.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Latency in seconds, or None without enough samples
+        """
+        if len(self.samples) < MIN_LATENCY_SAMPLES:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(percent / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+
+class ModelRouter:
+    """Orders candidate models and runs requests with failover and hedging."""
+
+    def __init__(
+        self,
+        fallbacks: Optional[Dict[str, List[str]]] = None,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        latency_window: int = 100,
+        route_by_latency: bool = False,
+        hedge_after: Optional[float] = None,
+        logger=None,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            fallbacks: Fallback models keyed by generation purpose, in preference order
+            failure_threshold: Consecutive failures that open a model's circuit
+            reset_timeout: Seconds before an open circuit is tried again
+            latency_window: Latency samples kept per purpose and model
+            route_by_latency: Order healthy candidates by p95 latency rather than
+                configured preference
+            hedge_after: Seconds after which a still-running request is hedged with
+                the next candidate (None or 0 disables hedging)
+            logger: Optional logger instance
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.fallbacks = fallbacks or {}
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.latency_window = latency_window
+        self.route_by_latency = route_by_latency
+        self.hedge_after = hedge_after or None
+
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._latencies: Dict[Tuple[Optional[str], str], LatencyTracker] = {}
+
+        self.failovers = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def _breaker(self, model: str) -> CircuitBreaker:
+        """Get the circuit breaker for a model."""
+        if model not in self._breakers:
+            self._breakers[model] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+        return self._breakers[model]
+
+    def _latency(self, purpose: Optional[str], model: str) -> LatencyTracker:
+        """Get the latency window for a purpose and model."""
+        key = (purpose, model)
+        if key not in self._latencies:
+            self._latencies[key] = LatencyTracker(self.latency_window)
+        return self._latencies[key]
+
+    def candidates(self, purpose: Optional[str], model: str) -> List[str]:
+        """
+        Get the models that may serve a request, in the order to try them.
+
+        Models with an open circuit are moved to the end rather than dropped, so a
+        request is never refused without an attempt.
+
+        Args:
+            purpose: Generation purpose (e.g. "lecture"), or None
+            model: The requested model
+
+        Returns:
+            Candidate model names, best first
+        """
+        models = [model]
+        for fallback in self.fallbacks.get(purpose, []) if purpose else []:
+            if fallback not in models:
+                models.append(fallback)
+        if len(models) == 1:
+            return models
+
+        healthy = [m for m in models if self._breaker(m).available()]
+        tripped = [m for m in models if m not in healthy]
+        if self.route_by_latency:
+            # Unmeasured models sort first (stable), so they are sampled before being ranked
+            healthy.sort(key=lambda m: self._latency(purpose, m).percentile(95) or 0.0)
+        return healthy + tripped
+
+    def record_success(self, purpose: Optional[str], model: str, latency: float) -> None:
+        """
+        Record a successful request.
+
+        Args:
+            purpose: Generation purpose, or None
+            model: Model that served the request
+            latency: Seconds the request took
+        """
+        self._breaker(model).record_success()
+        self._latency(purpose, model).record(latency)
+
+    def record_failure(self, model: str, error: Exception) -> None:
+        """
+        Record a failed request.
+
+        Args:
+            model: Model that failed
+            error: The raised exception
+        """
+        breaker = self._breaker(model)
+        opened = breaker.opened
+        breaker.record_failure()
+        if breaker.opened > opened:
+            self.logger.warning(
+                f"Circuit opened for model {model} after "
+                f"{breaker.consecutive_failures} failures: {error}"
+            )
+
+    def record_failover(self, model: str, error: Exception, next_model: str) -> None:
+        """
+        Record moving a request on to the next candidate.
+
+        Args:
+            model: Model that failed
+            error: The raised exception
+            next_model: Model tried next
+        """
+        self.failovers += 1
+        self.logger.warning(f"Model {model} failed ({error}); failing over to {next_model}")
+
+    async def call(
+        self,
+        purpose: Optional[str],
+        model: str,
+        fn: Callable[[str], Awaitable[T]],
+    ) -> T:
+        """
+        Run fn against the candidates for a request until one succeeds.
+
+        Candidates are tried in order, moving on when one fails. With hedging
+        enabled, the next candidate is also started whenever the running ones
+        have not finished within hedge_after seconds; the first success wins and
+        the other attempts are cancelled.
+
+        Args:
+            purpose: Generation purpose, or None
+            model: The requested model
+            fn: Coroutine function making the request with a given model
+
+        Returns:
+            The first successful result; raises the last error if every candidate fails
+        """
+        candidates = self.candidates(purpose, model)
+        if len(candidates) == 1:
+            return await self._call_one(purpose, model, fn)
+        return await self._call_many(purpose, candidates, fn)
+
+    async def _call_one(
+        self, purpose: Optional[str], model: str, fn: Callable[[str], Awaitable[T]]
+    ) -> T:
+        """Run fn for a model with no alternatives, recording the outcome."""
+        started = time.monotonic()
+        try:
+            result = await fn(model)
+        except Exception as e:
+            self.record_failure(model, e)
+            raise
+        self.record_success(purpose, model, time.monotonic() - started)
+        return result
+
+    async def _call_many(
+        self, purpose: Optional[str], remaining: List[str], fn: Callable[[str], Awaitable[T]]
+    ) -> T:
+        """Run fn over the candidates with failover and hedging."""
+        pending: Dict["asyncio.Future[T]", Tuple[str, float]] = {}
+        hedged = set()
+        last_error: Optional[Exception] = None
+
+        def launch() -> "asyncio.Future[T]":
+            candidate = remaining.pop(0)
+            task = asyncio.ensure_future(fn(candidate))
+            pending[task] = (candidate, time.monotonic())
+            return task
+
+        launch()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=self.hedge_after if remaining else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    self.hedges += 1
+                    self.logger.info(f"Hedging slow {purpose or 'generation'} request")
+                    hedged.add(launch())
+                    continue
+
+                for task in done:
+                    candidate, started = pending.pop(task)
+                    if task.exception() is None:
+                        self.record_success(purpose, candidate, time.monotonic() - started)
+                        self.hedge_wins += task in hedged
+                        return task.result()
+                    last_error = task.exception()
+                    self.record_failure(candidate, last_error)
+
+                if not pending and remaining:
+                    self.record_failover(candidate, last_error, remaining[0])
+                    launch()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise last_error
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get routing metrics.
+
+        Returns:
+            Dictionary of failover and hedge counts, breaker states per model
+            and p95 latency per purpose and model
+        """
+        return {
+            "failovers": self.failovers,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "breakers": {model: breaker.stats() for model, breaker in self._breakers.items()},
+            "p95_latency": {
+                f"{purpose or 'default'}:{model}": tracker.percentile(95)
+                for (purpose, model), tracker in self._latencies.items()
+            },
+        }
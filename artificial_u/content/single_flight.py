@@ -0,0 +1,97 @@
+"""
+Single-flight coalescing of identical concurrent requests.
+
+The first caller for a key (the leader) starts the work; callers arriving with
+the same key while it is in flight (followers) await the leader's result instead
+of starting their own. The work is cancelled once every caller waiting for it has
+been cancelled, so an abandoned request (e.g. a hedge that lost) stops running.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one execution."""
+
+    def __init__(self, logger=None):
+        """
+        Initialize the coalescer.
+
+        Args:
+            logger: Optional logger instance
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        # (event loop id, key) -> task running the leader's call
+        self._in_flight: Dict[Tuple[int, str], asyncio.Task] = {}
+        # task -> callers still awaiting it
+        self._waiters: Dict[asyncio.Task, int] = {}
+
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn for key, or join an identical call already in flight.
+
+        The call runs as its own task, so one caller being cancelled (for example
+        a disconnected HTTP client) does not cancel it for the others. When the
+        last caller waiting for it is cancelled, the call is cancelled too.
+
+        Args:
+            key: Identifies requests that may share a result
+            fn: Zero-argument coroutine function performing the work
+
+        Returns:
+            The result of fn; raises whatever fn raised
+        """
+        flight_key = (id(asyncio.get_running_loop()), key)
+        self.calls += 1
+
+        task = self._in_flight.get(flight_key)
+        if task is not None:
+            self.coalesced += 1
+            self.logger.debug(f"Joining in-flight request {key[:12]}")
+        else:
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[flight_key] = task
+            task.add_done_callback(lambda done: self._finish(flight_key, done))
+
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._waiters[task] == 1 and not task.done():
+                self.logger.debug(f"Cancelling abandoned request {key[:12]}")
+                task.cancel()
+            raise
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+
+    def _finish(self, flight_key: Tuple[int, str], task: asyncio.Task) -> None:
+        """Forget a finished call and mark its exception retrieved if every caller left."""
+        self._in_flight.pop(flight_key, None)
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing metrics.
+
+        Returns:
+            Dictionary of call, execution and coalesced-call counts
+        """
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "coalesce_rate": self.coalesced / self.calls if self.calls else 0.0,
+            "in_flight": len(self._in_flight),
+        }
@@ -0,0 +1,283 @@
+"""
+Token, latency and cost accounting for generation calls.
+
+Every model call is recorded with its purpose, backend, model, token counts and
+timings. Calls are aggregated per (purpose, backend, model) so the most
+expensive and slowest call sites can be found, and the cost of a call is
+estimated from per-model token prices, including discounted prompt cache reads.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+# Samples kept per group for latency percentiles
+LATENCY_WINDOW = 1000
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a text.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Approximate token count (about four characters per token)
+    """
+    return max(1, len(text) // 4) if text else 0
+
+
+def model_price(
+    model: str, prices: Dict[str, List[float]]
+) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Look up the token prices of a model.
+
+    Args:
+        model: Model name
+        prices: USD prices per million [input, output, cache read, cache write]
+            tokens, keyed by model name prefix; the longest matching prefix wins.
+            Cache prices are optional and default to the input price.
+
+    Returns:
+        (input, output, cache read, cache write) prices per million tokens, or
+        None if the model is not priced
+    """
+    matches = [prefix for prefix in prices if model.startswith(prefix)]
+    if not matches:
+        return None
+    entry = [float(price) for price in prices[max(matches, key=len)]]
+    input_price, output_price = entry[0], entry[1]
+    cache_read_price = entry[2] if len(entry) > 2 else input_price
+    cache_write_price = entry[3] if len(entry) > 3 else input_price
+    return input_price, output_price, cache_read_price, cache_write_price
+
+
+def estimate_cost(
+    model: str,
+    input_tokens: Optional[int],
+    output_tokens: Optional[int],
+    prices: Dict[str, List[float]],
+    cache_read_tokens: Optional[int] = None,
+    cache_write_tokens: Optional[int] = None,
+) -> Optional[float]:
+    """
+    Estimate the cost of a call.
+
+    Args:
+        model: Model name
+        input_tokens: Prompt tokens, including those read from or written to the cache
+        output_tokens: Generated tokens
+        prices: Price table as for model_price()
+        cache_read_tokens: Input tokens read from the prompt cache
+        cache_write_tokens: Input tokens written to the prompt cache
+
+    Returns:
+        Estimated cost in USD, or None if the model is not priced
+    """
+    price = model_price(model, prices)
+    if price is None:
+        return None
+    input_price, output_price, cache_read_price, cache_write_price = price
+    cache_read, cache_write = cache_read_tokens or 0, cache_write_tokens or 0
+    uncached = max(0, (input_tokens or 0) - cache_read - cache_write)
+    return (
+        uncached * input_price
+        + cache_read * cache_read_price
+        + cache_write * cache_write_price
+        + (output_tokens or 0) * output_price
+    ) / 1_000_000
+
+
+def _percentile(samples: List[float], percent: float) -> Optional[float]:
+    """Get a percentile of unsorted samples."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(percent / 100.0 * (len(ordered) - 1))))]
+
+
+class UsageStats:
+    """Aggregated usage of one purpose, backend and model."""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_write_tokens = 0
+        self.cost = 0.0
+        self.unpriced_calls = 0
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.first_token_latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the group."""
+        latencies = list(self.latencies)
+        first_token = list(self.first_token_latencies)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "cache_hits": self.cache_hits,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
+            "prompt_cache_hit_rate": (
+                self.cache_read_tokens / self.input_tokens if self.input_tokens else 0.0
+            ),
+            "cost": round(self.cost, 6),
+            "unpriced_calls": self.unpriced_calls,
+            "avg_latency": sum(latencies) / len(latencies) if latencies else None,
+            "p50_latency": _percentile(latencies, 50),
+            "p95_latency": _percentile(latencies, 95),
+            "p95_time_to_first_token": _percentile(first_token, 95),
+        }
+
+
+class UsageTracker:
+    """In-process aggregation of generation call metrics."""
+
+    def __init__(self, prices: Optional[Dict[str, List[float]]] = None):
+        """
+        Initialize the tracker.
+
+        Args:
+            prices: USD prices per million [input, output] tokens, keyed by model
+                name prefix
+        """
+        self.prices = prices or {}
+        self._lock = threading.Lock()
+        self._groups: Dict[Tuple[str, str, str], UsageStats] = {}
+
+    def _group(self, purpose: Optional[str], backend: str, model: str) -> UsageStats:
+        """Get the aggregate for a call site."""
+        key = (purpose or "unspecified", backend, model)
+        if key not in self._groups:
+            self._groups[key] = UsageStats()
+        return self._groups[key]
+
+    def record(
+        self,
+        purpose: Optional[str],
+        backend: str,
+        model: str,
+        input_tokens: Optional[int],
+        output_tokens: Optional[int],
+        duration: Optional[float],
+        time_to_first_token: Optional[float] = None,
+        cache_read_tokens: Optional[int] = None,
+        cache_write_tokens: Optional[int] = None,
+    ) -> Optional[float]:
+        """
+        Record a completed model call.
+
+        Args:
+            purpose: Generation purpose (e.g. "lecture"), or None
+            backend: Backend that served the call
+            model: Model that served the call
+            input_tokens: Prompt tokens
+            output_tokens: Generated tokens
+            duration: Seconds the call took
+            time_to_first_token: Seconds until the first streamed token, if streamed
+            cache_read_tokens: Input tokens read from the provider's prompt cache
+            cache_write_tokens: Input tokens written to the provider's prompt cache
+
+        Returns:
+            Estimated cost of the call in USD, or None if the model is not priced
+        """
+        cost = estimate_cost(
+            model, input_tokens, output_tokens, self.prices, cache_read_tokens, cache_write_tokens
+        )
+        with self._lock:
+            stats = self._group(purpose, backend, model)
+            stats.calls += 1
+            stats.input_tokens += input_tokens or 0
+            stats.output_tokens += output_tokens or 0
+            stats.cache_read_tokens += cache_read_tokens or 0
+            stats.cache_write_tokens += cache_write_tokens or 0
+            if cost is None:
+                stats.unpriced_calls += 1
+            else:
+                stats.cost += cost
+            if duration is not None:
+                stats.latencies.append(duration)
+            if time_to_first_token is not None:
+                stats.first_token_latencies.append(time_to_first_token)
+        return cost
+
+    def record_error(self, purpose: Optional[str], backend: str, model: str) -> None:
+        """Record a failed model call."""
+        with self._lock:
+            self._group(purpose, backend, model).errors += 1
+
+    def record_cache_hit(self, purpose: Optional[str], backend: str, model: str) -> None:
+        """Record a request answered from the response cache."""
+        with self._lock:
+            self._group(purpose, backend, model).cache_hits += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize usage by call site, most expensive first.
+
+        Returns:
+            Dictionary with per-group rows and overall totals
+        """
+        with self._lock:
+            rows = [
+                {"purpose": purpose, "backend": backend, "model": model, **stats.to_dict()}
+                for (purpose, backend, model), stats in self._groups.items()
+            ]
+        rows.sort(
+            key=lambda row: (row["cost"], row["input_tokens"] + row["output_tokens"]), reverse=True
+        )
+        totals = {
+            field: sum(row[field] for row in rows)
+            for field in (
+                "calls",
+                "errors",
+                "cache_hits",
+                "input_tokens",
+                "output_tokens",
+                "cache_read_tokens",
+                "cache_write_tokens",
+            )
+        }
+        totals["cost"] = round(sum(row["cost"] for row in rows), 6)
+        return {"groups": rows, "totals": totals}
+
+
+def summarize_logs(
+    records: Iterable[Dict[str, Any]], prices: Optional[Dict[str, List[float]]] = None
+) -> Dict[str, Any]:
+    """
+    Aggregate usage from content log records.
+
+    Records written before usage was logged count as calls without tokens.
+
+    Args:
+        records: Content log records, e.g. from iter_content_logs()
+        prices: Price table for cost estimates, as for model_price()
+
+    Returns:
+        Summary in the same shape as UsageTracker.summary()
+    """
+    tracker = UsageTracker(prices)
+    for record in records:
+        metadata = record.get("metadata", {})
+        usage = metadata.get("usage") or {}
+        tracker.record(
+            metadata.get("purpose"),
+            metadata.get("backend", "unknown"),
+            metadata.get("model", "unknown"),
+            usage.get("input_tokens"),
+            usage.get("output_tokens"),
+            usage.get("duration"),
+            usage.get("time_to_first_token"),
+            cache_read_tokens=usage.get("cache_read_tokens"),
+            cache_write_tokens=usage.get("cache_write_tokens"),
+        )
+    return tracker.summary()
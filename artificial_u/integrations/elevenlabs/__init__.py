@@ -4,7 +4,9 @@ ElevenLabs integration package for ArtificialU.
 This package provides integration with the ElevenLabs API for text-to-speech and voice management.
 """
 
+from artificial_u.integrations.elevenlabs.async_client import AsyncElevenLabsClient
 from artificial_u.integrations.elevenlabs.client import ElevenLabsClient
+from artificial_u.integrations.elevenlabs.retry import ElevenLabsAPIError
 from artificial_u.integrations.elevenlabs.voice_mapper import VoiceMapper
 
-__all__ = ["ElevenLabsClient", "VoiceMapper"]
+__all__ = ["AsyncElevenLabsClient", "ElevenLabsAPIError", "ElevenLabsClient", "VoiceMapper"]
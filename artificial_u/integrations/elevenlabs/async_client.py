@@ -0,0 +1,354 @@
+"""
+Async ElevenLabs API client for ArtificialU.
+
+Requests share one httpx.AsyncClient, so keep-alive connections to the API are
+reused across chunks and lectures instead of a new TLS handshake per request.
+Failed requests are retried per the policy in `retry`, waiting with
+asyncio.sleep so the event loop keeps serving other work.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import httpx
+
+from artificial_u.integrations.elevenlabs.retry import (
+    backoff_delay,
+    error_from_response,
+    is_retryable,
+)
+
+
+class AsyncElevenLabsClient:
+    """Async client for the ElevenLabs text-to-speech and voice endpoints."""
+
+    # ElevenLabs API base URL
+    BASE_URL = "https://api.elevenlabs.io/v1"
+
+    # Default TTS model
+    DEFAULT_MODEL = "eleven_flash_v2_5"
+
+    # Default audio encoding of synthesized speech
+    DEFAULT_OUTPUT_FORMAT = "mp3_44100_128"
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_retries: int = 2,
+        retry_backoff: float = 1.0,
+        max_retry_backoff: float = 30.0,
+        timeout: float = 60.0,
+        max_connections: int = 10,
+        base_url: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        logger=None,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            api_key: ElevenLabs API key. If not provided, will use
+                ELEVENLABS_API_KEY environment variable.
+            max_retries: Extra attempts for a request that failed with a retryable error
+            retry_backoff: Base seconds between retries, doubled per attempt
+            max_retry_backoff: Longest wait between retries
+            timeout: Seconds to wait for a connection or for the next bytes of a response
+            max_connections: Connections kept open to the API
+            base_url: Optional API base URL (defaults to the public API)
+            transport: Optional httpx transport (used by tests)
+            logger: Optional logger instance
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.api_key = api_key or os.environ.get("ELEVENLABS_API_KEY")
+        if not self.api_key:
+            raise ValueError("ElevenLabs API key is required")
+
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+        self.base_url = base_url or self.BASE_URL
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.transport = transport
+
+        self._http: Optional[httpx.AsyncClient] = None
+        self._http_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.requests = 0
+        self.retries = 0
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        Connections belong to the event loop that opened them, so a new client is
+        created if this one is used from another loop (e.g. successive asyncio.run
+        calls in the CLI).
+        """
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http.is_closed or self._http_loop is not loop:
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={"xi-api-key": self.api_key},
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                transport=self.transport,
+            )
+            self._http_loop = loop
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its connections."""
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._http = None
+
+    async def __aenter__(self) -> "AsyncElevenLabsClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _wait_before_retry(self, attempt: int, error: Exception, description: str) -> None:
+        """Raise a final or non-retryable error, otherwise sleep before the next attempt."""
+        if attempt >= self.max_retries or not is_retryable(error):
+            self.logger.error(f"{description} failed after {attempt + 1} attempts: {error}")
+            raise error
+        delay = backoff_delay(attempt, self.retry_backoff, self.max_retry_backoff, error)
+        self.retries += 1
+        self.logger.warning(
+            f"{description} attempt {attempt + 1}/{self.max_retries + 1} failed: {error}; "
+            f"retrying in {delay:.1f}s"
+        )
+        await asyncio.sleep(delay)
+
+    async def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET a JSON resource, retrying retryable failures."""
+        params = {key: value for key, value in (params or {}).items() if value is not None}
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.requests += 1
+                response = await self._get_http().get(path, params=params)
+                if response.is_error:
+                    raise error_from_response(response)
+                return response.json()
+            except Exception as e:
+                await self._wait_before_retry(attempt, e, f"GET {path}")
+
+    async def _stream_speech_once(
+        self, voice_id: str, body: Dict[str, Any], output_format: str
+    ) -> AsyncIterator[bytes]:
+        """Make one streaming TTS request, yielding audio bytes as they arrive."""
+        self.requests += 1
+        async with self._get_http().stream(
+            "POST",
+            f"/text-to-speech/{voice_id}/stream",
+            params={"output_format": output_format},
+            json=body,
+        ) as response:
+            if response.is_error:
+                await response.aread()
+                raise error_from_response(response)
+            async for chunk in response.aiter_bytes():
+                if chunk:
+                    yield chunk
+
+    def _speech_body(
+        self, text: str, model_id: Optional[str], voice_settings: Optional[Dict[str, float]]
+    ) -> Dict[str, Any]:
+        """Build the JSON body of a TTS request."""
+        body: Dict[str, Any] = {"text": text, "model_id": model_id or self.DEFAULT_MODEL}
+        if voice_settings:
+            body["voice_settings"] = voice_settings
+        return body
+
+    async def stream_text_to_speech(
+        self,
+        text: str,
+        voice_id: str,
+        model_id: Optional[str] = None,
+        voice_settings: Optional[Dict[str, float]] = None,
+        output_format: Optional[str] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Convert text to speech, yielding audio as the API streams it.
+
+        A request is retried only until its first audio bytes arrive; a stream
+        that breaks later raises, since the audio already yielded cannot be
+        taken back.
+
+        Args:
+            text: Text to convert to speech
+            voice_id: ElevenLabs Voice ID to use
+            model_id: Model ID to use (defaults to eleven_flash_v2_5)
+            voice_settings: Voice settings (stability, clarity, etc.)
+            output_format: Audio encoding (defaults to 128 kbps MP3)
+
+        Yields:
+            bytes: Audio data chunks in order
+        """
+        body = self._speech_body(text, model_id, voice_settings)
+        output_format = output_format or self.DEFAULT_OUTPUT_FORMAT
+        for attempt in range(self.max_retries + 1):
+            started = False
+            try:
+                async for chunk in self._stream_speech_once(voice_id, body, output_format):
+                    started = True
+                    yield chunk
+                return
+            except Exception as e:
+                if started:
+                    raise
+                await self._wait_before_retry(attempt, e, f"TTS for {len(text)} chars")
+
+    async def text_to_speech(
+        self,
+        text: str,
+        voice_id: str,
+        model_id: Optional[str] = None,
+        voice_settings: Optional[Dict[str, float]] = None,
+        output_format: Optional[str] = None,
+    ) -> bytes:
+        """
+        Convert text to speech.
+
+        The audio is read from a streamed response, and a request whose stream
+        breaks partway is retried as a whole.
+
+        Args:
+            text: Text to convert to speech
+            voice_id: ElevenLabs Voice ID to use
+            model_id: Model ID to use (defaults to eleven_flash_v2_5)
+            voice_settings: Voice settings (stability, clarity, etc.)
+            output_format: Audio encoding (defaults to 128 kbps MP3)
+
+        Returns:
+            Audio data as bytes
+        """
+        body = self._speech_body(text, model_id, voice_settings)
+        output_format = output_format or self.DEFAULT_OUTPUT_FORMAT
+        for attempt in range(self.max_retries + 1):
+            try:
+                chunks = [
+                    chunk async for chunk in self._stream_speech_once(voice_id, body, output_format)
+                ]
+                return b"".join(chunks)
+            except Exception as e:
+                await self._wait_before_retry(attempt, e, f"TTS for {len(text)} chars")
+
+    async def get_voice(self, voice_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get details of a specific voice.
+
+        Args:
+            voice_id: ElevenLabs Voice ID of the voice to retrieve
+
+        Returns:
+            Voice details or None if not found
+        """
+        try:
+            voice = await self._get_json(f"/voices/{voice_id}")
+        except Exception as e:
+            self.logger.error(f"Error retrieving ElevenLabs voice {voice_id}: {e}")
+            return None
+
+        labels = voice.get("labels") or {}
+        return {
+            "el_voice_id": voice["voice_id"],
+            "name": voice.get("name"),
+            "category": voice.get("category", "premade"),
+            "gender": labels.get("gender", "neutral"),
+            "accent": labels.get("accent", "american"),
+            "age": labels.get("age", "middle_aged"),
+            "description": voice.get("description") or "",
+            "preview_url": voice.get("preview_url") or "",
+        }
+
+    async def get_shared_voices(
+        self,
+        page_size: int = 100,
+        page: int = 0,
+        gender: Optional[str] = None,
+        accent: Optional[str] = None,
+        age: Optional[str] = None,
+        language: str = "en",
+        use_case: Optional[str] = None,
+        category: Optional[str] = None,
+        search: Optional[str] = None,
+        min_notice_period_days: Optional[int] = None,
+        featured: Optional[bool] = None,
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Get shared voices from the ElevenLabs API.
+
+        Args:
+            page_size: Number of results per page (max 100)
+            page: Page number
+            gender: Optional filter by gender
+            accent: Optional filter by accent
+            age: Optional filter by age
+            language: Language code
+            use_case: Optional filter by use case
+            category: Optional filter by category
+            search: Optional search term
+            min_notice_period_days: Optional minimum notice period in days
+            featured: Optional filter for featured voices
+
+        Returns:
+            Tuple of (list of voice data, has_more flag)
+        """
+        try:
+            response = await self._get_json(
+                "/shared-voices",
+                params={
+                    "page_size": min(page_size, 100),
+                    "page": page,
+                    "gender": gender,
+                    "accent": accent,
+                    "age": age,
+                    "language": language,
+                    "use_cases": use_case,
+                    "category": category,
+                    "search": search,
+                    "min_notice_period_days": min_notice_period_days,
+                    "featured": featured,
+                },
+            )
+        except Exception as e:
+            self.logger.error(f"Error retrieving shared voices: {e}")
+            return [], False
+
+        voices = [
+            {
+                "voice_id": voice["voice_id"],
+                "name": voice.get("name"),
+                "gender": voice.get("gender"),
+                "accent": voice.get("accent"),
+                "age": voice.get("age"),
+                "descriptive": voice.get("descriptive"),
+                "use_case": voice.get("use_case"),
+                "category": voice.get("category"),
+                "language": voice.get("language"),
+                "locale": voice.get("locale"),
+                "description": voice.get("description") or "",
+                "preview_url": voice.get("preview_url") or "",
+                "verified_languages": voice.get("verified_languages") or [],
+                "cloned_by_count": voice.get("cloned_by_count", 0),
+                "usage_character_count_1y": voice.get("usage_character_count_1y", 0),
+            }
+            for voice in response.get("voices", [])
+        ]
+        return voices, response.get("has_more", False)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get client metrics.
+
+        Returns:
+            Dictionary of request and retry counts
+        """
+        return {"requests": self.requests, "retries": self.retries}
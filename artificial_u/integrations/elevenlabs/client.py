@@ -11,9 +11,16 @@ import time
 from typing import Any, Dict, List, Optional, Tuple
 from unittest.mock import MagicMock
 
+import httpx
 from elevenlabs import play
 from elevenlabs.client import ElevenLabs
 
+from artificial_u.integrations.elevenlabs.retry import (
+    backoff_delay,
+    error_from_response,
+    is_retryable,
+)
+
 
 class ElevenLabsClient:
     """
@@ -30,11 +37,17 @@ class ElevenLabsClient:
     # Default TTS model
     DEFAULT_MODEL = "eleven_flash_v2_5"
 
-    # Maximum retries for API calls
+    # Default audio encoding of synthesized speech
+    DEFAULT_OUTPUT_FORMAT = "mp3_44100_128"
+
+    # Maximum attempts for API calls
     MAX_RETRIES = 3
 
-    # Wait time between retries (seconds)
-    RETRY_WAIT = 2
+    # Base wait between retries (seconds), doubled per attempt with jitter
+    RETRY_BACKOFF = 1.0
+
+    # Longest wait between retries (seconds)
+    MAX_RETRY_BACKOFF = 30.0
 
     def __init__(self, api_key: Optional[str] = None):
         """
@@ -79,6 +92,9 @@ class ElevenLabsClient:
             "Accept": "application/json",
         }
 
+        # Keep-alive connection pool for TTS requests
+        self._http: Optional[httpx.Client] = None
+
     def get_voice(self, voice_id: str) -> Optional[Dict[str, Any]]:
         """
         Get details of a specific voice.
@@ -228,6 +244,10 @@ class ElevenLabsClient:
         """
         Convert text to speech using ElevenLabs API.
 
+        Network errors, rate limits and server errors are retried with jittered
+        exponential backoff; other errors are raised at once. Async callers should
+        use AsyncElevenLabsClient, which does not block the event loop.
+
         Args:
             text: Text to convert to speech
             voice_id: ElevenLabs Voice ID to use
@@ -243,41 +263,38 @@ class ElevenLabsClient:
             "clarity": 0.8,
             "style": 0.0,
         }
+        body = {"text": text, "model_id": model_id, "voice_settings": voice_settings}
 
-        # Retry logic for API calls
         for attempt in range(self.MAX_RETRIES):
             try:
                 self.logger.debug(f"TTS attempt {attempt+1} for text of length {len(text)}")
-
-                # Get audio stream from the API
-                audio_stream = self.client.text_to_speech.convert(
-                    text=text,
-                    voice_id=voice_id,
-                    model_id=model_id,
-                    voice_settings=voice_settings,
-                )
-
-                # Consume the generator if it's a generator (new API behavior)
-                if hasattr(audio_stream, "__iter__") and not isinstance(audio_stream, bytes):
-                    self.logger.debug("Audio stream is a generator, consuming it")
-                    audio_data = b"".join(
-                        chunk for chunk in audio_stream if isinstance(chunk, bytes)
-                    )
-                else:
-                    # Handle the case where it's already bytes (old API behavior)
-                    self.logger.debug("Audio stream is bytes data")
-                    audio_data = audio_stream
-
-                return audio_data
+                with self._get_http().stream(
+                    "POST",
+                    f"{self.BASE_URL}/text-to-speech/{voice_id}/stream",
+                    params={"output_format": self.DEFAULT_OUTPUT_FORMAT},
+                    json=body,
+                ) as response:
+                    if response.is_error:
+                        response.read()
+                        raise error_from_response(response)
+                    return b"".join(response.iter_bytes())
 
             except Exception as e:
                 self.logger.error(f"Error in text-to-speech conversion: {str(e)}")
-                if attempt < self.MAX_RETRIES - 1:
-                    self.logger.info(f"Waiting {self.RETRY_WAIT}s before retry...")
-                    time.sleep(self.RETRY_WAIT)
-                else:
-                    self.logger.error(f"Failed after {self.MAX_RETRIES} attempts")
+                if attempt == self.MAX_RETRIES - 1 or not is_retryable(e):
+                    self.logger.error(f"Failed after {attempt + 1} attempts")
                     raise
+                delay = backoff_delay(attempt, self.RETRY_BACKOFF, self.MAX_RETRY_BACKOFF, e)
+                self.logger.info(f"Waiting {delay:.1f}s before retry...")
+                time.sleep(delay)
+
+    def _get_http(self) -> httpx.Client:
+        """Get the HTTP client shared by TTS requests, creating it on first use."""
+        if self._http is None:
+            self._http = httpx.Client(
+                headers={"xi-api-key": self.api_key}, timeout=httpx.Timeout(60.0)
+            )
+        return self._http
 
     def get_user_info(self) -> Dict[str, Any]:
         """
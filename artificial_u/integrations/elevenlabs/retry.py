@@ -0,0 +1,121 @@
+"""
+Retry policy shared by the ElevenLabs clients.
+
+Only failures another attempt can fix are retried: network errors, timeouts,
+rate limits (429) and server errors. Other 4xx responses (bad voice ID, invalid
+key, quota exceeded) fail immediately. Waits grow exponentially with full
+jitter, and a Retry-After header from the API takes precedence.
+"""
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+
+# Statuses worth retrying: timeouts, rate limits and server errors
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class ElevenLabsAPIError(Exception):
+    """Raised when an ElevenLabs API request fails."""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+    @property
+    def retryable(self) -> bool:
+        """Whether another attempt may succeed."""
+        return self.status_code is None or self.status_code in RETRYABLE_STATUS_CODES
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value: Header value, in seconds or as an HTTP date
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if absent or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def error_from_response(response: httpx.Response) -> ElevenLabsAPIError:
+    """
+    Build the error for a failed response whose body has been read.
+
+    Args:
+        response: The failed response
+
+    Returns:
+        ElevenLabsAPIError: Error carrying the status and any Retry-After wait
+    """
+    try:
+        detail = response.json().get("detail", response.text)
+    except ValueError:
+        detail = response.text
+    return ElevenLabsAPIError(
+        f"ElevenLabs API returned {response.status_code}: {detail}",
+        status_code=response.status_code,
+        retry_after=parse_retry_after(response.headers.get("retry-after")),
+    )
+
+
+def is_retryable(error: Exception) -> bool:
+    """
+    Check whether a failed request should be retried.
+
+    Args:
+        error: The error raised by the request
+
+    Returns:
+        bool: True for network errors, timeouts, rate limits and server errors
+    """
+    if isinstance(error, ElevenLabsAPIError):
+        return error.retryable
+    return isinstance(error, httpx.TransportError)
+
+
+def backoff_delay(
+    attempt: int, base: float, cap: float, error: Optional[Exception] = None
+) -> float:
+    """
+    Get the wait before retrying a failed request.
+
+    Args:
+        attempt: Zero-based number of the attempt that failed
+        base: Seconds to wait after the first attempt, before jitter
+        cap: Longest wait, before jitter
+        error: The error raised by the request, which may carry a Retry-After wait
+
+    Returns:
+        float: Seconds to wait; a random share of the exponential delay, but at
+        least any Retry-After wait the API asked for
+    """
+    delay = random.uniform(0, min(cap, base * 2**attempt))
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
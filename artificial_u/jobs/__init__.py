@@ -0,0 +1,24 @@
+"""
+Background jobs for ArtificialU.
+
+Long-running generation (lectures, audio, images) is queued in the jobs table
+and run by worker processes (`artificial-u worker`), so it survives restarts
+and does not tie up API workers.
+"""
+
+from artificial_u.jobs.handlers import (
+    GENERATE_LECTURE,
+    LECTURE_AUDIO,
+    PROFESSOR_IMAGE,
+    build_handlers,
+)
+from artificial_u.jobs.worker import JobWorker, retry_delay
+
+__all__ = [
+    "GENERATE_LECTURE",
+    "LECTURE_AUDIO",
+    "PROFESSOR_IMAGE",
+    "JobWorker",
+    "build_handlers",
+    "retry_delay",
+]
@@ -0,0 +1,75 @@
+"""
+Handlers for the background job kinds.
+
+Each handler takes a job's payload and returns its JSON-serializable result,
+using the services of a UniversitySystem.
+"""
+
+from functools import partial
+from typing import Any, Dict
+
+from artificial_u.jobs.worker import JobHandler
+
+# Job kinds
+GENERATE_LECTURE = "lecture.generate"
+LECTURE_AUDIO = "lecture.audio"
+PROFESSOR_IMAGE = "professor.image"
+
+
+async def generate_lecture(system, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Generate lecture content (without saving it).
+
+    Payload: {"partial_attributes": {...}} as for LectureService.generate_lecture.
+
+    Returns:
+        The generated lecture attributes
+    """
+    return await system.lecture_service.generate_lecture(
+        partial_attributes=payload.get("partial_attributes") or {}
+    )
+
+
+async def create_lecture_audio(system, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Synthesize, store and link the audio of a saved lecture.
+
+    Payload: {"lecture_id": ...}
+
+    Returns:
+        The lecture ID and its audio URL
+    """
+    audio_url, lecture = await system.audio_service.create_audio_for_lecture(payload["lecture_id"])
+    return {"lecture_id": lecture.id, "audio_url": audio_url}
+
+
+async def generate_professor_image(system, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Generate and store a professor's profile image.
+
+    Payload: {"professor_id": ...}
+
+    Returns:
+        The professor ID and the new image URL
+    """
+    professor = await system.professor_service.generate_and_set_professor_image(
+        professor_id=payload["professor_id"]
+    )
+    return {"professor_id": professor.id, "image_url": professor.image_url}
+
+
+def build_handlers(system) -> Dict[str, JobHandler]:
+    """
+    Bind the job handlers to a system's services.
+
+    Args:
+        system: UniversitySystem instance
+
+    Returns:
+        Job handlers keyed by job kind
+    """
+    return {
+        GENERATE_LECTURE: partial(generate_lecture, system),
+        LECTURE_AUDIO: partial(create_lecture_audio, system),
+        PROFESSOR_IMAGE: partial(generate_professor_image, system),
+    }
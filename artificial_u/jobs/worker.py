@@ -0,0 +1,264 @@
+"""
+Worker running queued background jobs.
+
+A worker leases due jobs from the jobs table, runs the handler registered for
+each job's kind and records the outcome. Failed attempts are retried with
+exponential backoff until the job runs out of attempts. The lease is renewed
+while a handler runs, so a job is only picked up again when its worker dies.
+Database errors are logged and retried after poll_interval rather than
+stopping the worker. Any number of workers can run side by side, in one
+process or across nodes.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import socket
+import uuid
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from artificial_u.models.core import Job
+from artificial_u.models.repositories.job import utcnow
+from artificial_u.utils import (
+    CourseNotFoundError,
+    LectureNotFoundError,
+    ProfessorNotFoundError,
+    TopicNotFoundError,
+)
+
+# A job handler takes the job's payload and returns its JSON-serializable result
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]
+
+# Errors that another attempt cannot fix
+NON_RETRYABLE_ERRORS = (
+    CourseNotFoundError,
+    KeyError,
+    LectureNotFoundError,
+    ProfessorNotFoundError,
+    TopicNotFoundError,
+)
+
+
+def retry_delay(attempt: int, base: float, cap: float) -> float:
+    """
+    Get the wait before retrying a job.
+
+    Args:
+        attempt: The attempt that failed, starting at 1
+        base: Seconds to wait after the first attempt
+        cap: Longest wait
+
+    Returns:
+        float: Seconds to wait, doubled per attempt up to the cap, with random
+        jitter of up to half the wait so failed jobs do not retry in lockstep
+    """
+    delay = min(cap, base * 2 ** (attempt - 1))
+    return delay * random.uniform(0.5, 1.0)
+
+
+def default_worker_id() -> str:
+    """Build a worker identifier unique across hosts and processes."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class JobWorker:
+    """Leases and runs queued jobs."""
+
+    def __init__(
+        self,
+        repository,
+        handlers: Dict[str, JobHandler],
+        worker_id: Optional[str] = None,
+        concurrency: int = 1,
+        kinds: Optional[List[str]] = None,
+        poll_interval: float = 2.0,
+        lease_seconds: float = 300.0,
+        retry_backoff: float = 30.0,
+        max_retry_backoff: float = 1800.0,
+        logger=None,
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            repository: Job repository
+            handlers: Job handlers keyed by job kind
+            worker_id: Identifier recorded on leased jobs (defaults to host, pid and a
+                random suffix)
+            concurrency: Jobs run at the same time
+            kinds: Only run jobs of these kinds (defaults to every kind with a handler)
+            poll_interval: Seconds to wait before polling again when no job is due
+            lease_seconds: Seconds a job is held without renewal; renewed every third
+            retry_backoff: Seconds before the first retry, doubled per attempt
+            max_retry_backoff: Longest wait between retries
+            logger: Optional logger instance
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.repository = repository
+        self.handlers = handlers
+        self.worker_id = worker_id or default_worker_id()
+        self.concurrency = concurrency
+        self.kinds = kinds or sorted(handlers)
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+
+        self._stopping = asyncio.Event()
+        self.succeeded = 0
+        self.retried = 0
+        self.failed = 0
+
+    def stop(self) -> None:
+        """Stop leasing jobs; running jobs are finished first."""
+        if not self._stopping.is_set():
+            self.logger.info(f"Worker {self.worker_id} stopping after its running jobs")
+        self._stopping.set()
+
+    async def run(self, burst: bool = False) -> Dict[str, Any]:
+        """
+        Run jobs until stopped.
+
+        Args:
+            burst: Return once no job is due instead of waiting for more
+
+        Returns:
+            Dictionary of job outcome counts
+        """
+        self.logger.info(
+            f"Worker {self.worker_id} running {', '.join(self.kinds)} jobs "
+            f"(concurrency {self.concurrency})"
+        )
+        await asyncio.gather(*(self._run_slot(burst) for _ in range(self.concurrency)))
+        return self.stats()
+
+    async def _run_slot(self, burst: bool) -> None:
+        """Lease and run jobs one at a time, riding out database errors."""
+        while not self._stopping.is_set():
+            try:
+                if not await self._run_next(burst):
+                    return
+            except SQLAlchemyError as e:
+                self.logger.error(
+                    f"Worker {self.worker_id} database error: {e}; "
+                    f"retrying in {self.poll_interval}s"
+                )
+                await self._sleep(self.poll_interval)
+
+    async def _run_next(self, burst: bool) -> bool:
+        """
+        Run the next due job, or wait for one.
+
+        Returns:
+            bool: False once a burst run finds no job due
+        """
+        job = await asyncio.to_thread(
+            self.repository.lease, self.worker_id, self.lease_seconds, self.kinds
+        )
+        if job is not None:
+            await self.process(job)
+            return True
+        if burst:
+            return False
+        abandoned = await asyncio.to_thread(self.repository.fail_abandoned)
+        if abandoned:
+            self.logger.warning(f"Failed {abandoned} jobs abandoned on their last attempt")
+        await self._sleep(self.poll_interval)
+        return True
+
+    async def _sleep(self, seconds: float) -> None:
+        """Wait for the given time, returning early if the worker is stopped."""
+        try:
+            await asyncio.wait_for(self._stopping.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def process(self, job: Job) -> None:
+        """
+        Run a leased job and record its outcome.
+
+        Args:
+            job: The leased job
+        """
+        handler = self.handlers.get(job.kind)
+        if handler is None:
+            await self._record_failure(job, f"No handler for job kind '{job.kind}'", retry=False)
+            return
+
+        self.logger.info(f"Running job {job.id} ({job.kind}), attempt {job.attempts}")
+        task = asyncio.ensure_future(handler(job.payload))
+        try:
+            if not await self._renew_lease_until_done(job, task):
+                return
+            result = task.result()
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        except Exception as e:
+            self.logger.error(f"Job {job.id} ({job.kind}) failed: {e}", exc_info=True)
+            await self._record_failure(
+                job, f"{type(e).__name__}: {e}", retry=not isinstance(e, NON_RETRYABLE_ERRORS)
+            )
+            return
+
+        if await asyncio.to_thread(self.repository.complete, job.id, self.worker_id, result):
+            self.succeeded += 1
+            self.logger.info(f"Job {job.id} ({job.kind}) succeeded")
+        else:
+            self.logger.warning(f"Job {job.id} finished after its lease was lost; result dropped")
+
+    async def _renew_lease_until_done(self, job: Job, task: "asyncio.Future[Any]") -> bool:
+        """
+        Wait for a job's handler, renewing the lease while it runs.
+
+        Returns:
+            bool: False if the lease was lost and the handler cancelled
+        """
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=self.lease_seconds / 3)
+            if done:
+                return True
+            try:
+                renewed = await asyncio.to_thread(
+                    self.repository.heartbeat, job.id, self.worker_id, self.lease_seconds
+                )
+            except SQLAlchemyError as e:
+                # The lease still has time left; try again at the next renewal
+                self.logger.warning(f"Could not renew the lease on job {job.id}: {e}")
+                continue
+            if not renewed:
+                task.cancel()
+                self.logger.warning(f"Lost the lease on job {job.id}; cancelled it")
+                return False
+
+    async def _record_failure(self, job: Job, error: str, retry: bool) -> None:
+        """Schedule a retry of a failed job, or mark it failed."""
+        retry_at = None
+        if retry and job.attempts < job.max_attempts:
+            delay = retry_delay(job.attempts, self.retry_backoff, self.max_retry_backoff)
+            retry_at = utcnow() + timedelta(seconds=delay)
+        await asyncio.to_thread(self.repository.fail, job.id, self.worker_id, error, retry_at)
+        if retry_at is None:
+            self.failed += 1
+            self.logger.error(f"Job {job.id} ({job.kind}) failed after {job.attempts} attempts")
+        else:
+            self.retried += 1
+            self.logger.info(f"Job {job.id} ({job.kind}) will be retried at {retry_at}")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get worker metrics.
+
+        Returns:
+            Dictionary of succeeded, retried and failed job counts
+        """
+        return {
+            "worker_id": self.worker_id,
+            "succeeded": self.succeeded,
+            "retried": self.retried,
+            "failed": self.failed,
+        }
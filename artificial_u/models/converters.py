@@ -310,6 +310,76 @@ def extract_xml_content(text: str, tag_name: str) -> Optional[str]:
     return match.group(1).strip() if match else None
 
 
+class StreamingTagExtractor:
+    """Incrementally extract the text inside one XML tag from a streamed response.
+
+    Text is released as soon as it is known not to be part of the closing tag, so
+    callers can forward the tag's content while the model is still generating.
+    """
+
+    def __init__(self, tag_name: str):
+        """
+        Initialize the extractor.
+
+        Args:
+            tag_name: The name of the XML tag to extract
+        """
+        self.open_tag = f"<{tag_name}>"
+        self.close_tag = f"</{tag_name}>"
+        self._buffer = ""
+        self._state = "before"  # before -> inside -> done
+        self._released_any = False
+
+    @property
+    def done(self) -> bool:
+        """Whether the closing tag has been seen."""
+        return self._state == "done"
+
+    def feed(self, delta: str) -> str:
+        """Add streamed text and return any newly available tag content.
+
+        Args:
+            delta: The next piece of streamed text
+
+        Returns:
+            str: Tag content that can be released (possibly empty)
+        """
+        if self._state == "done":
+            return ""
+        self._buffer += delta
+
+        if self._state == "before":
+            start = self._buffer.find(self.open_tag)
+            if start < 0:
+                # Keep just enough to match an opening tag split across deltas
+                self._buffer = self._buffer[-(len(self.open_tag) - 1) :]
+                return ""
+            self._buffer = self._buffer[start + len(self.open_tag) :]
+            self._state = "inside"
+
+        if not self._released_any:
+            # Match extract_xml_content, which strips surrounding whitespace
+            self._buffer = self._buffer.lstrip()
+
+        end = self._buffer.find(self.close_tag)
+        if end >= 0:
+            released = self._buffer[:end].rstrip()
+            self._buffer = ""
+            self._state = "done"
+            return released
+
+        # Hold back a possible partial closing tag and any whitespace before it
+        cut = len(self._buffer)
+        for size in range(min(len(self.close_tag) - 1, len(self._buffer)), 0, -1):
+            if self.close_tag.startswith(self._buffer[-size:]):
+                cut -= size
+                break
+        cut = len(self._buffer[:cut].rstrip())
+        released, self._buffer = self._buffer[:cut], self._buffer[cut:]
+        self._released_any = self._released_any or bool(released)
+        return released
+
+
 def _parse_text_field(element: Optional[ET.Element]) -> Optional[str]:
     """Parse a simple text field from an Element."""
     if element is not None and element.text:
@@ -3,7 +3,7 @@ Core data models for the ArtificialU system.
 """
 
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -193,6 +193,10 @@ class Lecture(BaseModel):
                 "content": "Good morning, students. Welcome to CSCI-4511...",
                 "summary": "Overview of AI definitions, history, and intelligent agents",
                 "audio_url": "https://example.com/audio_files/CS4511/week1/lecture1.mp3",
+                "audio_playlist_url": (
+                    "https://example.com/audio_files/CS4511/week1/lecture1/playlist.m3u8"
+                ),
+                "audio_manifest_url": "https://example.com/audio_files/CS4511/week1/lecture1.json",
                 "transcript_url": "https://example.com/transcript_files/CS4511/week1/lecture1.txt",
                 "course_id": 1,
                 "topic_id": 1,
@@ -205,6 +209,56 @@ class Lecture(BaseModel):
     content: Optional[str] = None
     summary: Optional[str] = None
     audio_url: Optional[str] = None
+    audio_playlist_url: Optional[str] = None
+    audio_manifest_url: Optional[str] = None
     transcript_url: Optional[str] = None
     course_id: int
     topic_id: int
+
+
+class LectureGenerationContext(BaseModel):
+    """Course data needed to generate its lectures, loaded in one go."""
+
+    course: Course
+    professor: Optional[Professor] = None
+    topics: List[Topic] = Field(default_factory=list)
+    # Lectures of the course without their content, in (week, order, revision) order
+    lectures: List[Lecture] = Field(default_factory=list)
+    # Rolling summary of the lectures saved so far
+    course_summary: Optional[str] = None
+
+
+class Job(BaseModel):
+    """Job model representing queued background work."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "id": 1,
+                "kind": "lecture.audio",
+                "payload": {"lecture_id": 1},
+                "status": "succeeded",
+                "idempotency_key": "lecture-1-audio",
+                "attempts": 1,
+                "max_attempts": 3,
+                "result": {"lecture_id": 1, "audio_url": "https://example.com/audio.mp3"},
+            }
+        }
+    )
+
+    id: Optional[int] = None
+    kind: str
+    payload: Dict[str, Any] = Field(default_factory=dict)
+    # One of "queued", "running", "succeeded" or "failed"
+    status: str = "queued"
+    idempotency_key: Optional[str] = None
+    attempts: int = 0
+    max_attempts: int = 3
+    run_at: Optional[datetime] = None
+    locked_by: Optional[str] = None
+    locked_until: Optional[datetime] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
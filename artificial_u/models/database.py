@@ -27,6 +27,8 @@ class CourseModel(Base):
     total_weeks = Column(Integer, nullable=True, default=14)
     department_id = Column(Integer, ForeignKey("departments.id"), nullable=True)
     professor_id = Column(Integer, ForeignKey("professors.id"), nullable=True)
+    # Rolling summary of the course's lectures, updated as each lecture is saved
+    lecture_summary = Column(Text, nullable=True)
 
     department = relationship("DepartmentModel", back_populates="courses")
     professor = relationship("ProfessorModel", back_populates="courses")
@@ -55,6 +57,8 @@ class LectureModel(Base):
     content = Column(Text, nullable=True)
     summary = Column(Text, nullable=True)
     audio_url = Column(String, nullable=True)
+    audio_playlist_url = Column(String, nullable=True)
+    audio_manifest_url = Column(String, nullable=True)
     transcript_url = Column(String, nullable=True)
     course_id = Column(Integer, ForeignKey("courses.id"), nullable=False)
     topic_id = Column(Integer, ForeignKey("topics.id"), nullable=False)
@@ -127,3 +131,28 @@ class VoiceModel(Base):
         # We'll create the text search index manually after migrations
         # to avoid Alembic issues with REGCONFIG type
     )
+
+
+class JobModel(Base):
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False)
+    status = Column(String(20), nullable=False, default="queued")
+    idempotency_key = Column(String, nullable=True, unique=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    # Earliest time the job may run (pushed back between retries)
+    run_at = Column(DateTime(timezone=True), nullable=False)
+    # Worker holding the job and when its lease runs out
+    locked_by = Column(String, nullable=True)
+    locked_until = Column(DateTime(timezone=True), nullable=True)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Workers poll for due jobs by status and run time
+    __table_args__ = (Index("idx_jobs_status_run_at", "status", "run_at"),)
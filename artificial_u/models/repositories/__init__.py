@@ -2,22 +2,54 @@
 Repository module for ArtificialU database operations.
 """
 
+from artificial_u.models.repositories.aio import (
+    AsyncBaseRepository,
+    AsyncCourseRepository,
+    AsyncDepartmentRepository,
+    AsyncLectureRepository,
+    AsyncProfessorRepository,
+    AsyncRepositoryFactory,
+    AsyncTopicRepository,
+    AsyncVoiceRepository,
+)
 from artificial_u.models.repositories.base import BaseRepository
 from artificial_u.models.repositories.course import CourseRepository
 from artificial_u.models.repositories.department import DepartmentRepository
+from artificial_u.models.repositories.engine import (
+    dispose_async_engines,
+    dispose_engines,
+    get_async_engine,
+    get_engine,
+    get_pool_stats,
+)
 from artificial_u.models.repositories.factory import RepositoryFactory
+from artificial_u.models.repositories.job import JobRepository
 from artificial_u.models.repositories.lecture import LectureRepository
 from artificial_u.models.repositories.professor import ProfessorRepository
 from artificial_u.models.repositories.topic import TopicRepository
 from artificial_u.models.repositories.voice import VoiceRepository
 
 __all__ = [
+    "AsyncBaseRepository",
+    "AsyncCourseRepository",
+    "AsyncDepartmentRepository",
+    "AsyncLectureRepository",
+    "AsyncProfessorRepository",
+    "AsyncRepositoryFactory",
+    "AsyncTopicRepository",
+    "AsyncVoiceRepository",
     "BaseRepository",
     "CourseRepository",
     "DepartmentRepository",
+    "JobRepository",
     "LectureRepository",
     "ProfessorRepository",
     "RepositoryFactory",
     "TopicRepository",
     "VoiceRepository",
+    "dispose_async_engines",
+    "dispose_engines",
+    "get_async_engine",
+    "get_engine",
+    "get_pool_stats",
 ]
@@ -0,0 +1,27 @@
+"""
+Async repositories for ArtificialU database operations.
+
+These mirror the synchronous repositories method-for-method but run on a
+SQLAlchemy AsyncEngine, so async callers (the FastAPI routers) await database
+I/O instead of blocking the event loop.
+"""
+
+from artificial_u.models.repositories.aio.base import AsyncBaseRepository
+from artificial_u.models.repositories.aio.course import AsyncCourseRepository
+from artificial_u.models.repositories.aio.department import AsyncDepartmentRepository
+from artificial_u.models.repositories.aio.factory import AsyncRepositoryFactory
+from artificial_u.models.repositories.aio.lecture import AsyncLectureRepository
+from artificial_u.models.repositories.aio.professor import AsyncProfessorRepository
+from artificial_u.models.repositories.aio.topic import AsyncTopicRepository
+from artificial_u.models.repositories.aio.voice import AsyncVoiceRepository
+
+__all__ = [
+    "AsyncBaseRepository",
+    "AsyncCourseRepository",
+    "AsyncDepartmentRepository",
+    "AsyncLectureRepository",
+    "AsyncProfessorRepository",
+    "AsyncRepositoryFactory",
+    "AsyncTopicRepository",
+    "AsyncVoiceRepository",
+]
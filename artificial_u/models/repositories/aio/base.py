@@ -0,0 +1,53 @@
+"""
+Base async repository for database operations.
+"""
+
+import logging
+import os
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from artificial_u.models.database import Base
+from artificial_u.models.repositories.engine import get_async_engine
+
+
+class AsyncBaseRepository:
+    """
+    Base async repository class for database operations.
+    Provides common functionality for all async repositories.
+    """
+
+    def __init__(self, db_url: str = None):
+        """
+        Initialize the repository.
+
+        Args:
+            db_url: SQLAlchemy database URL (sync form, e.g. postgresql://...).
+                   If not provided, uses DATABASE_URL environment variable.
+        """
+        self.logger = logging.getLogger(__name__)
+
+        self.db_url = db_url or os.environ.get("DATABASE_URL")
+
+        if not self.db_url:
+            raise ValueError("Database URL not provided. Set DATABASE_URL environment variable.")
+
+        # Async engines are shared process-wide per URL, like the sync ones
+        self.engine = get_async_engine(self.db_url)
+
+    def get_session(self) -> AsyncSession:
+        """
+        Get a new async database session.
+
+        Objects are not expired on commit, since attribute refreshes would
+        require implicit (and unsupported) I/O in async code.
+
+        Returns:
+            AsyncSession: A new SQLAlchemy async session
+        """
+        return AsyncSession(self.engine, expire_on_commit=False)
+
+    async def create_tables(self):
+        """Create database tables if they don't exist."""
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
@@ -0,0 +1,181 @@
+"""
+Async course repository for database operations.
+"""
+
+from typing import List, Optional, Tuple
+
+from sqlalchemy import select, update
+
+from artificial_u.models.core import Course
+from artificial_u.models.database import CourseModel
+from artificial_u.models.repositories.aio.base import AsyncBaseRepository
+
+
+def _to_course(db_course: CourseModel) -> Course:
+    """Convert a CourseModel row to a Course core model."""
+    return Course(
+        id=db_course.id,
+        code=db_course.code,
+        title=db_course.title,
+        credits=db_course.credits,
+        description=db_course.description,
+        lectures_per_week=db_course.lectures_per_week,
+        level=db_course.level,
+        total_weeks=db_course.total_weeks,
+        department_id=db_course.department_id,
+        professor_id=db_course.professor_id,
+    )
+
+
+class AsyncCourseRepository(AsyncBaseRepository):
+    """Async repository for Course operations."""
+
+    async def create(self, course: Course) -> Course:
+        """Create a new course."""
+        async with self.get_session() as session:
+            db_course = CourseModel(
+                code=course.code,
+                title=course.title,
+                credits=course.credits,
+                description=course.description,
+                lectures_per_week=course.lectures_per_week,
+                level=course.level,
+                total_weeks=course.total_weeks,
+                department_id=course.department_id,
+                professor_id=course.professor_id,
+            )
+
+            session.add(db_course)
+            await session.commit()
+            await session.refresh(db_course)
+
+            course.id = db_course.id
+            return course
+
+    async def get(self, course_id: int) -> Optional[Course]:
+        """Get a course by ID."""
+        async with self.get_session() as session:
+            db_course = await session.get(CourseModel, course_id)
+            return _to_course(db_course) if db_course else None
+
+    async def get_by_code(self, code: str) -> Optional[Course]:
+        """Get a course by course code."""
+        async with self.get_session() as session:
+            result = await session.execute(select(CourseModel).filter_by(code=code))
+            db_course = result.scalars().first()
+            return _to_course(db_course) if db_course else None
+
+    async def list(self, department_id: Optional[int] = None) -> List[Course]:
+        """List courses with optional department filter."""
+        async with self.get_session() as session:
+            query = select(CourseModel)
+
+            if department_id:
+                query = query.filter_by(department_id=department_id)
+
+            result = await session.execute(query)
+            return [_to_course(course) for course in result.scalars().all()]
+
+    async def update(self, course: Course) -> Course:
+        """Update an existing course."""
+        async with self.get_session() as session:
+            db_course = await session.get(CourseModel, course.id)
+
+            if not db_course:
+                raise ValueError(f"Course with ID {course.id} not found")
+
+            # Update fields
+            db_course.code = course.code
+            db_course.title = course.title
+            db_course.credits = course.credits
+            db_course.description = course.description
+            db_course.lectures_per_week = course.lectures_per_week
+            db_course.level = course.level
+            db_course.total_weeks = course.total_weeks
+            db_course.department_id = course.department_id
+            db_course.professor_id = course.professor_id
+
+            await session.commit()
+            return course
+
+    async def get_with_lecture_summary(
+        self, course_id: int
+    ) -> Optional[Tuple[Course, Optional[str]]]:
+        """
+        Get a course together with its rolling lecture summary.
+
+        Args:
+            course_id: ID of the course
+
+        Returns:
+            Tuple of (course, summary or None), or None if course not found
+        """
+        async with self.get_session() as session:
+            db_course = await session.get(CourseModel, course_id)
+            return (_to_course(db_course), db_course.lecture_summary) if db_course else None
+
+    async def update_lecture_summary(self, course_id: int, summary: Optional[str]) -> bool:
+        """
+        Replace a course's rolling lecture summary.
+
+        Args:
+            course_id: ID of the course
+            summary: The new summary
+
+        Returns:
+            True if updated, False if course not found
+        """
+        async with self.get_session() as session:
+            result = await session.execute(
+                update(CourseModel)
+                .where(CourseModel.id == course_id)
+                .values(lecture_summary=summary)
+            )
+            await session.commit()
+            return bool(result.rowcount)
+
+    async def swap_lecture_summary(
+        self, course_id: int, previous: Optional[str], summary: Optional[str]
+    ) -> bool:
+        """
+        Replace a course's rolling lecture summary only if it is still the given one.
+
+        Args:
+            course_id: ID of the course
+            previous: The summary the new one was built from
+            summary: The new summary
+
+        Returns:
+            True if updated, False if the summary changed meanwhile or course not found
+        """
+        async with self.get_session() as session:
+            result = await session.execute(
+                update(CourseModel)
+                .where(
+                    CourseModel.id == course_id,
+                    CourseModel.lecture_summary.is_not_distinct_from(previous),
+                )
+                .values(lecture_summary=summary)
+            )
+            await session.commit()
+            return bool(result.rowcount)
+
+    async def delete(self, course_id: int) -> bool:
+        """
+        Delete a course by ID.
+
+        Args:
+            course_id: ID of the course to delete
+
+        Returns:
+            True if deleted successfully, False if course not found
+        """
+        async with self.get_session() as session:
+            db_course = await session.get(CourseModel, course_id)
+
+            if not db_course:
+                return False
+
+            await session.delete(db_course)
+            await session.commit()
+            return True
@@ -0,0 +1,116 @@
+"""
+Async department repository for database operations.
+"""
+
+from typing import List, Optional
+
+from sqlalchemy import select, update
+
+from artificial_u.models.core import Department
+from artificial_u.models.database import CourseModel, DepartmentModel, ProfessorModel
+from artificial_u.models.repositories.aio.base import AsyncBaseRepository
+
+
+def _to_department(db_department: DepartmentModel) -> Department:
+    """Convert a DepartmentModel row to a Department core model."""
+    return Department(
+        id=db_department.id,
+        name=db_department.name,
+        code=db_department.code,
+        faculty=db_department.faculty,
+        description=db_department.description,
+    )
+
+
+class AsyncDepartmentRepository(AsyncBaseRepository):
+    """Async repository for Department operations."""
+
+    async def create(self, department: Department) -> Department:
+        """Create a new department."""
+        async with self.get_session() as session:
+            db_department = DepartmentModel(
+                name=department.name,
+                code=department.code,
+                faculty=department.faculty,
+                description=department.description,
+            )
+
+            session.add(db_department)
+            await session.commit()
+            await session.refresh(db_department)
+
+            department.id = db_department.id
+            return department
+
+    async def get(self, department_id: int) -> Optional[Department]:
+        """Get a department by ID."""
+        async with self.get_session() as session:
+            db_department = await session.get(DepartmentModel, department_id)
+            return _to_department(db_department) if db_department else None
+
+    async def get_by_code(self, code: str) -> Optional[Department]:
+        """Get a department by code."""
+        async with self.get_session() as session:
+            result = await session.execute(select(DepartmentModel).filter_by(code=code))
+            db_department = result.scalars().first()
+            return _to_department(db_department) if db_department else None
+
+    async def list(self, faculty: Optional[str] = None) -> List[Department]:
+        """List departments with optional faculty filter."""
+        async with self.get_session() as session:
+            query = select(DepartmentModel)
+
+            if faculty:
+                query = query.filter_by(faculty=faculty)
+
+            result = await session.execute(query)
+            return [_to_department(d) for d in result.scalars().all()]
+
+    async def update(self, department: Department) -> Department:
+        """Update a department."""
+        async with self.get_session() as session:
+            db_department = await session.get(DepartmentModel, department.id)
+
+            if not db_department:
+                raise ValueError(f"Department with ID {department.id} not found")
+
+            # Update fields
+            db_department.name = department.name
+            db_department.code = department.code
+            db_department.faculty = department.faculty
+            db_department.description = department.description
+
+            await session.commit()
+            return department
+
+    async def delete(self, department_id: int) -> bool:
+        """
+        Delete a department by ID and set department_id to null for associated records.
+
+        Args:
+            department_id: ID of the department to delete
+
+        Returns:
+            True if deleted successfully, False if department not found
+        """
+        async with self.get_session() as session:
+            db_department = await session.get(DepartmentModel, department_id)
+
+            if not db_department:
+                return False
+
+            # Detach associated professors and courses
+            await session.execute(
+                update(ProfessorModel)
+                .where(ProfessorModel.department_id == department_id)
+                .values(department_id=None)
+            )
+            await session.execute(
+                update(CourseModel)
+                .where(CourseModel.department_id == department_id)
+                .values(department_id=None)
+            )
+
+            await session.delete(db_department)
+            await session.commit()
+            return True
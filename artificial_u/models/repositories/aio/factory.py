@@ -0,0 +1,93 @@
+"""
+Factory for creating and managing async repository instances.
+"""
+
+from typing import Any, Dict, Optional, Type, TypeVar
+
+from artificial_u.models.repositories.aio.base import AsyncBaseRepository
+from artificial_u.models.repositories.aio.course import AsyncCourseRepository
+from artificial_u.models.repositories.aio.department import AsyncDepartmentRepository
+from artificial_u.models.repositories.aio.lecture import AsyncLectureRepository
+from artificial_u.models.repositories.aio.professor import AsyncProfessorRepository
+from artificial_u.models.repositories.aio.topic import AsyncTopicRepository
+from artificial_u.models.repositories.aio.voice import AsyncVoiceRepository
+from artificial_u.models.repositories.engine import get_pool_stats
+
+R = TypeVar("R", bound=AsyncBaseRepository)
+
+
+class AsyncRepositoryFactory:
+    """
+    Factory for creating and managing async repository instances.
+
+    Mirrors RepositoryFactory; all repositories share the process-wide async
+    engine for the configured database URL.
+    """
+
+    def __init__(self, db_url: Optional[str] = None):
+        """
+        Initialize the async repository factory.
+
+        Args:
+            db_url: SQLAlchemy database URL. If not provided, uses
+                   the DATABASE_URL environment variable.
+        """
+        self.db_url = db_url
+        self._repositories: Dict[str, AsyncBaseRepository] = {}
+
+    def get_repository(self, repo_class: Type[R]) -> R:
+        """
+        Get or create a repository of the specified type.
+
+        Args:
+            repo_class: The repository class to instantiate
+
+        Returns:
+            An instance of the specified repository class
+        """
+        repo_name = repo_class.__name__
+
+        if repo_name not in self._repositories:
+            self._repositories[repo_name] = repo_class(db_url=self.db_url)
+
+        return self._repositories[repo_name]
+
+    @property
+    def course(self) -> AsyncCourseRepository:
+        """Get the async course repository."""
+        return self.get_repository(AsyncCourseRepository)
+
+    @property
+    def department(self) -> AsyncDepartmentRepository:
+        """Get the async department repository."""
+        return self.get_repository(AsyncDepartmentRepository)
+
+    @property
+    def lecture(self) -> AsyncLectureRepository:
+        """Get the async lecture repository."""
+        return self.get_repository(AsyncLectureRepository)
+
+    @property
+    def professor(self) -> AsyncProfessorRepository:
+        """Get the async professor repository."""
+        return self.get_repository(AsyncProfessorRepository)
+
+    @property
+    def topic(self) -> AsyncTopicRepository:
+        """Get the async topic repository."""
+        return self.get_repository(AsyncTopicRepository)
+
+    @property
+    def voice(self) -> AsyncVoiceRepository:
+        """Get the async voice repository."""
+        return self.get_repository(AsyncVoiceRepository)
+
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get connection pool statistics for this factory's async engine."""
+        repo = self.get_repository(AsyncDepartmentRepository)
+        return get_pool_stats(repo.db_url)
+
+    async def create_tables(self):
+        """Create all database tables if they don't exist."""
+        repo = self.get_repository(AsyncDepartmentRepository)
+        await repo.create_tables()
@@ -0,0 +1,355 @@
+"""
+Async lecture repository for database operations.
+"""
+
+from typing import List, Optional
+
+from sqlalchemy import Select, delete, func, or_, select
+
+from artificial_u.models.core import Lecture, LectureGenerationContext
+from artificial_u.models.database import CourseModel, LectureModel, ProfessorModel, TopicModel
+from artificial_u.models.repositories.aio.base import AsyncBaseRepository
+from artificial_u.models.repositories.aio.course import _to_course
+from artificial_u.models.repositories.aio.professor import _to_professor
+from artificial_u.models.repositories.aio.topic import _to_topic
+
+
+def _to_lecture(db_lecture: LectureModel) -> Lecture:
+    """Convert a LectureModel row to a Lecture core model."""
+    return Lecture(
+        id=db_lecture.id,
+        revision=db_lecture.revision,
+        content=db_lecture.content,
+        summary=db_lecture.summary,
+        audio_url=db_lecture.audio_url,
+        audio_playlist_url=db_lecture.audio_playlist_url,
+        audio_manifest_url=db_lecture.audio_manifest_url,
+        transcript_url=db_lecture.transcript_url,
+        course_id=db_lecture.course_id,
+        topic_id=db_lecture.topic_id,
+    )
+
+
+def _apply_filters(
+    query: Select,
+    course_id: Optional[int] = None,
+    professor_id: Optional[int] = None,
+    search_query: Optional[str] = None,
+) -> Select:
+    """Apply the list/count filters shared by lecture queries."""
+    if course_id is not None:
+        query = query.where(LectureModel.course_id == course_id)
+
+    if professor_id is not None:
+        # Join with CourseModel to filter by professor_id
+        query = query.join(CourseModel).where(CourseModel.professor_id == professor_id)
+
+    if search_query:
+        query = query.where(
+            or_(
+                LectureModel.content.ilike(f"%{search_query}%"),
+                LectureModel.summary.ilike(f"%{search_query}%"),
+            )
+        )
+    return query
+
+
+class AsyncLectureRepository(AsyncBaseRepository):
+    """Async repository for Lecture operations."""
+
+    async def create(self, lecture: Lecture) -> Lecture:
+        """Create a new lecture."""
+        async with self.get_session() as session:
+            # If revision is not provided, calculate the next revision for the topic.
+            if lecture.revision is None:
+                max_revision = await session.scalar(
+                    select(func.max(LectureModel.revision)).where(
+                        LectureModel.topic_id == lecture.topic_id
+                    )
+                )
+                lecture.revision = (max_revision or 0) + 1
+
+            db_lecture = LectureModel(
+                revision=lecture.revision,
+                content=lecture.content,
+                summary=lecture.summary,
+                audio_url=lecture.audio_url,
+                audio_playlist_url=lecture.audio_playlist_url,
+                audio_manifest_url=lecture.audio_manifest_url,
+                transcript_url=lecture.transcript_url,
+                course_id=lecture.course_id,
+                topic_id=lecture.topic_id,
+            )
+
+            session.add(db_lecture)
+            await session.commit()
+            await session.refresh(db_lecture)
+
+            lecture.id = db_lecture.id
+            return lecture
+
+    async def get(self, lecture_id: int) -> Optional[Lecture]:
+        """
+        Get a lecture by ID.
+
+        Args:
+            lecture_id: The ID of the lecture to retrieve
+
+        Returns:
+            Optional[Lecture]: The lecture if found, None otherwise
+        """
+        async with self.get_session() as session:
+            db_lecture = await session.get(LectureModel, lecture_id)
+            return _to_lecture(db_lecture) if db_lecture else None
+
+    async def get_content(self, lecture_id: int) -> Optional[str]:
+        """
+        Get the content of a lecture by ID.
+
+        Args:
+            lecture_id: The ID of the lecture to retrieve content for
+
+        Returns:
+            Optional[str]: The lecture content if found, None otherwise
+        """
+        async with self.get_session() as session:
+            return await session.scalar(
+                select(LectureModel.content).where(LectureModel.id == lecture_id)
+            )
+
+    async def get_audio_url(self, lecture_id: int) -> Optional[str]:
+        """Get the audio URL for a lecture."""
+        async with self.get_session() as session:
+            return await session.scalar(
+                select(LectureModel.audio_url).where(LectureModel.id == lecture_id)
+            )
+
+    async def get_transcript_url(self, lecture_id: int) -> Optional[str]:
+        """Get the transcript URL for a lecture."""
+        async with self.get_session() as session:
+            return await session.scalar(
+                select(LectureModel.transcript_url).where(LectureModel.id == lecture_id)
+            )
+
+    async def list_by_course(self, course_id: int) -> List[Lecture]:
+        """
+        List all lectures for a specific course.
+
+        Args:
+            course_id: ID of the course to get lectures for
+
+        Returns:
+            List[Lecture]: List of lectures for the specified course
+        """
+        async with self.get_session() as session:
+            result = await session.execute(select(LectureModel).filter_by(course_id=course_id))
+            return [_to_lecture(lecture) for lecture in result.scalars().all()]
+
+    async def get_generation_context(self, course_id: int) -> Optional[LectureGenerationContext]:
+        """
+        Load everything lecture generation needs about a course in two queries.
+
+        The course is fetched together with its professor, then its topics
+        together with their lectures' ids, revisions and summaries. Lecture
+        content is never loaded.
+
+        Args:
+            course_id: ID of the course
+
+        Returns:
+            Optional[LectureGenerationContext]: The context, or None if the course doesn't exist
+        """
+        async with self.get_session() as session:
+            result = await session.execute(
+                select(CourseModel, ProfessorModel)
+                .outerjoin(ProfessorModel, CourseModel.professor_id == ProfessorModel.id)
+                .where(CourseModel.id == course_id)
+            )
+            row = result.first()
+            if not row:
+                return None
+            db_course, db_professor = row
+
+            result = await session.execute(
+                select(TopicModel, LectureModel.id, LectureModel.revision, LectureModel.summary)
+                .outerjoin(LectureModel, LectureModel.topic_id == TopicModel.id)
+                .where(TopicModel.course_id == course_id)
+                .order_by(TopicModel.week, TopicModel.order, LectureModel.revision)
+            )
+
+            topics = {}
+            lectures = []
+            for db_topic, lecture_id, revision, summary in result.all():
+                if db_topic.id not in topics:
+                    topics[db_topic.id] = _to_topic(db_topic)
+                if lecture_id is not None:
+                    lectures.append(
+                        Lecture(
+                            id=lecture_id,
+                            revision=revision,
+                            summary=summary,
+                            course_id=course_id,
+                            topic_id=db_topic.id,
+                        )
+                    )
+
+            return LectureGenerationContext(
+                course=_to_course(db_course),
+                professor=_to_professor(db_professor) if db_professor else None,
+                topics=list(topics.values()),
+                lectures=lectures,
+                course_summary=db_course.lecture_summary,
+            )
+
+    async def list_by_topic(self, topic_id: int) -> List[Lecture]:
+        """
+        List all lectures for a specific topic.
+
+        Args:
+            topic_id: ID of the topic to get lectures for
+
+        Returns:
+            List[Lecture]: List of lectures for the specified topic
+        """
+        async with self.get_session() as session:
+            result = await session.execute(select(LectureModel).filter_by(topic_id=topic_id))
+            return [_to_lecture(lecture) for lecture in result.scalars().all()]
+
+    async def list(
+        self,
+        page: int = 1,
+        size: int = 10,
+        course_id: Optional[int] = None,
+        professor_id: Optional[int] = None,
+        search_query: Optional[str] = None,
+    ) -> List[Lecture]:
+        """
+        List lectures with filtering and pagination.
+
+        Args:
+            page: Page number (1-indexed)
+            size: Items per page
+            course_id: Filter by course ID
+            professor_id: Filter by professor ID
+            search_query: Search query for content/summary
+
+        Returns:
+            List[Lecture]: List of lectures
+        """
+        async with self.get_session() as session:
+            query = _apply_filters(select(LectureModel), course_id, professor_id, search_query)
+
+            offset = (page - 1) * size
+            query = query.order_by(LectureModel.id).offset(offset).limit(size)
+
+            result = await session.execute(query)
+            return [_to_lecture(lecture) for lecture in result.scalars().all()]
+
+    async def count(
+        self,
+        course_id: Optional[int] = None,
+        professor_id: Optional[int] = None,
+        search_query: Optional[str] = None,
+    ) -> int:
+        """
+        Count lectures matching the same filters as list().
+
+        Args:
+            course_id: Filter by course ID
+            professor_id: Filter by professor ID
+            search_query: Search query for content/summary
+
+        Returns:
+            int: Number of matching lectures
+        """
+        async with self.get_session() as session:
+            query = _apply_filters(
+                select(func.count(LectureModel.id)).select_from(LectureModel),
+                course_id,
+                professor_id,
+                search_query,
+            )
+            return await session.scalar(query) or 0
+
+    async def update(self, lecture: Lecture) -> Lecture:
+        """
+        Update an existing lecture.
+
+        Args:
+            lecture: Lecture object with updated fields
+
+        Returns:
+            Lecture: Updated lecture
+        """
+        async with self.get_session() as session:
+            db_lecture = await session.get(LectureModel, lecture.id)
+            if not db_lecture:
+                raise ValueError(f"Lecture with ID {lecture.id} not found")
+
+            # Update fields
+            db_lecture.content = lecture.content
+            db_lecture.revision = lecture.revision
+            db_lecture.summary = lecture.summary
+            db_lecture.audio_url = lecture.audio_url
+            db_lecture.audio_playlist_url = lecture.audio_playlist_url
+            db_lecture.audio_manifest_url = lecture.audio_manifest_url
+            db_lecture.transcript_url = lecture.transcript_url
+            db_lecture.course_id = lecture.course_id
+            db_lecture.topic_id = lecture.topic_id
+
+            await session.commit()
+            return lecture
+
+    async def delete(self, lecture_id: int) -> bool:
+        """
+        Delete a lecture.
+
+        Args:
+            lecture_id: ID of the lecture to delete
+
+        Returns:
+            bool: True if lecture was deleted, False if not found
+        """
+        async with self.get_session() as session:
+            db_lecture = await session.get(LectureModel, lecture_id)
+
+            if not db_lecture:
+                return False
+
+            await session.delete(db_lecture)
+            await session.commit()
+            return True
+
+    async def delete_by_course(self, course_id: int) -> int:
+        """
+        Delete all lectures for a specific course.
+
+        Args:
+            course_id: ID of the course whose lectures should be deleted
+
+        Returns:
+            Number of lectures deleted
+        """
+        async with self.get_session() as session:
+            result = await session.execute(
+                delete(LectureModel).where(LectureModel.course_id == course_id)
+            )
+            await session.commit()
+            return result.rowcount
+
+    async def delete_by_topic(self, topic_id: int) -> int:
+        """
+        Delete all lectures for a specific topic.
+
+        Args:
+            topic_id: ID of the topic whose lectures should be deleted
+
+        Returns:
+            Number of lectures deleted
+        """
+        async with self.get_session() as session:
+            result = await session.execute(
+                delete(LectureModel).where(LectureModel.topic_id == topic_id)
+            )
+            await session.commit()
+            return result.rowcount
@@ -0,0 +1,222 @@
+"""
+Async professor repository for database operations.
+"""
+
+from typing import List, Optional
+
+from sqlalchemy import Select, func, select
+
+from artificial_u.models.core import Professor
+from artificial_u.models.database import ProfessorModel
+from artificial_u.models.repositories.aio.base import AsyncBaseRepository
+
+
+def _to_professor(db_professor: ProfessorModel) -> Professor:
+    """Convert a ProfessorModel row to a Professor core model."""
+    return Professor(
+        id=db_professor.id,
+        name=db_professor.name or "",
+        title=db_professor.title,
+        accent=db_professor.accent,
+        age=db_professor.age,
+        background=db_professor.background,
+        description=db_professor.description,
+        gender=db_professor.gender,
+        personality=db_professor.personality,
+        specialization=db_professor.specialization,
+        teaching_style=db_professor.teaching_style,
+        image_url=db_professor.image_url,
+        department_id=db_professor.department_id,
+        voice_id=db_professor.voice_id,
+    )
+
+
+def _apply_filters(
+    query: Select,
+    department_id: Optional[int] = None,
+    name: Optional[str] = None,
+    specialization: Optional[str] = None,
+) -> Select:
+    """Apply the list/count filters shared by professor queries."""
+    if department_id is not None:
+        query = query.where(ProfessorModel.department_id == department_id)
+
+    if name:
+        query = query.where(ProfessorModel.name.ilike(f"%{name}%"))
+
+    if specialization:
+        # Professors without a specialization never match (NULL ILIKE is not true)
+        query = query.where(ProfessorModel.specialization.ilike(f"%{specialization}%"))
+    return query
+
+
+class AsyncProfessorRepository(AsyncBaseRepository):
+    """Async repository for Professor operations."""
+
+    async def create(self, professor: Professor) -> Professor:
+        """Create a new professor."""
+        async with self.get_session() as session:
+            db_professor = ProfessorModel(
+                name=professor.name,
+                title=professor.title,
+                accent=professor.accent,
+                age=professor.age,
+                background=professor.background,
+                description=professor.description,
+                gender=professor.gender,
+                personality=professor.personality,
+                specialization=professor.specialization,
+                teaching_style=professor.teaching_style,
+                image_url=professor.image_url,
+                department_id=professor.department_id,
+                voice_id=professor.voice_id,
+            )
+
+            session.add(db_professor)
+            await session.commit()
+            await session.refresh(db_professor)
+
+            professor.id = db_professor.id
+            return professor
+
+    async def get(self, professor_id: int) -> Optional[Professor]:
+        """Get a professor by ID."""
+        async with self.get_session() as session:
+            db_professor = await session.get(ProfessorModel, professor_id)
+            return _to_professor(db_professor) if db_professor else None
+
+    async def list(
+        self,
+        department_id: Optional[int] = None,
+        name: Optional[str] = None,
+        specialization: Optional[str] = None,
+        page: Optional[int] = None,
+        size: Optional[int] = None,
+    ) -> List[Professor]:
+        """
+        List professors with optional filtering and pagination.
+
+        Args:
+            department_id: Filter by department ID
+            name: Filter by name (case-insensitive partial match)
+            specialization: Filter by specialization (case-insensitive partial match)
+            page: Page number (1-indexed); all matches are returned without page and size
+            size: Items per page
+
+        Returns:
+            List[Professor]: List of professors
+        """
+        async with self.get_session() as session:
+            query = _apply_filters(select(ProfessorModel), department_id, name, specialization)
+            query = query.order_by(ProfessorModel.id)
+            if page is not None and size is not None:
+                query = query.offset((page - 1) * size).limit(size)
+
+            result = await session.execute(query)
+            return [_to_professor(p) for p in result.scalars().all()]
+
+    async def count(
+        self,
+        department_id: Optional[int] = None,
+        name: Optional[str] = None,
+        specialization: Optional[str] = None,
+    ) -> int:
+        """
+        Count professors matching the same filters as list().
+
+        Args:
+            department_id: Filter by department ID
+            name: Filter by name (case-insensitive partial match)
+            specialization: Filter by specialization (case-insensitive partial match)
+
+        Returns:
+            int: Number of matching professors
+        """
+        async with self.get_session() as session:
+            query = _apply_filters(
+                select(func.count(ProfessorModel.id)).select_from(ProfessorModel),
+                department_id,
+                name,
+                specialization,
+            )
+            return await session.scalar(query) or 0
+
+    async def update(self, professor: Professor) -> Professor:
+        """Update an existing professor."""
+        async with self.get_session() as session:
+            db_professor = await session.get(ProfessorModel, professor.id)
+
+            if not db_professor:
+                raise ValueError(f"Professor with ID {professor.id} not found")
+
+            # Update fields
+            db_professor.name = professor.name
+            db_professor.title = professor.title
+            db_professor.accent = professor.accent
+            db_professor.age = professor.age
+            db_professor.background = professor.background
+            db_professor.description = professor.description
+            db_professor.gender = professor.gender
+            db_professor.personality = professor.personality
+            db_professor.specialization = professor.specialization
+            db_professor.teaching_style = professor.teaching_style
+            db_professor.image_url = professor.image_url
+            db_professor.department_id = professor.department_id
+            db_professor.voice_id = professor.voice_id
+
+            await session.commit()
+            return professor
+
+    async def update_field(self, professor_id: int, **fields) -> Optional[Professor]:
+        """
+        Update specific fields of a professor.
+
+        Args:
+            professor_id: ID of the professor to update
+            **fields: Field name-value pairs to update
+
+        Returns:
+            Updated professor or None if not found
+        """
+        async with self.get_session() as session:
+            db_professor = await session.get(ProfessorModel, professor_id)
+
+            if not db_professor:
+                return None
+
+            # Update only the specified fields
+            for field, value in fields.items():
+                if hasattr(db_professor, field):
+                    setattr(db_professor, field, value)
+
+            await session.commit()
+            await session.refresh(db_professor)
+            return _to_professor(db_professor)
+
+    async def delete(self, professor_id: int) -> bool:
+        """
+        Delete a professor by ID.
+
+        Args:
+            professor_id: ID of the professor to delete
+
+        Returns:
+            True if deleted successfully, False if professor not found
+        """
+        async with self.get_session() as session:
+            db_professor = await session.get(ProfessorModel, professor_id)
+
+            if not db_professor:
+                return False
+
+            await session.delete(db_professor)
+            await session.commit()
+            return True
+
+    async def list_by_department(self, department_id: int) -> List[Professor]:
+        """List all professors in a specific department."""
+        async with self.get_session() as session:
+            result = await session.execute(
+                select(ProfessorModel).filter_by(department_id=department_id)
+            )
+            return [_to_professor(p) for p in result.scalars().all()]
@@ -0,0 +1,165 @@
+"""
+Async topic repository for database operations.
+"""
+
+from typing import List, Optional
+
+from sqlalchemy import delete, select
+
+from artificial_u.models.core import Topic
+from artificial_u.models.database import TopicModel
+from artificial_u.models.repositories.aio.base import AsyncBaseRepository
+
+
+def _to_topic(db_topic: TopicModel) -> Topic:
+    """Convert a TopicModel row to a Topic core model."""
+    return Topic(
+        id=db_topic.id,
+        title=db_topic.title,
+        order=db_topic.order,
+        week=db_topic.week,
+        course_id=db_topic.course_id,
+    )
+
+
+class AsyncTopicRepository(AsyncBaseRepository):
+    """Async repository for Topic operations."""
+
+    async def create(self, topic: Topic) -> Topic:
+        """Create a new topic."""
+        async with self.get_session() as session:
+            db_topic = TopicModel(
+                title=topic.title,
+                order=topic.order,
+                week=topic.week,
+                course_id=topic.course_id,
+            )
+
+            session.add(db_topic)
+            await session.commit()
+            await session.refresh(db_topic)
+
+            topic.id = db_topic.id
+            return topic
+
+    async def create_batch(self, topics: List[Topic]) -> List[Topic]:
+        """
+        Create multiple topics in a single transaction.
+
+        Args:
+            topics: List of Topic models to create
+
+        Returns:
+            List of created Topic models with their IDs populated
+        """
+        async with self.get_session() as session:
+            db_topics = [
+                TopicModel(
+                    title=topic.title,
+                    order=topic.order,
+                    week=topic.week,
+                    course_id=topic.course_id,
+                )
+                for topic in topics
+            ]
+
+            session.add_all(db_topics)
+            # Flushing assigns primary keys without a refresh per row
+            await session.flush()
+
+            for topic, db_topic in zip(topics, db_topics):
+                topic.id = db_topic.id
+
+            await session.commit()
+            return topics
+
+    async def get(self, topic_id: int) -> Optional[Topic]:
+        """Get a topic by ID."""
+        async with self.get_session() as session:
+            db_topic = await session.get(TopicModel, topic_id)
+            return _to_topic(db_topic) if db_topic else None
+
+    async def get_by_course_week_order(
+        self, course_id: int, week: int, order: int
+    ) -> Optional[Topic]:
+        """Get a topic by course ID, week, and order."""
+        async with self.get_session() as session:
+            result = await session.execute(
+                select(TopicModel).filter_by(course_id=course_id, week=week, order=order)
+            )
+            db_topic = result.scalars().first()
+            return _to_topic(db_topic) if db_topic else None
+
+    async def list_by_course(self, course_id: int) -> List[Topic]:
+        """List all topics for a specific course."""
+        async with self.get_session() as session:
+            result = await session.execute(
+                select(TopicModel)
+                .filter_by(course_id=course_id)
+                .order_by(TopicModel.week, TopicModel.order)
+            )
+            return [_to_topic(t) for t in result.scalars().all()]
+
+    async def list_by_course_week(self, course_id: int, week: int) -> List[Topic]:
+        """List all topics for a specific course and week."""
+        async with self.get_session() as session:
+            result = await session.execute(
+                select(TopicModel)
+                .filter_by(course_id=course_id, week=week)
+                .order_by(TopicModel.order)
+            )
+            return [_to_topic(t) for t in result.scalars().all()]
+
+    async def update(self, topic: Topic) -> Topic:
+        """Update an existing topic."""
+        async with self.get_session() as session:
+            db_topic = await session.get(TopicModel, topic.id)
+
+            if not db_topic:
+                raise ValueError(f"Topic with ID {topic.id} not found")
+
+            # Update fields
+            db_topic.title = topic.title
+            db_topic.order = topic.order
+            db_topic.week = topic.week
+            db_topic.course_id = topic.course_id
+
+            await session.commit()
+            return topic
+
+    async def delete(self, topic_id: int) -> bool:
+        """
+        Delete a topic by ID.
+
+        Args:
+            topic_id: ID of the topic to delete
+
+        Returns:
+            True if deleted successfully, False if topic not found
+        """
+        async with self.get_session() as session:
+            db_topic = await session.get(TopicModel, topic_id)
+
+            if not db_topic:
+                return False
+
+            await session.delete(db_topic)
+            await session.commit()
+            return True
+
+    async def delete_by_course(self, course_id: int) -> int:
+        """
+        Delete all topics for a specific course.
+
+        Args:
+            course_id: ID of the course whose topics should be deleted
+
+        Returns:
+            Number of topics deleted
+        """
+        async with self.get_session() as session:
+            result = await session.execute(
+                delete(TopicModel).where(TopicModel.course_id == course_id)
+            )
+            await session.commit()
+            return result.rowcount
@@ -0,0 +1,182 @@
+"""
+Async voice repository for database operations.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import func, select
+
+from artificial_u.models.core import Voice
+from artificial_u.models.database import VoiceModel
+from artificial_u.models.repositories.aio.base import AsyncBaseRepository
+
+
+def _to_voice(db_voice: VoiceModel) -> Voice:
+    """Convert a VoiceModel row to a Voice core model."""
+    return Voice(
+        id=db_voice.id,
+        el_voice_id=db_voice.el_voice_id,
+        name=db_voice.name,
+        accent=db_voice.accent,
+        age=db_voice.age,
+        category=db_voice.category,
+        description=db_voice.description,
+        descriptive=db_voice.descriptive,
+        gender=db_voice.gender,
+        language=db_voice.language,
+        locale=db_voice.locale,
+        popularity_score=db_voice.popularity_score,
+        preview_url=db_voice.preview_url,
+        use_case=db_voice.use_case,
+        verified_languages=db_voice.verified_languages or {},
+        last_updated=db_voice.last_updated,
+    )
+
+
+def _apply_filters(
+    query,
+    accent: Optional[str] = None,
+    age: Optional[str] = None,
+    category: Optional[str] = None,
+    gender: Optional[str] = None,
+    language: Optional[str] = None,
+    use_case: Optional[str] = None,
+):
+    """Apply the case-insensitive voice filters shared by list() and count()."""
+    if accent:
+        query = query.filter(VoiceModel.accent.ilike(f"%{accent}%"))
+    if age:
+        query = query.filter(VoiceModel.age.ilike(f"%{age}%"))
+    if category:
+        query = query.filter(VoiceModel.category.ilike(f"%{category}%"))
+    if gender:
+        query = query.filter(VoiceModel.gender.ilike(f"%{gender}%"))
+    if language:
+        query = query.filter(VoiceModel.language.ilike(f"%{language}%"))
+    if use_case:
+        query = query.filter(VoiceModel.use_case.ilike(f"%{use_case}%"))
+    return query
+
+
+class AsyncVoiceRepository(AsyncBaseRepository):
+    """Async repository for Voice operations."""
+
+    async def create(self, voice: Voice) -> Voice:
+        """Create a new voice record."""
+        async with self.get_session() as session:
+            db_voice = VoiceModel(
+                el_voice_id=voice.el_voice_id,
+                name=voice.name,
+                accent=voice.accent,
+                age=voice.age,
+                category=voice.category,
+                description=voice.description,
+                descriptive=voice.descriptive,
+                gender=voice.gender,
+                language=voice.language,
+                locale=voice.locale,
+                popularity_score=voice.popularity_score,
+                preview_url=voice.preview_url,
+                use_case=voice.use_case,
+                verified_languages=voice.verified_languages,
+                last_updated=datetime.now(),
+            )
+
+            session.add(db_voice)
+            await session.commit()
+            await session.refresh(db_voice)
+
+            voice.id = db_voice.id
+            return voice
+
+    async def get(self, voice_id: int) -> Optional[Voice]:
+        """Get a voice by ID."""
+        async with self.get_session() as session:
+            db_voice = await session.get(VoiceModel, voice_id)
+            return _to_voice(db_voice) if db_voice else None
+
+    async def get_by_elevenlabs_id(self, elevenlabs_id: str) -> Optional[Voice]:
+        """Get a voice by ElevenLabs voice ID."""
+        async with self.get_session() as session:
+            result = await session.execute(select(VoiceModel).filter_by(el_voice_id=elevenlabs_id))
+            db_voice = result.scalars().first()
+            return _to_voice(db_voice) if db_voice else None
+
+    async def list(
+        self,
+        accent: Optional[str] = None,
+        age: Optional[str] = None,
+        category: Optional[str] = None,
+        gender: Optional[str] = None,
+        language: Optional[str] = None,
+        use_case: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Voice]:
+        """List voices with optional filters."""
+        async with self.get_session() as session:
+            query = _apply_filters(
+                select(VoiceModel), accent, age, category, gender, language, use_case
+            )
+            query = query.order_by(VoiceModel.popularity_score.desc()).limit(limit).offset(offset)
+
+            result = await session.execute(query)
+            return [_to_voice(v) for v in result.scalars().all()]
+
+    async def update(self, voice: Voice) -> Voice:
+        """Update an existing voice."""
+        async with self.get_session() as session:
+            db_voice = await session.get(VoiceModel, voice.id)
+
+            if not db_voice:
+                raise ValueError(f"Voice with ID {voice.id} not found")
+
+            db_voice.el_voice_id = voice.el_voice_id
+            db_voice.name = voice.name
+            db_voice.accent = voice.accent
+            db_voice.age = voice.age
+            db_voice.category = voice.category
+            db_voice.description = voice.description
+            db_voice.descriptive = voice.descriptive
+            db_voice.gender = voice.gender
+            db_voice.language = voice.language
+            db_voice.locale = voice.locale
+            db_voice.popularity_score = voice.popularity_score
+            db_voice.preview_url = voice.preview_url
+            db_voice.use_case = voice.use_case
+            db_voice.verified_languages = voice.verified_languages
+            db_voice.last_updated = datetime.now()
+
+            await session.commit()
+            return voice
+
+    async def upsert(self, voice: Voice) -> Voice:
+        """Create or update a voice based on ElevenLabs voice_id."""
+        existing_voice = await self.get_by_elevenlabs_id(voice.el_voice_id)
+        if existing_voice:
+            voice.id = existing_voice.id
+            return await self.update(voice)
+        return await self.create(voice)
+
+    async def count(
+        self,
+        accent: Optional[str] = None,
+        age: Optional[str] = None,
+        category: Optional[str] = None,
+        gender: Optional[str] = None,
+        language: Optional[str] = None,
+        use_case: Optional[str] = None,
+    ) -> int:
+        """Count voices with optional filters."""
+        async with self.get_session() as session:
+            query = _apply_filters(
+                select(func.count(VoiceModel.id)),
+                accent,
+                age,
+                category,
+                gender,
+                language,
+                use_case,
+            )
+            return (await session.execute(query)).scalar_one()
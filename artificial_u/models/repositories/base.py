@@ -5,10 +5,10 @@ Base repository for database operations.
 import logging
 import os
 
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 
 from artificial_u.models.database import Base
+from artificial_u.models.repositories.engine import get_engine
 
 
 class BaseRepository:
@@ -33,7 +33,8 @@ class BaseRepository:
         if not self.db_url:
             raise ValueError("Database URL not provided. Set DATABASE_URL environment variable.")
 
-        self.engine = create_engine(self.db_url)
+        # Engines (and their pools) are shared process-wide per URL
+        self.engine = get_engine(self.db_url)
 
     def get_session(self) -> Session:
         """
@@ -2,7 +2,7 @@
 Course repository for database operations.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from artificial_u.models.core import Course
 from artificial_u.models.database import CourseModel
@@ -124,6 +124,85 @@ class CourseRepository(BaseRepository):
             session.commit()
             return course
 
+    def get_with_lecture_summary(self, course_id: int) -> Optional[Tuple[Course, Optional[str]]]:
+        """
+        Get a course together with its rolling lecture summary.
+
+        Args:
+            course_id: ID of the course
+
+        Returns:
+            Tuple of (course, summary or None), or None if course not found
+        """
+        with self.get_session() as session:
+            db_course = session.query(CourseModel).filter_by(id=course_id).first()
+
+            if not db_course:
+                return None
+
+            course = Course(
+                id=db_course.id,
+                code=db_course.code,
+                title=db_course.title,
+                credits=db_course.credits,
+                description=db_course.description,
+                lectures_per_week=db_course.lectures_per_week,
+                level=db_course.level,
+                total_weeks=db_course.total_weeks,
+                department_id=db_course.department_id,
+                professor_id=db_course.professor_id,
+            )
+            return course, db_course.lecture_summary
+
+    def update_lecture_summary(self, course_id: int, summary: Optional[str]) -> bool:
+        """
+        Replace a course's rolling lecture summary.
+
+        Args:
+            course_id: ID of the course
+            summary: The new summary
+
+        Returns:
+            True if updated, False if course not found
+        """
+        with self.get_session() as session:
+            updated = (
+                session.query(CourseModel)
+                .filter_by(id=course_id)
+                .update({CourseModel.lecture_summary: summary}, synchronize_session=False)
+            )
+            session.commit()
+            return bool(updated)
+
+    def swap_lecture_summary(
+        self, course_id: int, previous: Optional[str], summary: Optional[str]
+    ) -> bool:
+        """
+        Replace a course's rolling lecture summary only if it is still the given one.
+
+        The check and the write are a single UPDATE, so of two writers that read
+        the same summary only the first succeeds.
+
+        Args:
+            course_id: ID of the course
+            previous: The summary the new one was built from
+            summary: The new summary
+
+        Returns:
+            True if updated, False if the summary changed meanwhile or course not found
+        """
+        with self.get_session() as session:
+            updated = (
+                session.query(CourseModel)
+                .filter(
+                    CourseModel.id == course_id,
+                    CourseModel.lecture_summary.is_not_distinct_from(previous),
+                )
+                .update({CourseModel.lecture_summary: summary}, synchronize_session=False)
+            )
+            session.commit()
+            return bool(updated)
+
     def delete(self, course_id: int) -> bool:
         """
         Delete a course by ID.
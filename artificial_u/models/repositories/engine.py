@@ -0,0 +1,189 @@
+"""
+Process-wide SQLAlchemy engine registry.
+
+Engines own connection pools, so creating one per repository (or per request)
+multiplies pools and churns connections. All repositories obtain their engine
+from this registry, which keeps exactly one engine per database URL (and one
+async engine per URL for the async repositories).
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from artificial_u.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_engines: Dict[str, Engine] = {}
+_async_engines: Dict[str, AsyncEngine] = {}
+_lock = threading.Lock()
+
+# Async drivers used for each sync backend
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+
+def to_async_url(db_url: str) -> str:
+    """
+    Convert a database URL to use the async driver for its backend.
+
+    Args:
+        db_url: SQLAlchemy database URL (e.g. postgresql://...)
+
+    Returns:
+        Equivalent URL using the async driver (e.g. postgresql+asyncpg://...)
+    """
+    url = make_url(db_url)
+    backend = url.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None:
+        raise ValueError(f"No async driver configured for database backend '{backend}'")
+    return url.set(drivername=f"{backend}+{driver}").render_as_string(hide_password=False)
+
+
+def _engine_options(db_url: str, use_async: bool = False) -> Dict[str, Any]:
+    """
+    Build create_engine keyword arguments from settings.
+
+    Pool tuning only applies to server databases; SQLite (used in unit tests)
+    keeps SQLAlchemy's default pool for its dialect.
+
+    Args:
+        db_url: SQLAlchemy database URL
+        use_async: Whether the options are for an async (asyncpg) engine
+
+    Returns:
+        Dictionary of keyword arguments for create_engine
+    """
+    if make_url(db_url).get_backend_name() == "sqlite":
+        return {}
+
+    settings = get_settings()
+    options: Dict[str, Any] = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        if use_async:
+            options["connect_args"] = {
+                "server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+            }
+        else:
+            options["connect_args"] = {
+                "options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+            }
+    return options
+
+
+def get_engine(db_url: str) -> Engine:
+    """
+    Get the shared engine for a database URL, creating it on first use.
+
+    Args:
+        db_url: SQLAlchemy database URL
+
+    Returns:
+        Engine: The process-wide engine for this URL
+    """
+    engine = _engines.get(db_url)
+    if engine is not None:
+        return engine
+
+    with _lock:
+        engine = _engines.get(db_url)
+        if engine is None:
+            engine = create_engine(db_url, **_engine_options(db_url))
+            _engines[db_url] = engine
+            logger.info(f"Created database engine for {engine.url!r}")
+        return engine
+
+
+def get_async_engine(db_url: str) -> AsyncEngine:
+    """
+    Get the shared async engine for a database URL, creating it on first use.
+
+    Args:
+        db_url: SQLAlchemy database URL; the sync driver is swapped for its async one
+
+    Returns:
+        AsyncEngine: The process-wide async engine for this URL
+    """
+    engine = _async_engines.get(db_url)
+    if engine is not None:
+        return engine
+
+    with _lock:
+        engine = _async_engines.get(db_url)
+        if engine is None:
+            engine = create_async_engine(
+                to_async_url(db_url), **_engine_options(db_url, use_async=True)
+            )
+            _async_engines[db_url] = engine
+            logger.info(f"Created async database engine for {engine.url!r}")
+        return engine
+
+
+def get_pool_stats(db_url: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Get connection pool statistics for registered engines.
+
+    Args:
+        db_url: Optional URL to restrict the stats to a single engine
+
+    Returns:
+        Mapping of masked database URL to pool statistics
+    """
+    stats: Dict[str, Dict[str, Any]] = {}
+    registered = list(_engines.items()) + list(_async_engines.items())
+    for url, engine in registered:
+        if db_url is not None and url != db_url:
+            continue
+
+        pool = engine.pool
+        pool_stats: Dict[str, Any] = {
+            "pool_class": type(pool).__name__,
+            "status": pool.status(),
+        }
+        # QueuePool exposes counters; other pool classes don't
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            counter = getattr(pool, name, None)
+            if callable(counter):
+                pool_stats[name] = counter()
+
+        stats[repr(engine.url)] = pool_stats
+    return stats
+
+
+def dispose_engines() -> None:
+    """
+    Dispose all registered engines and clear the registry.
+
+    Async engines are dropped without awaiting their dispose(); use
+    dispose_async_engines() from a running event loop to close them cleanly.
+    """
+    with _lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+        for async_engine in _async_engines.values():
+            async_engine.sync_engine.dispose(close=False)
+        _async_engines.clear()
+
+
+async def dispose_async_engines() -> None:
+    """Dispose all registered async engines, closing their pooled connections."""
+    with _lock:
+        engines = list(_async_engines.values())
+        _async_engines.clear()
+    for engine in engines:
+        await engine.dispose()
@@ -2,11 +2,13 @@
 Factory for creating and managing repository instances.
 """
 
-from typing import Dict, Optional, Type, TypeVar
+from typing import Any, Dict, Optional, Type, TypeVar
 
 from artificial_u.models.repositories.base import BaseRepository
 from artificial_u.models.repositories.course import CourseRepository
 from artificial_u.models.repositories.department import DepartmentRepository
+from artificial_u.models.repositories.engine import get_pool_stats
+from artificial_u.models.repositories.job import JobRepository
 from artificial_u.models.repositories.lecture import LectureRepository
 from artificial_u.models.repositories.professor import ProfessorRepository
 from artificial_u.models.repositories.topic import TopicRepository
@@ -61,6 +63,11 @@ class RepositoryFactory:
         """Get the department repository."""
         return self.get_repository(DepartmentRepository)
 
+    @property
+    def job(self) -> JobRepository:
+        """Get the job repository."""
+        return self.get_repository(JobRepository)
+
     @property
     def lecture(self) -> LectureRepository:
         """Get the lecture repository."""
@@ -81,6 +88,11 @@ class RepositoryFactory:
         """Get the voice repository."""
         return self.get_repository(VoiceRepository)
 
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get connection pool statistics for this factory's database engine."""
+        repo = self.get_repository(DepartmentRepository)
+        return get_pool_stats(repo.db_url)
+
     def create_tables(self):
         """Create all database tables if they don't exist."""
         # We only need to call this once for any repository
@@ -0,0 +1,265 @@
+"""
+Job repository for the background job queue.
+
+Jobs are leased by workers with SELECT ... FOR UPDATE SKIP LOCKED, so any number
+of worker processes can poll the same table without handing a job to two of them.
+A lease expires unless the worker renews it, which lets another worker pick up
+the jobs of a worker that died.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
+
+from artificial_u.models.core import Job
+from artificial_u.models.database import JobModel
+from artificial_u.models.repositories.base import BaseRepository
+
+# Job statuses
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+def utcnow() -> datetime:
+    """Get the current time in UTC."""
+    return datetime.now(timezone.utc)
+
+
+class JobRepository(BaseRepository):
+    """Repository for Job operations."""
+
+    @staticmethod
+    def _to_job(db_job: JobModel) -> Job:
+        """Convert a job row to the core model."""
+        return Job(
+            id=db_job.id,
+            kind=db_job.kind,
+            payload=db_job.payload,
+            status=db_job.status,
+            idempotency_key=db_job.idempotency_key,
+            attempts=db_job.attempts,
+            max_attempts=db_job.max_attempts,
+            run_at=db_job.run_at,
+            locked_by=db_job.locked_by,
+            locked_until=db_job.locked_until,
+            result=db_job.result,
+            error=db_job.error,
+            created_at=db_job.created_at,
+            updated_at=db_job.updated_at,
+            finished_at=db_job.finished_at,
+        )
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        idempotency_key: Optional[str] = None,
+        max_attempts: int = 3,
+    ) -> Job:
+        """
+        Add a job to the queue.
+
+        Args:
+            kind: Job kind, which selects the handler that runs it
+            payload: JSON-serializable handler arguments
+            idempotency_key: Optional key; enqueuing a key again returns the
+                existing job instead of adding another
+            max_attempts: Attempts made before the job is marked failed
+
+        Returns:
+            Job: The queued job, or the existing job with the same idempotency key
+        """
+        now = utcnow()
+        with self.get_session() as session:
+            db_job = JobModel(
+                kind=kind,
+                payload=payload,
+                status=QUEUED,
+                idempotency_key=idempotency_key,
+                attempts=0,
+                max_attempts=max_attempts,
+                run_at=now,
+                created_at=now,
+                updated_at=now,
+            )
+            session.add(db_job)
+            try:
+                session.commit()
+            except IntegrityError:
+                session.rollback()
+                if idempotency_key is None:
+                    raise
+                existing = session.query(JobModel).filter_by(idempotency_key=idempotency_key)
+                return self._to_job(existing.one())
+            session.refresh(db_job)
+            return self._to_job(db_job)
+
+    def get(self, job_id: int) -> Optional[Job]:
+        """
+        Get a job by ID.
+
+        Args:
+            job_id: The ID of the job
+
+        Returns:
+            Optional[Job]: The job if found, None otherwise
+        """
+        with self.get_session() as session:
+            db_job = session.query(JobModel).filter_by(id=job_id).first()
+            return self._to_job(db_job) if db_job else None
+
+    def lease(
+        self, worker_id: str, lease_seconds: float, kinds: Optional[List[str]] = None
+    ) -> Optional[Job]:
+        """
+        Claim the next due job for a worker.
+
+        Due jobs are queued jobs whose run time has come, and running jobs whose
+        lease expired with attempts left (their worker stopped renewing it).
+        Rows locked by another worker's lease transaction are skipped.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+            lease_seconds: Seconds the worker holds the job without renewing
+            kinds: Only claim jobs of these kinds (None for any)
+
+        Returns:
+            Optional[Job]: The claimed job with its attempt counted, or None if
+            no job is due
+        """
+        now = utcnow()
+        with self.get_session() as session:
+            query = session.query(JobModel).filter(
+                or_(
+                    and_(JobModel.status == QUEUED, JobModel.run_at <= now),
+                    and_(
+                        JobModel.status == RUNNING,
+                        JobModel.locked_until < now,
+                        JobModel.attempts < JobModel.max_attempts,
+                    ),
+                )
+            )
+            if kinds:
+                query = query.filter(JobModel.kind.in_(kinds))
+            db_job = (
+                query.order_by(JobModel.run_at, JobModel.id)
+                .with_for_update(skip_locked=True)
+                .first()
+            )
+            if not db_job:
+                return None
+
+            db_job.status = RUNNING
+            db_job.attempts += 1
+            db_job.locked_by = worker_id
+            db_job.locked_until = now + timedelta(seconds=lease_seconds)
+            db_job.updated_at = now
+            job = self._to_job(db_job)
+            session.commit()
+            return job
+
+    def _update_leased(self, job_id: int, worker_id: str, values: Dict[str, Any]) -> bool:
+        """Update a running job if the worker still holds its lease."""
+        with self.get_session() as session:
+            updated = (
+                session.query(JobModel)
+                .filter_by(id=job_id, status=RUNNING, locked_by=worker_id)
+                .update({**values, JobModel.updated_at: utcnow()}, synchronize_session=False)
+            )
+            session.commit()
+            return bool(updated)
+
+    def heartbeat(self, job_id: int, worker_id: str, lease_seconds: float) -> bool:
+        """
+        Renew a worker's lease on a running job.
+
+        Returns:
+            bool: False if the worker no longer holds the job
+        """
+        return self._update_leased(
+            job_id,
+            worker_id,
+            {JobModel.locked_until: utcnow() + timedelta(seconds=lease_seconds)},
+        )
+
+    def complete(self, job_id: int, worker_id: str, result: Optional[Dict[str, Any]]) -> bool:
+        """
+        Mark a leased job as succeeded.
+
+        Args:
+            job_id: The ID of the job
+            worker_id: The worker holding the job
+            result: JSON-serializable result of the job
+
+        Returns:
+            bool: False if the worker no longer holds the job
+        """
+        return self._update_leased(
+            job_id,
+            worker_id,
+            {
+                JobModel.status: SUCCEEDED,
+                JobModel.result: result,
+                JobModel.error: None,
+                JobModel.locked_by: None,
+                JobModel.locked_until: None,
+                JobModel.finished_at: utcnow(),
+            },
+        )
+
+    def fail(
+        self, job_id: int, worker_id: str, error: str, retry_at: Optional[datetime] = None
+    ) -> bool:
+        """
+        Record a failed attempt of a leased job.
+
+        Args:
+            job_id: The ID of the job
+            worker_id: The worker holding the job
+            error: Description of the failure
+            retry_at: When to run the job again, or None to mark it failed
+
+        Returns:
+            bool: False if the worker no longer holds the job
+        """
+        values = {JobModel.error: error, JobModel.locked_by: None, JobModel.locked_until: None}
+        if retry_at is None:
+            values.update({JobModel.status: FAILED, JobModel.finished_at: utcnow()})
+        else:
+            values.update({JobModel.status: QUEUED, JobModel.run_at: retry_at})
+        return self._update_leased(job_id, worker_id, values)
+
+    def fail_abandoned(self) -> int:
+        """
+        Fail running jobs whose lease expired on their last attempt.
+
+        Returns:
+            int: Number of jobs marked failed
+        """
+        now = utcnow()
+        with self.get_session() as session:
+            updated = (
+                session.query(JobModel)
+                .filter(
+                    JobModel.status == RUNNING,
+                    JobModel.locked_until < now,
+                    JobModel.attempts >= JobModel.max_attempts,
+                )
+                .update(
+                    {
+                        JobModel.status: FAILED,
+                        JobModel.error: "Worker stopped renewing the lease on the last attempt",
+                        JobModel.locked_by: None,
+                        JobModel.locked_until: None,
+                        JobModel.finished_at: now,
+                        JobModel.updated_at: now,
+                    },
+                    synchronize_session=False,
+                )
+            )
+            session.commit()
+            return updated
@@ -6,8 +6,8 @@ from typing import List, Optional
 
 from sqlalchemy import func, or_
 
-from artificial_u.models.core import Lecture
-from artificial_u.models.database import CourseModel, LectureModel
+from artificial_u.models.core import Course, Lecture, LectureGenerationContext, Professor, Topic
+from artificial_u.models.database import CourseModel, LectureModel, ProfessorModel, TopicModel
 from artificial_u.models.repositories.base import BaseRepository
 
 
@@ -31,6 +31,8 @@ class LectureRepository(BaseRepository):
                 content=lecture.content,
                 summary=lecture.summary,
                 audio_url=lecture.audio_url,
+                audio_playlist_url=lecture.audio_playlist_url,
+                audio_manifest_url=lecture.audio_manifest_url,
                 transcript_url=lecture.transcript_url,
                 course_id=lecture.course_id,
                 topic_id=lecture.topic_id,
@@ -64,6 +66,8 @@ class LectureRepository(BaseRepository):
                 content=db_lecture.content,
                 summary=db_lecture.summary,
                 audio_url=db_lecture.audio_url,
+                audio_playlist_url=db_lecture.audio_playlist_url,
+                audio_manifest_url=db_lecture.audio_manifest_url,
                 transcript_url=db_lecture.transcript_url,
                 course_id=db_lecture.course_id,
                 topic_id=db_lecture.topic_id,
@@ -115,6 +119,8 @@ class LectureRepository(BaseRepository):
                     content=lecture.content,
                     summary=lecture.summary,
                     audio_url=lecture.audio_url,
+                    audio_playlist_url=lecture.audio_playlist_url,
+                    audio_manifest_url=lecture.audio_manifest_url,
                     transcript_url=lecture.transcript_url,
                     course_id=lecture.course_id,
                     topic_id=lecture.topic_id,
@@ -122,6 +128,101 @@ class LectureRepository(BaseRepository):
                 for lecture in db_lectures
             ]
 
+    def get_generation_context(self, course_id: int) -> Optional[LectureGenerationContext]:
+        """
+        Load everything lecture generation needs about a course in two queries.
+
+        The course is fetched together with its professor, then its topics
+        together with their lectures' ids, revisions and summaries. Lecture
+        content is never loaded.
+
+        Args:
+            course_id: ID of the course
+
+        Returns:
+            Optional[LectureGenerationContext]: The context, or None if the course doesn't exist
+        """
+        with self.get_session() as session:
+            row = (
+                session.query(CourseModel, ProfessorModel)
+                .outerjoin(ProfessorModel, CourseModel.professor_id == ProfessorModel.id)
+                .filter(CourseModel.id == course_id)
+                .first()
+            )
+            if not row:
+                return None
+            db_course, db_professor = row
+
+            rows = (
+                session.query(
+                    TopicModel, LectureModel.id, LectureModel.revision, LectureModel.summary
+                )
+                .outerjoin(LectureModel, LectureModel.topic_id == TopicModel.id)
+                .filter(TopicModel.course_id == course_id)
+                .order_by(TopicModel.week, TopicModel.order, LectureModel.revision)
+                .all()
+            )
+
+            topics = {}
+            lectures = []
+            for db_topic, lecture_id, revision, summary in rows:
+                if db_topic.id not in topics:
+                    topics[db_topic.id] = Topic(
+                        id=db_topic.id,
+                        title=db_topic.title,
+                        order=db_topic.order,
+                        week=db_topic.week,
+                        course_id=db_topic.course_id,
+                    )
+                if lecture_id is not None:
+                    lectures.append(
+                        Lecture(
+                            id=lecture_id,
+                            revision=revision,
+                            summary=summary,
+                            course_id=course_id,
+                            topic_id=db_topic.id,
+                        )
+                    )
+
+            return LectureGenerationContext(
+                course=Course(
+                    id=db_course.id,
+                    code=db_course.code,
+                    title=db_course.title,
+                    credits=db_course.credits,
+                    description=db_course.description,
+                    lectures_per_week=db_course.lectures_per_week,
+                    level=db_course.level,
+                    total_weeks=db_course.total_weeks,
+                    department_id=db_course.department_id,
+                    professor_id=db_course.professor_id,
+                ),
+                professor=(
+                    Professor(
+                        id=db_professor.id,
+                        name=db_professor.name,
+                        title=db_professor.title,
+                        accent=db_professor.accent,
+                        age=db_professor.age,
+                        background=db_professor.background,
+                        description=db_professor.description,
+                        gender=db_professor.gender,
+                        personality=db_professor.personality,
+                        specialization=db_professor.specialization,
+                        teaching_style=db_professor.teaching_style,
+                        image_url=db_professor.image_url,
+                        department_id=db_professor.department_id,
+                        voice_id=db_professor.voice_id,
+                    )
+                    if db_professor
+                    else None
+                ),
+                topics=list(topics.values()),
+                lectures=lectures,
+                course_summary=db_course.lecture_summary,
+            )
+
     def list_by_topic(self, topic_id: int) -> List[Lecture]:
         """
         List all lectures for a specific topic.
@@ -142,6 +243,8 @@ class LectureRepository(BaseRepository):
                     content=lecture.content,
                     summary=lecture.summary,
                     audio_url=lecture.audio_url,
+                    audio_playlist_url=lecture.audio_playlist_url,
+                    audio_manifest_url=lecture.audio_manifest_url,
                     transcript_url=lecture.transcript_url,
                     course_id=lecture.course_id,
                     topic_id=lecture.topic_id,
@@ -204,6 +307,8 @@ class LectureRepository(BaseRepository):
                     content=lecture.content,
                     summary=lecture.summary,
                     audio_url=lecture.audio_url,
+                    audio_playlist_url=lecture.audio_playlist_url,
+                    audio_manifest_url=lecture.audio_manifest_url,
                     transcript_url=lecture.transcript_url,
                     course_id=lecture.course_id,
                     topic_id=lecture.topic_id,
@@ -211,6 +316,42 @@ class LectureRepository(BaseRepository):
                 for lecture in db_lectures
             ]
 
+    def count(
+        self,
+        course_id: Optional[int] = None,
+        professor_id: Optional[int] = None,
+        search_query: Optional[str] = None,
+    ) -> int:
+        """
+        Count lectures matching the same filters as list().
+
+        Args:
+            course_id: Filter by course ID
+            professor_id: Filter by professor ID
+            search_query: Search query for content/summary
+
+        Returns:
+            int: Number of matching lectures
+        """
+        with self.get_session() as session:
+            query = session.query(LectureModel)
+
+            if course_id is not None:
+                query = query.filter(LectureModel.course_id == course_id)
+
+            if professor_id is not None:
+                query = query.join(CourseModel).filter(CourseModel.professor_id == professor_id)
+
+            if search_query:
+                query = query.filter(
+                    or_(
+                        LectureModel.content.ilike(f"%{search_query}%"),
+                        LectureModel.summary.ilike(f"%{search_query}%"),
+                    )
+                )
+
+            return query.count()
+
     def update(self, lecture: Lecture) -> Lecture:
         """
         Update an existing lecture.
@@ -231,6 +372,8 @@ class LectureRepository(BaseRepository):
             db_lecture.revision = lecture.revision
             db_lecture.summary = lecture.summary
             db_lecture.audio_url = lecture.audio_url
+            db_lecture.audio_playlist_url = lecture.audio_playlist_url
+            db_lecture.audio_manifest_url = lecture.audio_manifest_url
             db_lecture.transcript_url = lecture.transcript_url
             db_lecture.course_id = lecture.course_id
             db_lecture.topic_id = lecture.topic_id
@@ -8,7 +8,11 @@ from artificial_u.prompts.base import PromptTemplate
 from artificial_u.prompts.course import get_course_prompt
 from artificial_u.prompts.department import get_department_prompt
 from artificial_u.prompts.image import format_professor_image_prompt
-from artificial_u.prompts.lecture import get_lecture_prompt
+from artificial_u.prompts.lecture import (
+    get_course_summary_prompt,
+    get_lecture_prompt,
+    get_lecture_prompt_parts,
+)
 from artificial_u.prompts.professor import get_professor_prompt
 from artificial_u.prompts.system import get_system_prompt
 from artificial_u.prompts.topics import get_topics_prompt
@@ -23,7 +27,9 @@ __all__ = [
     # Image prompts
     "format_professor_image_prompt",
     # Lecture prompts
+    "get_course_summary_prompt",
     "get_lecture_prompt",
+    "get_lecture_prompt_parts",
     # Professor prompts
     "get_professor_prompt",
     # System prompts
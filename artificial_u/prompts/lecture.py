@@ -1,7 +1,9 @@
 """Lecture-related prompt templates."""
 
-from typing import Any, Dict, List, Optional
+import logging
+from typing import Any, Dict, List, Optional, Tuple
 
+from artificial_u.content.usage import estimate_tokens
 from artificial_u.models.converters import (
     lectures_to_xml,
     partial_course_to_xml,
@@ -11,6 +13,8 @@ from artificial_u.models.converters import (
 )
 from artificial_u.prompts.base import PromptTemplate
 
+logger = logging.getLogger(__name__)
+
 # XML structure for lecture content
 LECTURE_XML_STRUCTURE = """<lecture>
   <content>
@@ -83,32 +87,15 @@ EXAMPLE_LECTURE_2 = """<lecture>
   </content>
 </lecture>"""
 
-# Unified lecture prompt that handles both structured and freeform inputs
-LECTURE_PROMPT = PromptTemplate(
-    template=f"""
+# Static instructions and examples shared by every lecture prompt. They come first so
+# providers can cache them (with the course context below) as a common prompt prefix.
+LECTURE_PROMPT_PREAMBLE = f"""
 Generate a university lecture in XML format.
 Use the structure below; fill in the <content></content> tags with the lecture content.
 
 XML Structure:
 {LECTURE_XML_STRUCTURE}
 
-Course Information:
-{{course_xml}}
-
-Professor Information:
-{{professor_xml}}
-
-Topic for this lecture:
-{{topic_xml}}
-
-Summary of existing lectures in this course (for context and continuity):
-{{existing_lectures_xml}}
-
-List of topics in this course (for context and continuity):
-{{topics_xml}}
-
-{{freeform_prompt_text}}
-
 Examples of properly formatted lectures:
 Example 1:
 {EXAMPLE_LECTURE_1}
@@ -123,23 +110,147 @@ IMPORTANT:
 - Create a narrative flow rather than just presenting facts
 - Include natural interactions and engagement
 - Produce text content that is suitable for a text-to-speech engine
-- Aim for approximately {{word_count}} words in the lecture content
+"""
+
+# Context shared by every lecture of a course
+LECTURE_COURSE_CONTEXT = PromptTemplate(
+    template="""
+Course Information:
+{course_xml}
+
+Professor Information:
+{professor_xml}
+
+List of topics in this course (for context and continuity):
+{topics_xml}
+""",
+    required_vars=["course_xml", "professor_xml", "topics_xml"],
+)
+
+# Per-lecture part of the prompt, following the cacheable prefix
+LECTURE_PROMPT = PromptTemplate(
+    template="""
+Summary of existing lectures in this course (for context and continuity):
+{existing_lectures_xml}
+
+Topic for this lecture:
+{topic_xml}
+
+{freeform_prompt_text}
+Aim for approximately {word_count} words in the lecture content.
 
 Wrap your answer in <output> tags, providing only the <lecture> element.
 """,
     required_vars=[
-        "course_xml",
-        "professor_xml",
         "topic_xml",
         "existing_lectures_xml",
-        "topics_xml",
         "freeform_prompt_text",
         "word_count",
     ],
 )
 
 
-def get_lecture_prompt(
+# Folds a newly saved lecture into the rolling summary of its course
+COURSE_SUMMARY_PROMPT = PromptTemplate(
+    template="""
+You maintain a running summary of a university course's lectures. It replaces older \
+lectures in the prompts that generate the course's later lectures, so it must capture \
+what students have already been taught.
+
+Course Information:
+{course_xml}
+
+Current summary of the lectures so far:
+{previous_summary_xml}
+
+Lecture just added (week {week}, lecture {order}: {title}):
+<lecture>
+{lecture_text}
+</lecture>
+
+Rewrite the summary so it also covers the new lecture. Keep the key concepts, terms, \
+examples, running threads and anything the professor promised to return to; drop detail \
+that later lectures will not build on. Keep it under {word_limit} words, however many \
+lectures it covers.
+
+Wrap your answer in <course_summary> tags.
+""",
+    required_vars=[
+        "course_xml",
+        "previous_summary_xml",
+        "week",
+        "order",
+        "title",
+        "lecture_text",
+        "word_limit",
+    ],
+)
+
+
+def course_summary_to_xml(course_summary: str) -> str:
+    """Format a rolling course summary as XML for context."""
+    return f"<course_summary>\n{course_summary}\n</course_summary>"
+
+
+def _most_recent_within(
+    lectures: List[Dict[str, Any]], budget: int
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Take lectures from the end while they fit in the budget, returning what is left of it."""
+    recent: List[Dict[str, Any]] = []
+    for lecture in reversed(lectures):
+        cost = estimate_tokens(lectures_to_xml([lecture]))
+        if cost > budget:
+            break
+        recent.insert(0, lecture)
+        budget -= cost
+    return recent, budget
+
+
+def select_lecture_context(
+    existing_lectures: List[Dict[str, Any]],
+    course_summary: Optional[str],
+    token_budget: Optional[int],
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Choose the existing lectures to include in a prompt within a token budget.
+
+    When every lecture fits, they are all included. Otherwise the rolling course
+    summary stands in for the older lectures, and the most recent lectures are
+    kept in full while they fit in what is left of the budget. A course without a
+    summary yet (e.g. one generated before summaries existed) keeps its older
+    lectures as topic-only outline entries instead, as many as fit.
+
+    Args:
+        existing_lectures: Existing lecture attribute dictionaries, oldest first
+        course_summary: Rolling summary of the course's lectures, if any
+        token_budget: Estimated tokens available for the lectures, or None for no limit
+
+    Returns:
+        Tuple of (lectures to include, summary to include or None)
+    """
+    if token_budget is None or estimate_tokens(lectures_to_xml(existing_lectures)) <= token_budget:
+        return existing_lectures, None
+
+    remaining = token_budget
+    if course_summary:
+        remaining -= estimate_tokens(course_summary_to_xml(course_summary))
+    recent, remaining = _most_recent_within(existing_lectures, remaining)
+    if course_summary:
+        return recent, course_summary
+
+    older = existing_lectures[: len(existing_lectures) - len(recent)]
+    outline = [
+        {key: lecture[key] for key in ("week", "order", "title") if key in lecture}
+        for lecture in older
+    ]
+    outline, _ = _most_recent_within(outline, remaining)
+    logger.warning(
+        f"No course summary for {len(older)} older lectures over the prompt budget; "
+        f"including {len(outline)} of them as topic outlines only"
+    )
+    return outline + recent, None
+
+
+def get_lecture_prompt_parts(
     course_data: Dict[str, Any],
     professor_data: Dict[str, Any],
     topic_data: Dict[str, Any],
@@ -147,8 +258,17 @@ def get_lecture_prompt(
     topics_data: List[Dict[str, Any]],
     freeform_prompt: Optional[str] = None,
     word_count: int = 2500,
-) -> str:
-    """Generate a lecture prompt using centralized converters.
+    course_summary: Optional[str] = None,
+    token_budget: Optional[int] = None,
+) -> Tuple[str, str]:
+    """Generate a lecture prompt split into a cacheable prefix and a per-lecture suffix.
+
+    The prefix holds the static instructions and examples followed by the course,
+    professor and topic list, so it is identical for every lecture of a course.
+    With a token budget, the existing lectures get whatever the other sections
+    leave of it, and older lectures that do not fit are replaced by the course
+    summary (see select_lecture_context), keeping the prompt size roughly
+    constant through a course.
 
     Args:
         course_data: Dictionary of course attributes
@@ -158,32 +278,120 @@ def get_lecture_prompt(
         topics_data: List of topic attribute dictionaries
         freeform_prompt: Optional freeform text context
         word_count: Target word count for the lecture
+        course_summary: Optional rolling summary of the course's lectures
+        token_budget: Optional estimated token limit for the whole prompt
 
     Returns:
-        Formatted prompt string
+        Tuple of (prefix, suffix); the full prompt is their concatenation
     """
-    # Use converters to generate XML sections
-    course_xml_str = partial_course_to_xml(course_data)
-    professor_xml_str = professor_to_xml(professor_data)
-    topic_xml_str = topic_to_xml(topic_data)
-    existing_lectures_xml_str = lectures_to_xml(existing_lectures)
-    topics_xml_str = topics_to_xml(topics_data)
-
     # Format freeform prompt if provided
     freeform_prompt_text = (
         f"Additional context/ideas for the lecture:\n{freeform_prompt}\n" if freeform_prompt else ""
     )
 
-    # Format the main prompt template
+    # Format the prompt templates
     try:
-        return LECTURE_PROMPT.format(
-            course_xml=course_xml_str,
-            professor_xml=professor_xml_str,
-            topic_xml=topic_xml_str,
-            existing_lectures_xml=existing_lectures_xml_str,
-            topics_xml=topics_xml_str,
-            word_count=word_count,
-            freeform_prompt_text=freeform_prompt_text,
+        prefix = LECTURE_PROMPT_PREAMBLE + LECTURE_COURSE_CONTEXT.format(
+            course_xml=partial_course_to_xml(course_data),
+            professor_xml=professor_to_xml(professor_data),
+            topics_xml=topics_to_xml(topics_data),
+        )
+        suffix_args = {
+            "topic_xml": topic_to_xml(topic_data),
+            "word_count": word_count,
+            "freeform_prompt_text": freeform_prompt_text,
+        }
+        lectures_budget = None
+        if token_budget:
+            fixed = estimate_tokens(
+                prefix + LECTURE_PROMPT.format(existing_lectures_xml="", **suffix_args)
+            )
+            lectures_budget = max(0, token_budget - fixed)
+        lectures, summary = select_lecture_context(
+            existing_lectures, course_summary, lectures_budget
         )
+        existing_lectures_xml = lectures_to_xml(lectures)
+        if summary:
+            existing_lectures_xml = f"{course_summary_to_xml(summary)}\n{existing_lectures_xml}"
+        suffix = LECTURE_PROMPT.format(existing_lectures_xml=existing_lectures_xml, **suffix_args)
     except ValueError as e:
         raise ValueError(f"Error formatting LECTURE_PROMPT: {e}")
+    return prefix, suffix
+
+
+def get_lecture_prompt(
+    course_data: Dict[str, Any],
+    professor_data: Dict[str, Any],
+    topic_data: Dict[str, Any],
+    existing_lectures: List[Dict[str, Any]],
+    topics_data: List[Dict[str, Any]],
+    freeform_prompt: Optional[str] = None,
+    word_count: int = 2500,
+    course_summary: Optional[str] = None,
+    token_budget: Optional[int] = None,
+) -> str:
+    """Generate a lecture prompt using centralized converters.
+
+    Args:
+        course_data: Dictionary of course attributes
+        professor_data: Dictionary of professor attributes
+        topic_data: Dictionary of topic attributes
+        existing_lectures: List of existing lecture attribute dictionaries
+        topics_data: List of topic attribute dictionaries
+        freeform_prompt: Optional freeform text context
+        word_count: Target word count for the lecture
+        course_summary: Optional rolling summary of the course's lectures
+        token_budget: Optional estimated token limit for the whole prompt
+
+    Returns:
+        Formatted prompt string
+    """
+    return "".join(
+        get_lecture_prompt_parts(
+            course_data,
+            professor_data,
+            topic_data,
+            existing_lectures,
+            topics_data,
+            freeform_prompt=freeform_prompt,
+            word_count=word_count,
+            course_summary=course_summary,
+            token_budget=token_budget,
+        )
+    )
+
+
+def get_course_summary_prompt(
+    course_data: Dict[str, Any],
+    previous_summary: Optional[str],
+    lecture_data: Dict[str, Any],
+    word_limit: int = 400,
+) -> str:
+    """Generate a prompt folding a new lecture into a course's rolling summary.
+
+    Args:
+        course_data: Dictionary of course attributes
+        previous_summary: The current summary, or None for a course's first lecture
+        lecture_data: Dictionary with the lecture's "title", "week", "order" and its
+            "summary" if it has one, otherwise its "content"
+        word_limit: Target maximum length of the summary in words
+
+    Returns:
+        Formatted prompt string
+    """
+    try:
+        return COURSE_SUMMARY_PROMPT.format(
+            course_xml=partial_course_to_xml(course_data),
+            previous_summary_xml=(
+                course_summary_to_xml(previous_summary)
+                if previous_summary
+                else "<no_existing_lectures />"
+            ),
+            week=lecture_data.get("week", ""),
+            order=lecture_data.get("order", ""),
+            title=lecture_data.get("title", ""),
+            lecture_text=lecture_data.get("summary") or lecture_data.get("content") or "",
+            word_limit=word_limit,
+        )
+    except ValueError as e:
+        raise ValueError(f"Error formatting COURSE_SUMMARY_PROMPT: {e}")
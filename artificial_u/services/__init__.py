@@ -8,7 +8,7 @@ injection system rather than using global state.
 """
 
 from artificial_u.services.audio_service import AudioService
-from artificial_u.services.content_service import ContentService
+from artificial_u.services.content_service import ContentService, GenerationUsage
 from artificial_u.services.course_service import CourseService
 from artificial_u.services.department_service import DepartmentService
 from artificial_u.services.image_service import ImageService
@@ -22,6 +22,7 @@ from artificial_u.services.voice_service import VoiceService
 __all__ = [
     # Content generation services
     "ContentService",
+    "GenerationUsage",
     "ImageService",
     "TTSService",
     "VoiceService",
@@ -2,26 +2,54 @@
 Audio processing service for ArtificialU.
 """
 
+import asyncio
+import html
 import logging
 import os
+import time
 import urllib.parse
-from typing import Any, Dict, Optional, Tuple
-
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from artificial_u.audio.hls import (
+    PLAYLIST_CONTENT_TYPE,
+    PLAYLIST_NAME,
+    SEGMENT_CONTENT_TYPE,
+    HlsSegment,
+    HlsSegmenter,
+    build_playlist,
+)
+from artificial_u.audio.manifest import MANIFEST_CONTENT_TYPE, MANIFEST_EXTENSION, AudioManifest
+from artificial_u.audio.speech_processor import StreamingChunker
+from artificial_u.config import get_settings
 from artificial_u.models.core import Lecture
 from artificial_u.services.storage_service import StorageService
 from artificial_u.services.tts_service import TTSService
-from artificial_u.utils import AudioProcessingError
+from artificial_u.utils import (
+    AudioProcessingError,
+    CourseNotFoundError,
+    LectureNotFoundError,
+    ProfessorNotFoundError,
+    TopicNotFoundError,
+)
 
 
 class AudioService:
     """Service for processing audio in ArtificialU."""
 
+    # Characters of lecture text after which the first chunk is synthesized
+    FIRST_CHUNK_SIZE = 600
+
+    # Maximum characters per chunk of streamed lecture text
+    MAX_CHUNK_SIZE = 4000
+
     def __init__(
         self,
         repository_factory,
         api_key: Optional[str] = None,
         tts_service: Optional[TTSService] = None,
         storage_service: Optional[StorageService] = None,
+        lecture_service=None,
         logger=None,
     ):
         """
@@ -32,10 +60,14 @@ class AudioService:
             api_key: Optional ElevenLabs API key
             tts_service: Optional TTS service instance
             storage_service: Optional storage service instance
+            lecture_service: Optional lecture service (needed to generate lectures with audio)
             logger: Optional logger instance
         """
         self.logger = logger or logging.getLogger(__name__)
         self.repository_factory = repository_factory
+        self.lecture_service = lecture_service
+        # Course summary updates scheduled after yielding generated lectures
+        self._background_tasks: Set[asyncio.Future] = set()
 
         # Initialize services
         storage_settings = (storage_service or StorageService()).settings
@@ -55,6 +87,9 @@ class AudioService:
         """
         Get course, lecture, and professor entities needed for audio creation.
 
+        The lecture is the latest revision of the course's topic at the given
+        week and position.
+
         Returns:
             Tuple of (course, lecture, professor)
         """
@@ -66,13 +101,13 @@ class AudioService:
             raise ValueError(error_msg)
 
         # Get lecture
-        lecture = self.repository_factory.lecture.get_by_course_week_order(
-            course_id=course.id, week_number=week, order_in_week=number
-        )
-        if not lecture:
+        topic = self.repository_factory.topic.get_by_course_week_order(course.id, week, number)
+        lectures = self.repository_factory.lecture.list_by_topic(topic.id) if topic else []
+        if not lectures:
             error_msg = f"Lecture for course {course_code}, week {week}, number {number} not found"
             self.logger.error(error_msg)
             raise ValueError(error_msg)
+        lecture = max(lectures, key=lambda lecture: (lecture.revision or 0, lecture.id or 0))
 
         # Get professor
         professor = self.repository_factory.professor.get(course.professor_id)
@@ -83,6 +118,33 @@ class AudioService:
 
         return course, lecture, professor
 
+    def _get_lecture_audio_entities(self, lecture_id: int) -> Tuple[Any, Any, Lecture, Any]:
+        """
+        Get the course, topic, lecture and professor of a saved lecture.
+
+        Returns:
+            Tuple of (course, topic, lecture, professor)
+
+        Raises:
+            LectureNotFoundError: If the lecture does not exist
+            CourseNotFoundError: If the lecture's course does not exist
+            TopicNotFoundError: If the lecture's topic does not exist
+            ProfessorNotFoundError: If the course's professor does not exist
+        """
+        lecture = self.repository_factory.lecture.get(lecture_id)
+        if not lecture:
+            raise LectureNotFoundError(f"Lecture with ID {lecture_id} not found")
+        course = self.repository_factory.course.get(lecture.course_id)
+        if not course:
+            raise CourseNotFoundError(f"Course with ID {lecture.course_id} not found")
+        topic = self.repository_factory.topic.get(lecture.topic_id)
+        if not topic:
+            raise TopicNotFoundError(f"Topic with ID {lecture.topic_id} not found")
+        professor = self.repository_factory.professor.get(course.professor_id)
+        if not professor:
+            raise ProfessorNotFoundError(f"Professor with ID {course.professor_id} not found")
+        return course, topic, lecture, professor
+
     def _get_professor_voice_id(self, professor) -> Optional[str]:
         """Get ElevenLabs voice ID for the professor if available."""
         if not professor.voice_id:
@@ -104,39 +166,120 @@ class AudioService:
         week: int,
         number: int,
         el_voice_id: Optional[str],
-    ) -> str:
-        """Generate audio using TTS and store it. Returns storage URL."""
-        # Generate audio using TTS service
-        _, audio_data = self.tts_service.generate_lecture_audio(
+    ) -> Tuple[str, Optional[str], Optional[str]]:
+        """
+        Generate audio using TTS and store it with its HLS package and chunk manifest.
+
+        Returns:
+            Tuple of (audio URL, HLS playlist URL or None, manifest URL or None)
+        """
+        manifest = AudioManifest()
+        audio_stream = self.tts_service.stream_lecture_audio(
             lecture=lecture,
             professor=professor,
             el_voice_id=el_voice_id,
+            manifest=manifest,
         )
+        audio_url, playlist_url = await self._store_audio_stream(
+            audio_stream, course_code, week, number
+        )
+        manifest_url = await self._store_manifest(manifest, course_code, week, number)
+        return audio_url, playlist_url, manifest_url
 
-        # Upload to storage service (MinIO/S3)
+    async def _store_audio_stream(
+        self, audio_stream: AsyncIterator[bytes], course_code: str, week: int, number: int
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Store streamed lecture audio as an MP3 and, alongside it, as HLS.
+
+        Audio is piped into a multipart upload as each chunk is synthesized, so
+        the full file is never held in memory. HLS segments are cut from the same
+        stream and uploaded as they complete; the playlist is written last.
+
+        Returns:
+            Tuple of (audio URL, HLS playlist URL or None if HLS is disabled or failed)
+        """
         storage_key = self.storage_service.generate_audio_key(
             course_id=course_code, week_number=week, lecture_order=number
         )
+        hls = None
+        segment_duration = get_settings().HLS_SEGMENT_DURATION
+        if segment_duration > 0:
+            hls = _HlsUpload(
+                self.storage_service,
+                lambda file_name: self.storage_service.generate_hls_key(
+                    course_id=course_code,
+                    week_number=week,
+                    lecture_order=number,
+                    file_name=file_name,
+                ),
+                segment_duration,
+                self.logger,
+            )
+            audio_stream = hls.tee(audio_stream)
 
-        success, storage_url = await self.storage_service.upload_audio_file(
-            file_data=audio_data, object_name=storage_key, content_type="audio/mpeg"
-        )
+        try:
+            success, storage_url = await self.storage_service.upload_audio_stream(
+                audio_stream, object_name=storage_key, content_type="audio/mpeg"
+            )
+            if not success:
+                error_msg = "Failed to upload audio to storage"
+                self.logger.error(error_msg)
+                raise AudioProcessingError(error_msg)
+            self.logger.info(f"Audio uploaded to storage at {storage_url}")
+            playlist_url = await hls.finish() if hls else None
+        finally:
+            if hls:
+                hls.cancel()
+
+        if playlist_url:
+            self.logger.info(f"HLS playlist uploaded to storage at {playlist_url}")
+        return storage_url, playlist_url
+
+    async def _store_manifest(
+        self, manifest: AudioManifest, course_code: str, week: int, number: int
+    ) -> Optional[str]:
+        """
+        Store the chunk manifest of a lecture's audio next to its MP3.
 
-        if not success:
-            error_msg = "Failed to upload audio to storage"
-            self.logger.error(error_msg)
-            raise AudioProcessingError(error_msg)
+        Like the HLS package, the manifest is best effort: the lecture keeps its
+        audio if the manifest cannot be stored.
 
-        self.logger.info(f"Audio uploaded to storage at {storage_url}")
-        return storage_url
+        Returns:
+            The manifest URL, or None if it could not be stored
+        """
+        storage_key = self.storage_service.generate_audio_key(
+            course_id=course_code,
+            week_number=week,
+            lecture_order=number,
+            extension=MANIFEST_EXTENSION,
+        )
+        success, manifest_url = await self.storage_service.upload_audio_file(
+            manifest.to_json().encode(),
+            object_name=storage_key,
+            content_type=MANIFEST_CONTENT_TYPE,
+        )
+        if not success:
+            self.logger.warning(f"Failed to upload audio manifest {storage_key}")
+            return None
+        self.logger.info(f"Audio manifest uploaded to storage at {manifest_url}")
+        return manifest_url
 
-    def _update_lecture_audio_url(self, lecture, audio_url: str) -> Lecture:
-        """Update lecture with audio URL and return updated lecture."""
+    def _update_lecture_audio_url(
+        self,
+        lecture,
+        audio_url: str,
+        playlist_url: Optional[str] = None,
+        manifest_url: Optional[str] = None,
+    ) -> Lecture:
+        """Update lecture with audio, playlist and manifest URLs and return updated lecture."""
         lecture_to_update = self.repository_factory.lecture.get(lecture.id)
         if not lecture_to_update:
             raise ValueError(f"Lecture with ID {lecture.id} not found")
 
         lecture_to_update.audio_url = audio_url
+        lecture_to_update.audio_playlist_url = playlist_url
+        lecture_to_update.audio_manifest_url = manifest_url
         updated_lecture = self.repository_factory.lecture.update(lecture_to_update)
         self.logger.debug(f"Lecture updated with audio url: {audio_url}")
         return updated_lecture
@@ -160,25 +303,269 @@ class AudioService:
         try:
             # Get required entities
             course, lecture, professor = await self._get_lecture_entities(course_code, week, number)
+            return await self._create_and_link_audio(lecture, professor, course_code, week, number)
 
-            # Get voice ID if available
-            el_voice_id = self._get_professor_voice_id(professor)
+        except Exception as e:
+            error_msg = f"Failed to create lecture audio: {str(e)}"
+            self.logger.error(error_msg)
+            raise AudioProcessingError(error_msg) from e
 
-            # Generate and store audio
-            audio_url = await self._generate_and_store_audio(
-                lecture, professor, course_code, week, number, el_voice_id
-            )
+    async def create_audio_for_lecture(self, lecture_id: int) -> Tuple[str, Lecture]:
+        """
+        Create audio for a saved lecture, identified by its ID.
 
-            # Update lecture with audio URL
-            lecture = self._update_lecture_audio_url(lecture, audio_url)
+        Unlike create_lecture_audio, this renders exactly the given lecture, not
+        the latest revision of its topic.
 
-            return audio_url, lecture
+        Args:
+            lecture_id: ID of the lecture
 
+        Returns:
+            Tuple: (audio_url, lecture) - URL to the audio file and the lecture
+
+        Raises:
+            LectureNotFoundError: If the lecture does not exist
+            CourseNotFoundError: If the lecture's course does not exist
+            TopicNotFoundError: If the lecture's topic does not exist
+            ProfessorNotFoundError: If the course's professor does not exist
+            AudioProcessingError: If the audio cannot be generated or stored
+        """
+        self.logger.info(f"Creating audio for lecture {lecture_id}")
+        course, topic, lecture, professor = self._get_lecture_audio_entities(lecture_id)
+
+        try:
+            return await self._create_and_link_audio(
+                lecture, professor, course.code, topic.week, topic.order
+            )
         except Exception as e:
-            error_msg = f"Failed to create lecture audio: {str(e)}"
+            error_msg = f"Failed to create audio for lecture {lecture_id}: {str(e)}"
             self.logger.error(error_msg)
             raise AudioProcessingError(error_msg) from e
 
+    async def _create_and_link_audio(
+        self, lecture: Lecture, professor, course_code: str, week: int, number: int
+    ) -> Tuple[str, Lecture]:
+        """Generate and store a lecture's audio, then save its URLs on the lecture."""
+        # Get voice ID if available
+        el_voice_id = self._get_professor_voice_id(professor)
+
+        # Generate and store audio
+        audio_url, playlist_url, manifest_url = await self._generate_and_store_audio(
+            lecture, professor, course_code, week, number, el_voice_id
+        )
+
+        # Update lecture with audio URLs
+        lecture = self._update_lecture_audio_url(lecture, audio_url, playlist_url, manifest_url)
+
+        return audio_url, lecture
+
+    def _get_generation_entities(self, partial_attributes: Dict[str, Any]) -> Tuple[Any, Any, Any]:
+        """
+        Get the course, topic and professor of a lecture about to be generated.
+
+        Returns:
+            Tuple of (course, topic, professor)
+        """
+        course_id = partial_attributes.get("course_id")
+        topic_id = partial_attributes.get("topic_id")
+        course = self.repository_factory.course.get(course_id)
+        if not course:
+            raise ValueError(f"Course with ID {course_id} not found")
+        topic = self.repository_factory.topic.get(topic_id)
+        if not topic or topic.course_id != course.id:
+            raise ValueError(f"Topic with ID {topic_id} not found in course {course_id}")
+        professor = self.repository_factory.professor.get(course.professor_id)
+        if not professor:
+            raise ValueError(f"Professor with ID {course.professor_id} not found")
+        return course, topic, professor
+
+    async def generate_lecture_with_audio(
+        self,
+        partial_attributes: Dict[str, Any],
+        el_voice_id: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate a lecture and its audio together, yielding events as both progress.
+
+        The lecture text is cut into speakable chunks as its paragraphs stream
+        from the model, and each chunk is synthesized while the rest is still
+        being written; the audio is piped into storage as it arrives. The lecture
+        is saved with its audio URL once both are complete, and the course summary
+        is updated in the background after the lecture is yielded; callers that
+        exit soon after should await wait_for_background_tasks.
+
+        Events are those of LectureService.generate_lecture_stream, plus:
+        - audio: {"chunk": ..., "bytes": ..., "elapsed": ...} as each chunk is synthesized
+        - lecture: the saved lecture, with its audio, playlist and manifest URLs (replaces the
+          unsaved lecture event)
+
+        Args:
+            partial_attributes: Known lecture attributes; must contain 'course_id' and 'topic_id'
+            el_voice_id: Optional ElevenLabs voice ID (defaults to the professor's voice)
+
+        Yields:
+            Dict[str, Any]: Generation events, ending with a single lecture event.
+
+        Raises:
+            AudioProcessingError: If the audio cannot be generated or stored
+            ContentGenerationError: If the lecture text cannot be generated
+        """
+        if self.lecture_service is None:
+            raise ValueError("A lecture service is required to generate lectures")
+
+        # Database lookups run off the event loop this pipeline keeps free
+        course, topic, professor = await asyncio.to_thread(
+            self._get_generation_entities, partial_attributes
+        )
+        el_voice_id = el_voice_id or await asyncio.to_thread(
+            self._get_professor_voice_id, professor
+        )
+        if not el_voice_id:
+            raise AudioProcessingError(f"No voice found for professor {professor.id}")
+        started = time.monotonic()
+        text_chunks: asyncio.Queue = asyncio.Queue()
+        audio_events: asyncio.Queue = asyncio.Queue()
+        manifest = AudioManifest()
+        audio_stream = self._lecture_audio(
+            text_chunks, audio_events, el_voice_id, started, manifest
+        )
+        upload = asyncio.ensure_future(
+            self._store_audio_stream(audio_stream, course.code, topic.week, topic.order)
+        )
+        events = self.lecture_service.generate_lecture_stream(partial_attributes=partial_attributes)
+        try:
+            lecture_data = None
+            async for event in self._feed_lecture_text(events, text_chunks, upload):
+                while not audio_events.empty():
+                    yield audio_events.get_nowait()
+                if event["event"] == "lecture":
+                    lecture_data = event["data"]
+                else:
+                    yield event
+
+            async for event in self._drain_audio_events(audio_events, upload):
+                yield event
+            audio_url, playlist_url = self._stored_audio_urls(upload)
+        finally:
+            upload.cancel()
+            # Let the upload abort before the lecture stream is closed
+            await asyncio.gather(upload, return_exceptions=True)
+            await events.aclose()
+
+        if lecture_data is None:
+            raise AudioProcessingError("Lecture generation ended without a lecture")
+        manifest.locate(lecture_data["content"])
+        lecture_data["audio_url"] = audio_url
+        lecture_data["audio_playlist_url"] = playlist_url
+        lecture_data["audio_manifest_url"] = await self._store_manifest(
+            manifest, course.code, topic.week, topic.order
+        )
+        lecture = await asyncio.to_thread(self.lecture_service.create_lecture, **lecture_data)
+        self.logger.info(
+            f"Generated lecture {lecture.id} with audio in {time.monotonic() - started:.1f}s"
+        )
+        self._schedule(self.lecture_service.update_course_summary(lecture))
+        yield {"event": "lecture", "data": lecture.model_dump()}
+
+    def _schedule(self, coroutine) -> None:
+        """Run a coroutine in the background, keeping a reference until it finishes."""
+        task = asyncio.ensure_future(coroutine)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def wait_for_background_tasks(self) -> None:
+        """Wait for background work, such as course summary updates, to finish."""
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
+    async def _lecture_audio(
+        self,
+        text_chunks: asyncio.Queue,
+        audio_events: asyncio.Queue,
+        el_voice_id: str,
+        started: float,
+        manifest: AudioManifest,
+    ) -> AsyncIterator[bytes]:
+        """Synthesize queued text chunks, reporting each chunk's audio as an event."""
+
+        async def queued_chunks() -> AsyncIterator[str]:
+            while (chunk := await text_chunks.get()) is not None:
+                yield chunk
+
+        audio_stream = self.tts_service.stream_chunks_to_speech(
+            queued_chunks(), el_voice_id, manifest=manifest
+        )
+        chunks = 0
+        try:
+            async for audio_data in audio_stream:
+                chunks += 1
+                audio_events.put_nowait(
+                    {
+                        "event": "audio",
+                        "data": {
+                            "chunk": chunks,
+                            "bytes": len(audio_data),
+                            "elapsed": round(time.monotonic() - started, 2),
+                        },
+                    }
+                )
+                yield audio_data
+        finally:
+            await audio_stream.aclose()
+
+    async def _feed_lecture_text(
+        self,
+        events: AsyncIterator[Dict[str, Any]],
+        text_chunks: asyncio.Queue,
+        upload: asyncio.Future,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Re-yield lecture generation events, queuing speakable chunks of the content.
+
+        Stops early if the audio upload has already ended, which means it failed.
+        """
+        chunker = StreamingChunker(
+            self.tts_service.speech_processor,
+            max_chunk_size=self.MAX_CHUNK_SIZE,
+            first_chunk_size=self.FIRST_CHUNK_SIZE,
+        )
+        async for event in events:
+            if upload.done():
+                return
+            if event["event"] == "content":
+                # Streamed content is raw XML text; entities never span a paragraph break
+                for chunk in chunker.feed(event["data"]["text"]):
+                    text_chunks.put_nowait(html.unescape(chunk))
+            yield event
+        for chunk in chunker.flush():
+            text_chunks.put_nowait(html.unescape(chunk))
+        text_chunks.put_nowait(None)
+
+    @staticmethod
+    async def _drain_audio_events(
+        audio_events: asyncio.Queue, upload: asyncio.Future
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield audio events until the upload has ended."""
+        while not upload.done():
+            next_event = asyncio.ensure_future(audio_events.get())
+            await asyncio.wait({next_event, upload}, return_when=asyncio.FIRST_COMPLETED)
+            if next_event.done():
+                yield next_event.result()
+            else:
+                next_event.cancel()
+        while not audio_events.empty():
+            yield audio_events.get_nowait()
+
+    @staticmethod
+    def _stored_audio_urls(upload: asyncio.Future) -> Tuple[str, Optional[str]]:
+        """Get the URLs of finished audio storage, raising if it failed."""
+        try:
+            return upload.result()
+        except AudioProcessingError:
+            raise
+        except Exception as e:
+            raise AudioProcessingError(f"Failed to generate lecture audio: {e}") from e
+
     def test_tts_connection(self) -> Dict[str, Any]:
         """
         Test connection to the TTS service.
@@ -239,3 +626,92 @@ class AudioService:
             error_msg = f"Error processing storage URL {audio_url}: {e}"
             self.logger.error(error_msg)
             raise AudioProcessingError(error_msg) from e
+
+
+class _HlsUpload:
+    """
+    Package streamed lecture audio as HLS, uploading segments as they complete.
+
+    Packaging is best effort: a failed segment upload stops it without failing
+    the lecture's MP3, and finish() then returns None.
+    """
+
+    # Segment uploads in flight before the audio stream waits for the oldest
+    MAX_PENDING_SEGMENTS = 4
+
+    def __init__(
+        self,
+        storage_service: StorageService,
+        key_for: Callable[[str], str],
+        segment_duration: float,
+        logger,
+    ):
+        self.storage_service = storage_service
+        self.key_for = key_for
+        self.segmenter = HlsSegmenter(target_duration=segment_duration)
+        self.logger = logger
+        self.durations: List[float] = []
+        self.failed = False
+        self._pending: Deque[asyncio.Future] = deque()
+
+    async def tee(self, audio_stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        """Re-yield streamed audio, cutting segments from it on the way."""
+        try:
+            async for audio_data in audio_stream:
+                await self._upload(self.segmenter.feed(audio_data))
+                yield audio_data
+        finally:
+            await audio_stream.aclose()
+
+    async def _upload(self, segments: List[HlsSegment]) -> None:
+        """Start uploading segments, waiting if too many uploads are in flight."""
+        for segment in segments:
+            if self.failed:
+                return
+            if len(self._pending) >= self.MAX_PENDING_SEGMENTS:
+                await self._wait_oldest()
+                if self.failed:
+                    return
+            self.durations.append(segment.duration)
+            self._pending.append(
+                asyncio.ensure_future(
+                    self.storage_service.upload_audio_file(
+                        segment.data,
+                        object_name=self.key_for(segment.name),
+                        content_type=SEGMENT_CONTENT_TYPE,
+                    )
+                )
+            )
+
+    async def _wait_oldest(self) -> None:
+        """Wait for the oldest segment upload, giving up on HLS if it failed."""
+        success, _ = await self._pending.popleft()
+        if not success:
+            self.failed = True
+            self.logger.warning("Failed to upload an HLS segment; skipping HLS packaging")
+            self.cancel()
+
+    async def finish(self) -> Optional[str]:
+        """
+        Upload the last segment and the playlist.
+
+        Returns:
+            Optional[str]: The playlist URL, or None if packaging failed or found no audio
+        """
+        await self._upload(self.segmenter.flush())
+        while self._pending:
+            await self._wait_oldest()
+        if self.failed or not self.durations:
+            return None
+
+        success, playlist_url = await self.storage_service.upload_audio_file(
+            build_playlist(self.durations).encode(),
+            object_name=self.key_for(PLAYLIST_NAME),
+            content_type=PLAYLIST_CONTENT_TYPE,
+        )
+        return playlist_url if success else None
+
+    def cancel(self) -> None:
+        """Cancel segment uploads still in flight."""
+        while self._pending:
+            self._pending.popleft().cancel()
@@ -1,18 +1,59 @@
-import json
+import asyncio
 import logging
-import os
+import time
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime
-from typing import Optional
+from functools import partial
+from typing import Any, AsyncIterator, Dict, Optional, Union
 
 from google.genai import types
 
 from artificial_u.config import get_settings
+from artificial_u.content.continuation import (
+    ContinuationPolicy,
+    continuation_prompt,
+    is_truncated,
+    stitch,
+    trim_overlap,
+)
+from artificial_u.content.log_writer import ContentLogWriter, get_content_log_writer
+from artificial_u.content.rate_limiter import AdmissionController, is_throttle_error
+from artificial_u.content.replay import ReplayBackend
+from artificial_u.content.response_cache import ResponseCache
+from artificial_u.content.router import ModelRouter
+from artificial_u.content.single_flight import SingleFlight
+from artificial_u.content.usage import UsageTracker, estimate_tokens
 from artificial_u.integrations import anthropic_client, gemini_client, ollama_client, openai_client
 
 # TODO: Make these configurable
 DEFAULT_TEMPERATURE = 0.3
 DEFAULT_MAX_TOKENS = 1024
 
+# Backends whose prompt caching must be requested explicitly for a prompt prefix;
+# the others cache repeated prefixes automatically
+EXPLICIT_PROMPT_CACHE_BACKENDS = {"anthropic"}
+
+
+@dataclass
+class GenerationUsage:
+    """Usage of one model call; the final record yielded by generate_text_stream."""
+
+    backend: str
+    model: str
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    stop_reason: Optional[str] = None
+    time_to_first_token: Optional[float] = None
+    duration: float = 0.0
+    cost: Optional[float] = None
+    # Input tokens read from / written to the provider's prompt cache (included in input_tokens)
+    cache_read_tokens: Optional[int] = None
+    cache_write_tokens: Optional[int] = None
+
+    def to_dict(self) -> dict:
+        """Convert the usage record to a plain dictionary."""
+        return asdict(self)
+
 
 class ContentService:
     """
@@ -20,13 +61,93 @@ class ContentService:
     Provides a model-agnostic interface.
     """
 
-    def __init__(self, logger=None):
+    def __init__(
+        self,
+        logger=None,
+        response_cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        admission: Optional[AdmissionController] = None,
+        log_writer: Optional[ContentLogWriter] = None,
+        replay: Optional[ReplayBackend] = None,
+        router: Optional[ModelRouter] = None,
+        usage_tracker: Optional[UsageTracker] = None,
+        continuation: Optional[ContinuationPolicy] = None,
+    ):
+        """
+        Initialize the content service.
+
+        Args:
+            logger: Optional logger instance
+            response_cache: Optional response cache (created from settings when enabled)
+            single_flight: Optional coalescer shared by services that should
+                deduplicate identical concurrent requests
+            admission: Optional admission controller (created from settings if omitted)
+            log_writer: Optional content log writer (the shared writer for
+                CONTENT_LOGS_PATH if omitted)
+            replay: Optional replay backend; when set, every text model is served
+                from recorded logs (created from settings when content_backend is "replay")
+            router: Optional model router for failover and hedging (created from
+                settings if omitted)
+            usage_tracker: Optional aggregator of per-call token, latency and cost
+                metrics (created from settings if omitted)
+            continuation: Optional per-purpose output limits and continuation of
+                truncated responses (created from settings if omitted)
+        """
         self.logger = logger or logging.getLogger(__name__)
         # Get settings instance
         settings = get_settings()
         self.default_backend = settings.content_backend
         self.default_model = settings.content_model
         self.content_logs_path = settings.CONTENT_LOGS_PATH
+        self.log_writer = log_writer or get_content_log_writer(
+            settings.CONTENT_LOGS_PATH,
+            segment_max_bytes=settings.CONTENT_LOG_SEGMENT_MAX_BYTES,
+            sample_rate=settings.CONTENT_LOG_SAMPLE_RATE,
+            max_queue=settings.CONTENT_LOG_QUEUE_SIZE,
+        )
+
+        if response_cache is None and settings.CONTENT_CACHE_ENABLED:
+            response_cache = ResponseCache(
+                cache_dir=settings.CONTENT_CACHE_PATH,
+                ttl=settings.CONTENT_CACHE_TTL,
+                memory_entries=settings.CONTENT_CACHE_MEMORY_ENTRIES,
+                max_bytes=settings.CONTENT_CACHE_MAX_BYTES,
+                logger=self.logger,
+            )
+        self.response_cache = response_cache
+
+        if replay is None and self.default_backend == "replay":
+            replay = ReplayBackend(
+                settings.CONTENT_REPLAY_PATH or settings.CONTENT_LOGS_PATH,
+                latency=settings.CONTENT_REPLAY_LATENCY,
+                tokens_per_second=settings.CONTENT_REPLAY_TOKENS_PER_SECOND,
+                logger=self.logger,
+            )
+        self.replay = replay
+        self.router = router or ModelRouter(
+            fallbacks=settings.CONTENT_FALLBACK_MODELS,
+            failure_threshold=settings.CONTENT_CIRCUIT_FAILURES,
+            reset_timeout=settings.CONTENT_CIRCUIT_RESET,
+            route_by_latency=settings.CONTENT_ROUTE_BY_LATENCY,
+            hedge_after=settings.CONTENT_HEDGE_AFTER,
+            logger=self.logger,
+        )
+        self.usage_tracker = usage_tracker or UsageTracker(settings.CONTENT_MODEL_PRICES)
+        self.continuation = continuation or ContinuationPolicy(
+            max_tokens=settings.CONTENT_MAX_TOKENS,
+            budgets=settings.CONTENT_TOKEN_BUDGETS,
+            max_continuations=settings.CONTENT_MAX_CONTINUATIONS,
+            default_max_tokens=DEFAULT_MAX_TOKENS,
+            logger=self.logger,
+        )
+        self.single_flight = single_flight or SingleFlight(logger=self.logger)
+        self.admission = admission or AdmissionController(
+            limits=settings.CONTENT_RATE_LIMITS,
+            max_retries=settings.CONTENT_RATE_LIMIT_RETRIES,
+            backoff=settings.CONTENT_RATE_LIMIT_BACKOFF,
+            max_backoff=settings.CONTENT_RATE_LIMIT_MAX_BACKOFF,
+            logger=self.logger,
+        )
         self.logger.info(
             f"ContentService initialized with default backend: {self.default_backend}, "
             f"default model: {self.default_model}"
@@ -45,17 +166,19 @@ class ContentService:
         Raises:
             ValueError: If the model is not suitable for text generation
         """
-        if model.startswith("claude-"):
+        if model.startswith("imagen-"):
+            self.logger.error(
+                f"Model '{model}' is an image model, not suitable for text generation."
+            )
+            raise ValueError(f"Model '{model}' is for image generation.")
+        elif self.replay is not None:
+            return "replay"
+        elif model.startswith("claude-"):
             return "anthropic"
         elif model.startswith("gpt-"):
             return "openai"
         elif model.startswith("gemini-"):
             return "gemini"
-        elif model.startswith("imagen-"):
-            self.logger.error(
-                f"Model '{model}' is an image model, not suitable for text generation."
-            )
-            raise ValueError(f"Model '{model}' is for image generation.")
         else:
             return "ollama"  # Default assumption, adjust as needed
 
@@ -66,6 +189,9 @@ class ContentService:
         system_prompt: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        use_cache: bool = True,
+        purpose: Optional[str] = None,
+        prompt_prefix: Optional[str] = None,
     ) -> str:
         """
         Generates text based on the provided prompt using the specified or default model.
@@ -76,8 +202,15 @@ class ContentService:
             'gpt-4', 'gemini-1.5-pro'). If None, uses the default model from settings.
             system_prompt: An optional system prompt or instruction for the model.
             temperature: Optional temperature for sampling (model-dependent, default varies).
-            max_tokens: Optional maximum number of tokens to generate
-            (model-dependent, default varies).
+            max_tokens: Optional maximum number of tokens to generate per call
+            (defaults to the purpose's CONTENT_MAX_TOKENS entry). A response cut off
+            at this limit is continued within the purpose's token budget.
+            use_cache: If False, skip the response cache lookup and always call the
+            model (the fresh response still replaces the cached one).
+            purpose: Optional generation purpose (e.g. "lecture"); its fallback models
+            in CONTENT_FALLBACK_MODELS are tried if the model fails or is slow.
+            prompt_prefix: Optional leading part of the prompt shared across requests,
+            which is cached by the provider where caching must be requested explicitly.
 
         Returns:
             The generated text content as a string.
@@ -90,7 +223,35 @@ class ContentService:
         if not target_model:
             self.logger.error("No model specified and no default model configured.")
             raise ValueError("No model specified and no default model configured.")
+        max_tokens = self.continuation.call_max_tokens(purpose, max_tokens)
+
+        return await self.router.call(
+            purpose,
+            target_model,
+            lambda candidate: self._generate_with_model(
+                candidate,
+                prompt,
+                system_prompt,
+                temperature,
+                max_tokens,
+                use_cache,
+                purpose,
+                prompt_prefix,
+            ),
+        )
 
+    async def _generate_with_model(
+        self,
+        target_model: str,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        use_cache: bool,
+        purpose: Optional[str],
+        prompt_prefix: Optional[str] = None,
+    ) -> str:
+        """Generate text with one model, via the response cache and request coalescing."""
         self.logger.info(
             f"Generating text for prompt: '{prompt[:500]}...' using model: {target_model}"
         )
@@ -104,6 +265,7 @@ class ContentService:
             "openai": self._generate_openai,
             "gemini": self._generate_gemini,
             "ollama": self._generate_ollama,
+            "replay": self._generate_replay,
         }
 
         # Get the appropriate generation method
@@ -111,18 +273,557 @@ class ContentService:
             self.logger.error(f"Unsupported backend: {backend} for model {target_model}")
             raise NotImplementedError(f"Backend '{backend}' is not implemented.")
 
+        generation_method = self._with_prompt_prefix(
+            backend, backend_methods[backend], prompt, prompt_prefix
+        )
+        request_key = self._request_key(
+            backend, target_model, system_prompt, prompt, temperature, max_tokens
+        )
+        if self.response_cache and use_cache:
+            # The cache reads SQLite, so it is queried off the event loop
+            cached = await asyncio.to_thread(self.response_cache.get, request_key)
+            if cached is not None:
+                self.logger.info(f"Serving response for model {target_model} from cache")
+                self.usage_tracker.record_cache_hit(purpose, backend, target_model)
+                return cached
+
+        # Identical requests already in flight share that call's result
+        return await self.single_flight.do(
+            request_key,
+            lambda: self._generate_and_store(
+                generation_method,
+                request_key,
+                GenerationUsage(backend=backend, model=target_model),
+                prompt,
+                system_prompt,
+                temperature,
+                max_tokens,
+                purpose,
+            ),
+        )
+
+    async def _generate_and_store(
+        self,
+        generation_method,
+        request_key: str,
+        usage: GenerationUsage,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        max_tokens: int,
+        purpose: Optional[str],
+    ) -> str:
+        """Generate a complete response, continuing it if truncated, then cache it."""
+        response = await self._generate_once(
+            generation_method, usage, prompt, system_prompt, temperature, max_tokens, purpose
+        )
+        response = await self._continue_truncated(
+            generation_method,
+            usage,
+            response,
+            prompt,
+            system_prompt,
+            temperature,
+            max_tokens,
+            purpose,
+        )
+        if self.response_cache and response:
+            await asyncio.to_thread(self.response_cache.put, request_key, response)
+        return response
+
+    async def _generate_once(
+        self,
+        generation_method,
+        usage: GenerationUsage,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        purpose: Optional[str],
+    ) -> str:
+        """Call a backend generation method, then account for and log the response."""
+        backend, model = usage.backend, usage.model
+        started = time.monotonic()
+        try:
+            response = await self.admission.call(
+                backend,
+                model,
+                self._estimate_tokens(prompt, system_prompt, max_tokens),
+                lambda: generation_method(
+                    prompt, model, system_prompt, temperature, max_tokens, usage
+                ),
+            )
+        except Exception as e:
+            self.usage_tracker.record_error(purpose, backend, model)
+            self.logger.error(
+                f"Error generating text with model {model} (backend {backend}): {e}",
+                exc_info=True,
+            )
+            raise
+
+        usage.duration = time.monotonic() - started
+        self._record_usage(usage, purpose, prompt, system_prompt, response)
+        if backend != "replay":
+            await self._log_content(
+                model=model,
+                prompt=prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response=response,
+                backend=backend,
+                usage=usage,
+                purpose=purpose,
+            )
+        return response
+
+    async def _continue_truncated(
+        self,
+        generation_method,
+        usage: GenerationUsage,
+        response: str,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        max_tokens: int,
+        purpose: Optional[str],
+    ) -> str:
+        """Ask the model to continue a response cut off at max_tokens and stitch the parts."""
+        used = usage.output_tokens or estimate_tokens(response)
+        continuations = 0
+        while is_truncated(usage.backend, usage.stop_reason):
+            next_max_tokens = self.continuation.next_max_tokens(
+                purpose, max_tokens, used, continuations
+            )
+            if next_max_tokens is None:
+                return response
+            continuations += 1
+            self.logger.info(
+                f"Response from {usage.model} truncated after {used} output tokens; "
+                f"continuing (continuation {continuations})"
+            )
+            usage = GenerationUsage(backend=usage.backend, model=usage.model)
+            part = await self._generate_once(
+                generation_method,
+                usage,
+                continuation_prompt(prompt, response),
+                system_prompt,
+                temperature,
+                next_max_tokens,
+                purpose,
+            )
+            response = stitch(response, part)
+            used += usage.output_tokens or estimate_tokens(part)
+        if continuations:
+            self.continuation.record_completed()
+        return response
+
+    def _with_prompt_prefix(self, backend: str, method, prompt: str, prompt_prefix: Optional[str]):
+        """Pass a cacheable prompt prefix to backend methods that take one."""
+        if not prompt_prefix or backend not in EXPLICIT_PROMPT_CACHE_BACKENDS:
+            return method
+        if not prompt.startswith(prompt_prefix):
+            self.logger.warning("Prompt does not start with its prefix; not caching it")
+            return method
+        return partial(method, prompt_prefix=prompt_prefix)
+
+    def _record_usage(
+        self,
+        usage: GenerationUsage,
+        purpose: Optional[str],
+        prompt: str,
+        system_prompt: Optional[str],
+        response: str,
+    ) -> None:
+        """Fill in token counts the provider did not report and add the call to the metrics."""
+        if usage.input_tokens is None:
+            usage.input_tokens = estimate_tokens((system_prompt or "") + prompt)
+        if usage.output_tokens is None:
+            usage.output_tokens = estimate_tokens(response or "")
+        usage.cost = self.usage_tracker.record(
+            purpose,
+            usage.backend,
+            usage.model,
+            usage.input_tokens,
+            usage.output_tokens,
+            usage.duration,
+            usage.time_to_first_token,
+            cache_read_tokens=usage.cache_read_tokens,
+            cache_write_tokens=usage.cache_write_tokens,
+        )
+        self.logger.info(
+            f"{purpose or 'Generation'} call to {usage.model}: {usage.input_tokens} input / "
+            f"{usage.output_tokens} output tokens in {usage.duration:.2f}s"
+            + (f", ~${usage.cost:.4f}" if usage.cost is not None else "")
+        )
+
+    @staticmethod
+    def _estimate_tokens(
+        prompt: str, system_prompt: Optional[str], max_tokens: Optional[int]
+    ) -> int:
+        """Estimate the tokens a request counts against tokens-per-minute limits."""
+        # Roughly four characters per token for English text
+        input_tokens = (len(prompt) + len(system_prompt or "")) // 4
+        return input_tokens + (max_tokens if max_tokens is not None else DEFAULT_MAX_TOKENS)
+
+    def _request_key(
+        self,
+        backend: str,
+        model: str,
+        system_prompt: Optional[str],
+        prompt: str,
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+    ) -> str:
+        """Build the key identifying a request for caching and coalescing."""
+        return ResponseCache.make_key(
+            backend,
+            model,
+            system_prompt,
+            prompt,
+            temperature if temperature is not None else DEFAULT_TEMPERATURE,
+            max_tokens if max_tokens is not None else DEFAULT_MAX_TOKENS,
+        )
+
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get response cache metrics.
+
+        Returns:
+            Cache statistics, or None if the response cache is disabled
+        """
+        return self.response_cache.stats() if self.response_cache else None
+
+    def single_flight_stats(self) -> Dict[str, Any]:
+        """
+        Get request coalescing metrics.
+
+        Returns:
+            Counts of calls, model executions and calls served by an in-flight request
+        """
+        return self.single_flight.stats()
+
+    def rate_limit_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get admission control metrics.
+
+        Returns:
+            Queue depth, wait time and throttling statistics per backend and model
+        """
+        return self.admission.stats()
+
+    def replay_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get replay backend metrics.
+
+        Returns:
+            Loaded record and match counts, or None if not replaying
+        """
+        return self.replay.stats() if self.replay else None
+
+    def routing_stats(self) -> Dict[str, Any]:
+        """
+        Get model routing metrics.
+
+        Returns:
+            Failover and hedge counts, circuit breaker states and p95 latencies
+        """
+        return self.router.stats()
+
+    def continuation_stats(self) -> Dict[str, Any]:
+        """
+        Get metrics for responses truncated at max_tokens.
+
+        Returns:
+            Counts of truncated responses, continuations made and budgets exhausted
+        """
+        return self.continuation.stats()
+
+    def usage_stats(self) -> Dict[str, Any]:
+        """
+        Get token, latency and cost metrics for the calls made so far.
+
+        Returns:
+            Per purpose/backend/model aggregates, most expensive first, and totals
+        """
+        return self.usage_tracker.summary()
+
+    def log_stats(self) -> Dict[str, Any]:
+        """
+        Get content log writer metrics.
+
+        Returns:
+            Counts of queued, written, dropped and sampled-out log records
+        """
+        return self.log_writer.stats()
+
+    async def generate_text_stream(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        purpose: Optional[str] = None,
+        prompt_prefix: Optional[str] = None,
+    ) -> AsyncIterator[Union[str, GenerationUsage]]:
+        """
+        Stream generated text as it arrives from the model.
+
+        Yields text deltas (str) in order, followed by exactly one GenerationUsage
+        record once the stream completes. A response cut off at max_tokens is
+        continued by the same model, streaming on without repeated text, and the
+        usage record then totals every call. Each call is written to the content
+        log like generate_text.
+
+        Args:
+            prompt: The main text prompt for generation.
+            model: The specific model name to use. If None, uses the default model.
+            system_prompt: An optional system prompt or instruction for the model.
+            temperature: Optional temperature for sampling.
+            max_tokens: Optional maximum number of tokens to generate per call
+            (defaults to the purpose's CONTENT_MAX_TOKENS entry).
+            purpose: Optional generation purpose; its fallback models are tried if
+            the model fails before streaming any text.
+            prompt_prefix: Optional leading part of the prompt to cache, as for
+            generate_text.
+
+        Yields:
+            Text deltas, then a GenerationUsage record.
+
+        Raises:
+            ValueError: If the specified or default model is not supported or configured.
+            NotImplementedError: If the backend for the model is not implemented.
+        """
+        target_model = model or self.default_model
+        if not target_model:
+            self.logger.error("No model specified and no default model configured.")
+            raise ValueError("No model specified and no default model configured.")
+
+        max_tokens = self.continuation.call_max_tokens(purpose, max_tokens)
+
+        response = ""
+        usage = None
+        async for event in self._stream_routed(
+            target_model, prompt, system_prompt, temperature, max_tokens, purpose, prompt_prefix
+        ):
+            if isinstance(event, GenerationUsage):
+                usage = event
+                continue
+            response += event
+            yield event
+
+        async for event in self._continue_stream(
+            usage, response, prompt, system_prompt, temperature, max_tokens, purpose, prompt_prefix
+        ):
+            yield event
+
+    async def _stream_routed(
+        self,
+        target_model: str,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        max_tokens: int,
+        purpose: Optional[str],
+        prompt_prefix: Optional[str],
+    ) -> AsyncIterator[Union[str, GenerationUsage]]:
+        """Stream from the purpose's candidate models, failing over before the first delta."""
+        candidates = self.router.candidates(purpose, target_model)
+        for index, candidate in enumerate(candidates):
+            started = time.monotonic()
+            stream = self._stream_with_model(
+                candidate, prompt, system_prompt, temperature, max_tokens, purpose, prompt_prefix
+            )
+            try:
+                # Once text has been streamed the response is committed to this model
+                first = await stream.__anext__()
+            except Exception as e:
+                self.router.record_failure(candidate, e)
+                if index == len(candidates) - 1:
+                    raise
+                self.router.record_failover(candidate, e, candidates[index + 1])
+                continue
+
+            yield first
+            try:
+                async for event in stream:
+                    yield event
+            except Exception as e:
+                self.router.record_failure(candidate, e)
+                raise
+            self.router.record_success(purpose, candidate, time.monotonic() - started)
+            return
+
+    async def _continue_stream(
+        self,
+        usage: GenerationUsage,
+        response: str,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        max_tokens: int,
+        purpose: Optional[str],
+        prompt_prefix: Optional[str],
+    ) -> AsyncIterator[Union[str, GenerationUsage]]:
+        """Stream continuations of a truncated response, then the combined usage record."""
+        total = replace(usage)
+        used = usage.output_tokens or estimate_tokens(response)
+        continuations = 0
+        while is_truncated(usage.backend, usage.stop_reason):
+            next_max_tokens = self.continuation.next_max_tokens(
+                purpose, max_tokens, used, continuations
+            )
+            if next_max_tokens is None:
+                break
+            continuations += 1
+            self.logger.info(
+                f"Streamed response from {usage.model} truncated after {used} output tokens; "
+                f"continuing (continuation {continuations})"
+            )
+            stream = self._stream_with_model(
+                usage.model,
+                continuation_prompt(prompt, response),
+                system_prompt,
+                temperature,
+                next_max_tokens,
+                purpose,
+                prompt_prefix,
+            )
+            part = ""
+            async for event in trim_overlap(stream, response):
+                if isinstance(event, GenerationUsage):
+                    usage = event
+                    continue
+                part += event
+                yield event
+            response += part
+            used += usage.output_tokens or estimate_tokens(part)
+            self._add_usage(total, usage)
+        if continuations and not is_truncated(usage.backend, usage.stop_reason):
+            self.continuation.record_completed()
+        yield total
+
+    @staticmethod
+    def _add_usage(total: GenerationUsage, usage: GenerationUsage) -> None:
+        """Add a continuation's usage to the usage of the whole response."""
+        for field in (
+            "input_tokens",
+            "output_tokens",
+            "cache_read_tokens",
+            "cache_write_tokens",
+            "cost",
+        ):
+            value = getattr(usage, field)
+            if value is not None:
+                setattr(total, field, (getattr(total, field) or 0) + value)
+        total.duration += usage.duration
+        total.stop_reason = usage.stop_reason
+
+    async def _stream_with_model(
+        self,
+        target_model: str,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        purpose: Optional[str],
+        prompt_prefix: Optional[str] = None,
+    ) -> AsyncIterator[Union[str, GenerationUsage]]:
+        """Stream text from one model, then its usage record."""
+        backend = self._determine_backend(target_model)
+        stream_methods = {
+            "anthropic": self._stream_anthropic,
+            "openai": self._stream_openai,
+            "gemini": self._stream_gemini,
+            "ollama": self._stream_ollama,
+            "replay": self._stream_replay,
+        }
+        if backend not in stream_methods:
+            self.logger.error(f"Unsupported backend: {backend} for model {target_model}")
+            raise NotImplementedError(f"Backend '{backend}' is not implemented.")
+
+        self.logger.info(
+            f"Streaming text for prompt: '{prompt[:500]}...' using model: {target_model}"
+        )
+
+        stream_method = self._with_prompt_prefix(
+            backend, stream_methods[backend], prompt, prompt_prefix
+        )
+        usage = GenerationUsage(backend=backend, model=target_model)
+        parts = []
+        started = time.monotonic()
         try:
-            generation_method = backend_methods[backend]
-            return await generation_method(
-                prompt, target_model, system_prompt, temperature, max_tokens
+            stream = self._admitted_stream(
+                backend,
+                target_model,
+                self._estimate_tokens(prompt, system_prompt, max_tokens),
+                lambda: stream_method(
+                    prompt, target_model, system_prompt, temperature, max_tokens, usage
+                ),
             )
+            async for delta in stream:
+                if not delta:
+                    continue
+                if usage.time_to_first_token is None:
+                    usage.time_to_first_token = time.monotonic() - started
+                parts.append(delta)
+                yield delta
         except Exception as e:
+            self.usage_tracker.record_error(purpose, backend, target_model)
             self.logger.error(
-                f"Error generating text with model {target_model} (backend {backend}): {e}",
+                f"Error streaming text with model {target_model} (backend {backend}): {e}",
                 exc_info=True,
             )
             raise
 
+        usage.duration = time.monotonic() - started
+        response = "".join(parts)
+        self._record_usage(usage, purpose, prompt, system_prompt, response)
+        self.logger.info(
+            f"Streamed {usage.output_tokens} tokens from {backend} in {usage.duration:.2f}s "
+            f"(first token after {usage.time_to_first_token or 0:.2f}s)"
+        )
+        if backend != "replay":
+            await self._log_content(
+                model=target_model,
+                prompt=prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response=response,
+                backend=backend,
+                usage=usage,
+                purpose=purpose,
+            )
+        yield usage
+
+    async def _admitted_stream(
+        self, backend: str, model: str, tokens: int, open_stream
+    ) -> AsyncIterator[str]:
+        """
+        Run a backend stream under admission control.
+
+        A throttled stream is retried after backing off as long as it has not
+        produced any text yet; once text has been yielded the error is raised.
+        """
+        for attempt in range(self.admission.max_retries + 1):
+            started = False
+            async with self.admission.admit(backend, model, tokens) as limiters:
+                try:
+                    async for delta in open_stream():
+                        started = True
+                        yield delta
+                    self.admission.record_success(limiters)
+                    return
+                except Exception as e:
+                    if started or not is_throttle_error(e) or attempt == self.admission.max_retries:
+                        raise
+                    delay = self.admission.record_throttle(e, limiters)
+                    self.logger.warning(
+                        f"{backend}/{model} stream throttled ({e}); retrying in {delay:.1f}s"
+                    )
+
     async def _log_content(
         self,
         model: str,
@@ -132,8 +833,10 @@ class ContentService:
         max_tokens: int | None,
         response: str,
         backend: str,
+        usage: Optional[GenerationUsage] = None,
+        purpose: Optional[str] = None,
     ) -> None:
-        """Log the content generation details to a file.
+        """Queue the content generation details for the background log writer.
 
         Args:
             model: The model used for generation
@@ -143,6 +846,8 @@ class ContentService:
             max_tokens: Optional max tokens setting
             response: The generated response
             backend: The backend service used (anthropic, openai, etc.)
+            usage: Optional token counts, timings and cost of the call
+            purpose: Optional generation purpose (lecture, course, etc.)
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
 
@@ -152,31 +857,68 @@ class ContentService:
                 "timestamp": timestamp,
                 "backend": backend,
                 "model": model,
+                "purpose": purpose,
                 "settings": {
                     "temperature": temperature,
                     "max_tokens": max_tokens,
                 },
+                "usage": usage.to_dict() if usage else None,
             },
             "content": {"system_prompt": system_prompt, "prompt": prompt, "response": response},
         }
 
-        # Create a unique filename for this generation
-        filename = f"{timestamp}_{backend}_{model.replace('/', '_')}.json"
-        filepath = os.path.join(self.content_logs_path, filename)
+        # Never blocks: records are sampled or dropped under back-pressure instead
+        self.log_writer.write(log_data)
 
-        try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(log_data, f, indent=2, ensure_ascii=False)
-            self.logger.debug(f"Content log saved to {filepath}")
-        except Exception as e:
-            self.logger.error(f"Failed to save content log to {filepath}: {str(e)}")
+    @staticmethod
+    def _anthropic_content(prompt: str, prompt_prefix: Optional[str]):
+        """Build Anthropic message content, marking the prompt prefix for caching."""
+        if not prompt_prefix:
+            return prompt
+        # The cache breakpoint covers the system prompt and everything up to the prefix's end
+        return [
+            {
+                "type": "text",
+                "text": prompt_prefix,
+                "cache_control": {"type": "ephemeral"},
+            },
+            {"type": "text", "text": prompt[len(prompt_prefix) :]},
+        ]
+
+    @staticmethod
+    def _read_anthropic_usage(usage: GenerationUsage, message) -> None:
+        """Copy token counts from an Anthropic message, counting cached input as input."""
+        cache_read = getattr(message.usage, "cache_read_input_tokens", None) or 0
+        cache_write = getattr(message.usage, "cache_creation_input_tokens", None) or 0
+        usage.input_tokens = message.usage.input_tokens + cache_read + cache_write
+        usage.output_tokens = message.usage.output_tokens
+        usage.cache_read_tokens = cache_read
+        usage.cache_write_tokens = cache_write
+        usage.stop_reason = message.stop_reason
 
-    async def _generate_anthropic(self, prompt, model, system_prompt, temperature, max_tokens):
+    @staticmethod
+    def _read_openai_usage(usage: GenerationUsage, response_usage) -> None:
+        """Copy token counts from OpenAI usage, including automatically cached input."""
+        usage.input_tokens = response_usage.prompt_tokens
+        usage.output_tokens = response_usage.completion_tokens
+        details = getattr(response_usage, "prompt_tokens_details", None)
+        usage.cache_read_tokens = getattr(details, "cached_tokens", None)
+
+    @staticmethod
+    def _read_gemini_usage(usage: GenerationUsage, usage_metadata) -> None:
+        """Copy token counts from Gemini usage metadata, including implicitly cached input."""
+        usage.input_tokens = usage_metadata.prompt_token_count
+        usage.output_tokens = usage_metadata.candidates_token_count
+        usage.cache_read_tokens = getattr(usage_metadata, "cached_content_token_count", None)
+
+    async def _generate_anthropic(
+        self, prompt, model, system_prompt, temperature, max_tokens, usage, prompt_prefix=None
+    ):
         self.logger.info(f"Generating text with Anthropic model: {model}")
         messages = []
         if system_prompt:
             pass  # Anthropic uses 'system' parameter outside messages
-        messages.append({"role": "user", "content": prompt})
+        messages.append({"role": "user", "content": self._anthropic_content(prompt, prompt_prefix)})
         response = await anthropic_client.messages.create(
             model=model,
             max_tokens=max_tokens if max_tokens is not None else DEFAULT_MAX_TOKENS,
@@ -186,20 +928,11 @@ class ContentService:
         )
         response_text = response.content[0].text
         self.logger.info(f"Received response from Anthropic: {response_text[:500]}")
-
-        await self._log_content(
-            model=model,
-            prompt=prompt,
-            system_prompt=system_prompt,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            response=response_text,
-            backend="anthropic",
-        )
+        self._read_anthropic_usage(usage, response)
 
         return response_text
 
-    async def _generate_openai(self, prompt, model, system_prompt, temperature, max_tokens):
+    async def _generate_openai(self, prompt, model, system_prompt, temperature, max_tokens, usage):
         self.logger.info(f"Generating text with OpenAI model: {model}")
         messages = []
         if system_prompt:
@@ -213,54 +946,40 @@ class ContentService:
         )
         response_text = response.choices[0].message.content
         self.logger.info(f"Received response from OpenAI: {response_text[:500]}")
-
-        await self._log_content(
-            model=model,
-            prompt=prompt,
-            system_prompt=system_prompt,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            response=response_text,
-            backend="openai",
-        )
+        if response.usage:
+            self._read_openai_usage(usage, response.usage)
+        usage.stop_reason = response.choices[0].finish_reason
 
         return response_text
 
-    async def _generate_gemini(self, prompt, model, system_prompt, temperature, max_tokens):
+    async def _generate_gemini(self, prompt, model, system_prompt, temperature, max_tokens, usage):
         self.logger.info(f"Generating text with Gemini model: {model}")
-        contents = [types.Content(parts=[types.Part.from_text(prompt)])]
-        generation_config = types.GenerationConfig(
+        config = types.GenerateContentConfig(
             temperature=temperature if temperature is not None else DEFAULT_TEMPERATURE,
             max_output_tokens=max_tokens if max_tokens is not None else DEFAULT_MAX_TOKENS,
+            system_instruction=system_prompt or None,
         )
-        if system_prompt:
-            generation_config.system_instruction = system_prompt
         response = await gemini_client.aio.models.generate_content(
             model=model,
-            contents=contents,
-            generation_config=generation_config,
+            contents=prompt,
+            config=config,
         )
 
+        if response.usage_metadata:
+            self._read_gemini_usage(usage, response.usage_metadata)
+        if response.candidates and response.candidates[0].finish_reason:
+            reason = response.candidates[0].finish_reason
+            usage.stop_reason = getattr(reason, "name", str(reason))
         if response.candidates and response.candidates[0].content:
             response_text = response.candidates[0].content.parts[0].text
             self.logger.info(f"Received response from Gemini: {response_text[:500]}")
 
-            await self._log_content(
-                model=model,
-                prompt=prompt,
-                system_prompt=system_prompt,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                response=response_text,
-                backend="gemini",
-            )
-
             return response_text
         else:
             self.logger.warning("No content generated from Gemini model")
             return ""
 
-    async def _generate_ollama(self, prompt, model, system_prompt, temperature, max_tokens):
+    async def _generate_ollama(self, prompt, model, system_prompt, temperature, max_tokens, usage):
         self.logger.info(f"Generating text with Ollama model: {model}")
         messages = []
         if system_prompt:
@@ -276,15 +995,116 @@ class ContentService:
         )
         response_text = response.get("message", {}).get("content", "")
         self.logger.info(f"Received response from Ollama: {response_text[:500]}")
+        usage.input_tokens = response.get("prompt_eval_count")
+        usage.output_tokens = response.get("eval_count")
+        usage.stop_reason = response.get("done_reason")
+
+        return response_text
 
-        await self._log_content(
+    async def _stream_anthropic(
+        self, prompt, model, system_prompt, temperature, max_tokens, usage, prompt_prefix=None
+    ) -> AsyncIterator[str]:
+        kwargs = {}
+        if system_prompt:
+            kwargs["system"] = system_prompt
+        async with anthropic_client.messages.stream(
             model=model,
-            prompt=prompt,
-            system_prompt=system_prompt,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            response=response_text,
-            backend="ollama",
+            max_tokens=max_tokens if max_tokens is not None else DEFAULT_MAX_TOKENS,
+            messages=[{"role": "user", "content": self._anthropic_content(prompt, prompt_prefix)}],
+            temperature=temperature if temperature is not None else DEFAULT_TEMPERATURE,
+            **kwargs,
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+            message = await stream.get_final_message()
+
+        self._read_anthropic_usage(usage, message)
+
+    async def _stream_openai(
+        self, prompt, model, system_prompt, temperature, max_tokens, usage
+    ) -> AsyncIterator[str]:
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        stream = await openai_client.chat.completions.create(
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens if max_tokens is not None else DEFAULT_MAX_TOKENS,
+            temperature=temperature if temperature is not None else DEFAULT_TEMPERATURE,
+            stream=True,
+            stream_options={"include_usage": True},
         )
+        async for chunk in stream:
+            # The usage chunk arrives last with an empty choices list
+            if chunk.usage:
+                self._read_openai_usage(usage, chunk.usage)
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            if choice.finish_reason:
+                usage.stop_reason = choice.finish_reason
+            if choice.delta and choice.delta.content:
+                yield choice.delta.content
 
-        return response_text
+    async def _stream_gemini(
+        self, prompt, model, system_prompt, temperature, max_tokens, usage
+    ) -> AsyncIterator[str]:
+        config = types.GenerateContentConfig(
+            temperature=temperature if temperature is not None else DEFAULT_TEMPERATURE,
+            max_output_tokens=max_tokens if max_tokens is not None else DEFAULT_MAX_TOKENS,
+            system_instruction=system_prompt or None,
+        )
+        stream = await gemini_client.aio.models.generate_content_stream(
+            model=model,
+            contents=prompt,
+            config=config,
+        )
+        async for chunk in stream:
+            # Usage metadata is cumulative, so the last chunk holds the totals
+            if chunk.usage_metadata:
+                self._read_gemini_usage(usage, chunk.usage_metadata)
+            if chunk.candidates and chunk.candidates[0].finish_reason:
+                reason = chunk.candidates[0].finish_reason
+                usage.stop_reason = getattr(reason, "name", str(reason))
+            if chunk.text:
+                yield chunk.text
+
+    async def _stream_ollama(
+        self, prompt, model, system_prompt, temperature, max_tokens, usage
+    ) -> AsyncIterator[str]:
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        stream = await ollama_client.chat(
+            model=model,
+            messages=messages,
+            options={
+                "temperature": temperature if temperature is not None else DEFAULT_TEMPERATURE,
+                "num_predict": max_tokens if max_tokens is not None else DEFAULT_MAX_TOKENS,
+            },
+            stream=True,
+        )
+        async for chunk in stream:
+            if chunk.get("done"):
+                usage.input_tokens = chunk.get("prompt_eval_count")
+                usage.output_tokens = chunk.get("eval_count")
+                usage.stop_reason = chunk.get("done_reason")
+            text = chunk.get("message", {}).get("content", "")
+            if text:
+                yield text
+
+    async def _generate_replay(self, prompt, model, system_prompt, temperature, max_tokens, usage):
+        self.logger.info(f"Replaying recorded response for model: {model}")
+        return await self.replay.generate(prompt, model, system_prompt)
+
+    async def _stream_replay(
+        self, prompt, model, system_prompt, temperature, max_tokens, usage
+    ) -> AsyncIterator[str]:
+        usage.input_tokens = estimate_tokens((system_prompt or "") + prompt)
+        usage.output_tokens = 0
+        async for text in self.replay.stream(prompt, model, system_prompt):
+            usage.output_tokens += estimate_tokens(text)
+            yield text
+        usage.stop_reason = "end_turn"
@@ -364,6 +364,7 @@ class CourseService:
             model=settings.COURSE_GENERATION_MODEL,
             prompt=course_prompt,
             system_prompt=system_prompt,
+            purpose="course",
         )
         self.logger.info("Received response from content service.")
 
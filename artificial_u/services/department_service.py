@@ -334,6 +334,7 @@ class DepartmentService:
                 prompt=prompt,
                 model=settings.DEPARTMENT_GENERATION_MODEL,
                 system_prompt=get_system_prompt("department"),
+                purpose="department",
             )
             self.logger.info("Received response from content service.")
 
@@ -2,11 +2,15 @@
 Lecture management service for ArtificialU.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import weakref
+from itertools import groupby
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from artificial_u.config import get_settings
 from artificial_u.models.converters import (
+    StreamingTagExtractor,
     course_model_to_dict,
     extract_xml_content,
     parse_lecture_xml,
@@ -14,21 +18,40 @@ from artificial_u.models.converters import (
     topic_model_to_dict,
     topics_model_to_dict,
 )
-from artificial_u.models.core import Lecture
+from artificial_u.models.core import Course, Lecture, LectureGenerationContext, Topic
 from artificial_u.prompts import (
-    get_lecture_prompt,
+    get_course_summary_prompt,
+    get_lecture_prompt_parts,
     get_system_prompt,
 )
+from artificial_u.services.content_service import GenerationUsage
 from artificial_u.utils import (
     ContentGenerationError,
     DatabaseError,
     LectureNotFoundError,
 )
 
+# Per-course locks serializing rolling summary updates across every LectureService
+# of the process (the API builds one per request), kept per event loop since
+# asyncio locks cannot be shared between loops
+_summary_locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _summary_lock(course_id: int) -> asyncio.Lock:
+    """Get the lock serializing this process's summary updates of a course."""
+    locks = _summary_locks.setdefault(asyncio.get_running_loop(), {})
+    return locks.setdefault(course_id, asyncio.Lock())
+
 
 class LectureService:
     """Service for managing lecture entities."""
 
+    # Lecture fields whose change leaves the course summary out of date
+    COURSE_SUMMARY_FIELDS = frozenset({"content", "summary", "topic_id", "course_id"})
+
+    # Times a summary update is retried when the stored summary changed meanwhile
+    SUMMARY_UPDATE_ATTEMPTS = 3
+
     def __init__(
         self,
         content_service,
@@ -67,6 +90,8 @@ class LectureService:
         audio_url: Optional[str] = None,
         transcript_url: Optional[str] = None,
         revision: Optional[int] = None,
+        audio_playlist_url: Optional[str] = None,
+        audio_manifest_url: Optional[str] = None,
     ) -> Lecture:
         """
         Create a new lecture.
@@ -79,6 +104,8 @@ class LectureService:
             audio_url: Optional URL to audio content
             transcript_url: Optional URL to transcript content
             revision: Optional revision number for the lecture
+            audio_playlist_url: Optional URL to the HLS playlist of the audio
+            audio_manifest_url: Optional URL to the chunk manifest of the audio
 
         Returns:
             Lecture: The created lecture
@@ -94,6 +121,8 @@ class LectureService:
             content=content,
             summary=summary,
             audio_url=audio_url,
+            audio_playlist_url=audio_playlist_url,
+            audio_manifest_url=audio_manifest_url,
             transcript_url=transcript_url,
         )
 
@@ -201,6 +230,10 @@ class LectureService:
         """
         Update a lecture.
 
+        Changing a lecture's text or topic clears its course's rolling summary,
+        which would otherwise still cover the old text, until
+        rebuild_course_summary is run.
+
         Args:
             lecture_id: ID of the lecture to update
             update_data: Dictionary of fields to update
@@ -214,6 +247,7 @@ class LectureService:
         """
         # Get existing lecture
         lecture = self.get_lecture(lecture_id)
+        previous_course_id = lecture.course_id
 
         # Update fields
         for key, value in update_data.items():
@@ -226,16 +260,23 @@ class LectureService:
             # Save changes
             updated_lecture = self.repository_factory.lecture.update(lecture)
             self.logger.info(f"Updated lecture {lecture_id}")
-            return updated_lecture
         except Exception as e:
             error_msg = f"Failed to update lecture: {str(e)}"
             self.logger.error(error_msg)
             raise DatabaseError(error_msg) from e
 
+        if self.COURSE_SUMMARY_FIELDS & update_data.keys():
+            for course_id in {previous_course_id, updated_lecture.course_id}:
+                self._clear_course_summary(course_id)
+        return updated_lecture
+
     def delete_lecture(self, lecture_id: int) -> bool:
         """
         Delete a lecture.
 
+        Deleting a lecture clears its course's rolling summary until
+        rebuild_course_summary is run.
+
         Args:
             lecture_id: ID of the lecture to delete
 
@@ -247,19 +288,34 @@ class LectureService:
             DatabaseError: If there's an error deleting from the database
         """
         # Check if lecture exists
-        self.get_lecture(lecture_id)
+        lecture = self.get_lecture(lecture_id)
 
         try:
             # Delete the lecture
             result = self.repository_factory.lecture.delete(lecture_id)
             if result:
                 self.logger.info(f"Lecture {lecture_id} deleted successfully")
-            return result
         except Exception as e:
             error_msg = f"Failed to delete lecture: {str(e)}"
             self.logger.error(error_msg)
             raise DatabaseError(error_msg) from e
 
+        if result:
+            self._clear_course_summary(lecture.course_id)
+        return result
+
+    def _clear_course_summary(self, course_id: int) -> None:
+        """
+        Clear a course's rolling summary once it no longer matches its lectures.
+
+        Prompts then outline the older lectures instead, and a summary update
+        built from the old summary fails its compare-and-swap and starts over.
+        """
+        try:
+            self.repository_factory.course.update_lecture_summary(course_id, None)
+        except Exception as e:
+            self.logger.warning(f"Failed to clear the summary of course {course_id}: {e}")
+
     # --- Generation Methods --- #
 
     async def _prepare_prompt_arguments(
@@ -270,6 +326,7 @@ class LectureService:
         topic_data: Dict[str, Any],
         existing_lectures_data: List[Dict[str, Any]],
         all_course_topics_data: List[Dict[str, Any]],
+        course_summary: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Prepare arguments for the lecture generation prompt."""
         return {
@@ -280,22 +337,29 @@ class LectureService:
             "topics_data": all_course_topics_data,
             "freeform_prompt": partial_attributes.get("freeform_prompt"),
             "word_count": partial_attributes.get("word_count", 2500),
+            "course_summary": course_summary,
+            "token_budget": get_settings().LECTURE_PROMPT_TOKEN_BUDGET or None,
         }
 
     async def _generate_and_parse_content(self, prompt_args: Dict[str, Any]) -> str:
         """Generate lecture content and parse the XML response."""
-        lecture_prompt = get_lecture_prompt(**prompt_args)
+        prompt_prefix, prompt_suffix = get_lecture_prompt_parts(**prompt_args)
         system_prompt = get_system_prompt("lecture")
 
         self.logger.info("Calling content service to generate lecture...")
         raw_response = await self.content_service.generate_text(
             model=get_settings().LECTURE_GENERATION_MODEL,
-            prompt=lecture_prompt,
+            prompt=prompt_prefix + prompt_suffix,
             system_prompt=system_prompt,
+            purpose="lecture",
+            prompt_prefix=prompt_prefix,
         )
         self.logger.info("Received response from content service.")
 
-        # Extract XML content
+        return self._extract_lecture_xml(raw_response)
+
+    def _extract_lecture_xml(self, raw_response: str) -> str:
+        """Extract the <lecture> XML document from a raw model response."""
         generated_xml_output = extract_xml_content(raw_response, "output")
         if not generated_xml_output:
             # Try to extract just the lecture tag content
@@ -322,9 +386,10 @@ class LectureService:
         Dict[str, Any],  # topic_dict
         List[Dict[str, Any]],  # existing_lectures_list_of_dicts
         List[Dict[str, Any]],  # all_course_topics_list_of_dicts
+        Optional[str],  # course_summary
     ]:
-        """Process course, professor, topic, existing lectures, and all course topics
-        for generation."""
+        """Process course, professor, topic, existing lectures, all course topics
+        and the rolling course summary for generation."""
         course_id = partial_attributes.get("course_id")
         topic_id = partial_attributes.get("topic_id")
 
@@ -333,108 +398,112 @@ class LectureService:
         if not topic_id:
             raise ValueError("topic_id is required for lecture generation.")
 
-        course_dict = await self._get_course_data_for_generation(course_id)
-        professor_dict = await self._get_professor_data_for_generation(course_dict.get("id"))
-        current_topic_dict = await self._get_current_topic_data_for_generation(topic_id, course_id)
-        existing_lectures_list_of_dicts = await self._get_existing_lectures_data_for_generation(
-            course_id
-        )
-        all_course_topics_list_of_dicts = await self._get_all_course_topics_data_for_generation(
-            course_id
-        )
+        context = self._load_generation_context(course_id)
+        current_topic = next((topic for topic in context.topics if topic.id == topic_id), None)
+        if current_topic is None:
+            err_msg = f"Topic {topic_id} not found or does not belong to course {course_id}."
+            self.logger.error(err_msg)
+            raise DatabaseError(err_msg)
 
         return (
-            course_dict,
-            professor_dict,
-            current_topic_dict,
-            existing_lectures_list_of_dicts,
-            all_course_topics_list_of_dicts,
+            course_model_to_dict(context.course),
+            professor_model_to_dict(context.professor),
+            topic_model_to_dict(current_topic),
+            self._existing_lectures_context(context),
+            topics_model_to_dict(context.topics),
+            context.course_summary,
         )
 
-    async def _get_course_data_for_generation(self, course_id: int) -> Dict[str, Any]:
-        """Fetches and prepares course data for lecture generation."""
+    def _load_generation_context(self, course_id: int) -> LectureGenerationContext:
+        """Load a course's generation context with a constant number of queries."""
         try:
-            course = self.course_service.get_course(course_id)
-            return course_model_to_dict(course) if course else {}
+            context = self.repository_factory.lecture.get_generation_context(course_id)
         except Exception as e:
-            self.logger.error(f"Error fetching course {course_id}: {e}")
-            raise DatabaseError(f"Error fetching course {course_id}: {e}")
+            self.logger.error(f"Error loading generation context for course {course_id}: {e}")
+            raise DatabaseError(f"Error loading generation context for course {course_id}: {e}")
+        if context is None:
+            self.logger.error(f"Course {course_id} not found for lecture generation.")
+            raise DatabaseError(f"Course {course_id} not found.")
+        return context
+
+    def _existing_lectures_context(self, context: LectureGenerationContext) -> List[Dict[str, Any]]:
+        """Build the prompt context entries of a course's existing lectures."""
+        topics_by_id = {topic.id: topic for topic in context.topics}
+        return [
+            self._lecture_context(topics_by_id[lecture.topic_id], lecture.summary)
+            for lecture in context.lectures
+            if lecture.topic_id in topics_by_id
+        ]
+
+    @staticmethod
+    def _lecture_context(topic: Topic, summary: Optional[str]) -> Dict[str, Any]:
+        """Build the prompt context entry of an existing lecture."""
+        return {
+            "title": topic.title,
+            "week": topic.week,
+            "order": topic.order,
+            "summary": summary or "",
+        }
 
-    async def _get_professor_data_for_generation(self, course_id: Optional[int]) -> Dict[str, Any]:
-        """Fetches and prepares professor data for lecture generation."""
-        if not course_id:
-            return {}
-        try:
-            # Need to get the course first to find the professor_id
-            course = self.course_service.get_course(course_id)
-            if course and course.professor_id:
-                professor = self.professor_service.get_professor(course.professor_id)
-                return professor_model_to_dict(professor) if professor else {}
-            return {}
-        except Exception as e:
-            self.logger.warning(f"Error fetching professor for course {course_id}: {e}")
-            return {}  # Return empty dict on error as per original logic
+    async def _load_prompt_arguments(self, partial_attributes: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch the generation context and build the lecture prompt arguments."""
+        (
+            course_dict,
+            professor_dict,
+            current_topic_dict,
+            existing_lectures_data,
+            all_course_topics_data,
+            course_summary,
+        ) = await self._process_models_for_generation(partial_attributes)
 
-    async def _get_current_topic_data_for_generation(
-        self, topic_id: int, course_id: int
+        return await self._prepare_prompt_arguments(
+            partial_attributes,
+            course_dict,
+            professor_dict,
+            current_topic_dict,
+            existing_lectures_data,
+            all_course_topics_data,
+            course_summary,
+        )
+
+    def _build_lecture_data(
+        self, partial_attributes: Dict[str, Any], generated_xml_output: str
     ) -> Dict[str, Any]:
-        """Fetches and prepares the current topic data for lecture generation."""
-        try:
-            current_topic = await self.topic_service.get_topic(topic_id)
-            if not current_topic or current_topic.course_id != course_id:
-                err_msg = f"Topic {topic_id} not found or does not belong to course {course_id}."
-                self.logger.error(err_msg)
-                raise DatabaseError(err_msg)
-            return topic_model_to_dict(current_topic) if current_topic else {}
-        except Exception as e:
-            self.logger.error(f"Error fetching topic {topic_id}: {e}")
-            raise DatabaseError(f"Error fetching topic {topic_id}: {e}")
+        """Parse generated lecture XML and combine it with the partial attributes."""
+        # Parse XML and combine with partial attributes
+        # parse_lecture_xml is expected to return {'content': '...'}
+        parsed_lecture_data = parse_lecture_xml(generated_xml_output)
 
-    async def _get_existing_lectures_data_for_generation(
-        self, course_id: int
-    ) -> List[Dict[str, Any]]:
-        """Fetches and prepares existing lectures data for context."""
-        existing_lectures_list_of_dicts = []
-        try:
-            lectures_core_models = self.repository_factory.lecture.list_by_course(course_id)
-            for lec_model in lectures_core_models:
-                try:
-                    lec_topic = await self.topic_service.get_topic(lec_model.topic_id)
-                    if lec_topic:
-                        existing_lectures_list_of_dicts.append(
-                            {
-                                "title": lec_topic.title,
-                                "week": lec_topic.week,
-                                "order": lec_topic.order,
-                                "summary": lec_model.summary or "",
-                            }
-                        )
-                    else:
-                        self.logger.warning(
-                            f"Could not find topic {lec_model.topic_id} for existing lecture "
-                            f"{lec_model.id}"
-                        )
-                except Exception as topic_e:
-                    self.logger.error(
-                        f"Error fetching topic {lec_model.topic_id} for existing lecture "
-                        f"{lec_model.id}: {topic_e}"
-                    )
-        except Exception as e:
-            self.logger.warning(
-                f"Error fetching or processing existing lectures for course {course_id}: {e}"
+        if parsed_lecture_data.get("content") is None:
+            error_msg = (
+                "Failed to extract valid <content> from generated XML. "
+                f"Input XML: {generated_xml_output[:500]}..."
             )
-        return existing_lectures_list_of_dicts
+            self.logger.error(error_msg)
+            raise ContentGenerationError(error_msg)
+
+        # final_lecture_data should be built based on Lecture model fields
+        final_lecture_data = {
+            "course_id": partial_attributes.get("course_id"),
+            "topic_id": partial_attributes.get("topic_id"),
+            "revision": partial_attributes.get("revision"),
+            "content": parsed_lecture_data.get("content"),
+            "summary": partial_attributes.get("summary"),
+        }
 
-    async def _get_all_course_topics_data_for_generation(
-        self, course_id: int
-    ) -> List[Dict[str, Any]]:
-        """Fetches and prepares all course topics data for context."""
-        try:
-            topics_core_models = await self.topic_service.list_topics(course_id=course_id)
-            return topics_model_to_dict(topics_core_models)
-        except Exception as e:
-            self.logger.warning(f"Error fetching all topics for course {course_id}: {e}")
-            return []  # Return empty list on error as per original logic
+        # Add other relevant fields from partial_attributes if they are valid for Lecture model
+        for key in ["audio_url", "transcript_url"]:
+            if key in partial_attributes:
+                final_lecture_data[key] = partial_attributes[key]
+
+        # Filter final_lecture_data to include only valid LectureModel fields
+        from artificial_u.models.database import LectureModel  # Keep import local for clarity
+
+        valid_lecture_keys = {c.name for c in LectureModel.__table__.columns}
+        final_lecture_data = {
+            k: v for k, v in final_lecture_data.items() if k in valid_lecture_keys
+        }
+        return final_lecture_data
 
     async def generate_lecture(
         self,
@@ -463,73 +532,424 @@ class LectureService:
 
         try:
             # Process models and prepare data for generation
-            (
-                course_dict,
-                professor_dict,
-                current_topic_dict,
-                existing_lectures_data,
-                all_course_topics_data,
-            ) = await self._process_models_for_generation(partial_attributes)
-
-            # Prepare prompt arguments
-            prompt_args = await self._prepare_prompt_arguments(
-                partial_attributes,
-                course_dict,
-                professor_dict,
-                current_topic_dict,
-                existing_lectures_data,
-                all_course_topics_data,
-            )
+            prompt_args = await self._load_prompt_arguments(partial_attributes)
 
             # Generate and parse content
             generated_xml_output = await self._generate_and_parse_content(prompt_args)
             self.logger.debug(f"Generated XML for lecture: {generated_xml_output[:500]}...")
+            final_lecture_data = self._build_lecture_data(partial_attributes, generated_xml_output)
 
-            # Parse XML and combine with partial attributes
-            # parse_lecture_xml is expected to return {'content': '...'}
-            parsed_lecture_data = parse_lecture_xml(generated_xml_output)
+            self.logger.info(
+                "Successfully generated lecture content for topic "
+                f"{final_lecture_data.get('topic_id')}"
+            )
+            return final_lecture_data
 
-            if parsed_lecture_data.get("content") is None:
-                error_msg = (
-                    "Failed to extract valid <content> from generated XML. "
-                    f"Input XML: {generated_xml_output[:500]}..."
-                )
-                self.logger.error(error_msg)
-                raise ContentGenerationError(error_msg)
+        except ContentGenerationError:
+            # Let content generation errors propagate up
+            raise
+        except ValueError as e:
+            raise ContentGenerationError(f"Error generating/parsing lecture: {e}")
+        except Exception as e:
+            self.logger.error(f"Unexpected error during lecture generation: {e}", exc_info=True)
+            raise ContentGenerationError(f"An unexpected error occurred: {e}")
 
-            # final_lecture_data should be built based on Lecture model fields
-            final_lecture_data = {
-                "course_id": partial_attributes.get("course_id"),
-                "topic_id": partial_attributes.get("topic_id"),
-                "revision": partial_attributes.get("revision"),
-                "content": parsed_lecture_data.get("content"),
-                "summary": partial_attributes.get("summary"),
-            }
+    async def generate_lecture_stream(
+        self,
+        partial_attributes: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate a lecture, yielding events as generation progresses.
+
+        Events are dictionaries with an "event" name and a "data" payload:
+        - progress: {"stage": ...} as context loading, generation and parsing start
+        - content: {"text": ...} for each piece of <content> text as it is produced
+        - lecture: the generated lecture attributes, as returned by generate_lecture
+
+        Args:
+            partial_attributes: Optional dictionary of known attributes to guide generation.
+                              Expected to contain 'course_id' and 'topic_id'.
 
-            # Add other relevant fields from partial_attributes if they are valid for Lecture model
-            for key in ["audio_url", "transcript_url"]:
-                if key in partial_attributes:
-                    final_lecture_data[key] = partial_attributes[key]
+        Yields:
+            Dict[str, Any]: Generation events, ending with a single lecture event.
 
-            # Filter final_lecture_data to include only valid LectureModel fields
-            from artificial_u.models.database import LectureModel  # Keep import local for clarity
+        Raises:
+            ContentGenerationError: If content generation or parsing fails.
+        """
+        partial_attributes = partial_attributes or {}
+        self.logger.info(
+            "Streaming lecture generation with partial attributes: "
+            f"{list(partial_attributes.keys())}"
+        )
 
-            valid_lecture_keys = {c.name for c in LectureModel.__table__.columns}
-            final_lecture_data = {
-                k: v for k, v in final_lecture_data.items() if k in valid_lecture_keys
+        try:
+            yield {"event": "progress", "data": {"stage": "loading_context"}}
+            prompt_args = await self._load_prompt_arguments(partial_attributes)
+
+            yield {"event": "progress", "data": {"stage": "generating"}}
+            extractor = StreamingTagExtractor("content")
+            parts = []
+            usage = None
+            prompt_prefix, prompt_suffix = get_lecture_prompt_parts(**prompt_args)
+            async for delta in self.content_service.generate_text_stream(
+                model=get_settings().LECTURE_GENERATION_MODEL,
+                prompt=prompt_prefix + prompt_suffix,
+                system_prompt=get_system_prompt("lecture"),
+                purpose="lecture",
+                prompt_prefix=prompt_prefix,
+            ):
+                if isinstance(delta, GenerationUsage):
+                    usage = delta
+                    continue
+                parts.append(delta)
+                text = extractor.feed(delta)
+                if text:
+                    yield {"event": "content", "data": {"text": text}}
+
+            yield {
+                "event": "progress",
+                "data": {"stage": "parsing", "usage": usage.to_dict() if usage else None},
             }
+            generated_xml_output = self._extract_lecture_xml("".join(parts))
+            final_lecture_data = self._build_lecture_data(partial_attributes, generated_xml_output)
 
             self.logger.info(
-                "Successfully generated lecture content for topic "
+                "Successfully streamed lecture content for topic "
                 f"{final_lecture_data.get('topic_id')}"
             )
-            return final_lecture_data
+            yield {"event": "lecture", "data": final_lecture_data}
 
         except ContentGenerationError:
-            # Let content generation errors propagate up
             raise
         except ValueError as e:
             raise ContentGenerationError(f"Error generating/parsing lecture: {e}")
         except Exception as e:
             self.logger.error(f"Unexpected error during lecture generation: {e}", exc_info=True)
             raise ContentGenerationError(f"An unexpected error occurred: {e}")
+
+    async def _fold_into_summary(
+        self,
+        course: Course,
+        previous_summary: Optional[str],
+        topic: Optional[Topic],
+        lecture: Lecture,
+    ) -> str:
+        """Ask the model to fold one lecture into a course summary."""
+        settings = get_settings()
+        lecture_data = {
+            "title": topic.title if topic else "",
+            "week": topic.week if topic else "",
+            "order": topic.order if topic else "",
+            "summary": lecture.summary,
+            "content": lecture.content,
+        }
+        response = await self.content_service.generate_text(
+            model=settings.COURSE_SUMMARY_MODEL,
+            prompt=get_course_summary_prompt(
+                course_model_to_dict(course),
+                previous_summary,
+                lecture_data,
+                word_limit=settings.COURSE_SUMMARY_WORDS,
+            ),
+            system_prompt=get_system_prompt("generic"),
+            purpose="course_summary",
+        )
+        summary = extract_xml_content(response, "course_summary")
+        if not summary:
+            raise ContentGenerationError("Response has no <course_summary> element")
+        return summary
+
+    async def _load_course_summary(self, course_id: int) -> Tuple[Course, Optional[str]]:
+        """Load a course and its current summary off the event loop."""
+        loaded = await asyncio.to_thread(
+            self.repository_factory.course.get_with_lecture_summary, course_id
+        )
+        if not loaded:
+            raise DatabaseError(f"Course {course_id} not found.")
+        return loaded
+
+    async def _has_other_lectures(self, lecture: Lecture) -> bool:
+        """Check whether a lecture's course has lectures besides it."""
+        lectures = await asyncio.to_thread(
+            self.repository_factory.lecture.list_by_course, lecture.course_id
+        )
+        return any(other.id != lecture.id for other in lectures)
+
+    async def update_course_summary(self, lecture: Lecture) -> Optional[str]:
+        """
+        Fold a saved lecture into its course's rolling summary.
+
+        The summary stands in for older lectures in the prompts of later lectures,
+        so it is updated as each lecture is saved rather than rebuilt from all of
+        them. Updates of a course are serialized within the process, and the new
+        summary is only written if the stored one is still the one it was built
+        from; otherwise it is rebuilt from the newer summary, up to
+        SUMMARY_UPDATE_ATTEMPTS times. A course without a summary but with older
+        lectures (a course from before summaries, or one whose summary was cleared
+        by an edit) is rebuilt from all of its lectures instead, so the summary
+        never covers only the newest one. Failures are logged rather than raised,
+        since the lecture itself is already saved.
+
+        Args:
+            lecture: The saved lecture, with its content or summary
+
+        Returns:
+            Optional[str]: The updated summary, or None if it could not be updated
+        """
+        course_id = lecture.course_id
+        try:
+            async with _summary_lock(course_id):
+                topic = await asyncio.to_thread(self.repository_factory.topic.get, lecture.topic_id)
+                for _ in range(self.SUMMARY_UPDATE_ATTEMPTS):
+                    course, previous = await self._load_course_summary(course_id)
+                    if previous is None and await self._has_other_lectures(lecture):
+                        summary = await self._rebuild_summary(course_id)
+                        break
+                    summary = await self._fold_into_summary(course, previous, topic, lecture)
+                    if await asyncio.to_thread(
+                        self.repository_factory.course.swap_lecture_summary,
+                        course_id,
+                        previous,
+                        summary,
+                    ):
+                        break
+                    self.logger.info(f"Summary of course {course_id} changed meanwhile; retrying")
+                else:
+                    raise DatabaseError("The summary kept changing during the update")
+        except Exception as e:
+            self.logger.warning(f"Failed to update the summary of course {course_id}: {e}")
+            return None
+
+        self.logger.info(f"Updated the summary of course {course_id}")
+        return summary
+
+    async def _rebuild_summary(self, course_id: int) -> Optional[str]:
+        """
+        Rebuild and store a course's summary; the caller holds the course's lock.
+
+        Raises:
+            DatabaseError: If the stored summary kept changing during the rebuild
+        """
+        for _ in range(self.SUMMARY_UPDATE_ATTEMPTS):
+            _, previous = await self._load_course_summary(course_id)
+            context = await asyncio.to_thread(self._load_generation_context, course_id)
+            topics_by_id = {topic.id: topic for topic in context.topics}
+            # Lectures come in (week, order, revision) order; keep each topic's last
+            latest = {lecture.topic_id: lecture for lecture in context.lectures}
+            summary = None
+            for topic_id, lecture in latest.items():
+                summary = await self._fold_into_summary(
+                    context.course, summary, topics_by_id.get(topic_id), lecture
+                )
+            if await asyncio.to_thread(
+                self.repository_factory.course.swap_lecture_summary,
+                course_id,
+                previous,
+                summary,
+            ):
+                self.logger.info(
+                    f"Rebuilt the summary of course {course_id} from {len(latest)} lectures"
+                )
+                return summary
+            self.logger.info(f"Summary of course {course_id} changed meanwhile; retrying")
+        raise DatabaseError("The summary kept changing during the rebuild")
+
+    async def rebuild_course_summary(self, course_id: int) -> Optional[str]:
+        """
+        Rebuild a course's rolling summary from its stored lectures.
+
+        Used after a lecture is edited or deleted, when the summary still covers
+        the old text. The latest revision of each topic's lecture is folded in
+        (week, order) order, from its summary, into a new summary that is written
+        as in update_course_summary. Failures are logged rather than raised.
+
+        Args:
+            course_id: ID of the course
+
+        Returns:
+            Optional[str]: The rebuilt summary (None if the course has no lectures
+            or it could not be rebuilt)
+        """
+        try:
+            async with _summary_lock(course_id):
+                return await self._rebuild_summary(course_id)
+        except Exception as e:
+            self.logger.warning(f"Failed to rebuild the summary of course {course_id}: {e}")
+            return None
+
+    # --- Batch Generation --- #
+
+    def _load_course_schedule(
+        self, course_id: int
+    ) -> Tuple[LectureGenerationContext, List[Topic], List[Dict[str, Any]]]:
+        """
+        Load a course's generation context and find the topics without a lecture.
+
+        Returns:
+            The generation context, topics without a lecture in (week, order)
+            order, and the prompt context entries of the existing lectures
+        """
+        context = self._load_generation_context(course_id)
+        generated = {lecture.topic_id for lecture in context.lectures}
+        pending = sorted(
+            (topic for topic in context.topics if topic.id not in generated),
+            key=lambda topic: (topic.week, topic.order),
+        )
+        return context, pending, self._existing_lectures_context(context)
+
+    async def _generate_scheduled_lecture(
+        self,
+        semaphore: asyncio.Semaphore,
+        topic: Topic,
+        batch: Dict[str, Any],
+        context: List[Dict[str, Any]],
+    ) -> Tuple[Topic, Optional[Lecture], Optional[str]]:
+        """
+        Generate and save the lecture for one topic of a batch, then fold it into
+        the course summary.
+
+        Returns:
+            The topic, the saved lecture (None on failure) and the error message, if any
+        """
+        attributes = {**batch["attributes"], "course_id": topic.course_id, "topic_id": topic.id}
+        async with semaphore:
+            try:
+                prompt_args = await self._prepare_prompt_arguments(
+                    attributes,
+                    batch["course"],
+                    batch["professor"],
+                    topic_model_to_dict(topic),
+                    # A lecture builds on the lectures of earlier weeks only
+                    [entry for entry in context if entry["week"] < topic.week],
+                    batch["topics"],
+                    batch["course_summary"],
+                )
+                generated_xml_output = await self._generate_and_parse_content(prompt_args)
+                lecture_data = self._build_lecture_data(attributes, generated_xml_output)
+                # Save off the event loop, which serves the other lectures in flight
+                lecture = await asyncio.to_thread(self.create_lecture, **lecture_data)
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to generate lecture for topic {topic.id} "
+                    f"(week {topic.week}, order {topic.order}): {e}",
+                    exc_info=True,
+                )
+                return topic, None, str(e)
+
+        # The next week's prompts use the updated summary
+        summary = await self.update_course_summary(lecture)
+        if summary:
+            batch["course_summary"] = summary
+        return topic, lecture, None
+
+    async def generate_course_lectures(
+        self,
+        course_id: int,
+        partial_attributes: Optional[Dict[str, Any]] = None,
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate and save every missing lecture of a course, yielding progress events.
+
+        Topics that already have a lecture are skipped, so an interrupted batch
+        resumes where it stopped. Weeks are generated in order, since a lecture's
+        prompt includes the summaries of the earlier weeks' lectures; the lectures
+        within a week are generated concurrently. Each lecture is saved as soon as
+        it is generated and folded into the course summary, and a failed lecture
+        does not stop the batch.
+
+        Events are dictionaries with an "event" name and a "data" payload:
+        - progress: {"stage": "scheduled", "total", "skipped", "weeks"} once, then
+          {"stage": "week", "week", "lectures"} as each week starts
+        - lecture: {"lecture_id", "topic_id", "week", "order", "title", "completed", "total"}
+        - error: {"topic_id", "week", "order", "title", "detail"} for a failed lecture
+        - complete: {"generated", "failed", "skipped"}
+
+        Args:
+            course_id: ID of the course to generate lectures for
+            partial_attributes: Optional attributes applied to every lecture
+                (e.g. "freeform_prompt", "word_count", "revision")
+            concurrency: Lectures generated at the same time (defaults to
+                LECTURE_BATCH_CONCURRENCY)
+
+        Yields:
+            Dict[str, Any]: Batch events, ending with a single complete event.
+
+        Raises:
+            DatabaseError: If the course, its topics or its lectures cannot be loaded.
+        """
+        concurrency = concurrency or get_settings().LECTURE_BATCH_CONCURRENCY
+        course_context, pending, context = await asyncio.to_thread(
+            self._load_course_schedule, course_id
+        )
+        batch = {
+            "attributes": partial_attributes or {},
+            "course": course_model_to_dict(course_context.course),
+            "professor": professor_model_to_dict(course_context.professor),
+            "topics": topics_model_to_dict(course_context.topics),
+            "course_summary": course_context.course_summary,
+        }
+        weeks = sorted({topic.week for topic in pending})
+        skipped = len(course_context.topics) - len(pending)
+        self.logger.info(
+            f"Generating {len(pending)} lectures for course {course_id} over {len(weeks)} weeks "
+            f"({skipped} already generated, concurrency {concurrency})"
+        )
+        yield {
+            "event": "progress",
+            "data": {
+                "stage": "scheduled",
+                "total": len(pending),
+                "skipped": skipped,
+                "weeks": weeks,
+            },
+        }
+
+        semaphore = asyncio.Semaphore(concurrency)
+        completed = failed = 0
+        for week, week_topics in groupby(pending, key=lambda topic: topic.week):
+            week_topics = list(week_topics)
+            yield {
+                "event": "progress",
+                "data": {"stage": "week", "week": week, "lectures": len(week_topics)},
+            }
+            tasks = [
+                asyncio.ensure_future(
+                    self._generate_scheduled_lecture(semaphore, topic, batch, context)
+                )
+                for topic in week_topics
+            ]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    topic, lecture, error = await next_done
+                    topic_data = {
+                        "topic_id": topic.id,
+                        "week": topic.week,
+                        "order": topic.order,
+                        "title": topic.title,
+                    }
+                    if lecture is None:
+                        failed += 1
+                        yield {"event": "error", "data": {**topic_data, "detail": error}}
+                        continue
+                    completed += 1
+                    context.append(self._lecture_context(topic, lecture.summary))
+                    yield {
+                        "event": "lecture",
+                        "data": {
+                            "lecture_id": lecture.id,
+                            **topic_data,
+                            "completed": completed,
+                            "total": len(pending),
+                        },
+                    }
+            finally:
+                # Stop the week's remaining lectures if the consumer stops listening
+                for task in tasks:
+                    task.cancel()
+
+        self.logger.info(f"Generated {completed} lectures for course {course_id} ({failed} failed)")
+        yield {
+            "event": "complete",
+            "data": {"generated": completed, "failed": failed, "skipped": skipped},
+        }
@@ -453,6 +453,7 @@ class ProfessorService:
                 prompt=prompt,
                 model=settings.PROFESSOR_GENERATION_MODEL,
                 system_prompt=get_system_prompt("professor"),
+                purpose="professor",
             )
         except Exception as e:
             self.logger.error(f"ContentService generation call failed: {e}", exc_info=True)
@@ -5,9 +5,10 @@ This service abstracts storage operations for files, allowing the application
 to work with either local MinIO (development) or AWS S3 (production).
 """
 
+import asyncio
 import io
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterable, Dict, List, Optional, Tuple
 
 import boto3
 from botocore.client import Config
@@ -15,6 +16,9 @@ from botocore.exceptions import ClientError
 
 from artificial_u.config import get_settings
 
+# S3 rejects multipart parts smaller than this, except the last one
+MIN_MULTIPART_PART_SIZE = 5 * 1024 * 1024
+
 
 class StorageService:
     """Service for handling file storage operations with S3/MinIO compatibility."""
@@ -36,6 +40,7 @@ class StorageService:
         self.audio_bucket = self.settings.STORAGE_AUDIO_BUCKET
         self.lectures_bucket = self.settings.STORAGE_LECTURES_BUCKET
         self.images_bucket = self.settings.STORAGE_IMAGES_BUCKET
+        self.part_size = max(MIN_MULTIPART_PART_SIZE, self.settings.STORAGE_MULTIPART_PART_SIZE)
 
     def _get_s3_client(self):
         """
@@ -91,8 +96,10 @@ class StorageService:
             if content_type:
                 extra_args["ContentType"] = content_type
 
-            # Upload to S3/MinIO
-            self.client.upload_fileobj(file_obj, bucket, object_name, ExtraArgs=extra_args)
+            # Upload to S3/MinIO without blocking the event loop
+            await asyncio.to_thread(
+                self.client.upload_fileobj, file_obj, bucket, object_name, ExtraArgs=extra_args
+            )
 
             # Generate URL
             url = self.get_file_url(bucket, object_name)
@@ -120,6 +127,78 @@ class StorageService:
             file_data, self.audio_bucket, object_name, content_type=content_type
         )
 
+    async def upload_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        bucket: str,
+        object_name: str,
+        content_type: str = None,
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Upload a stream of data to storage as it is produced.
+
+        Chunks are gathered into parts of STORAGE_MULTIPART_PART_SIZE bytes and
+        sent as a multipart upload, one part in flight while the next one fills,
+        so at most two parts are held in memory however long the stream is. A
+        stream that ends within the first part is sent with a single PUT.
+
+        Args:
+            chunks: Async iterable of data chunks, in order
+            bucket: Bucket name
+            object_name: Object key/name
+            content_type: Content type of the file
+
+        Returns:
+            Tuple of (success, url)
+
+        Raises:
+            Exception: Any error raised by the chunk stream, after the partial
+                upload has been aborted
+        """
+        extra_args = {"ContentType": content_type} if content_type else {}
+        upload = _MultipartUpload(self.client, bucket, object_name, extra_args)
+        buffer = bytearray()
+        try:
+            async for chunk in chunks:
+                buffer.extend(chunk)
+                if len(buffer) >= self.part_size:
+                    await upload.send_part(bytes(buffer))
+                    buffer.clear()
+            total = await upload.finish(bytes(buffer))
+        except _StorageUploadError as e:
+            await upload.abort()
+            await _close_stream(chunks)
+            self.logger.error(f"Error uploading stream to {bucket}/{object_name}: {e.__cause__}")
+            return False, None
+        except BaseException:
+            await upload.abort()
+            await _close_stream(chunks)
+            raise
+
+        url = self.get_file_url(bucket, object_name)
+        self.logger.info(
+            f"Uploaded {total} bytes in {max(1, upload.part_count)} parts to {bucket}/{object_name}"
+        )
+        return True, url
+
+    async def upload_audio_stream(
+        self, chunks: AsyncIterable[bytes], object_name: str, content_type: str = "audio/mpeg"
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Upload streamed audio data to storage as it is produced.
+
+        Args:
+            chunks: Async iterable of audio data chunks, in order
+            object_name: Object key/name
+            content_type: Content type of the audio file
+
+        Returns:
+            Tuple of (success, url)
+        """
+        return await self.upload_stream(
+            chunks, self.audio_bucket, object_name, content_type=content_type
+        )
+
     async def upload_lecture_file(
         self, file_data: bytes, object_name: str, content_type: str = "text/markdown"
     ) -> Tuple[bool, Optional[str]]:
@@ -314,6 +393,29 @@ class StorageService:
         """
         return f"{course_id}/week{week_number}/lecture{lecture_order}.{extension}"
 
+    def generate_hls_key(
+        self,
+        course_id: str,
+        week_number: int,
+        lecture_order: int,
+        file_name: str,
+    ) -> str:
+        """
+        Generate the object key of a file in a lecture's HLS package.
+
+        The package sits next to the lecture's MP3, in a directory named after it.
+
+        Args:
+            course_id: Course ID
+            week_number: Week number
+            lecture_order: Lecture order within week
+            file_name: Playlist or segment file name
+
+        Returns:
+            Object key for S3/MinIO
+        """
+        return f"{course_id}/week{week_number}/lecture{lecture_order}/{file_name}"
+
     def generate_lecture_key(
         self,
         course_id: str,
@@ -334,3 +436,118 @@ class StorageService:
             Object key for S3/MinIO
         """
         return f"{course_id}/week{week_number}/lecture{lecture_order}.{extension}"
+
+
+async def _close_stream(chunks: AsyncIterable[bytes]) -> None:
+    """Close an abandoned chunk stream, e.g. to cancel speech synthesis still in flight."""
+    aclose = getattr(chunks, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+class _StorageUploadError(Exception):
+    """Wraps a storage error so it is told apart from errors of the uploaded stream."""
+
+
+class _MultipartUpload:
+    """
+    A multipart upload started on its first part.
+
+    Blocking S3 calls run in a worker thread. Each part upload runs in the
+    background until the next part is ready, keeping one part in flight.
+    """
+
+    def __init__(self, client, bucket: str, object_name: str, extra_args: Dict[str, Any]):
+        self.client = client
+        self.bucket = bucket
+        self.object_name = object_name
+        self.extra_args = extra_args
+        self.upload_id: Optional[str] = None
+        self.parts: List[Dict[str, Any]] = []
+        self.part_count = 0
+        self.total = 0
+        self._in_flight: Optional[asyncio.Task] = None
+
+    async def _call(self, method: str, **kwargs) -> Dict[str, Any]:
+        """Run an S3 client method in a worker thread."""
+        try:
+            return await asyncio.to_thread(getattr(self.client, method), **kwargs)
+        except Exception as e:
+            raise _StorageUploadError(method) from e
+
+    async def _upload_part(self, number: int, data: bytes) -> None:
+        response = await self._call(
+            "upload_part",
+            Bucket=self.bucket,
+            Key=self.object_name,
+            UploadId=self.upload_id,
+            PartNumber=number,
+            Body=data,
+        )
+        self.parts.append({"PartNumber": number, "ETag": response["ETag"]})
+
+    async def _wait_in_flight(self) -> None:
+        if self._in_flight is not None:
+            task, self._in_flight = self._in_flight, None
+            await task
+
+    async def send_part(self, data: bytes) -> None:
+        """Start uploading a part once the previous part has been sent."""
+        if self.upload_id is None:
+            response = await self._call(
+                "create_multipart_upload",
+                Bucket=self.bucket,
+                Key=self.object_name,
+                **self.extra_args,
+            )
+            self.upload_id = response["UploadId"]
+        await self._wait_in_flight()
+        self.part_count += 1
+        self.total += len(data)
+        self._in_flight = asyncio.ensure_future(self._upload_part(self.part_count, data))
+
+    async def finish(self, remainder: bytes) -> int:
+        """
+        Send the remaining data and complete the upload.
+
+        Returns:
+            int: Total bytes uploaded
+        """
+        if self.upload_id is None:
+            await self._call(
+                "put_object",
+                Bucket=self.bucket,
+                Key=self.object_name,
+                Body=remainder,
+                **self.extra_args,
+            )
+            return len(remainder)
+
+        if remainder:
+            await self.send_part(remainder)
+        await self._wait_in_flight()
+        await self._call(
+            "complete_multipart_upload",
+            Bucket=self.bucket,
+            Key=self.object_name,
+            UploadId=self.upload_id,
+            MultipartUpload={"Parts": sorted(self.parts, key=lambda part: part["PartNumber"])},
+        )
+        return self.total
+
+    async def abort(self) -> None:
+        """Abort the upload, discarding the parts sent so far."""
+        if self._in_flight is not None:
+            self._in_flight.cancel()
+            self._in_flight = None
+        if self.upload_id is None:
+            return
+        try:
+            await self._call(
+                "abort_multipart_upload",
+                Bucket=self.bucket,
+                Key=self.object_name,
+                UploadId=self.upload_id,
+            )
+        except _StorageUploadError:
+            pass
@@ -275,6 +275,7 @@ class TopicService:
             model=settings.TOPICS_GENERATION_MODEL,
             prompt=topics_prompt,
             system_prompt=system_prompt,
+            purpose="topics",
         )
         self.logger.info("Received response from content service for topics.")
 
@@ -4,11 +4,26 @@ Text-to-Speech service for ArtificialU.
 This service handles converting text to speech using ElevenLabs.
 """
 
+import asyncio
 import logging
 import os
-from typing import Any, Dict, Optional, Tuple, Union
-
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from artificial_u.audio.chunk_cache import ChunkAudioCache
+from artificial_u.audio.manifest import AudioManifest
 from artificial_u.audio.speech_processor import SpeechProcessor
+from artificial_u.config import get_settings
 from artificial_u.integrations import elevenlabs
 from artificial_u.models.core import Lecture, Professor
 from artificial_u.utils import AudioProcessingError
@@ -32,8 +47,13 @@ class TTSService:
         api_key: Optional[str] = None,
         audio_path: Optional[str] = None,
         client: Optional[elevenlabs.ElevenLabsClient] = None,
+        async_client: Optional[elevenlabs.AsyncElevenLabsClient] = None,
         speech_processor: Optional[SpeechProcessor] = None,
         repository_factory=None,
+        max_concurrency: Optional[int] = None,
+        chunk_retries: Optional[int] = None,
+        retry_backoff: Optional[float] = None,
+        chunk_cache: Optional[ChunkAudioCache] = None,
         logger=None,
     ):
         """
@@ -42,29 +62,68 @@ class TTSService:
         Args:
             api_key: Optional ElevenLabs API key
             audio_path: Optional base path for audio files
-            client: Optional ElevenLabs client instance
+            client: Optional ElevenLabs client instance (playback and connection tests)
+            async_client: Optional async ElevenLabs client instance (speech synthesis)
             speech_processor: Optional speech processor instance
             repository_factory: Optional repository factory instance
+            max_concurrency: Maximum chunks synthesized at once (defaults to TTS_MAX_CONCURRENCY)
+            chunk_retries: Extra attempts per chunk request when the async client is created
+                here (defaults to TTS_CHUNK_RETRIES)
+            retry_backoff: Base seconds between chunk retries when the async client is
+                created here (defaults to TTS_RETRY_BACKOFF)
+            chunk_cache: Optional chunk audio cache (created from settings when enabled)
             logger: Optional logger instance
         """
         self.logger = logger or logging.getLogger(__name__)
         self.audio_path = audio_path
         self.repository_factory = repository_factory
 
+        settings = get_settings()
+        self.max_concurrency = max(1, max_concurrency or settings.TTS_MAX_CONCURRENCY)
+        self.chunk_retries = max(
+            0, settings.TTS_CHUNK_RETRIES if chunk_retries is None else chunk_retries
+        )
+        self.retry_backoff = settings.TTS_RETRY_BACKOFF if retry_backoff is None else retry_backoff
+
+        if chunk_cache is None and settings.TTS_CACHE_ENABLED:
+            chunk_cache = ChunkAudioCache(
+                cache_dir=settings.TTS_CACHE_PATH,
+                max_bytes=settings.TTS_CACHE_MAX_BYTES,
+                logger=self.logger,
+            )
+        self.chunk_cache = chunk_cache
+
         # Initialize components
         self.client = client or elevenlabs.ElevenLabsClient(api_key=api_key)
+        self.async_client = async_client or elevenlabs.AsyncElevenLabsClient(
+            api_key=self.client.api_key,
+            max_retries=self.chunk_retries,
+            retry_backoff=self.retry_backoff,
+            logger=self.logger,
+        )
         self.speech_processor = speech_processor or SpeechProcessor(logger=self.logger)
 
-    def convert_text_to_speech(
+    def _prepare_chunks(self, text: str, chunk_size: int) -> List[str]:
+        """Split text into the chunks to synthesize, each enhanced for speech when queued."""
+        # Split before enhancing, so each chunk is still a span of the source text.
+        # Content-defined cuts only pay off when unchanged chunks can be reused.
+        chunks = self.speech_processor.split_into_chunks(
+            text, max_chunk_size=chunk_size, content_defined=self.chunk_cache is not None
+        )
+        self.logger.info(f"Converting text to speech in {len(chunks)} chunks")
+        return chunks
+
+    async def stream_text_to_speech(
         self,
         text: str,
         el_voice_id: str,
         model_id: Optional[str] = None,
         voice_settings: Optional[Dict[str, float]] = None,
         chunk_size: int = 4000,
-    ) -> bytes:
+        manifest: Optional[AudioManifest] = None,
+    ) -> AsyncIterator[bytes]:
         """
-        Convert text to speech.
+        Convert text to speech, yielding each chunk's audio in text order.
 
         Args:
             text: Text to convert
@@ -72,60 +131,267 @@ class TTSService:
             model_id: Optional model ID (defaults to eleven_flash_v2_5)
             voice_settings: Optional voice settings
             chunk_size: Maximum size of text chunks
+            manifest: Optional manifest to record each chunk's audio and text span in
 
-        Returns:
-            Audio data as bytes
+        Yields:
+            bytes: Audio data of each chunk, in text order
+        """
+        chunks = self._prepare_chunks(text, chunk_size)
+
+        async def chunk_source() -> AsyncIterator[str]:
+            for chunk in chunks:
+                yield chunk
+
+        audio_stream = self.stream_chunks_to_speech(
+            chunk_source(),
+            el_voice_id,
+            model_id=model_id,
+            voice_settings=voice_settings,
+            total_chunks=len(chunks),
+            manifest=manifest,
+        )
+        try:
+            async for audio_data in audio_stream:
+                yield audio_data
+        finally:
+            await audio_stream.aclose()
+        if manifest is not None:
+            manifest.locate(text)
+
+    async def stream_chunks_to_speech(
+        self,
+        chunks: AsyncIterable[str],
+        el_voice_id: str,
+        model_id: Optional[str] = None,
+        voice_settings: Optional[Dict[str, float]] = None,
+        total_chunks: Optional[int] = None,
+        enhance: bool = True,
+        manifest: Optional[AudioManifest] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Convert a stream of text chunks to speech, yielding audio in chunk order.
+
+        Chunks are synthesized in a sliding window of max_concurrency requests,
+        started as soon as they arrive: a new chunk starts as the oldest one is
+        handed on, so only the window's audio is held in memory and synthesis can
+        run while the text is still being produced.
+
+        Args:
+            chunks: Async iterable of text chunks, in order
+            el_voice_id: ElevenLabs Voice ID to use
+            model_id: Optional model ID (defaults to eleven_flash_v2_5)
+            voice_settings: Optional voice settings
+            total_chunks: Number of chunks, if known (used in logs)
+            enhance: Whether to apply speech markup enhancement to each chunk
+            manifest: Optional manifest to record each chunk's source text and audio in
+
+        Yields:
+            bytes: Audio data of each chunk, in order
+
+        Raises:
+            AudioProcessingError: If a chunk cannot be synthesized or no chunk is valid
         """
         model_id = model_id or self.DEFAULT_MODEL
         voice_settings = voice_settings or self.DEFAULT_VOICE_SETTINGS.copy()
+        reused = set()
+        # Each started chunk holds a slot until its audio has been handed on
+        slots = asyncio.Semaphore(self.max_concurrency)
+        window: asyncio.Queue = asyncio.Queue()
+
+        async def synthesize(index: int, source: str, chunk: str) -> Tuple[str, bytes]:
+            audio_data, from_cache = await self._get_or_synthesize_chunk(
+                chunk, index, total_chunks, el_voice_id, model_id, voice_settings
+            )
+            if from_cache:
+                reused.add(index)
+            return source, audio_data
+
+        feeder = asyncio.ensure_future(
+            self._queue_chunks(chunks, synthesize, window, slots, enhance)
+        )
+        synthesized = 0
+        try:
+            while (task := await window.get()) is not None:
+                if isinstance(task, Exception):
+                    raise task
+                source, audio_data = await task
+                slots.release()
+                synthesized += 1
+                if manifest is not None:
+                    manifest.add(source, audio_data)
+                yield audio_data
+        finally:
+            # Don't leave chunks running once one has failed or the consumer stopped
+            feeder.cancel()
+            while not window.empty():
+                task = window.get_nowait()
+                if isinstance(task, asyncio.Future):
+                    task.cancel()
+
+        if self.chunk_cache:
+            self.logger.info(
+                f"TTS chunk cache: {len(reused)}/{synthesized} chunks reused "
+                f"(lifetime hit rate {self.chunk_cache.stats()['hit_rate']:.0%})"
+            )
 
-        # Enhance text for better speech
-        enhanced_text = self.speech_processor.enhance_speech_markup(text)
+    async def _queue_chunks(
+        self,
+        chunks: AsyncIterable[str],
+        synthesize: Callable[[int, str, str], Awaitable[Tuple[str, bytes]]],
+        window: asyncio.Queue,
+        slots: asyncio.Semaphore,
+        enhance: bool,
+    ) -> None:
+        """
+        Start synthesizing chunks as they arrive, queuing their tasks in order.
 
-        # Split text into chunks if necessary
-        chunks = self.speech_processor.split_into_chunks(enhanced_text, max_chunk_size=chunk_size)
+        The queue ends with None, or with the error that stopped the chunks.
+        """
+        started = 0
+        index = -1
+        try:
+            async for index, source in _aenumerate(chunks):
+                chunk = self.speech_processor.enhance_speech_markup(source) if enhance else source
+                if not self.speech_processor.is_valid_chunk(chunk):
+                    self.logger.warning(f"Skipping invalid chunk {index+1}: too short or empty")
+                    continue
+                await slots.acquire()
+                window.put_nowait(asyncio.ensure_future(synthesize(index, source, chunk)))
+                started += 1
+            if not started:
+                raise AudioProcessingError("No audio segments were generated")
+        except Exception as e:
+            window.put_nowait(e)
+            return
+        self.logger.info(f"Queued {started}/{index + 1} chunks for synthesis")
+        window.put_nowait(None)
 
-        # Generate audio for each chunk
-        audio_segments = []
-        total_chunks = len(chunks)
+    async def convert_text_to_speech(
+        self,
+        text: str,
+        el_voice_id: str,
+        model_id: Optional[str] = None,
+        voice_settings: Optional[Dict[str, float]] = None,
+        chunk_size: int = 4000,
+        manifest: Optional[AudioManifest] = None,
+    ) -> bytes:
+        """
+        Convert text to speech.
 
-        self.logger.info(f"Converting text to speech in {total_chunks} chunks")
+        Args:
+            text: Text to convert
+            el_voice_id: ElevenLabs Voice ID to use
+            model_id: Optional model ID (defaults to eleven_flash_v2_5)
+            voice_settings: Optional voice settings
+            chunk_size: Maximum size of text chunks
+            manifest: Optional manifest to record where each chunk lands in the joined audio
 
-        for i, chunk in enumerate(chunks):
-            chunk_size = len(chunk)
-            word_count = len(chunk.split())
-            self.logger.info(
-                f"Processing chunk {i+1}/{total_chunks} ({chunk_size} chars, {word_count} words)"
+        Returns:
+            Audio data as bytes
+        """
+        audio_segments = [
+            segment
+            async for segment in self.stream_text_to_speech(
+                text, el_voice_id, model_id, voice_settings, chunk_size, manifest
             )
+        ]
+        return b"".join(audio_segments)
 
-            # Skip invalid chunks
-            if not self.speech_processor.is_valid_chunk(chunk):
-                self.logger.warning(f"Skipping invalid chunk {i+1}: too short or empty")
-                continue
+    async def _get_or_synthesize_chunk(
+        self,
+        chunk: str,
+        index: int,
+        total_chunks: Optional[int],
+        el_voice_id: str,
+        model_id: str,
+        voice_settings: Dict[str, float],
+    ) -> Tuple[bytes, bool]:
+        """
+        Get a chunk's audio from the chunk cache, synthesizing it on a miss.
 
-            # Generate audio
-            try:
-                audio_data = self.client.text_to_speech(
-                    text=chunk,
-                    voice_id=el_voice_id,
-                    model_id=model_id,
-                    voice_settings=voice_settings,
-                )
-
-                audio_segments.append(audio_data)
-                self.logger.info(f"Successfully processed chunk {i+1}")
-            except Exception as e:
-                self.logger.error(f"Error processing chunk {i+1}: {e}")
-                raise AudioProcessingError(f"Failed to convert chunk {i+1} to speech: {e}")
+        Returns:
+            Tuple of (audio data, whether it came from the cache)
+        """
+        if not self.chunk_cache:
+            audio_data = await self._synthesize_chunk(
+                chunk, index, total_chunks, el_voice_id, model_id, voice_settings
+            )
+            return audio_data, False
+
+        cache_key = self.chunk_cache.make_key(chunk, el_voice_id, model_id, voice_settings)
+        # Cache reads and writes hit the disk, so keep them off the event loop
+        cached = await asyncio.to_thread(self.chunk_cache.get, cache_key, len(chunk))
+        if cached is not None:
+            self.logger.info(f"Chunk {index+1}/{total_chunks or '?'} served from cache")
+            return cached, True
+
+        audio_data = await self._synthesize_chunk(
+            chunk, index, total_chunks, el_voice_id, model_id, voice_settings
+        )
+        await asyncio.to_thread(self.chunk_cache.put, cache_key, audio_data)
+        return audio_data, False
+
+    async def _synthesize_chunk(
+        self,
+        chunk: str,
+        index: int,
+        total_chunks: Optional[int],
+        el_voice_id: str,
+        model_id: str,
+        voice_settings: Dict[str, float],
+    ) -> bytes:
+        """
+        Synthesize a single chunk.
+
+        Retryable failures (rate limits, server and network errors) are retried by
+        the async client with jittered exponential backoff.
+
+        Args:
+            chunk: Enhanced chunk text
+            index: Zero-based position of the chunk in the lecture
+            total_chunks: Total number of chunks in the lecture, if known
+            el_voice_id: ElevenLabs Voice ID to use
+            model_id: ElevenLabs model ID
+            voice_settings: Voice settings
 
-        # Combine audio segments
-        if not audio_segments:
-            raise AudioProcessingError("No audio segments were generated")
+        Returns:
+            Audio data for the chunk
 
-        audio = b"".join(audio_segments)
-        return audio
+        Raises:
+            AudioProcessingError: If the chunk cannot be synthesized
+        """
+        self.logger.info(
+            f"Processing chunk {index+1}/{total_chunks or '?'} "
+            f"({len(chunk)} chars, {len(chunk.split())} words)"
+        )
 
-    def generate_lecture_audio(
+        try:
+            audio_data = await self.async_client.text_to_speech(
+                text=chunk,
+                voice_id=el_voice_id,
+                model_id=model_id,
+                voice_settings=voice_settings,
+            )
+        except Exception as e:
+            self.logger.error(f"Error processing chunk {index+1}: {e}")
+            raise AudioProcessingError(f"Failed to convert chunk {index+1} to speech: {e}") from e
+
+        self.logger.info(f"Successfully processed chunk {index+1}")
+        return audio_data
+
+    def _resolve_voice_id(self, professor: Professor, el_voice_id: Optional[str]) -> str:
+        """Get the ElevenLabs voice ID to use, looking up the professor's voice if needed."""
+        if el_voice_id:
+            return el_voice_id
+        if professor.voice_id and self.repository_factory:
+            # Look up the voice in the database
+            voice = self.repository_factory.voice.get(professor.voice_id)
+            if voice:
+                return voice.el_voice_id
+            # TODO: Maybe use select_voice_for_professor here?
+        raise ValueError("No voice ID specified or found for professor")
+
+    async def generate_lecture_audio(
         self,
         lecture: Lecture,
         professor: Professor,
@@ -146,26 +412,11 @@ class TTSService:
         Returns:
             Tuple of (file path or empty string, audio data)
         """
-        # Get voice ID from professor if not specified
-        if not el_voice_id:
-            if (
-                professor.voice_id
-                and hasattr(self, "repository_factory")
-                and self.repository_factory
-            ):
-                # Look up the voice in the database
-                voice = self.repository_factory.voice.get(professor.voice_id)
-                if voice:
-                    el_voice_id = voice.el_voice_id
-                else:
-                    raise ValueError("No voice ID specified or found for professor")
-                # TODO: Maybe use select_voice_for_professor here?
-            else:
-                raise ValueError("No voice ID specified or found for professor")
+        el_voice_id = self._resolve_voice_id(professor, el_voice_id)
 
         # Generate the audio
         try:
-            audio_data = self.convert_text_to_speech(
+            audio_data = await self.convert_text_to_speech(
                 text=lecture.content,
                 el_voice_id=el_voice_id,
                 model_id=model_id,
@@ -181,6 +432,45 @@ class TTSService:
 
         return file_path, audio_data
 
+    async def stream_lecture_audio(
+        self,
+        lecture: Lecture,
+        professor: Professor,
+        el_voice_id: Optional[str] = None,
+        model_id: Optional[str] = None,
+        manifest: Optional[AudioManifest] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Generate audio for a lecture, yielding it as it is synthesized.
+
+        Nothing is written to disk; the caller consumes the audio as it arrives.
+
+        Args:
+            lecture: Lecture to generate audio for
+            professor: Professor delivering the lecture
+            el_voice_id: Optional ElevenLabs voice ID (will be selected if not provided)
+            model_id: Optional ElevenLabs model ID
+            manifest: Optional manifest to record each chunk's audio and text span in
+
+        Yields:
+            bytes: Audio data chunks, in order
+        """
+        el_voice_id = self._resolve_voice_id(professor, el_voice_id)
+
+        audio_stream = self.stream_text_to_speech(
+            text=lecture.content,
+            el_voice_id=el_voice_id,
+            model_id=model_id,
+            manifest=manifest,
+        )
+        try:
+            async for audio_data in audio_stream:
+                yield audio_data
+        except Exception as e:
+            raise AudioProcessingError(f"Failed to generate lecture audio: {e}") from e
+        finally:
+            await audio_stream.aclose()
+
     def _get_lecture_file_path(self, lecture: Lecture) -> str:
         """Get the file path for a lecture audio file."""
         if not self.audio_path:
@@ -231,6 +521,15 @@ class TTSService:
         except Exception as e:
             raise AudioProcessingError(f"Failed to play audio: {e}")
 
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get chunk cache metrics.
+
+        Returns:
+            Cache statistics, or None if the chunk cache is disabled
+        """
+        return self.chunk_cache.stats() if self.chunk_cache else None
+
     def test_connection(self) -> Dict[str, Any]:
         """
         Test connection to the TTS service.
@@ -239,3 +538,11 @@ class TTSService:
             Connection status information
         """
         return self.client.test_connection()
+
+
+async def _aenumerate(items: AsyncIterable[Any]) -> AsyncIterator[Tuple[int, Any]]:
+    """Enumerate an async iterable."""
+    index = 0
+    async for item in items:
+        yield index, item
+        index += 1
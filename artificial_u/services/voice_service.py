@@ -4,6 +4,7 @@ Voice service for ArtificialU.
 This service manages voice selection and assignment for professors.
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
@@ -20,6 +21,7 @@ class VoiceService:
         self,
         repository_factory: RepositoryFactory,
         client: Optional[elevenlabs.ElevenLabsClient] = None,
+        async_client: Optional[elevenlabs.AsyncElevenLabsClient] = None,
         logger=None,
     ):
         """
@@ -28,6 +30,7 @@ class VoiceService:
         Args:
             repository_factory: Repository factory instance
             client: ElevenLabs client instance (optional)
+            async_client: Async ElevenLabs client instance for the async lookups (optional)
             logger: Optional logger instance
         """
         self.logger = logger or logging.getLogger(__name__)
@@ -35,6 +38,9 @@ class VoiceService:
         # Initialize client and components
         self.repository_factory = repository_factory
         self.client = client or elevenlabs.ElevenLabsClient()
+        self.async_client = async_client or elevenlabs.AsyncElevenLabsClient(
+            api_key=self.client.api_key, logger=self.logger
+        )
         self.mapper = elevenlabs.VoiceMapper(logger=self.logger)
 
     def _find_voices_in_db(self, attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -301,7 +307,7 @@ class VoiceService:
             return db_voice.model_dump()
         return None
 
-    def get_voice_by_el_id(self, el_voice_id: str) -> Optional[Dict[str, Any]]:
+    async def get_voice_by_el_id(self, el_voice_id: str) -> Optional[Dict[str, Any]]:
         """
         Get voice data by ElevenLabs voice ID.
 
@@ -312,19 +318,21 @@ class VoiceService:
             Voice data dictionary or None if not found
         """
         # Try to get from database first
-        db_voice = self.repository_factory.voice.get_by_elevenlabs_id(el_voice_id)
+        db_voice = await asyncio.to_thread(
+            self.repository_factory.voice.get_by_elevenlabs_id, el_voice_id
+        )
         if db_voice:
             return db_voice.model_dump()
 
         # Fall back to API
-        el_voice_data = self.client.get_el_voice(el_voice_id)
+        el_voice_data = await self.async_client.get_voice(el_voice_id)
         if el_voice_data:
             # Save to database
-            self._save_voice_to_db(el_voice_data)
+            await asyncio.to_thread(self._save_voice_to_db, el_voice_data)
 
         return el_voice_data
 
-    def manual_voice_assignment(self, professor_id: str, el_voice_id: str) -> None:
+    async def manual_voice_assignment(self, professor_id: str, el_voice_id: str) -> None:
         """
         Manually assign a voice to a professor.
 
@@ -333,25 +341,29 @@ class VoiceService:
             el_voice_id: ID of the voice to assign
         """
         # Verify voice exists
-        voice_data = self.get_voice_by_el_id(el_voice_id)
+        voice_data = await self.get_voice_by_el_id(el_voice_id)
         if not voice_data:
             raise ValueError(f"Voice with ID {el_voice_id} not found")
 
         # Find or Create DB Voice record with el_voice_id
-        voice = self.repository_factory.voice.get_by_elevenlabs_id(el_voice_id)
+        voice = await asyncio.to_thread(
+            self.repository_factory.voice.get_by_elevenlabs_id, el_voice_id
+        )
         if not voice:
             voice = Voice(
                 el_voice_id=el_voice_id,
                 name=voice_data["name"],
             )
-            self.repository_factory.voice.upsert(voice)
+            await asyncio.to_thread(self.repository_factory.voice.upsert, voice)
 
         # Update professor with voice ID
-        self.repository_factory.professor.update_field(professor_id, voice_id=voice.id)
+        await asyncio.to_thread(
+            self.repository_factory.professor.update_field, professor_id, voice_id=voice.id
+        )
 
         self.logger.info(f"Manually assigned voice {el_voice_id} to professor {professor_id}")
 
-    def list_available_voices(
+    async def list_available_voices(
         self,
         gender: Optional[str] = None,
         accent: Optional[str] = None,
@@ -379,7 +391,8 @@ class VoiceService:
             List of voice dictionaries
         """
         # Try database first
-        voices = self.repository_factory.voice.list(
+        voices = await asyncio.to_thread(
+            self.repository_factory.voice.list,
             gender=gender,
             accent=accent,
             age=age,
@@ -394,7 +407,7 @@ class VoiceService:
             return [v.model_dump() for v in voices]
 
         # Get from API
-        voices_page, _ = self.client.get_shared_voices(
+        voices_page, _ = await self.async_client.get_shared_voices(
             gender=gender,
             accent=accent,
             age=age,
@@ -407,7 +420,7 @@ class VoiceService:
 
         # Save to database
         for voice in voices_page:
-            self._save_voice_to_db(voice)
+            await asyncio.to_thread(self._save_voice_to_db, voice)
 
         return voices_page
 
@@ -57,7 +57,8 @@ class UniversitySystem:
             speech_key: API key for Azure Speech
             speech_region: Azure Speech region
             db_url: PostgreSQL database URL
-            content_backend: Backend to use for content generation ('anthropic' or 'ollama')
+            content_backend: Backend to use for content generation ('anthropic', 'ollama'
+                or 'replay')
             content_model: Model to use with the chosen backend
             log_level: Logging level
             storage_type: Storage type ('minio' or 's3')
@@ -158,6 +159,12 @@ class UniversitySystem:
             self.elevenlabs_client = elevenlabs.ElevenLabsClient(
                 api_key=self.settings.ELEVENLABS_API_KEY
             )
+            self.async_elevenlabs_client = elevenlabs.AsyncElevenLabsClient(
+                api_key=self.elevenlabs_client.api_key,
+                max_retries=self.settings.TTS_CHUNK_RETRIES,
+                retry_backoff=self.settings.TTS_RETRY_BACKOFF,
+                logger=logging.getLogger("artificial_u.integrations.elevenlabs.async_client"),
+            )
             self.speech_processor = SpeechProcessor()
 
             # Initialize voice mapper
@@ -191,6 +198,7 @@ class UniversitySystem:
             api_key=self.settings.ELEVENLABS_API_KEY,
             audio_path=self.settings.TEMP_AUDIO_PATH,
             client=self.elevenlabs_client,
+            async_client=self.async_elevenlabs_client,
             speech_processor=self.speech_processor,
             repository_factory=self.repository_factory,
             logger=logging.getLogger("artificial_u.services.tts_service"),
@@ -202,6 +210,7 @@ class UniversitySystem:
         self.voice_service = VoiceService(
             repository_factory=self.repository_factory,
             client=self.elevenlabs_client,
+            async_client=self.async_elevenlabs_client,
             logger=logging.getLogger("artificial_u.services.voice_service"),
         )
 
@@ -228,7 +237,6 @@ class UniversitySystem:
             content_service=self.content_service,
             professor_service=self.professor_service,
             course_service=self.course_service,
-            storage_service=self.storage_service,
             logger=logging.getLogger("artificial_u.services.lecture_service"),
         )
 
@@ -238,6 +246,7 @@ class UniversitySystem:
             api_key=self.settings.ELEVENLABS_API_KEY,
             tts_service=self.tts_service,
             storage_service=self.storage_service,
+            lecture_service=self.lecture_service,
             logger=logging.getLogger("artificial_u.services.audio_service"),
         )
 
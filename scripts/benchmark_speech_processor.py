@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark SpeechProcessor.enhance_speech_markup against the sequential passes.
+
+Runs both implementations over the sample lectures, checks that they produce
+identical output, and reports the per-call time of each.
+
+Usage:
+    python scripts/benchmark_speech_processor.py [--repeat N] [FILES...]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from artificial_u.audio.speech_processor import SpeechProcessor  # noqa: E402
+
+DEFAULT_SAMPLES = os.path.join(os.path.dirname(__file__), "..", "samples", "*.md")
+
+
+def benchmark_file(processor: SpeechProcessor, path: str, repeat: int) -> tuple:
+    """Time both implementations on one file and verify their output matches."""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    compiled = processor.enhance_speech_markup(text)
+    sequential = processor._enhance_speech_markup_sequential(text)
+    if compiled != sequential:
+        raise SystemExit(f"Output mismatch for {path}")
+
+    compiled_time = min(
+        timeit.repeat(lambda: processor.enhance_speech_markup(text), number=repeat, repeat=3)
+    )
+    sequential_time = min(
+        timeit.repeat(
+            lambda: processor._enhance_speech_markup_sequential(text), number=repeat, repeat=3
+        )
+    )
+    return len(text), sequential_time / repeat, compiled_time / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("files", nargs="*", help="Markdown files (defaults to samples/*.md)")
+    parser.add_argument("--repeat", type=int, default=50, help="Calls per timing run")
+    args = parser.parse_args()
+
+    files = args.files or sorted(glob.glob(DEFAULT_SAMPLES))
+    if not files:
+        raise SystemExit("No sample files found")
+
+    processor = SpeechProcessor()
+    total_sequential = total_compiled = 0.0
+
+    print(f"{'file':40} {'chars':>8} {'sequential':>12} {'compiled':>12} {'speedup':>8}")
+    for path in files:
+        chars, sequential, compiled = benchmark_file(processor, path, args.repeat)
+        total_sequential += sequential
+        total_compiled += compiled
+        print(
+            f"{os.path.basename(path):40} {chars:>8} {sequential * 1000:>10.2f}ms "
+            f"{compiled * 1000:>10.2f}ms {sequential / compiled:>7.1f}x"
+        )
+
+    print(
+        f"{'total':40} {'':>8} {total_sequential * 1000:>10.2f}ms "
+        f"{total_compiled * 1000:>10.2f}ms {total_sequential / total_compiled:>7.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
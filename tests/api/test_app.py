@@ -41,3 +41,51 @@ def test_index_route():
     assert data["name"] == "Artificial University API"
     assert data["version"] == "v1"
     assert data["docs_url"] == "/api/docs"
+
+
+@pytest.mark.unit
+def test_database_pool_stats():
+    """Test that the database pool endpoint reports stats for the shared engine"""
+    from artificial_u.api.dependencies import get_repository_factory
+    from artificial_u.models.repositories import RepositoryFactory
+
+    app.dependency_overrides[get_repository_factory] = lambda: RepositoryFactory(
+        db_url="sqlite:///:memory:"
+    )
+    try:
+        response = client.get("/api/v1/health/database")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data["timestamp"], float)
+    assert len(data["pools"]) == 1
+    pool = next(iter(data["pools"].values()))
+    assert "pool_class" in pool
+    assert "status" in pool
+
+
+@pytest.mark.unit
+def test_content_metrics():
+    """Test that the content metrics endpoint reports usage of the shared content service"""
+    from artificial_u.api.dependencies import get_content_service
+    from artificial_u.services import ContentService
+
+    content_service = ContentService()
+    content_service.usage_tracker.record(
+        "lecture", "anthropic", "claude-3-7-sonnet", 1000, 500, 2.0
+    )
+    app.dependency_overrides[get_content_service] = lambda: content_service
+    try:
+        response = client.get("/api/v1/health/content")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    data = response.json()
+    [group] = data["usage"]["groups"]
+    assert (group["purpose"], group["calls"], group["output_tokens"]) == ("lecture", 1, 500)
+    assert data["usage"]["totals"]["cost"] == pytest.approx(0.0105)
+    assert "failovers" in data["routing"]
+    assert data["continuation"]["truncated"] == 0
@@ -2,7 +2,7 @@
 Unit Tests for the department API endpoints, mocking the service layer.
 """
 
-from unittest.mock import MagicMock  # Import MagicMock only
+from unittest.mock import AsyncMock
 
 import pytest
 from fastapi.testclient import TestClient
@@ -56,16 +56,16 @@ sample_courses_brief_base = [
 @pytest.fixture
 def mock_api_service(monkeypatch):
     """Mock the DepartmentApiService methods for unit testing the API router."""
-    # Use MagicMock for synchronous methods, AsyncMock for async methods
+    # The service methods are all async, so mock them with AsyncMock
     mock_service = {
-        "get_departments": MagicMock(),  # Sync
-        "get_department": MagicMock(),  # Sync
-        "create_department": MagicMock(),  # Sync
-        "update_department": MagicMock(),  # Sync
-        "delete_department": MagicMock(),  # Sync
-        "get_department_professors": MagicMock(),  # Sync
-        "get_department_courses": MagicMock(),  # Sync
-        "get_department_by_code": MagicMock(),  # Sync
+        "get_departments": AsyncMock(),
+        "get_department": AsyncMock(),
+        "create_department": AsyncMock(),
+        "update_department": AsyncMock(),
+        "delete_department": AsyncMock(),
+        "get_department_professors": AsyncMock(),
+        "get_department_courses": AsyncMock(),
+        "get_department_by_code": AsyncMock(),
         # "generate_department": AsyncMock(), # Keep AsyncMock if/when added
     }
 
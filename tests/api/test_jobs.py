@@ -0,0 +1,63 @@
+"""
+Unit tests for the job API endpoints, run against a SQLite job queue.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from artificial_u.api.dependencies import get_async_repository_factory, get_repository_factory
+from artificial_u.models.repositories import AsyncRepositoryFactory, RepositoryFactory
+
+
+@pytest.fixture
+def repository_factory(tmp_path):
+    """Create a repository factory backed by a fresh SQLite file."""
+    factory = RepositoryFactory(db_url=f"sqlite:///{tmp_path / 'jobs.db'}")
+    factory.create_tables()
+    return factory
+
+
+@pytest.fixture
+def client(test_app, repository_factory):
+    """Create a test client using the SQLite repositories."""
+    async_repository_factory = AsyncRepositoryFactory(db_url=repository_factory.db_url)
+    test_app.dependency_overrides[get_repository_factory] = lambda: repository_factory
+    test_app.dependency_overrides[get_async_repository_factory] = lambda: async_repository_factory
+    return TestClient(test_app)
+
+
+def test_enqueue_lecture_generation(client):
+    """Test queuing lecture generation and polling the job."""
+    request = {"partial_attributes": {"topic_id": 1}, "freeform_prompt": "Keep it short"}
+    response = client.post("/api/v1/jobs/lectures/generate", json=request)
+
+    assert response.status_code == 202
+    job = response.json()
+    assert (job["kind"], job["status"], job["attempts"]) == ("lecture.generate", "queued", 0)
+
+    response = client.get(f"/api/v1/jobs/{job['id']}")
+    assert response.status_code == 200
+    assert response.json()["id"] == job["id"]
+
+
+def test_enqueue_with_idempotency_key(client, repository_factory):
+    """Test that repeating an idempotency key returns the queued job."""
+    headers = {"Idempotency-Key": "generate-topic-1"}
+    request = {"partial_attributes": {"topic_id": 1}}
+    first = client.post("/api/v1/jobs/lectures/generate", json=request, headers=headers)
+    second = client.post("/api/v1/jobs/lectures/generate", json=request, headers=headers)
+
+    assert first.json()["id"] == second.json()["id"]
+    job = repository_factory.job.get(first.json()["id"])
+    assert job.payload == {"partial_attributes": {"topic_id": 1}}
+
+
+def test_enqueue_for_missing_records(client):
+    """Test that audio and image jobs require an existing lecture or professor."""
+    assert client.post("/api/v1/jobs/lectures/999/audio").status_code == 404
+    assert client.post("/api/v1/jobs/professors/999/image").status_code == 404
+
+
+def test_get_missing_job(client):
+    """Test that an unknown job ID returns 404."""
+    assert client.get("/api/v1/jobs/999").status_code == 404
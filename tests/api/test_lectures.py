@@ -2,7 +2,7 @@
 Unit Tests for the lecture API endpoints, mocking the service layer.
 """
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, call
 
 import pytest
 from fastapi.testclient import TestClient
@@ -35,13 +35,15 @@ sample_lectures_base = [
 def mock_api_service(monkeypatch):
     """Mock the LectureApiService methods for unit testing the API router."""
     mock_service = {
-        "list_lectures": MagicMock(),
-        "get_lecture": MagicMock(),
-        "create_lecture": MagicMock(),
-        "update_lecture": MagicMock(),
-        "delete_lecture": MagicMock(),
-        "get_lecture_content": MagicMock(),
-        "get_lecture_audio_url": MagicMock(),
+        "list_lectures": AsyncMock(),
+        "get_lecture": AsyncMock(),
+        "create_lecture": AsyncMock(),
+        "update_course_summary": AsyncMock(),
+        "rebuild_course_summary": AsyncMock(),
+        "update_lecture": AsyncMock(),
+        "delete_lecture": AsyncMock(),
+        "get_lecture_content": AsyncMock(),
+        "get_lecture_audio_url": AsyncMock(),
         "generate_lecture": AsyncMock(),
     }
 
@@ -130,6 +132,10 @@ def mock_api_service(monkeypatch):
     monkeypatch.setattr(f"{base_path}.list_lectures", mock_service["list_lectures"])
     monkeypatch.setattr(f"{base_path}.get_lecture", mock_service["get_lecture"])
     monkeypatch.setattr(f"{base_path}.create_lecture", mock_service["create_lecture"])
+    monkeypatch.setattr(f"{base_path}.update_course_summary", mock_service["update_course_summary"])
+    monkeypatch.setattr(
+        f"{base_path}.rebuild_course_summary", mock_service["rebuild_course_summary"]
+    )
     monkeypatch.setattr(f"{base_path}.update_lecture", mock_service["update_lecture"])
     monkeypatch.setattr(f"{base_path}.delete_lecture", mock_service["delete_lecture"])
     monkeypatch.setattr(f"{base_path}.get_lecture_content", mock_service["get_lecture_content"])
@@ -252,6 +258,8 @@ def test_create_lecture(client: TestClient, mock_api_service):
         "content": new_lecture_data["content"],
         "summary": new_lecture_data["summary"],
         "audio_url": new_lecture_data["audio_url"],
+        "audio_playlist_url": None,
+        "audio_manifest_url": None,
         "transcript_url": new_lecture_data["transcript_url"],
     }
 
@@ -263,6 +271,7 @@ def test_create_lecture(client: TestClient, mock_api_service):
     call_args = mock_api_service["create_lecture"].call_args[0]
     assert isinstance(call_args[0], LectureCreate)
     assert call_args[0].model_dump() == new_lecture_data
+    mock_api_service["update_course_summary"].assert_awaited_once_with(5)
 
 
 @pytest.mark.unit
@@ -282,12 +291,28 @@ def test_update_lecture(client: TestClient, mock_api_service):
     assert call_args[0] == lecture_id_to_update
     assert isinstance(call_args[1], LectureUpdate)
     assert call_args[1].model_dump(exclude_unset=True) == update_data
+    course_id = sample_lectures_base[1].course_id
+    mock_api_service["rebuild_course_summary"].assert_awaited_once_with(course_id)
+
+    # Changing only the audio leaves the summary alone
+    mock_api_service["rebuild_course_summary"].reset_mock()
+    response = client.patch("/api/v1/lectures/2", json={"audio_url": "http://audio/2.mp3"})
+    assert response.status_code == 200
+    mock_api_service["rebuild_course_summary"].assert_not_awaited()
+
+    # Moving a lecture rebuilds the summaries of both its old and new course
+    response = client.patch("/api/v1/lectures/2", json={"course_id": 2})
+    assert response.status_code == 200
+    assert mock_api_service["rebuild_course_summary"].await_args_list == [call(1), call(2)]
 
     # Test invalid ID
     mock_api_service["update_lecture"].reset_mock()
     mock_api_service["update_lecture"].return_value = None
     response = client.patch("/api/v1/lectures/999", json=update_data)
     assert response.status_code == 404
+    mock_api_service["update_lecture"].assert_not_called()  # the lookup already 404s
+    response = client.patch("/api/v1/lectures/999", json={"audio_url": "http://audio/9.mp3"})
+    assert response.status_code == 404
     mock_api_service["update_lecture"].assert_called_once()
 
 
@@ -298,6 +323,9 @@ def test_delete_lecture(client: TestClient, mock_api_service):
     response = client.delete("/api/v1/lectures/3")
     assert response.status_code == 204
     mock_api_service["delete_lecture"].assert_called_once_with(3)
+    mock_api_service["rebuild_course_summary"].assert_awaited_once_with(
+        sample_lectures_base[2].course_id
+    )
 
     # Test deleting non-existent lecture
     mock_api_service["delete_lecture"].reset_mock()
@@ -346,3 +374,58 @@ def test_generate_lecture(client: TestClient, mock_api_service):
     call_args = mock_api_service["generate_lecture"].call_args[0]
     assert isinstance(call_args[0], LectureGenerate)
     assert call_args[0].model_dump() == generation_data
+
+
+@pytest.mark.unit
+def test_generate_lecture_stream(client: TestClient, monkeypatch):
+    """Test the streaming generation endpoint returns the service's SSE messages."""
+    calls = []
+
+    async def _mock_generate_lecture_stream(self, generation_data):
+        calls.append(generation_data)
+        yield 'event: progress\ndata: {"stage": "generating"}\n\n'
+        yield 'event: content\ndata: {"text": "Hello"}\n\n'
+
+    monkeypatch.setattr(
+        "artificial_u.api.services.LectureApiService.generate_lecture_stream",
+        _mock_generate_lecture_stream,
+    )
+    generation_data = {"partial_attributes": {"course_id": 1, "topic_id": 50}}
+
+    response = client.post("/api/v1/lectures/generate/stream", json=generation_data)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.text == (
+        'event: progress\ndata: {"stage": "generating"}\n\n'
+        'event: content\ndata: {"text": "Hello"}\n\n'
+    )
+    assert calls[0].partial_attributes == {"course_id": 1, "topic_id": 50}
+
+
+@pytest.mark.unit
+def test_generate_course_lectures(client: TestClient, monkeypatch):
+    """Test the course batch endpoint streams the service's SSE messages."""
+    calls = []
+
+    async def _mock_generate_course_lectures(self, course_id, generation_data):
+        calls.append((course_id, generation_data))
+        yield 'event: complete\ndata: {"generated": 2, "failed": 0, "skipped": 0}\n\n'
+
+    monkeypatch.setattr(
+        "artificial_u.api.services.LectureApiService.generate_course_lectures",
+        _mock_generate_course_lectures,
+    )
+
+    response = client.post("/api/v1/lectures/generate/course/3", json={"concurrency": 2})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text == 'event: complete\ndata: {"generated": 2, "failed": 0, "skipped": 0}\n\n'
+    [(course_id, generation_data)] = calls
+    assert (course_id, generation_data.concurrency) == (3, 2)
+    assert (
+        client.post("/api/v1/lectures/generate/course/3", json={"concurrency": 0}).status_code
+        == 422
+    )
@@ -70,16 +70,16 @@ sample_lectures_brief_base = [
 def mock_api_service(monkeypatch):
     """Mock the ProfessorApiService methods for unit testing the API router."""
     mock_service = {
-        "get_professors": MagicMock(),
-        "get_professor": MagicMock(),
-        "create_professor": MagicMock(),
-        "update_professor": MagicMock(),
-        "delete_professor": MagicMock(),
-        "get_professor_courses": MagicMock(),
-        "get_professor_lectures": MagicMock(),
+        "get_professors": AsyncMock(),
+        "get_professor": AsyncMock(),
+        "create_professor": AsyncMock(),
+        "update_professor": AsyncMock(),
+        "delete_professor": AsyncMock(),
+        "get_professor_courses": AsyncMock(),
+        "get_professor_lectures": AsyncMock(),
         "generate_professor_image": AsyncMock(),
         "generate_professor": AsyncMock(),
-        "get_featured_professors": MagicMock(),
+        "get_featured_professors": AsyncMock(),
     }
 
     # --- Configure Mock Return Values ---
@@ -26,12 +26,12 @@ from artificial_u.api.services.topic_service import TopicApiService  # Keep for
 def mock_api_service(monkeypatch):
     """Mocks the TopicApiService methods using monkeypatch."""
     mock_service = MagicMock(spec=TopicApiService)
-    mock_service.create_topic = MagicMock()
-    mock_service.get_topic = MagicMock()
-    mock_service.list_topics_by_course = MagicMock()
-    mock_service.update_topic = MagicMock()
-    mock_service.delete_topic = MagicMock()
-    mock_service.generate_topics_for_course = AsyncMock()  # This one remains async
+    mock_service.create_topic = AsyncMock()
+    mock_service.get_topic = AsyncMock()
+    mock_service.list_topics_by_course = AsyncMock()
+    mock_service.update_topic = AsyncMock()
+    mock_service.delete_topic = AsyncMock()
+    mock_service.generate_topics_for_course = AsyncMock()
 
     base_path = "artificial_u.api.services.topic_service.TopicApiService"
 
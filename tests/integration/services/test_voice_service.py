@@ -3,7 +3,7 @@ Integration tests for VoiceService.
 """
 
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -90,11 +90,23 @@ def mock_elevenlabs_client():
 
 
 @pytest.fixture
-def voice_service(repository_factory, mock_elevenlabs_client):
-    """Create a VoiceService with mocked ElevenLabs client."""
+def mock_async_elevenlabs_client(mock_elevenlabs_client):
+    """Create a mock async ElevenLabs client returning the same voices."""
+    client = MagicMock()
+    client.get_shared_voices = AsyncMock(
+        return_value=mock_elevenlabs_client.get_shared_voices.return_value
+    )
+    client.get_voice = AsyncMock(side_effect=mock_elevenlabs_client.get_el_voice.side_effect)
+    return client
+
+
+@pytest.fixture
+def voice_service(repository_factory, mock_elevenlabs_client, mock_async_elevenlabs_client):
+    """Create a VoiceService with mocked ElevenLabs clients."""
     return VoiceService(
         repository_factory=repository_factory,
         client=mock_elevenlabs_client,
+        async_client=mock_async_elevenlabs_client,
     )
 
 
@@ -223,7 +235,8 @@ class TestVoiceService:
         assert retrieved.gender == "female"
         assert retrieved.accent == "British"
 
-    def test_list_available_voices(self, voice_service, repository_factory):
+    @pytest.mark.asyncio
+    async def test_list_available_voices(self, voice_service, repository_factory):
         """Test listing available voices with filters."""
         # Prepopulate database with test voices
         test_voices = [
@@ -272,7 +285,7 @@ class TestVoiceService:
             repository_factory.voice.upsert(voice)
 
         # Test filtering by gender and accent
-        voices = voice_service.list_available_voices(
+        voices = await voice_service.list_available_voices(
             gender="male",
             accent="American",
             language="en",
@@ -283,22 +296,23 @@ class TestVoiceService:
         assert voices[0]["language"] == "en"
 
         # Test filtering by gender only
-        voices = voice_service.list_available_voices(gender="female")
+        voices = await voice_service.list_available_voices(gender="female")
         assert len(voices) == 1
         assert voices[0]["gender"] == "female"
         assert voices[0]["name"] == "Female Professor Voice"
 
         # Test filtering by language
-        voices = voice_service.list_available_voices(language="de")
+        voices = await voice_service.list_available_voices(language="de")
         assert len(voices) == 1
         assert voices[0]["language"] == "de"
         assert voices[0]["name"] == "German Professor Voice"
 
         # Test no filters (should return all voices)
-        voices = voice_service.list_available_voices()
+        voices = await voice_service.list_available_voices()
         assert len(voices) == 3
 
-    def test_manual_voice_assignment(self, voice_service, repository_factory):
+    @pytest.mark.asyncio
+    async def test_manual_voice_assignment(self, voice_service, repository_factory):
         """Test manually assigning a voice to a professor."""
         # Create a professor
         professor = Professor(
@@ -311,7 +325,7 @@ class TestVoiceService:
         professor = repository_factory.professor.create(professor)
 
         # Manually assign a voice
-        voice_service.manual_voice_assignment(professor.id, "test-voice-2")
+        await voice_service.manual_voice_assignment(professor.id, "test-voice-2")
 
         # Verify the assignment
         updated_professor = repository_factory.professor.get(professor.id)
@@ -343,7 +357,8 @@ class TestVoiceService:
         assert selected_voice is not None
         assert "el_voice_id" in selected_voice
 
-    def test_get_voice_by_el_id(self, voice_service, repository_factory):
+    @pytest.mark.asyncio
+    async def test_get_voice_by_el_id(self, voice_service, repository_factory):
         """Test retrieving voice data by ElevenLabs ID."""
         # First create a voice in the database
         voice = Voice(
@@ -362,7 +377,7 @@ class TestVoiceService:
         repository_factory.voice.upsert(voice)
 
         # Get the voice from the service
-        voice_data = voice_service.get_voice_by_el_id("test-voice-1")
+        voice_data = await voice_service.get_voice_by_el_id("test-voice-1")
 
         # Verify the data
         assert voice_data is not None
@@ -372,5 +387,5 @@ class TestVoiceService:
         assert voice_data["accent"] == "American"
 
         # Try getting a non-existent voice
-        voice_data = voice_service.get_voice_by_el_id("non-existent-voice")
+        voice_data = await voice_service.get_voice_by_el_id("non-existent-voice")
         assert voice_data is None
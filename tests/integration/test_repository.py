@@ -391,3 +391,46 @@ def test_lecture_delete_by_topic(repository, db_lecture):
     # Verify delete by topic
     topic_lectures = repository.lecture.list_by_topic(db_lecture.topic_id)
     assert len(topic_lectures) == 0
+
+
+@pytest.mark.integration
+def test_lecture_generation_context(repository, db_lecture, db_professor):
+    """Test loading a course's generation context without lecture content."""
+    second_topic = repository.topic.create(
+        Topic(title="Mocking", week=2, order=1, course_id=db_lecture.course_id)
+    )
+
+    context = repository.lecture.get_generation_context(db_lecture.course_id)
+
+    assert context.course.id == db_lecture.course_id
+    assert context.professor.id == db_professor.id
+    assert [topic.id for topic in context.topics] == [db_lecture.topic_id, second_topic.id]
+    [lecture] = context.lectures
+    assert (lecture.id, lecture.summary) == (db_lecture.id, db_lecture.summary)
+    assert lecture.content is None
+    assert context.course_summary is None
+
+    assert repository.lecture.get_generation_context(999999) is None
+
+
+@pytest.mark.integration
+def test_course_lecture_summary(repository, db_lecture):
+    """Test storing a course's rolling lecture summary."""
+    assert repository.course.update_lecture_summary(db_lecture.course_id, "Testing so far")
+
+    context = repository.lecture.get_generation_context(db_lecture.course_id)
+    assert context.course_summary == "Testing so far"
+    assert not repository.course.update_lecture_summary(999999, "Nothing")
+
+
+@pytest.mark.integration
+def test_course_lecture_summary_compare_and_swap(repository, db_lecture):
+    """Test that a summary is only replaced while it is still the one it was built from."""
+    course_id = db_lecture.course_id
+    assert repository.course.swap_lecture_summary(course_id, None, "First")
+    assert not repository.course.swap_lecture_summary(course_id, None, "Stale")
+    assert repository.course.swap_lecture_summary(course_id, "First", "Second")
+
+    course, summary = repository.course.get_with_lecture_summary(course_id)
+    assert (course.id, summary) == (course_id, "Second")
+    assert repository.course.get_with_lecture_summary(999999) is None
@@ -0,0 +1,92 @@
+"""
+Unit tests for the segment manifest of lecture audio.
+"""
+
+import json
+
+import pytest
+
+from artificial_u.audio.manifest import AudioManifest
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, no padding: 417 bytes of 1152 samples
+FRAME = bytes([0xFF, 0xFB, 0x90, 0x64]) + b"\x00" * 413
+FRAME_DURATION = 1152 / 44100
+
+CONTENT = "# Search\n\nWelcome to  the lecture.\nToday: search.\n\n[pause]\n\nNext week, planning."
+
+
+def make_manifest():
+    """Build a manifest of three chunks of two, three and one frames."""
+    manifest = AudioManifest()
+    manifest.add("# Search\n\nWelcome to the lecture.", FRAME * 2)
+    manifest.add("Today: search.", FRAME * 3)
+    manifest.add("Next week, planning.", FRAME)
+    return manifest
+
+
+@pytest.mark.unit
+class TestAudioManifest:
+    """Test recording, locating and patching chunks."""
+
+    def test_records_byte_ranges_and_timings(self):
+        """Test that each chunk starts where the previous one ends."""
+        manifest = make_manifest()
+
+        assert [entry.byte_offset for entry in manifest.entries] == [0, 834, 2085]
+        assert [entry.byte_length for entry in manifest.entries] == [834, 1251, 417]
+        assert manifest.entries[2].start == pytest.approx(5 * FRAME_DURATION)
+        assert manifest.duration == pytest.approx(6 * FRAME_DURATION)
+
+    def test_locates_text_spans_ignoring_whitespace(self):
+        """Test that spans are found in order, skipping text that was not spoken."""
+        manifest = make_manifest()
+
+        manifest.locate(CONTENT)
+
+        spans = [CONTENT[entry.text_start : entry.text_end] for entry in manifest.entries]
+        assert spans == [
+            "# Search\n\nWelcome to  the lecture.",
+            "Today: search.",
+            "Next week, planning.",
+        ]
+
+    def test_unmatched_chunk_has_no_span(self):
+        """Test that a chunk missing from the text is left without a span."""
+        manifest = make_manifest()
+
+        manifest.locate("Today: search.\n\nNext week, planning.")
+
+        assert manifest.entries[0].text_start is None
+        assert manifest.entries[2].text_start == 16
+
+    def test_entry_at(self):
+        """Test finding the chunk playing at a point in the audio."""
+        manifest = make_manifest()
+
+        assert manifest.entry_at(3 * FRAME_DURATION).index == 1
+        assert manifest.entry_at(10.0) is None
+
+    def test_replace_shifts_later_chunks(self):
+        """Test that regenerated audio moves the chunks after it."""
+        manifest = make_manifest()
+
+        manifest.replace(1, FRAME)
+
+        assert [entry.byte_offset for entry in manifest.entries] == [0, 834, 1251]
+        assert manifest.entries[2].start == pytest.approx(3 * FRAME_DURATION)
+        assert manifest.byte_length == 1668
+
+    def test_json_round_trip(self):
+        """Test that the stored manifest loads back without the chunk text."""
+        manifest = make_manifest()
+        manifest.locate(CONTENT)
+
+        stored = manifest.to_json()
+        loaded = AudioManifest.from_json(stored)
+
+        assert json.loads(stored)["byte_length"] == 2502
+        assert "Welcome" not in stored
+        assert [entry.text_end for entry in loaded.entries] == [
+            entry.text_end for entry in manifest.entries
+        ]
+        assert loaded.entries[1].byte_offset == 834
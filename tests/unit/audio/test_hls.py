@@ -0,0 +1,143 @@
+"""
+Unit tests for HLS packaging of lecture audio.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from artificial_u.audio.hls import (
+    HlsSegmenter,
+    build_playlist,
+    parse_frame_header,
+    timestamp_tag,
+)
+from artificial_u.services.audio_service import _HlsUpload
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, no padding: 417 bytes of 1152 samples
+HEADER = bytes([0xFF, 0xFB, 0x90, 0x64])
+FRAME_DURATION = 1152 / 44100
+
+
+def frame(marker: int = 0) -> bytes:
+    """Build a frame whose body is filled with the given byte."""
+    return HEADER + bytes([marker]) * 413
+
+
+def info_frame() -> bytes:
+    """Build a Xing/Info header frame as encoders write at the start of a file."""
+    data = bytearray(frame())
+    data[36:40] = b"Info"
+    return bytes(data)
+
+
+def id3_tag(size: int = 20) -> bytes:
+    """Build an ID3v2.3 tag with a body of the given size."""
+    return b"ID3\x03\x00\x00" + bytes([0, 0, 0, size]) + b"\x00" * size
+
+
+def feed_all(segmenter, data: bytes, piece_size: int):
+    """Feed data in pieces of the given size, then flush."""
+    segments = []
+    for start in range(0, len(data), piece_size):
+        segments.extend(segmenter.feed(data[start : start + piece_size]))
+    return segments + segmenter.flush()
+
+
+@pytest.mark.unit
+class TestHlsSegmenter:
+    """Test cutting MP3 data into segments."""
+
+    def test_parses_frame_header(self):
+        """Test the frame length and duration of a known header."""
+        assert parse_frame_header(HEADER) == (417, 1152, 44100)
+        assert parse_frame_header(b"\x00\x00\x00\x00") is None
+
+    @pytest.mark.parametrize("piece_size", [1, 100, 417, 5000])
+    def test_segments_by_duration(self, piece_size):
+        """Test that segments hold whole frames whatever size the data arrives in."""
+        data = b"".join(frame(i) for i in range(10))
+        segmenter = HlsSegmenter(target_duration=4 * FRAME_DURATION)
+
+        segments = feed_all(segmenter, data, piece_size)
+
+        assert [segment.sequence for segment in segments] == [0, 1, 2]
+        assert [round(s.duration / FRAME_DURATION) for s in segments] == [4, 4, 2]
+        assert segments[1].start == pytest.approx(4 * FRAME_DURATION)
+        assert segments[2].data.endswith(frame(8) + frame(9))
+
+    def test_drops_tags_and_info_frames_between_files(self):
+        """Test that stray ID3 tags and Info frames of concatenated files are skipped."""
+        data = id3_tag() + info_frame() + frame(1) + id3_tag() + info_frame() + frame(2)
+
+        segments = feed_all(HlsSegmenter(target_duration=60), data, 300)
+
+        assert len(segments) == 1
+        assert segments[0].data == timestamp_tag(0) + frame(1) + frame(2)
+
+    def test_timestamp_tag(self):
+        """Test that segments start with the 90 kHz transport stream timestamp."""
+        tag = timestamp_tag(2.0)
+
+        assert tag.startswith(b"ID3\x04")
+        assert b"com.apple.streaming.transportStreamTimestamp\x00" in tag
+        assert tag.endswith((180000).to_bytes(8, "big"))
+
+
+@pytest.mark.unit
+def test_build_playlist():
+    """Test the VOD playlist lists every segment and rounds the target duration up."""
+    playlist = build_playlist([6.01, 6.0, 2.5])
+
+    lines = playlist.splitlines()
+    assert lines[0] == "#EXTM3U"
+    assert "#EXT-X-TARGETDURATION:7" in lines
+    assert lines[-3:] == ["#EXTINF:2.500,", "segment00002.mp3", "#EXT-X-ENDLIST"]
+    assert "segment00000.mp3" in lines
+
+
+async def stream(*chunks):
+    """Yield the given chunks."""
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestHlsUpload:
+    """Test uploading segments and the playlist of streamed audio."""
+
+    def make_upload(self, results=None):
+        storage_service = MagicMock()
+        storage_service.upload_audio_file = AsyncMock(
+            side_effect=lambda data, object_name, content_type: (
+                results.pop(0) if results else (True, f"http://storage/{object_name}")
+            )
+        )
+        upload = _HlsUpload(
+            storage_service, lambda name: f"CS101/{name}", 2 * FRAME_DURATION, MagicMock()
+        )
+        return upload, storage_service
+
+    async def test_uploads_segments_then_playlist(self):
+        """Test that audio passes through unchanged and the playlist is written last."""
+        upload, storage_service = self.make_upload()
+        data = [frame(1) + frame(2)[:100], frame(2)[100:] + frame(3)]
+
+        passed = [chunk async for chunk in upload.tee(stream(*data))]
+        playlist_url = await upload.finish()
+
+        assert passed == data
+        assert playlist_url == "http://storage/CS101/playlist.m3u8"
+        keys = [call.kwargs["object_name"] for call in storage_service.upload_audio_file.mock_calls]
+        assert keys == ["CS101/segment00000.mp3", "CS101/segment00001.mp3", "CS101/playlist.m3u8"]
+
+    async def test_failed_segment_skips_playlist(self):
+        """Test that a failed segment upload gives up on HLS without raising."""
+        upload, storage_service = self.make_upload(results=[(False, None)])
+
+        [chunk async for chunk in upload.tee(stream(frame(1) + frame(2) + frame(3)))]
+
+        assert await upload.finish() is None
+        keys = [call.kwargs["object_name"] for call in storage_service.upload_audio_file.mock_calls]
+        assert "CS101/playlist.m3u8" not in keys
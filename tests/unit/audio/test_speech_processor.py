@@ -0,0 +1,158 @@
+"""
+Unit tests for SpeechProcessor markup enhancement and streamed chunking.
+"""
+
+import glob
+import os
+import random
+
+import pytest
+
+from artificial_u.audio.speech_processor import SpeechProcessor, StreamingChunker
+
+SAMPLES = sorted(
+    glob.glob(os.path.join(os.path.dirname(__file__), "..", "..", "..", "samples", "*.md"))
+)
+
+# Inputs where the sequential passes feed into each other
+CASCADE_CASES = [
+    "# Python and NoSQL",
+    "The angle θ ≤ π/2",
+    "if (a === b && c !== d) return x => x -> y",
+    "<== !=== >=> ==>",
+    "x**2 + y***3 - sin(x)/cos(x)",
+    "H2O at 100°C and 212°F",
+    "K2 and °C2 and °Ca2 and K°C and OK.",
+    "sin==x and var==const",
+    "speed in m/s or mol/L",
+]
+
+
+@pytest.fixture
+def processor():
+    """Create a speech processor."""
+    return SpeechProcessor()
+
+
+@pytest.mark.unit
+class TestEnhanceSpeechMarkup:
+    """Test that the compiled rewrite phases match the sequential passes."""
+
+    @pytest.mark.parametrize("text", CASCADE_CASES)
+    def test_matches_sequential_on_cascades(self, processor, text):
+        """Test rule interactions produce the same output as the sequential passes."""
+        assert processor.enhance_speech_markup(text) == (
+            processor._enhance_speech_markup_sequential(text)
+        )
+
+    @pytest.mark.parametrize("path", SAMPLES, ids=os.path.basename)
+    def test_matches_sequential_on_samples(self, processor, path):
+        """Test the sample lectures produce identical output."""
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        assert processor.enhance_speech_markup(text) == (
+            processor._enhance_speech_markup_sequential(text)
+        )
+
+    def test_matches_sequential_on_random_text(self, processor):
+        """Test random mixes of rule triggers produce identical output."""
+        tokens = list("=!<>-*/+°CFKHaOk2 #\n.") + [
+            "var",
+            "const",
+            "sin",
+            "ln",
+            "Python",
+            "SQL",
+            "θ",
+            "≤",
+            "°C",
+            "Ca",
+            "->",
+            "m/s",
+        ]
+        rng = random.Random(42)
+        for _ in range(2000):
+            text = "".join(rng.choice(tokens) for _ in range(rng.randint(0, 20)))
+            assert processor.enhance_speech_markup(text) == (
+                processor._enhance_speech_markup_sequential(text)
+            ), text
+
+    def test_pronunciation_markup(self, processor):
+        """Test technical terms are wrapped in phoneme tags."""
+        enhanced = processor.enhance_speech_markup("Claude")
+        assert enhanced.startswith('<phoneme alphabet="ipa" ph="klɔːd">Claude')
+
+
+@pytest.mark.unit
+class TestStreamingChunker:
+    """Test cutting streamed text into speakable chunks."""
+
+    @staticmethod
+    def feed_all(chunker, text, step):
+        """Feed text in pieces of the given size, collecting every chunk."""
+        chunks = []
+        for start in range(0, len(text), step):
+            chunks.extend(chunker.feed(text[start : start + step]))
+        return chunks + chunker.flush()
+
+    def test_releases_paragraphs_as_they_complete(self, processor):
+        """Test that a chunk is released once the next paragraph would not fit."""
+        chunker = StreamingChunker(processor, max_chunk_size=30)
+
+        assert chunker.feed("First paragraph here.\n\nSecond") == []
+        assert chunker.feed(" paragraph here.\n\n") == ["First paragraph here."]
+        assert chunker.flush() == ["Second paragraph here."]
+
+    def test_chunks_do_not_depend_on_delta_boundaries(self, processor):
+        """Test that the same text yields the same chunks however it is streamed."""
+        text = "\n\n".join(f"Paragraph {i} says something about topic {i}." for i in range(12))
+
+        expected = self.feed_all(StreamingChunker(processor, max_chunk_size=120), text, len(text))
+        for step in (1, 7, 50):
+            chunker = StreamingChunker(processor, max_chunk_size=120)
+            assert self.feed_all(chunker, text, step) == expected
+        assert all(len(chunk) <= 120 for chunk in expected)
+        assert "\n\n".join(expected) == text
+
+    def test_first_chunk_is_released_early(self, processor):
+        """Test that the first chunk goes out at first_chunk_size, later ones when full."""
+        chunker = StreamingChunker(processor, max_chunk_size=100, first_chunk_size=10)
+
+        assert chunker.feed("Opening words here.\n\n") == ["Opening words here."]
+        assert chunker.feed("Second part here.\n\n") == []
+
+    def test_splits_oversized_paragraphs_by_sentence(self, processor):
+        """Test that a paragraph longer than a chunk is split into sentences."""
+        chunker = StreamingChunker(processor, max_chunk_size=25)
+
+        chunks = chunker.feed("One short sentence. Another short sentence.\n\n") + chunker.flush()
+
+        assert chunks == ["One short sentence.", "Another short sentence."]
+
+    def test_short_paragraphs_are_never_released_alone(self, processor):
+        """Test that a paragraph too short to synthesize joins the chunk before it."""
+        text = "First paragraph goes here.\n\nSecond paragraph goes here.\n\nThanks!"
+
+        chunks = self.feed_all(StreamingChunker(processor, max_chunk_size=40), text, 5)
+
+        assert chunks == [
+            "First paragraph goes here.",
+            "Second paragraph goes here.\n\nThanks!",
+        ]
+        assert all(processor.is_valid_chunk(chunk) for chunk in chunks)
+
+    def test_short_chunk_merges_forward_when_previous_is_full(self, processor):
+        """Test that a short chunk moves to the next chunk rather than overfilling the last."""
+        text = (
+            "One two three four five six. Seven eight nine ten eleven. Ok thanks."
+            "\n\nAnother one here."
+        )
+
+        chunks = processor.split_into_chunks(text, max_chunk_size=30)
+
+        assert chunks == [
+            "One two three four five six.",
+            "Seven eight nine ten eleven.",
+            "Ok thanks. Another one here.",
+        ]
+        assert all(processor.is_valid_chunk(chunk) for chunk in chunks)
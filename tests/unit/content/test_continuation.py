@@ -0,0 +1,81 @@
+"""
+Unit tests for continuing responses truncated at max_tokens.
+"""
+
+import pytest
+
+from artificial_u.content.continuation import (
+    ContinuationPolicy,
+    continuation_prompt,
+    is_truncated,
+    stitch,
+    trim_overlap,
+)
+
+
+async def aiter(items):
+    """Wrap a list in an async iterator."""
+    for item in items:
+        yield item
+
+
+@pytest.mark.unit
+def test_is_truncated():
+    """Test truncation stop reasons for each backend."""
+    assert is_truncated("anthropic", "max_tokens")
+    assert is_truncated("openai", "length")
+    assert is_truncated("gemini", "MAX_TOKENS")
+    assert not is_truncated("anthropic", "end_turn")
+    assert not is_truncated("replay", "max_tokens")
+
+
+@pytest.mark.unit
+def test_continuation_prompt_keeps_original_prompt_first():
+    """Test that the original prompt stays a prefix of the continuation prompt."""
+    prompt = continuation_prompt("Write a lecture.", "<lecture>Once upon")
+    assert prompt.startswith("Write a lecture.")
+    assert "<lecture>Once upon" in prompt
+
+
+@pytest.mark.unit
+def test_stitch_drops_repeated_text():
+    """Test that text the continuation repeats is dropped, but short matches are kept."""
+    partial = "The mitochondria is the powerhouse of the"
+    assert stitch(partial, "powerhouse of the cell.") == partial + " cell."
+    assert stitch(partial, " cell.") == partial + " cell."
+    # A match shorter than the minimum overlap is a coincidence, not a repeat
+    assert stitch("abc the", " the end") == "abc the the end"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_trim_overlap_streams_without_repeats():
+    """Test that a streamed continuation is trimmed and other items pass through."""
+    partial = "The mitochondria is the powerhouse of the"
+    items = [
+        item async for item in trim_overlap(aiter(["power", "house of the", " cell.", 7]), partial)
+    ]
+    assert items == [" cell.", 7]
+
+
+@pytest.mark.unit
+class TestContinuationPolicy:
+    """Test per-purpose limits and budgets."""
+
+    def test_call_max_tokens(self):
+        """Test the caller's limit, then the purpose's, then the default."""
+        policy = ContinuationPolicy(max_tokens={"lecture": 4096}, default_max_tokens=1024)
+        assert policy.call_max_tokens("lecture", 500) == 500
+        assert policy.call_max_tokens("lecture", None) == 4096
+        assert policy.call_max_tokens("course", None) == 1024
+        assert policy.call_max_tokens(None, None) == 1024
+
+    def test_budget_limits_continuations(self):
+        """Test that continuations are capped by the budget and the continuation count."""
+        policy = ContinuationPolicy(budgets={"lecture": 5000}, max_continuations=3)
+        assert policy.next_max_tokens("lecture", 2000, 2000, 0) == 2000
+        assert policy.next_max_tokens("lecture", 2000, 4000, 1) == 1000
+        assert policy.next_max_tokens("lecture", 2000, 5000, 2) is None
+        assert policy.next_max_tokens("course", 2000, 6000, 3) is None
+        assert policy.stats()["budget_exhausted"] == 2
+        assert policy.stats()["truncated"] == 1
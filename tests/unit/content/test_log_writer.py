@@ -0,0 +1,83 @@
+"""
+Unit tests for the background content log writer.
+"""
+
+import json
+import threading
+
+import pytest
+
+from artificial_u.content.log_writer import ContentLogWriter, iter_content_logs
+
+
+def record(i, backend="openai", model="gpt-test"):
+    """Build a content log record."""
+    return {
+        "metadata": {"timestamp": f"20260101_000000_{i:06d}", "backend": backend, "model": model},
+        "content": {"system_prompt": None, "prompt": f"prompt {i}", "response": f"response {i}"},
+    }
+
+
+@pytest.mark.unit
+class TestContentLogWriter:
+    """Test batching, rotation, sampling and back-pressure."""
+
+    def test_records_round_trip_in_order(self, tmp_path):
+        """Test that written records are read back in order from compressed segments."""
+        writer = ContentLogWriter(str(tmp_path))
+        for i in range(10):
+            assert writer.write(record(i))
+        writer.close()
+
+        records = list(iter_content_logs(str(tmp_path)))
+        assert [r["content"]["prompt"] for r in records] == [f"prompt {i}" for i in range(10)]
+        assert all(path.suffixes[-2:] == [".jsonl", ".gz"] for path in tmp_path.glob("content-*"))
+        assert writer.stats()["written"] == 10
+
+    def test_rotates_segments_and_indexes_them(self, tmp_path):
+        """Test that segments rotate at the size limit and each is listed in the index."""
+        writer = ContentLogWriter(str(tmp_path), segment_max_bytes=1)
+        for i in range(3):
+            writer.write(record(i, backend="anthropic" if i else "ollama"))
+            writer.flush()
+        writer.close()
+
+        index = [json.loads(line) for line in (tmp_path / "index.jsonl").read_text().splitlines()]
+        assert len(index) == 3
+        assert [entry["records"] for entry in index] == [1, 1, 1]
+        assert index[0]["backends"] == ["ollama"]
+        assert index[1]["first_timestamp"] == "20260101_000000_000001"
+        assert len(list(iter_content_logs(str(tmp_path)))) == 3
+
+    def test_sampling(self, tmp_path):
+        """Test that a zero sample rate disables logging."""
+        writer = ContentLogWriter(str(tmp_path), sample_rate=0.0)
+
+        assert not writer.write(record(1))
+        assert writer.stats()["sampled_out"] == 1
+        assert list(tmp_path.iterdir()) == []
+
+    def test_drops_records_when_queue_is_full(self, tmp_path, monkeypatch):
+        """Test that a stalled writer drops records instead of blocking the caller."""
+        release = threading.Event()
+        original = ContentLogWriter._write_batch
+
+        def slow_write_batch(self, batch):
+            release.wait()
+            original(self, batch)
+
+        monkeypatch.setattr(ContentLogWriter, "_write_batch", slow_write_batch)
+        writer = ContentLogWriter(str(tmp_path), max_queue=2)
+
+        results = [writer.write(record(i)) for i in range(10)]
+        release.set()
+        writer.close()
+
+        assert results.count(False) == writer.stats()["dropped"] > 0
+        assert len(list(iter_content_logs(str(tmp_path)))) == results.count(True)
+
+    def test_reads_legacy_json_logs(self, tmp_path):
+        """Test that per-call JSON files from earlier versions are still read."""
+        (tmp_path / "20250101_000000_000000_openai_gpt-test.json").write_text(json.dumps(record(0)))
+
+        assert list(iter_content_logs(str(tmp_path))) == [record(0)]
@@ -0,0 +1,152 @@
+"""
+Unit tests for LLM admission control and rate limiting.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from artificial_u.content.rate_limiter import (
+    AdmissionController,
+    TokenBucket,
+    is_throttle_error,
+    retry_after,
+)
+
+
+class ThrottleError(Exception):
+    """Provider-style rate limit error carrying a status code and response headers."""
+
+    def __init__(self, headers=None, status_code=429):
+        super().__init__("rate limited")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+@pytest.mark.unit
+class TestThrottleDetection:
+    """Test rate limit error classification and Retry-After parsing."""
+
+    def test_is_throttle_error(self):
+        """Test that 429/503/529 statuses are treated as throttling."""
+        assert is_throttle_error(ThrottleError())
+        assert is_throttle_error(ThrottleError(status_code=529))
+        assert is_throttle_error(SimpleNamespace(code=429))
+        assert not is_throttle_error(ThrottleError(status_code=400))
+        assert not is_throttle_error(ValueError("bad"))
+
+    def test_retry_after(self):
+        """Test Retry-After in milliseconds, seconds and missing."""
+        assert retry_after(ThrottleError({"retry-after-ms": "1500"})) == 1.5
+        assert retry_after(ThrottleError({"retry-after": "2"})) == 2.0
+        assert retry_after(ThrottleError({"retry-after": "soon"})) is None
+        assert retry_after(ThrottleError()) is None
+        assert retry_after(ValueError()) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAdmissionController:
+    """Test concurrency limits, token buckets and throttling backoff."""
+
+    async def test_concurrency_limit_and_queue_metrics(self):
+        """Test that a backend's concurrency cap holds excess requests in a queue."""
+        controller = AdmissionController(limits={"ollama": {"concurrency": 2}})
+        in_flight = peak = 0
+
+        async def request():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "ok"
+
+        results = await asyncio.gather(
+            *(controller.call("ollama", "llama3", 10, request) for _ in range(6))
+        )
+
+        assert results == ["ok"] * 6
+        assert peak == 2
+        stats = controller.stats()["ollama"]
+        assert stats["admitted"] == 6
+        assert stats["max_queue_depth"] == 4
+        assert stats["queue_depth"] == 0
+        assert stats["max_wait"] > 0
+
+    async def test_model_limit_applies_with_backend_limit(self):
+        """Test that a model's own limit is enforced under a looser backend limit."""
+        controller = AdmissionController(
+            limits={"openai": {"concurrency": 8}, "gpt-big": {"concurrency": 1}}
+        )
+        in_flight = peak = 0
+
+        async def request():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        await asyncio.gather(*(controller.call("openai", "gpt-big", 10, request) for _ in range(3)))
+
+        assert peak == 1
+        assert controller.stats()["gpt-big"]["admitted"] == 3
+
+    async def test_token_bucket_waits_for_refill(self):
+        """Test that requests beyond the bucket wait for tokens to refill."""
+        bucket = TokenBucket(per_minute=6000)  # 100 tokens per second
+        await bucket.acquire(6000)
+
+        started = time.monotonic()
+        await bucket.acquire(5)
+
+        assert time.monotonic() - started >= 0.04
+
+    async def test_retries_throttled_request_after_retry_after(self):
+        """Test that a 429 pauses the backend for Retry-After and is retried."""
+        controller = AdmissionController(max_retries=2)
+        attempts = 0
+
+        async def request():
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise ThrottleError({"retry-after": "0.05"})
+            return "ok"
+
+        started = time.monotonic()
+        assert await controller.call("anthropic", "claude-test", 10, request) == "ok"
+
+        assert time.monotonic() - started >= 0.05
+        assert attempts == 2
+        stats = controller.stats()["anthropic"]
+        assert stats["throttled"] == 1
+        assert controller._limiters["anthropic"].consecutive_throttles == 0
+
+    async def test_gives_up_after_max_retries(self):
+        """Test that persistent throttling eventually raises."""
+        controller = AdmissionController(max_retries=1, backoff=0.001)
+
+        async def request():
+            raise ThrottleError()
+
+        with pytest.raises(ThrottleError):
+            await controller.call("openai", "gpt-test", 10, request)
+        assert controller.stats()["openai"]["throttled"] == 1
+
+    async def test_other_errors_are_not_retried(self):
+        """Test that non-throttling errors propagate immediately."""
+        controller = AdmissionController(max_retries=3)
+        attempts = 0
+
+        async def request():
+            nonlocal attempts
+            attempts += 1
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            await controller.call("openai", "gpt-test", 10, request)
+        assert attempts == 1
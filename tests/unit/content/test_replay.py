@@ -0,0 +1,110 @@
+"""
+Unit tests for the replay backend.
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from artificial_u.content.log_writer import ContentLogWriter
+from artificial_u.content.replay import ReplayBackend
+from artificial_u.utils import ContentGenerationError
+
+
+def record(model, prompt, response, system_prompt=None):
+    """Build a content log record."""
+    return {
+        "metadata": {"timestamp": "20260101_000000_000000", "backend": "test", "model": model},
+        "content": {"system_prompt": system_prompt, "prompt": prompt, "response": response},
+    }
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    """Write a few recorded calls as a log segment and a legacy JSON file."""
+    writer = ContentLogWriter(str(tmp_path))
+    writer.write(record("claude-test", "Lecture on quantum tunneling", "Tunneling lecture"))
+    writer.write(record("claude-test", "Lecture on medieval trade routes", "Trade lecture"))
+    writer.write(record("claude-test", "Lecture on quantum tunneling", "Kind lecture", "Be kind"))
+    writer.close()
+    (tmp_path / "legacy.json").write_text(
+        json.dumps(record("gpt-test", "Describe a professor", "A professor"))
+    )
+    return str(tmp_path)
+
+
+@pytest.mark.unit
+class TestReplayBackend:
+    """Test response matching and simulated timing."""
+
+    def test_exact_match(self, log_dir):
+        """Test that the system prompt is part of an exact match."""
+        backend = ReplayBackend(log_dir)
+
+        assert backend.lookup("Lecture on quantum tunneling", "claude-test") == "Tunneling lecture"
+        assert (
+            backend.lookup("Lecture on quantum tunneling", "claude-test", "Be kind")
+            == "Kind lecture"
+        )
+        assert backend.lookup("Describe a professor", "gpt-test") == "A professor"
+        assert backend.stats()["exact_matches"] == 3
+
+    def test_nearest_match_by_model(self, log_dir):
+        """Test that unseen prompts get the most similar prompt recorded for the model."""
+        backend = ReplayBackend(log_dir)
+
+        assert backend.lookup("A lecture about trade routes", "claude-test") == "Trade lecture"
+        assert backend.lookup("Describe a professor", "unknown-model") == "A professor"
+        assert backend.stats()["model_matches"] == 1
+        assert backend.stats()["fallback_matches"] == 1
+
+    def test_empty_logs(self, tmp_path):
+        """Test that replaying with no recordings fails clearly."""
+        with pytest.raises(ContentGenerationError):
+            ReplayBackend(str(tmp_path)).lookup("Hi", "claude-test")
+
+    @pytest.mark.asyncio
+    async def test_simulated_timing(self, log_dir, monkeypatch):
+        """Test latency and token-rate pacing for whole and streamed responses."""
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr("artificial_u.content.replay.asyncio.sleep", fake_sleep)
+        backend = ReplayBackend(log_dir, latency=0.5, tokens_per_second=2.0)
+
+        response = await backend.generate("Lecture on quantum tunneling", "claude-test")
+        assert response == "Tunneling lecture"
+        # 17 characters is about 4 tokens, at 2 tokens per second
+        assert sleeps == [pytest.approx(2.5)]
+
+        sleeps.clear()
+        deltas = [d async for d in backend.stream("Lecture on quantum tunneling", "claude-test")]
+        assert "".join(deltas) == "Tunneling lecture"
+        assert deltas == ["Tunneling ", "lecture"]
+        assert sleeps == [0.5, 1.0, 0.5]
+
+    @pytest.mark.asyncio
+    async def test_logs_load_once_off_the_event_loop(self, log_dir, monkeypatch):
+        """Test that concurrent first requests load the logs once, in a worker thread."""
+        backend = ReplayBackend(log_dir)
+        load = backend.load
+        load_threads = []
+
+        def tracking_load():
+            load_threads.append(threading.current_thread())
+            return load()
+
+        monkeypatch.setattr(backend, "load", tracking_load)
+
+        responses = await asyncio.gather(
+            backend.generate("Lecture on quantum tunneling", "claude-test"),
+            backend.generate("Describe a professor", "gpt-test"),
+        )
+
+        assert responses == ["Tunneling lecture", "A professor"]
+        assert len(load_threads) == 1
+        assert load_threads[0] is not threading.main_thread()
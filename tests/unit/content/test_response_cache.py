@@ -0,0 +1,90 @@
+"""
+Unit tests for the two-tier LLM response cache.
+"""
+
+import pytest
+
+from artificial_u.content.response_cache import ResponseCache
+
+
+def key(name):
+    """Build a cache key for a prompt with fixed request settings."""
+    return ResponseCache.make_key("openai", "gpt-test", None, name, 0.3, 1024)
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    """Test ResponseCache lookups, expiry and eviction."""
+
+    def test_key_depends_on_every_request_field(self):
+        """Test that each request field changes the cache key."""
+        base = ResponseCache.make_key("openai", "gpt", "sys", "prompt", 0.3, 100)
+        assert base == ResponseCache.make_key("openai", "gpt", "sys", "prompt", 0.3, 100)
+        variants = [
+            ("ollama", "gpt", "sys", "prompt", 0.3, 100),
+            ("openai", "gpt-2", "sys", "prompt", 0.3, 100),
+            ("openai", "gpt", None, "prompt", 0.3, 100),
+            ("openai", "gpt", "sys", "prompt!", 0.3, 100),
+            ("openai", "gpt", "sys", "prompt", 0.7, 100),
+            ("openai", "gpt", "sys", "prompt", 0.3, 200),
+        ]
+        assert all(ResponseCache.make_key(*variant) != base for variant in variants)
+
+    def test_memory_and_disk_tiers(self, tmp_path):
+        """Test that entries survive a restart and are promoted back into memory."""
+        ResponseCache(str(tmp_path)).put(key("a"), "answer")
+
+        cache = ResponseCache(str(tmp_path))
+        assert cache.get(key("a")) == "answer"
+        assert cache.get(key("a")) == "answer"
+        assert cache.get(key("b")) is None
+
+        stats = cache.stats()
+        assert (stats["disk_hits"], stats["memory_hits"], stats["misses"]) == (1, 1, 1)
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+    def test_expired_entries_are_dropped(self, tmp_path, monkeypatch):
+        """Test that entries older than the TTL miss and are removed."""
+        clock = [1000.0]
+        monkeypatch.setattr("artificial_u.content.response_cache.time.time", lambda: clock[0])
+        cache = ResponseCache(str(tmp_path), ttl=60)
+        cache.put(key("a"), "answer")
+
+        clock[0] += 61
+        assert cache.get(key("a")) is None
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["entries"] == 0
+
+    def test_evicts_least_recently_used(self, tmp_path, monkeypatch):
+        """Test size-based LRU eviction of the disk tier."""
+        clock = [1000.0]
+        monkeypatch.setattr("artificial_u.content.response_cache.time.time", lambda: clock[0])
+        cache = ResponseCache(str(tmp_path), memory_entries=0, max_bytes=10)
+        cache.put(key("a"), "12345")
+        clock[0] += 1
+        cache.put(key("b"), "12345")
+        clock[0] += 1
+        assert cache.get(key("a")) == "12345"  # a is now most recently used
+        clock[0] += 1
+
+        cache.put(key("c"), "12345")
+
+        assert cache.get(key("b")) is None
+        assert cache.get(key("a")) == "12345"
+        assert cache.stats()["evictions"] == 1
+
+    def test_tracks_size_without_rescanning(self, tmp_path, monkeypatch):
+        """Test that the running size total follows replacements, expiry and reopening."""
+        clock = [1000.0]
+        monkeypatch.setattr("artificial_u.content.response_cache.time.time", lambda: clock[0])
+        cache = ResponseCache(str(tmp_path), ttl=60, max_bytes=12)
+        cache.put(key("a"), "12345")
+        cache.put(key("a"), "1234567")  # replacing an entry counts only its new size
+        cache.put(key("b"), "12345")
+        assert cache._size_bytes == cache.stats()["size_bytes"] == 12
+        assert cache.stats()["evictions"] == 0
+
+        assert ResponseCache(str(tmp_path), max_bytes=12)._size_bytes == 12
+        clock[0] += 61
+        assert cache.get(key("a")) is None
+        assert cache._size_bytes == cache.stats()["size_bytes"] == 5
@@ -0,0 +1,151 @@
+"""
+Unit tests for model routing, circuit breaking and hedging.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from artificial_u.content.router import CircuitBreaker, ModelRouter
+from artificial_u.content.single_flight import SingleFlight
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions."""
+
+    def test_opens_and_resets(self, monkeypatch):
+        """Test opening after consecutive failures and re-opening on a failed trial."""
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0)
+
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+        assert breaker.state == "open" and not breaker.available()
+
+        now[0] += 10.0
+        assert breaker.state == "half_open" and breaker.available()
+        breaker.record_failure()
+        assert breaker.state == "open"
+
+        now[0] += 10.0
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.stats()["opened"] == 2
+
+
+@pytest.mark.unit
+class TestCandidates:
+    """Test candidate ordering."""
+
+    def test_fallbacks_follow_primary(self):
+        """Test that the requested model leads its purpose's fallbacks."""
+        router = ModelRouter(fallbacks={"lecture": ["gpt-b", "claude-a", "gemini-c"]})
+
+        assert router.candidates("lecture", "claude-a") == ["claude-a", "gpt-b", "gemini-c"]
+        assert router.candidates("course", "claude-a") == ["claude-a"]
+        assert router.candidates(None, "claude-a") == ["claude-a"]
+
+    def test_open_circuits_are_tried_last(self):
+        """Test that a tripped model moves behind healthy ones."""
+        router = ModelRouter(fallbacks={"lecture": ["gpt-b"]}, failure_threshold=1)
+        router.record_failure("claude-a", RuntimeError("down"))
+
+        assert router.candidates("lecture", "claude-a") == ["gpt-b", "claude-a"]
+
+    def test_route_by_latency(self):
+        """Test ordering healthy models by p95 latency."""
+        router = ModelRouter(fallbacks={"lecture": ["gpt-b"]}, route_by_latency=True)
+        for _ in range(5):
+            router.record_success("lecture", "claude-a", 9.0)
+            router.record_success("lecture", "gpt-b", 2.0)
+            router.record_success("course", "claude-a", 0.5)
+
+        assert router.candidates("lecture", "claude-a") == ["gpt-b", "claude-a"]
+        assert router.stats()["p95_latency"]["lecture:claude-a"] == 9.0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCall:
+    """Test failover and hedged requests."""
+
+    async def test_failover(self):
+        """Test that a failing model hands the request to the next candidate."""
+        router = ModelRouter(fallbacks={"lecture": ["gpt-b"]})
+        calls = []
+
+        async def generate(model):
+            calls.append(model)
+            if model == "claude-a":
+                raise RuntimeError("overloaded")
+            return f"from {model}"
+
+        assert await router.call("lecture", "claude-a", generate) == "from gpt-b"
+        assert calls == ["claude-a", "gpt-b"]
+        assert router.stats()["failovers"] == 1
+        assert router.stats()["breakers"]["claude-a"]["failures"] == 1
+
+    async def test_raises_last_error_when_all_fail(self):
+        """Test that the last candidate's error surfaces."""
+        router = ModelRouter(fallbacks={"lecture": ["gpt-b"]})
+
+        async def generate(model):
+            raise RuntimeError(model)
+
+        with pytest.raises(RuntimeError, match="gpt-b"):
+            await router.call("lecture", "claude-a", generate)
+
+    async def test_hedged_request(self):
+        """Test that a slow request is hedged and the loser cancelled."""
+        router = ModelRouter(fallbacks={"lecture": ["gpt-b"]}, hedge_after=0.01)
+        cancelled = asyncio.Event()
+
+        async def generate(model):
+            if model == "claude-a":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return f"from {model}"
+
+        assert await router.call("lecture", "claude-a", generate) == "from gpt-b"
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert router.stats()["hedges"] == 1
+        assert router.stats()["hedge_wins"] == 1
+
+    async def test_hedge_loser_behind_single_flight_is_cancelled(self):
+        """Test that the losing backend call stops when attempts go through SingleFlight."""
+        router = ModelRouter(fallbacks={"lecture": ["gpt-b"]}, hedge_after=0.01)
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def backend(model):
+            if model == "claude-a":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return f"from {model}"
+
+        async def generate(model):
+            return await flight.do(model, lambda: backend(model))
+
+        assert await router.call("lecture", "claude-a", generate) == "from gpt-b"
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+    async def test_single_model_errors_pass_through(self):
+        """Test that without fallbacks the model's own error is raised."""
+        router = ModelRouter(hedge_after=0.01)
+
+        async def generate(model):
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            await router.call("lecture", "claude-a", generate)
+        assert router.stats()["breakers"]["claude-a"]["consecutive_failures"] == 1
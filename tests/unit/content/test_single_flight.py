@@ -0,0 +1,101 @@
+"""
+Unit tests for single-flight request coalescing.
+"""
+
+import asyncio
+
+import pytest
+
+from artificial_u.content.single_flight import SingleFlight
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSingleFlight:
+    """Test SingleFlight.do coalescing and error handling."""
+
+    async def test_concurrent_calls_share_one_execution(self):
+        """Test that identical concurrent calls run the work once."""
+        flight = SingleFlight()
+        runs = 0
+
+        async def work():
+            nonlocal runs
+            runs += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(flight.do("key", work) for _ in range(5)))
+
+        assert results == ["result"] * 5
+        assert runs == 1
+        stats = flight.stats()
+        assert (stats["executions"], stats["coalesced"], stats["in_flight"]) == (1, 4, 0)
+
+    async def test_sequential_and_distinct_calls_are_not_coalesced(self):
+        """Test that only calls overlapping in time with the same key share a result."""
+        flight = SingleFlight()
+        counter = iter(range(10))
+
+        async def work():
+            await asyncio.sleep(0)
+            return next(counter)
+
+        first = await flight.do("a", work)
+        second = await flight.do("a", work)
+        other, another = await asyncio.gather(flight.do("b", work), flight.do("c", work))
+
+        assert len({first, second, other, another}) == 4
+        assert flight.stats()["coalesced"] == 0
+
+    async def test_followers_receive_leader_error(self):
+        """Test that a failure is raised to every waiting caller."""
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("rate limited")
+
+        results = await asyncio.gather(
+            flight.do("key", work), flight.do("key", work), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        """Test that a follower still gets the result if the leader's caller goes away."""
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        leader = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "done"
+
+    async def test_call_is_cancelled_when_every_caller_leaves(self):
+        """Test that the work stops once no caller is waiting for it."""
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def work():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        callers = [asyncio.ensure_future(flight.do("key", work)) for _ in range(2)]
+        await asyncio.sleep(0)
+        callers[0].cancel()
+        await asyncio.sleep(0.01)
+        assert not cancelled.is_set()
+
+        callers[1].cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert flight.stats()["in_flight"] == 0
@@ -0,0 +1,74 @@
+"""
+Unit tests for token and cost accounting.
+"""
+
+import pytest
+
+from artificial_u.content.usage import UsageTracker, estimate_cost, summarize_logs
+
+PRICES = {"gpt-4.1": [2.0, 8.0], "gpt-4.1-nano": [0.1, 0.4]}
+
+
+@pytest.mark.unit
+def test_estimate_cost_uses_longest_prefix():
+    """Test that the most specific price applies and unknown models are unpriced."""
+    assert estimate_cost("gpt-4.1-nano-2025", 1_000_000, 1_000_000, PRICES) == pytest.approx(0.5)
+    assert estimate_cost("gpt-4.1", 1000, 500, PRICES) == pytest.approx(0.006)
+    assert estimate_cost("llama3", 1000, 500, PRICES) is None
+
+
+@pytest.mark.unit
+def test_estimate_cost_with_prompt_cache():
+    """Test that cached input is billed at the cache prices, defaulting to the input price."""
+    prices = {"claude-test": [3.0, 15.0, 0.3, 3.75], "gpt-4.1": [2.0, 8.0]}
+
+    # 1000 uncached, 8000 read and 1000 written input tokens
+    cost = estimate_cost("claude-test", 10_000, 0, prices, 8000, 1000)
+    assert cost == pytest.approx((1000 * 3.0 + 8000 * 0.3 + 1000 * 3.75) / 1_000_000)
+    assert estimate_cost("gpt-4.1", 1000, 0, prices, 800) == estimate_cost(
+        "gpt-4.1", 1000, 0, prices
+    )
+
+
+@pytest.mark.unit
+def test_tracker_summary():
+    """Test aggregation per call site, ordered by cost."""
+    tracker = UsageTracker(PRICES)
+    for duration in (1.0, 2.0, 3.0):
+        tracker.record("lecture", "openai", "gpt-4.1", 1000, 2000, duration, 0.5)
+    tracker.record("course", "openai", "gpt-4.1-nano", 100, 100, 0.2)
+    tracker.record("course", "ollama", "llama3", 100, 100, 0.2)
+    tracker.record_error("course", "openai", "gpt-4.1-nano")
+    tracker.record_cache_hit("lecture", "openai", "gpt-4.1")
+
+    summary = tracker.summary()
+    lecture = summary["groups"][0]
+    assert (lecture["purpose"], lecture["calls"], lecture["cache_hits"]) == ("lecture", 3, 1)
+    assert lecture["output_tokens"] == 6000
+    assert lecture["p95_latency"] == 3.0
+    assert lecture["p95_time_to_first_token"] == 0.5
+    assert summary["groups"][-1]["unpriced_calls"] == 1
+    assert summary["totals"]["calls"] == 5
+    assert summary["totals"]["errors"] == 1
+    assert summary["totals"]["cost"] == pytest.approx(0.054 + 0.00005)
+
+
+@pytest.mark.unit
+def test_summarize_logs():
+    """Test that logged usage is aggregated and older records still count as calls."""
+    records = [
+        {
+            "metadata": {
+                "backend": "openai",
+                "model": "gpt-4.1",
+                "purpose": "topics",
+                "usage": {"input_tokens": 1000, "output_tokens": 500, "duration": 4.0},
+            }
+        },
+        {"metadata": {"backend": "openai", "model": "gpt-4.1"}},
+    ]
+
+    groups = {g["purpose"]: g for g in summarize_logs(records, PRICES)["groups"]}
+    assert groups["topics"]["cost"] == pytest.approx(0.006)
+    assert groups["unspecified"]["calls"] == 1
+    assert groups["unspecified"]["input_tokens"] == 0
@@ -0,0 +1,174 @@
+"""
+Unit tests for the ElevenLabs clients' HTTP handling and retry policy.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from artificial_u.integrations.elevenlabs import (
+    AsyncElevenLabsClient,
+    ElevenLabsAPIError,
+    ElevenLabsClient,
+)
+from artificial_u.integrations.elevenlabs.retry import backoff_delay, parse_retry_after
+
+
+def make_client(responses, **kwargs):
+    """Create an async client answering requests with the given responses in turn."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    client = AsyncElevenLabsClient(
+        api_key="key", transport=httpx.MockTransport(handler), retry_backoff=0.1, **kwargs
+    )
+    return client, requests
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAsyncElevenLabsClient:
+    """Test text-to-speech requests and retries."""
+
+    async def test_text_to_speech_streams_audio(self):
+        """Test the request sent and that the streamed audio is joined."""
+        client, requests = make_client([httpx.Response(200, content=b"mp3-bytes")])
+
+        audio = await client.text_to_speech("Hello", voice_id="v1", voice_settings={"a": 1.0})
+
+        assert audio == b"mp3-bytes"
+        [request] = requests
+        assert request.url.path == "/v1/text-to-speech/v1/stream"
+        assert request.headers["xi-api-key"] == "key"
+        body = json.loads(request.content)
+        assert body == {
+            "text": "Hello",
+            "model_id": "eleven_flash_v2_5",
+            "voice_settings": {"a": 1.0},
+        }
+
+    async def test_rate_limit_is_retried_after_retry_after(self):
+        """Test that a 429 is retried, waiting at least the Retry-After seconds."""
+        client, requests = make_client(
+            [
+                httpx.Response(429, headers={"Retry-After": "3"}, json={"detail": "busy"}),
+                httpx.Response(503),
+                httpx.Response(200, content=b"ok"),
+            ]
+        )
+        with patch(
+            "artificial_u.integrations.elevenlabs.async_client.asyncio.sleep", new=AsyncMock()
+        ) as sleep:
+            assert await client.text_to_speech("Hi", voice_id="v") == b"ok"
+
+        first_wait, second_wait = [call.args[0] for call in sleep.call_args_list]
+        assert first_wait >= 3
+        assert 0 <= second_wait <= 0.2
+        assert client.stats() == {"requests": 3, "retries": 2}
+
+    async def test_network_errors_are_retried(self):
+        """Test that connection failures are retried."""
+        client, _ = make_client([httpx.ConnectError("refused"), httpx.Response(200, content=b"ok")])
+        with patch(
+            "artificial_u.integrations.elevenlabs.async_client.asyncio.sleep", new=AsyncMock()
+        ):
+            assert await client.text_to_speech("Hi", voice_id="v") == b"ok"
+
+    async def test_client_errors_are_not_retried(self):
+        """Test that a 4xx other than 408/429 fails on the first attempt."""
+        client, requests = make_client([httpx.Response(401, json={"detail": "invalid key"})])
+
+        with pytest.raises(ElevenLabsAPIError, match="invalid key") as error:
+            await client.text_to_speech("Hi", voice_id="v")
+
+        assert error.value.status_code == 401
+        assert len(requests) == 1
+
+    async def test_gives_up_after_max_retries(self):
+        """Test that a persistent server error is raised after the last retry."""
+        client, requests = make_client([httpx.Response(500)] * 2, max_retries=1)
+
+        with patch(
+            "artificial_u.integrations.elevenlabs.async_client.asyncio.sleep", new=AsyncMock()
+        ):
+            with pytest.raises(ElevenLabsAPIError):
+                await client.text_to_speech("Hi", voice_id="v")
+
+        assert len(requests) == 2
+
+    async def test_shared_voices_are_formatted(self):
+        """Test the shared voices query parameters and result format."""
+        client, requests = make_client(
+            [
+                httpx.Response(
+                    200,
+                    json={
+                        "voices": [{"voice_id": "v1", "name": "Ada", "gender": "female"}],
+                        "has_more": True,
+                    },
+                )
+            ]
+        )
+
+        voices, has_more = await client.get_shared_voices(gender="female", page=2)
+
+        assert has_more is True
+        assert (voices[0]["voice_id"], voices[0]["gender"]) == ("v1", "female")
+        params = dict(requests[0].url.params)
+        assert params == {"page_size": "100", "page": "2", "gender": "female", "language": "en"}
+
+    async def test_connections_are_shared(self):
+        """Test that requests reuse one HTTP client until it is closed."""
+        client, _ = make_client([httpx.Response(200, content=b"a")] * 2)
+        await client.text_to_speech("one", voice_id="v")
+        http = client._get_http()
+        await client.text_to_speech("two", voice_id="v")
+
+        assert client._get_http() is http
+        await client.aclose()
+        assert client._get_http() is not http
+
+
+@pytest.mark.unit
+def test_sync_client_does_not_retry_client_errors():
+    """Test that the sync client raises a 4xx at once instead of sleeping and retrying."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(422, json={"detail": "bad voice settings"})
+
+    client = ElevenLabsClient(api_key="key")
+    client._http = httpx.Client(transport=httpx.MockTransport(handler))
+
+    with pytest.raises(ElevenLabsAPIError, match="bad voice settings"):
+        client.text_to_speech("Hi", voice_id="v")
+    assert len(requests) == 1
+
+
+@pytest.mark.unit
+def test_retry_after_parsing():
+    """Test Retry-After headers in seconds and as HTTP dates."""
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    later = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 28 <= parse_retry_after(format_datetime(later, usegmt=True)) <= 30
+
+
+@pytest.mark.unit
+def test_backoff_delay_is_jittered_and_capped():
+    """Test that delays stay within the exponential bound and its cap."""
+    for attempt, bound in [(0, 1), (1, 2), (3, 8), (10, 20)]:
+        assert 0 <= backoff_delay(attempt, base=1, cap=20) <= bound
+    assert backoff_delay(0, 1, 20, ElevenLabsAPIError("busy", 429, retry_after=5)) >= 5
@@ -0,0 +1,117 @@
+"""
+Unit tests for the job handlers, run against the real services.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from artificial_u.audio.speech_processor import SpeechProcessor
+from artificial_u.jobs.handlers import LECTURE_AUDIO, build_handlers
+from artificial_u.models.core import Course, Lecture, Professor, Topic, Voice
+from artificial_u.models.repositories import (
+    CourseRepository,
+    LectureRepository,
+    ProfessorRepository,
+    TopicRepository,
+    VoiceRepository,
+)
+from artificial_u.services.audio_service import AudioService
+from artificial_u.services.tts_service import TTSService
+from artificial_u.utils import LectureNotFoundError
+
+LECTURES = {
+    7: Lecture(id=7, revision=1, content="The first take on search.", course_id=1, topic_id=3),
+    8: Lecture(id=8, revision=2, content="The second take on search.", course_id=1, topic_id=3),
+}
+
+
+def make_repository_factory():
+    """Create repositories restricted to the methods the real classes have."""
+    repository_factory = SimpleNamespace(
+        course=MagicMock(spec=CourseRepository),
+        topic=MagicMock(spec=TopicRepository),
+        lecture=MagicMock(spec=LectureRepository),
+        professor=MagicMock(spec=ProfessorRepository),
+        voice=MagicMock(spec=VoiceRepository),
+    )
+    repository_factory.course.get.return_value = Course(
+        id=1, code="CS101", title="Search", professor_id=2
+    )
+    repository_factory.topic.get.return_value = Topic(
+        id=3, title="Search", week=1, order=2, course_id=1
+    )
+    repository_factory.lecture.get.side_effect = lambda lecture_id: LECTURES.get(lecture_id)
+    repository_factory.lecture.update.side_effect = lambda lecture: lecture
+    repository_factory.professor.get.return_value = Professor(id=2, name="Ada", voice_id=5)
+    repository_factory.voice.get.return_value = Voice(id=5, el_voice_id="v", name="Voice")
+    return repository_factory
+
+
+def make_system():
+    """Create a system whose AudioService only has TTS and storage mocked."""
+    repository_factory = make_repository_factory()
+    async_client = MagicMock()
+    async_client.text_to_speech = AsyncMock(side_effect=lambda text, **kwargs: text.encode())
+    tts_service = TTSService(
+        client=MagicMock(),
+        async_client=async_client,
+        speech_processor=SpeechProcessor(),
+        repository_factory=repository_factory,
+    )
+
+    async def upload_audio_stream(chunks, object_name, content_type="audio/mpeg"):
+        storage_service.uploaded[object_name] = b"".join([chunk async for chunk in chunks])
+        return True, f"http://storage/{object_name}"
+
+    storage_service = MagicMock()
+    storage_service.uploaded = {}
+    storage_service.generate_audio_key.side_effect = (
+        lambda course_id, week_number, lecture_order, extension="mp3": (
+            f"{course_id}/week{week_number}/lecture{lecture_order}.{extension}"
+        )
+    )
+    storage_service.upload_audio_stream = upload_audio_stream
+    storage_service.upload_audio_file = AsyncMock(
+        side_effect=lambda data, object_name, content_type: (True, f"http://storage/{object_name}")
+    )
+
+    audio_service = AudioService(
+        repository_factory=repository_factory,
+        tts_service=tts_service,
+        storage_service=storage_service,
+    )
+    return SimpleNamespace(
+        audio_service=audio_service,
+        repository_factory=repository_factory,
+        storage_service=storage_service,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLectureAudioHandler:
+    """Test the lecture.audio job handler."""
+
+    async def test_renders_the_lecture_in_the_payload(self):
+        """Test that the job's lecture revision is rendered, stored and linked."""
+        system = make_system()
+        handler = build_handlers(system)[LECTURE_AUDIO]
+
+        result = await handler({"lecture_id": 7})
+
+        assert result == {"lecture_id": 7, "audio_url": "http://storage/CS101/week1/lecture2.mp3"}
+        assert system.storage_service.uploaded["CS101/week1/lecture2.mp3"] == (
+            b"The first take on search."
+        )
+        updated = system.repository_factory.lecture.update.call_args.args[0]
+        assert updated.id == 7
+        assert updated.audio_url == result["audio_url"]
+
+    async def test_missing_lecture_is_not_retryable(self):
+        """Test that an unknown lecture fails with the error the worker won't retry."""
+        handler = build_handlers(make_system())[LECTURE_AUDIO]
+
+        with pytest.raises(LectureNotFoundError):
+            await handler({"lecture_id": 99})
@@ -0,0 +1,162 @@
+"""
+Unit tests for the job worker, run against an in-memory job queue.
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from artificial_u.jobs import JobWorker, retry_delay
+from artificial_u.models.core import Job
+from artificial_u.utils import LectureNotFoundError
+
+
+class FakeJobRepository:
+    """In-memory stand-in for JobRepository."""
+
+    def __init__(self, *jobs):
+        self.jobs = {job.id: job for job in jobs}
+        self.holds_lease = True
+
+    def lease(self, worker_id, lease_seconds, kinds=None):
+        for job in self.jobs.values():
+            if job.status == "queued" and (not kinds or job.kind in kinds):
+                job.status, job.locked_by = "running", worker_id
+                job.attempts += 1
+                return job.model_copy()
+        return None
+
+    def heartbeat(self, job_id, worker_id, lease_seconds):
+        return self.holds_lease
+
+    def complete(self, job_id, worker_id, result):
+        self.jobs[job_id].status, self.jobs[job_id].result = "succeeded", result
+        return True
+
+    def fail(self, job_id, worker_id, error, retry_at=None):
+        job = self.jobs[job_id]
+        job.error, job.run_at = error, retry_at
+        job.status = "failed" if retry_at is None else "retrying"
+        return True
+
+    def fail_abandoned(self):
+        return 0
+
+
+def make_job(job_id=1, kind="lecture.audio", attempts=0, max_attempts=3):
+    """Create a queued job."""
+    return Job(
+        id=job_id,
+        kind=kind,
+        payload={"lecture_id": job_id},
+        attempts=attempts,
+        max_attempts=max_attempts,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestJobWorker:
+    """Test running jobs and recording their outcomes."""
+
+    async def test_runs_due_jobs(self):
+        """Test that a burst run completes every due job with its handler's result."""
+        repository = FakeJobRepository(make_job(1), make_job(2))
+
+        async def handler(payload):
+            return {"audio_url": f"lecture-{payload['lecture_id']}.mp3"}
+
+        worker = JobWorker(repository, {"lecture.audio": handler}, concurrency=2)
+        stats = await worker.run(burst=True)
+
+        assert stats["succeeded"] == 2
+        assert repository.jobs[2].result == {"audio_url": "lecture-2.mp3"}
+
+    async def test_failure_is_retried_with_backoff(self):
+        """Test that a failed attempt is rescheduled until attempts run out."""
+        repository = FakeJobRepository(make_job(1), make_job(2, attempts=2))
+
+        async def handler(payload):
+            raise RuntimeError("TTS unavailable")
+
+        worker = JobWorker(repository, {"lecture.audio": handler}, retry_backoff=10)
+        stats = await worker.run(burst=True)
+
+        assert (stats["retried"], stats["failed"]) == (1, 1)
+        assert repository.jobs[1].status == "retrying"
+        assert repository.jobs[1].run_at is not None
+        assert repository.jobs[2].status == "failed"
+        assert repository.jobs[2].error == "RuntimeError: TTS unavailable"
+
+    async def test_permanent_errors_are_not_retried(self):
+        """Test that missing records and unknown kinds fail on the first attempt."""
+        repository = FakeJobRepository(make_job(1), make_job(2, kind="unknown"))
+
+        async def handler(payload):
+            raise LectureNotFoundError("Lecture with ID 1 not found")
+
+        worker = JobWorker(repository, {"lecture.audio": handler}, kinds=["lecture.audio"])
+        await worker.process(repository.lease("w", 60))
+        await worker.process(repository.lease("w", 60))
+
+        assert [job.status for job in repository.jobs.values()] == ["failed", "failed"]
+        assert repository.jobs[2].error == "No handler for job kind 'unknown'"
+
+    async def test_lost_lease_cancels_handler(self):
+        """Test that a handler is cancelled once its lease cannot be renewed."""
+        repository = FakeJobRepository(make_job(1))
+        repository.holds_lease = False
+        cancelled = asyncio.Event()
+
+        async def handler(payload):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        worker = JobWorker(repository, {"lecture.audio": handler}, lease_seconds=0.03)
+        await worker.run(burst=True)
+
+        assert cancelled.is_set()
+        assert repository.jobs[1].status == "running"
+        assert worker.stats()["succeeded"] == 0
+
+    async def test_database_errors_do_not_stop_the_worker(self):
+        """Test that a failed lease or heartbeat is retried instead of killing the worker."""
+        repository = FakeJobRepository(make_job(1))
+        lease, heartbeat = repository.lease, repository.heartbeat
+        errors = {"lease": 1, "heartbeat": 1}
+
+        def flaky(name, method):
+            def call(*args):
+                if errors[name]:
+                    errors[name] -= 1
+                    raise OperationalError("SELECT", {}, Exception("connection reset"))
+                return method(*args)
+
+            return call
+
+        repository.lease = flaky("lease", lease)
+        repository.heartbeat = flaky("heartbeat", heartbeat)
+
+        async def handler(payload):
+            await asyncio.sleep(0.05)
+            return {"ok": True}
+
+        worker = JobWorker(
+            repository, {"lecture.audio": handler}, poll_interval=0.01, lease_seconds=0.03
+        )
+        stats = await worker.run(burst=True)
+
+        assert stats["succeeded"] == 1
+        assert errors == {"lease": 0, "heartbeat": 0}
+
+
+@pytest.mark.unit
+def test_retry_delay_doubles_up_to_cap():
+    """Test that retry delays grow exponentially within the jitter bounds."""
+    for attempt, expected in [(1, 10), (2, 20), (3, 40), (8, 300)]:
+        delay = retry_delay(attempt, base=10, cap=300)
+        assert expected / 2 <= delay <= expected
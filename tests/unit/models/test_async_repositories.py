@@ -0,0 +1,202 @@
+"""
+Unit tests for the async repositories, run against an aiosqlite database.
+"""
+
+import inspect
+
+import pytest
+import pytest_asyncio
+
+from artificial_u.models import repositories
+from artificial_u.models.core import Course, Department, Lecture, Professor, Topic, Voice
+from artificial_u.models.repositories import engine as engine_registry
+from artificial_u.models.repositories.aio import AsyncRepositoryFactory
+
+
+@pytest_asyncio.fixture
+async def factory(tmp_path):
+    """Create an async repository factory backed by a fresh SQLite file."""
+    db_url = f"sqlite:///{tmp_path / 'async_repos.db'}"
+    repository_factory = AsyncRepositoryFactory(db_url=db_url)
+    await repository_factory.create_tables()
+    yield repository_factory
+    await engine_registry.dispose_async_engines()
+
+
+async def _create_course(factory: AsyncRepositoryFactory) -> Course:
+    """Create a department, professor and course for lecture tests."""
+    department = await factory.department.create(
+        Department(name="Computer Science", code="CS", faculty="Engineering")
+    )
+    professor = await factory.professor.create(
+        Professor(name="Dr. Ada", title="Professor", department_id=department.id)
+    )
+    return await factory.course.create(
+        Course(
+            code="CS101",
+            title="Intro",
+            department_id=department.id,
+            professor_id=professor.id,
+        )
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAsyncRepositories:
+    """Test async repository CRUD paths."""
+
+    async def test_factory_uses_async_driver(self, factory):
+        """Test that the factory's repositories run on the aiosqlite driver."""
+        assert factory.lecture.engine.url.drivername == "sqlite+aiosqlite"
+        assert factory.lecture.engine is factory.course.engine
+
+    async def test_course_crud(self, factory):
+        """Test creating, fetching, updating and deleting a course."""
+        course = await _create_course(factory)
+
+        fetched = await factory.course.get_by_code("CS101")
+        assert fetched.id == course.id
+
+        fetched.title = "Introduction"
+        await factory.course.update(fetched)
+        assert (await factory.course.get(course.id)).title == "Introduction"
+
+        assert await factory.course.delete(course.id) is True
+        assert await factory.course.get(course.id) is None
+
+    async def test_lecture_list_count_and_fields(self, factory):
+        """Test lecture listing, counting and single-field lookups."""
+        course = await _create_course(factory)
+        topics = await factory.topic.create_batch(
+            [Topic(title=f"Topic {i}", week=1, order=i, course_id=course.id) for i in (1, 2)]
+        )
+        assert all(topic.id for topic in topics)
+
+        first = await factory.lecture.create(
+            Lecture(
+                course_id=course.id,
+                topic_id=topics[0].id,
+                content="Neural networks",
+                audio_url="https://example.com/a.mp3",
+            )
+        )
+        revision = await factory.lecture.create(
+            Lecture(course_id=course.id, topic_id=topics[0].id, content="Neural networks v2")
+        )
+        await factory.lecture.create(
+            Lecture(course_id=course.id, topic_id=topics[1].id, content="Search")
+        )
+
+        assert first.revision == 1
+        assert revision.revision == 2
+        assert await factory.lecture.get_content(first.id) == "Neural networks"
+        assert await factory.lecture.get_audio_url(first.id) == "https://example.com/a.mp3"
+
+        page = await factory.lecture.list(page=1, size=2, course_id=course.id)
+        assert [lecture.id for lecture in page] == [first.id, revision.id]
+        assert await factory.lecture.count(course_id=course.id) == 3
+        assert await factory.lecture.count(search_query="neural") == 2
+        assert await factory.lecture.count(professor_id=course.professor_id) == 3
+
+        assert await factory.lecture.delete_by_topic(topics[0].id) == 2
+        assert await factory.lecture.count() == 1
+
+    async def test_voice_upsert_and_filters(self, factory):
+        """Test voice upsert by ElevenLabs ID and filtered counts."""
+        voice = Voice(el_voice_id="el-1", name="Calm", accent="british", gender="female")
+        created = await factory.voice.upsert(voice)
+
+        updated = await factory.voice.upsert(
+            Voice(el_voice_id="el-1", name="Calmer", accent="british", gender="female")
+        )
+        assert updated.id == created.id
+        assert (await factory.voice.get_by_elevenlabs_id("el-1")).name == "Calmer"
+        assert await factory.voice.count(accent="brit") == 1
+        assert await factory.voice.list(accent="american") == []
+
+    async def test_lecture_generation_context(self, factory):
+        """Test loading a course's generation context without lecture content."""
+        course = await _create_course(factory)
+        topics = await factory.topic.create_batch(
+            [Topic(title=f"Topic {i}", week=i, order=1, course_id=course.id) for i in (2, 1)]
+        )
+        lecture = await factory.lecture.create(
+            Lecture(course_id=course.id, topic_id=topics[0].id, content="Body", summary="Gist")
+        )
+
+        context = await factory.lecture.get_generation_context(course.id)
+
+        assert context.course.code == "CS101"
+        assert context.professor.name == "Dr. Ada"
+        assert [topic.title for topic in context.topics] == ["Topic 1", "Topic 2"]
+        [loaded] = context.lectures
+        assert (loaded.id, loaded.summary, loaded.content) == (lecture.id, "Gist", None)
+        assert await factory.lecture.get_generation_context(999) is None
+
+    async def test_course_lecture_summary(self, factory):
+        """Test storing and compare-and-swapping a course's rolling summary."""
+        course = await _create_course(factory)
+
+        assert await factory.course.swap_lecture_summary(course.id, None, "First")
+        assert not await factory.course.swap_lecture_summary(course.id, None, "Stale")
+        assert await factory.course.swap_lecture_summary(course.id, "First", "Second")
+        assert (await factory.course.get_with_lecture_summary(course.id))[1] == "Second"
+
+        assert await factory.course.update_lecture_summary(course.id, None)
+        assert (await factory.course.get_with_lecture_summary(course.id))[1] is None
+        assert not await factory.course.update_lecture_summary(999, "Nothing")
+        assert await factory.course.get_with_lecture_summary(999) is None
+
+    async def test_professor_list_filters_and_pagination(self, factory):
+        """Test professor filters and paging run in the query, tolerating NULL specializations."""
+        department = await factory.department.create(
+            Department(name="Computer Science", code="CS", faculty="Engineering")
+        )
+        for name, specialization in [
+            ("Dr. Ada", "Machine Learning"),
+            ("Dr. Alan", None),
+            ("Dr. Grace", "Compilers and machine code"),
+        ]:
+            await factory.professor.create(
+                Professor(
+                    name=name,
+                    title="Professor",
+                    department_id=department.id,
+                    specialization=specialization,
+                )
+            )
+
+        matches = await factory.professor.list(specialization="MACHINE")
+        assert [p.name for p in matches] == ["Dr. Ada", "Dr. Grace"]
+        assert await factory.professor.count(specialization="machine") == 2
+
+        assert [p.name for p in await factory.professor.list(name="dr. a")] == [
+            "Dr. Ada",
+            "Dr. Alan",
+        ]
+        assert [p.name for p in await factory.professor.list(page=2, size=2)] == ["Dr. Grace"]
+        assert await factory.professor.count(department_id=department.id) == 3
+        assert await factory.professor.count(department_id=999) == 0
+        assert len(await factory.professor.list()) == 3
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "sync_class",
+    [
+        repositories.CourseRepository,
+        repositories.DepartmentRepository,
+        repositories.LectureRepository,
+        repositories.ProfessorRepository,
+        repositories.TopicRepository,
+        repositories.VoiceRepository,
+    ],
+)
+def test_async_repositories_mirror_sync_methods(sync_class):
+    """Test that every public sync repository method has an async equivalent."""
+    async_class = getattr(repositories, f"Async{sync_class.__name__}")
+    for name, method in inspect.getmembers(sync_class, inspect.isfunction):
+        if name.startswith("_") or hasattr(repositories.BaseRepository, name):
+            continue
+        assert inspect.iscoroutinefunction(getattr(async_class, name, None)), name
@@ -35,20 +35,26 @@ class TestBaseRepository:
         with pytest.raises(ValueError, match="Database URL not provided"):
             BaseRepository()
 
-    @patch("artificial_u.models.repositories.base.create_engine")
+    @patch("artificial_u.models.repositories.base.get_engine")
     @patch.dict(
         "artificial_u.models.repositories.base.os.environ", {"DATABASE_URL": "sqlite:///:memory:"}
     )
-    def test_engine_creation(self, mock_create_engine):
-        """Test that the engine is created properly."""
+    def test_engine_creation(self, mock_get_engine):
+        """Test that the engine is obtained from the shared registry."""
         mock_engine = MagicMock()
-        mock_create_engine.return_value = mock_engine
+        mock_get_engine.return_value = mock_engine
 
         repo = BaseRepository()
 
-        mock_create_engine.assert_called_once_with("sqlite:///:memory:")
+        mock_get_engine.assert_called_once_with("sqlite:///:memory:")
         assert repo.engine == mock_engine
 
+    def test_repositories_share_engine(self):
+        """Test that repositories for the same URL share one engine."""
+        repo1 = BaseRepository(db_url="sqlite:///test.db")
+        repo2 = BaseRepository(db_url="sqlite:///test.db")
+        assert repo1.engine is repo2.engine
+
     def test_get_session(self, mock_session):
         """Test getting a database session."""
         # Override the get_session method to return our mock
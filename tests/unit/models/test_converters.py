@@ -7,6 +7,7 @@ import xml.etree.ElementTree as ET
 import pytest
 
 from artificial_u.models.converters import (
+    StreamingTagExtractor,
     course_model_to_dict,
     courses_to_xml,
     department_model_to_dict,
@@ -799,3 +800,21 @@ def test_parse_lecture_xml():
     # Test error handling
     with pytest.raises(ValueError):
         parse_lecture_xml("<invalid>XML</with>")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("size", [1, 3, 7, 1000])
+def test_streaming_tag_extractor(size):
+    """Test extracting tag content from a response streamed in arbitrary pieces."""
+    response = (
+        "<thinking>plan the <con tent></thinking><output><lecture>\n<content>\n"
+        "Today: a < b and </cont is not a tag.\n</content></lecture></output>"
+    )
+    extractor = StreamingTagExtractor("content")
+    pieces = [response[i : i + size] for i in range(0, len(response), size)]
+
+    streamed = "".join(extractor.feed(piece) for piece in pieces)
+
+    assert streamed == extract_xml_content(response, "content")
+    assert extractor.done
+    assert extractor.feed("<content>more</content>") == ""
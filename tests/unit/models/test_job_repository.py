@@ -0,0 +1,91 @@
+"""
+Unit tests for the job repository, run against a SQLite database.
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from artificial_u.models.repositories import RepositoryFactory
+from artificial_u.models.repositories.job import FAILED, QUEUED, RUNNING, SUCCEEDED, utcnow
+
+
+@pytest.fixture
+def jobs(tmp_path):
+    """Create a job repository backed by a fresh SQLite file."""
+    factory = RepositoryFactory(db_url=f"sqlite:///{tmp_path / 'jobs.db'}")
+    factory.create_tables()
+    return factory.job
+
+
+@pytest.mark.unit
+class TestJobRepository:
+    """Test queuing, leasing and finishing jobs."""
+
+    def test_enqueue_is_idempotent(self, jobs):
+        """Test that enqueuing an idempotency key again returns the existing job."""
+        first = jobs.enqueue("lecture.audio", {"lecture_id": 1}, idempotency_key="audio-1")
+        again = jobs.enqueue("lecture.audio", {"lecture_id": 1}, idempotency_key="audio-1")
+        other = jobs.enqueue("lecture.audio", {"lecture_id": 1})
+
+        assert again.id == first.id
+        assert other.id != first.id
+        assert (first.status, first.attempts, first.payload) == (QUEUED, 0, {"lecture_id": 1})
+
+    def test_lease_and_complete(self, jobs):
+        """Test that a leased job is held by one worker until it completes."""
+        queued = jobs.enqueue("lecture.audio", {"lecture_id": 1})
+
+        leased = jobs.lease("worker-a", lease_seconds=60)
+        assert (leased.id, leased.status, leased.attempts) == (queued.id, RUNNING, 1)
+        assert leased.locked_by == "worker-a"
+        assert jobs.lease("worker-b", lease_seconds=60) is None
+
+        assert not jobs.complete(leased.id, "worker-b", {"audio_url": "x"})
+        assert jobs.complete(leased.id, "worker-a", {"audio_url": "x"})
+        job = jobs.get(leased.id)
+        assert (job.status, job.result, job.locked_by) == (SUCCEEDED, {"audio_url": "x"}, None)
+        assert job.finished_at is not None
+
+    def test_lease_filters_kinds(self, jobs):
+        """Test that a worker only leases the kinds it runs."""
+        jobs.enqueue("lecture.audio", {"lecture_id": 1})
+
+        assert jobs.lease("worker-a", 60, kinds=["professor.image"]) is None
+        assert jobs.lease("worker-a", 60, kinds=["lecture.audio"]) is not None
+
+    def test_failed_attempt_is_retried_when_due(self, jobs):
+        """Test that a retry waits for its run time and a final failure sticks."""
+        queued = jobs.enqueue("lecture.audio", {"lecture_id": 1})
+        leased = jobs.lease("worker-a", 60)
+
+        assert jobs.fail(leased.id, "worker-a", "boom", retry_at=utcnow() + timedelta(hours=1))
+        job = jobs.get(queued.id)
+        assert (job.status, job.error) == (QUEUED, "boom")
+        assert jobs.lease("worker-a", 60) is None
+
+        assert jobs.fail(queued.id, "worker-a", "boom") is False
+        jobs.enqueue("lecture.audio", {"lecture_id": 2}, idempotency_key="due")
+        due = jobs.lease("worker-a", 60)
+        assert due.payload == {"lecture_id": 2}
+        assert jobs.fail(due.id, "worker-a", "gave up")
+        assert jobs.get(due.id).status == FAILED
+
+    def test_expired_lease_is_reclaimed(self, jobs):
+        """Test that another worker takes over a job whose lease expired."""
+        queued = jobs.enqueue("lecture.audio", {"lecture_id": 1}, max_attempts=2)
+        jobs.lease("worker-a", lease_seconds=-1)
+
+        reclaimed = jobs.lease("worker-b", lease_seconds=60)
+        assert (reclaimed.id, reclaimed.attempts) == (queued.id, 2)
+        assert not jobs.heartbeat(queued.id, "worker-a", 60)
+        assert jobs.heartbeat(queued.id, "worker-b", 60)
+
+    def test_abandoned_last_attempt_fails(self, jobs):
+        """Test that a job abandoned on its last attempt is marked failed."""
+        queued = jobs.enqueue("lecture.audio", {"lecture_id": 1}, max_attempts=1)
+        jobs.lease("worker-a", lease_seconds=-1)
+
+        assert jobs.lease("worker-b", 60) is None
+        assert jobs.fail_abandoned() == 1
+        assert jobs.get(queued.id).status == FAILED
@@ -43,6 +43,8 @@ class TestLectureRepository:
         lecture.content = "Test Content"
         lecture.summary = "Test Summary"
         lecture.audio_url = "test_audio_url"
+        lecture.audio_playlist_url = None
+        lecture.audio_manifest_url = None
         lecture.transcript_url = "test_transcript_url"
         lecture.course_id = 1
         lecture.topic_id = 1
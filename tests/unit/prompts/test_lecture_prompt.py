@@ -2,7 +2,13 @@
 
 import pytest
 
-from artificial_u.prompts.lecture import get_lecture_prompt
+from artificial_u.content.usage import estimate_tokens
+from artificial_u.prompts.lecture import (
+    get_course_summary_prompt,
+    get_lecture_prompt,
+    get_lecture_prompt_parts,
+    select_lecture_context,
+)
 
 
 @pytest.mark.unit
@@ -152,3 +158,123 @@ def test_lecture_prompt_minimal():
     assert "<lecture>" in prompt
     assert "<no_existing_lectures />" in prompt
     assert "<no_existing_topics />" in prompt
+
+
+@pytest.mark.unit
+def test_lecture_prompt_prefix_is_shared_within_a_course():
+    """Test that lectures of one course share the cacheable prefix."""
+    course_data = {"code": "CS101", "title": "Introduction to Computer Science"}
+    professor_data = {"name": "Dr. Sarah Chen"}
+    topics_data = [
+        {"title": "Bits", "week": 1, "order": 1},
+        {"title": "Bytes", "week": 1, "order": 2},
+    ]
+
+    first_prefix, first_suffix = get_lecture_prompt_parts(
+        course_data=course_data,
+        professor_data=professor_data,
+        topic_data=topics_data[0],
+        existing_lectures=[],
+        topics_data=topics_data,
+    )
+    second_prefix, second_suffix = get_lecture_prompt_parts(
+        course_data=course_data,
+        professor_data=professor_data,
+        topic_data=topics_data[1],
+        existing_lectures=[{"week": 1, "order": 1, "title": "Bits", "summary": "On bits"}],
+        topics_data=topics_data,
+        word_count=1200,
+    )
+
+    assert first_prefix == second_prefix
+    assert "CS101" in first_prefix and "Dr. Sarah Chen" in first_prefix
+    assert "Bytes" in second_suffix and "1200" in second_suffix
+    assert "On bits" not in second_prefix
+    assert (
+        get_lecture_prompt(
+            course_data=course_data,
+            professor_data=professor_data,
+            topic_data=topics_data[0],
+            existing_lectures=[],
+            topics_data=topics_data,
+        )
+        == first_prefix + first_suffix
+    )
+
+
+def _lectures(count):
+    """Build existing lecture entries with long summaries, one per week."""
+    return [
+        {"week": week, "order": 1, "title": f"Topic {week}", "summary": f"Lecture {week}. " * 40}
+        for week in range(1, count + 1)
+    ]
+
+
+@pytest.mark.unit
+def test_select_lecture_context_keeps_recent_lectures_within_budget():
+    """Test that older lectures give way to the course summary when over budget."""
+    lectures = _lectures(10)
+
+    assert select_lecture_context(lectures, "So far...", None) == (lectures, None)
+    assert select_lecture_context(lectures[:2], "So far...", 10_000) == (lectures[:2], None)
+
+    recent, summary = select_lecture_context(lectures, "So far...", 500)
+    assert summary == "So far..."
+    assert 0 < len(recent) < 10
+    assert recent == lectures[-len(recent) :]
+
+
+@pytest.mark.unit
+def test_select_lecture_context_outlines_older_lectures_without_summary():
+    """Test that without a course summary older lectures are kept as topic outlines."""
+    lectures = _lectures(10)
+
+    selected, summary = select_lecture_context(lectures, None, 500)
+
+    assert summary is None
+    assert [lecture["week"] for lecture in selected] == list(range(selected[0]["week"], 11))
+    full = [lecture for lecture in selected if "summary" in lecture]
+    outline = selected[: len(selected) - len(full)]
+    assert 0 < len(full) < 10 and full == lectures[-len(full) :]
+    assert outline and all(set(lecture) == {"week", "order", "title"} for lecture in outline)
+
+
+@pytest.mark.unit
+def test_lecture_prompt_size_is_bounded_by_token_budget():
+    """Test that a budgeted prompt stays the same size however many lectures precede it."""
+    args = {
+        "course_data": {"code": "CS101", "title": "Introduction to Computer Science"},
+        "professor_data": {"name": "Dr. Sarah Chen"},
+        "topic_data": {"title": "Recursion", "week": 12, "order": 1},
+        "topics_data": [],
+        "course_summary": "Weeks one to eleven covered the basics.",
+        "token_budget": 2500,
+    }
+
+    early = get_lecture_prompt(existing_lectures=_lectures(2), **args)
+    late = get_lecture_prompt(existing_lectures=_lectures(11), **args)
+    unbudgeted = get_lecture_prompt(
+        existing_lectures=_lectures(11), **{**args, "token_budget": None}
+    )
+
+    assert "<course_summary>" not in early and "Topic 1<" in early
+    assert "<course_summary>\nWeeks one to eleven" in late
+    assert "Topic 11<" in late and "Topic 1<" not in late
+    assert estimate_tokens(late) <= 2500 < estimate_tokens(unbudgeted)
+
+
+@pytest.mark.unit
+def test_course_summary_prompt():
+    """Test the prompt folding a new lecture into the course summary."""
+    lecture = {"title": "Bytes", "week": 2, "order": 1, "content": "Eight bits make a byte."}
+
+    first = get_course_summary_prompt({"code": "CS101"}, None, lecture, word_limit=250)
+    assert "<no_existing_lectures />" in first
+    assert "Eight bits make a byte." in first
+    assert "week 2, lecture 1: Bytes" in first and "250 words" in first
+
+    later = get_course_summary_prompt(
+        {"code": "CS101"}, "Bits were introduced.", {**lecture, "summary": "On bytes"}
+    )
+    assert "<course_summary>\nBits were introduced.\n</course_summary>" in later
+    assert "On bytes" in later and "Eight bits" not in later
@@ -0,0 +1,396 @@
+"""
+Unit tests for ContentService streaming, caching and request coalescing.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from artificial_u.content.log_writer import ContentLogWriter, iter_content_logs
+from artificial_u.content.replay import ReplayBackend
+from artificial_u.content.response_cache import ResponseCache
+from artificial_u.content.router import ModelRouter
+from artificial_u.services.content_service import ContentService, GenerationUsage
+
+
+async def aiter(items):
+    """Wrap a list in an async iterator."""
+    for item in items:
+        yield item
+
+
+async def collect(stream):
+    """Split a generate_text_stream run into its text deltas and usage record."""
+    deltas = []
+    usage = None
+    async for event in stream:
+        if isinstance(event, GenerationUsage):
+            usage = event
+        else:
+            deltas.append(event)
+    return deltas, usage
+
+
+@pytest.fixture
+def service(tmp_path):
+    """Create a content service logging to a temporary directory."""
+    return ContentService(log_writer=ContentLogWriter(str(tmp_path)))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGenerateTextStream:
+    """Test generate_text_stream for each backend."""
+
+    async def test_anthropic(self, service, tmp_path):
+        """Test Anthropic deltas, usage and the content log."""
+        stream = MagicMock()
+        stream.text_stream = aiter(["Hello", ", ", "world"])
+        stream.get_final_message = AsyncMock(
+            return_value=SimpleNamespace(
+                usage=SimpleNamespace(input_tokens=12, output_tokens=3),
+                stop_reason="end_turn",
+            )
+        )
+        manager = MagicMock()
+        manager.__aenter__ = AsyncMock(return_value=stream)
+        manager.__aexit__ = AsyncMock(return_value=False)
+
+        with patch("artificial_u.services.content_service.anthropic_client") as client:
+            client.messages.stream.return_value = manager
+            deltas, usage = await collect(
+                service.generate_text_stream("Hi", model="claude-test", system_prompt="Be kind")
+            )
+
+        assert deltas == ["Hello", ", ", "world"]
+        assert usage.backend == "anthropic"
+        assert (usage.input_tokens, usage.output_tokens) == (12, 3)
+        assert usage.stop_reason == "end_turn"
+        assert usage.time_to_first_token is not None
+        assert client.messages.stream.call_args.kwargs["system"] == "Be kind"
+        service.log_writer.close()
+        [record] = iter_content_logs(str(tmp_path))
+        assert record["content"]["response"] == "Hello, world"
+        assert record["metadata"]["backend"] == "anthropic"
+
+    async def test_openai(self, service):
+        """Test OpenAI deltas and the trailing usage chunk."""
+
+        def chunk(content=None, finish_reason=None):
+            return SimpleNamespace(
+                choices=[
+                    SimpleNamespace(
+                        delta=SimpleNamespace(content=content), finish_reason=finish_reason
+                    )
+                ],
+                usage=None,
+            )
+
+        chunks = [
+            chunk("Hel"),
+            chunk("lo"),
+            chunk(finish_reason="length"),
+            SimpleNamespace(
+                choices=[], usage=SimpleNamespace(prompt_tokens=5, completion_tokens=2)
+            ),
+        ]
+        # Report the truncated response as is rather than continuing it
+        service.continuation.max_continuations = 0
+        with patch("artificial_u.services.content_service.openai_client") as client:
+            client.chat.completions.create = AsyncMock(return_value=aiter(chunks))
+            deltas, usage = await collect(service.generate_text_stream("Hi", model="gpt-test"))
+
+        assert deltas == ["Hel", "lo"]
+        assert (usage.input_tokens, usage.output_tokens) == (5, 2)
+        assert usage.stop_reason == "length"
+        assert client.chat.completions.create.call_args.kwargs["stream"] is True
+
+    async def test_gemini(self, service):
+        """Test Gemini deltas with cumulative usage metadata."""
+        finish = SimpleNamespace(name="STOP")
+        chunks = [
+            SimpleNamespace(
+                text="Bon",
+                candidates=[SimpleNamespace(finish_reason=None)],
+                usage_metadata=SimpleNamespace(prompt_token_count=4, candidates_token_count=1),
+            ),
+            SimpleNamespace(
+                text="jour",
+                candidates=[SimpleNamespace(finish_reason=finish)],
+                usage_metadata=SimpleNamespace(prompt_token_count=4, candidates_token_count=2),
+            ),
+        ]
+        with patch("artificial_u.services.content_service.gemini_client") as client:
+            client.aio.models.generate_content_stream = AsyncMock(return_value=aiter(chunks))
+            deltas, usage = await collect(service.generate_text_stream("Hi", model="gemini-test"))
+
+        assert deltas == ["Bon", "jour"]
+        assert (usage.input_tokens, usage.output_tokens) == (4, 2)
+        assert usage.stop_reason == "STOP"
+
+    async def test_ollama(self, service):
+        """Test Ollama deltas with counts from the final chunk."""
+        chunks = [
+            {"message": {"content": "Hal"}, "done": False},
+            {"message": {"content": "lo"}, "done": False},
+            {
+                "message": {"content": ""},
+                "done": True,
+                "done_reason": "stop",
+                "prompt_eval_count": 7,
+                "eval_count": 2,
+            },
+        ]
+        with patch("artificial_u.services.content_service.ollama_client") as client:
+            client.chat = AsyncMock(return_value=aiter(chunks))
+            deltas, usage = await collect(service.generate_text_stream("Hi", model="llama3"))
+
+        assert deltas == ["Hal", "lo"]
+        assert usage.backend == "ollama"
+        assert (usage.input_tokens, usage.output_tokens) == (7, 2)
+        assert usage.stop_reason == "stop"
+
+    async def test_rejects_image_models(self, service):
+        """Test that image models are rejected before any request is made."""
+        with pytest.raises(ValueError):
+            await collect(service.generate_text_stream("Hi", model="imagen-3"))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestResponseCaching:
+    """Test generate_text with the response cache enabled."""
+
+    async def test_repeated_prompt_served_from_cache(self, tmp_path):
+        """Test that identical requests reach the model once unless bypassed."""
+        service = ContentService(
+            response_cache=ResponseCache(str(tmp_path / "cache")),
+            log_writer=ContentLogWriter(str(tmp_path)),
+        )
+        service._generate_openai = AsyncMock(side_effect=["first", "second"])
+
+        assert await service.generate_text("Hi", model="gpt-test") == "first"
+        assert await service.generate_text("Hi", model="gpt-test", temperature=0.3) == "first"
+        assert await service.generate_text("Hi", model="gpt-test", temperature=0.9) == "second"
+        assert service._generate_openai.call_count == 2
+
+        service._generate_openai = AsyncMock(return_value="fresh")
+        assert await service.generate_text("Hi", model="gpt-test", use_cache=False) == "fresh"
+        assert await service.generate_text("Hi", model="gpt-test") == "fresh"
+        assert service.cache_stats()["hits"] == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_are_coalesced(service):
+    """Test that duplicate in-flight requests make one model call."""
+    release = asyncio.Event()
+
+    async def generate(*args):
+        await release.wait()
+        return "shared"
+
+    service._generate_openai = AsyncMock(side_effect=generate)
+    calls = [service.generate_text("Hi", model="gpt-test") for _ in range(3)]
+    calls.append(service.generate_text("Other", model="gpt-test"))
+    pending = asyncio.gather(*calls)
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await pending == ["shared"] * 4
+    assert service._generate_openai.call_count == 2
+    assert service.single_flight_stats()["coalesced"] == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_replay_backend_serves_every_model(tmp_path):
+    """Test that a replaying service never calls a model and does not re-log replays."""
+    recorded = ContentLogWriter(str(tmp_path / "recorded"))
+    recorded.write(
+        {
+            "metadata": {"backend": "anthropic", "model": "claude-test"},
+            "content": {"system_prompt": None, "prompt": "Hi", "response": "Hello there"},
+        }
+    )
+    recorded.close()
+    log_writer = ContentLogWriter(str(tmp_path / "logs"))
+    service = ContentService(
+        log_writer=log_writer, replay=ReplayBackend(str(tmp_path / "recorded"))
+    )
+    service._generate_anthropic = AsyncMock()
+
+    assert await service.generate_text("Hi", model="claude-test") == "Hello there"
+    deltas, usage = await collect(service.generate_text_stream("Hi", model="llama3"))
+
+    assert "".join(deltas) == "Hello there"
+    assert usage.backend == "replay"
+    service._generate_anthropic.assert_not_called()
+    assert log_writer.stats()["enqueued"] == 0
+    assert service.replay_stats()["exact_matches"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_fails_over_before_first_delta(service):
+    """Test that a stream failing to start is retried on the purpose's fallback model."""
+    service.router = ModelRouter(fallbacks={"lecture": ["llama3"]})
+
+    async def unavailable(*args):
+        raise RuntimeError("overloaded")
+        yield  # pragma: no cover
+
+    async def fallback(prompt, model, system_prompt, temperature, max_tokens, usage):
+        usage.output_tokens = 1
+        yield "Hallo"
+
+    service._stream_anthropic = unavailable
+    service._stream_ollama = fallback
+    deltas, usage = await collect(
+        service.generate_text_stream("Hi", model="claude-test", purpose="lecture")
+    )
+
+    assert deltas == ["Hallo"]
+    assert (usage.backend, usage.model) == ("ollama", "llama3")
+    assert service.routing_stats()["failovers"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_generate_text_records_usage(service, tmp_path):
+    """Test that provider token counts are aggregated by purpose and logged."""
+    response = SimpleNamespace(
+        content=[SimpleNamespace(text="Hello")],
+        usage=SimpleNamespace(input_tokens=1000, output_tokens=200),
+        stop_reason="end_turn",
+    )
+    service.usage_tracker.prices = {"claude-test": [3.0, 15.0]}
+    with patch("artificial_u.services.content_service.anthropic_client") as client:
+        client.messages.create = AsyncMock(return_value=response)
+        assert await service.generate_text("Hi", model="claude-test", purpose="lecture") == "Hello"
+
+    [group] = service.usage_stats()["groups"]
+    assert (group["purpose"], group["input_tokens"], group["output_tokens"]) == (
+        "lecture",
+        1000,
+        200,
+    )
+    assert group["cost"] == pytest.approx(0.006)
+
+    service.log_writer.close()
+    [record] = iter_content_logs(str(tmp_path))
+    assert record["metadata"]["purpose"] == "lecture"
+    assert record["metadata"]["usage"]["cost"] == pytest.approx(0.006)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_anthropic_prompt_prefix_is_cached(service):
+    """Test that the prompt prefix is sent as a cache breakpoint and cache reads are counted."""
+    response = SimpleNamespace(
+        content=[SimpleNamespace(text="Lecture")],
+        usage=SimpleNamespace(
+            input_tokens=50,
+            output_tokens=10,
+            cache_read_input_tokens=1500,
+            cache_creation_input_tokens=0,
+        ),
+        stop_reason="end_turn",
+    )
+    with patch("artificial_u.services.content_service.anthropic_client") as client:
+        client.messages.create = AsyncMock(return_value=response)
+        await service.generate_text(
+            "Static preamble. Per-lecture part.",
+            model="claude-test",
+            purpose="lecture",
+            prompt_prefix="Static preamble.",
+        )
+
+    [message] = client.messages.create.call_args.kwargs["messages"]
+    assert message["content"] == [
+        {"type": "text", "text": "Static preamble.", "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": " Per-lecture part."},
+    ]
+    [group] = service.usage_stats()["groups"]
+    assert (group["input_tokens"], group["cache_read_tokens"]) == (1550, 1500)
+    assert group["prompt_cache_hit_rate"] == pytest.approx(1500 / 1550)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_truncated_response_is_continued(service):
+    """Test that a response cut off at max_tokens is continued and stitched."""
+    rounds = [
+        ("<output><lecture>The cell is the basic", "max_tokens"),
+        (" unit.</lecture></output>", "end_turn"),
+    ]
+
+    async def generate(prompt, model, system_prompt, temperature, max_tokens, usage):
+        text, usage.stop_reason = rounds.pop(0)
+        usage.output_tokens = 10
+        return text
+
+    service._generate_anthropic = AsyncMock(side_effect=generate)
+    response = await service.generate_text("Lecture please", model="claude-test", purpose="lecture")
+
+    assert response == "<output><lecture>The cell is the basic unit.</lecture></output>"
+    first, second = service._generate_anthropic.call_args_list
+    assert first.args[4] == 4096
+    assert second.args[0].startswith("Lecture please")
+    assert "The cell is the basic" in second.args[0]
+    assert service.continuation_stats()["completed"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_truncated_stream_is_continued(service):
+    """Test that a truncated stream continues without repeats and totals its usage."""
+    rounds = [
+        (["The mitochondria ", "is the power"], "length"),
+        (["mitochondria is the powerhouse."], "stop"),
+    ]
+
+    async def stream(prompt, model, system_prompt, temperature, max_tokens, usage):
+        deltas, usage.stop_reason = rounds.pop(0)
+        usage.output_tokens = len(deltas)
+        for delta in deltas:
+            yield delta
+
+    service._stream_ollama = stream
+    deltas, usage = await collect(service.generate_text_stream("Hi", model="llama3"))
+
+    assert "".join(deltas) == "The mitochondria is the powerhouse."
+    assert (usage.output_tokens, usage.stop_reason) == (3, "stop")
+    assert service.continuation_stats()["continuations"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_truncated_gemini_response_is_continued(service):
+    """Test that a Gemini response stopped at MAX_TOKENS is continued."""
+
+    def response(text, reason):
+        return SimpleNamespace(
+            candidates=[
+                SimpleNamespace(
+                    finish_reason=SimpleNamespace(name=reason),
+                    content=SimpleNamespace(parts=[SimpleNamespace(text=text)]),
+                )
+            ],
+            usage_metadata=SimpleNamespace(prompt_token_count=4, candidates_token_count=10),
+        )
+
+    with patch("artificial_u.services.content_service.gemini_client") as client:
+        client.aio.models.generate_content = AsyncMock(
+            side_effect=[
+                response("<lecture>The cell is the basic", "MAX_TOKENS"),
+                response(" unit.</lecture>", "STOP"),
+            ]
+        )
+        text = await service.generate_text("Lecture please", model="gemini-test")
+
+    assert text == "<lecture>The cell is the basic unit.</lecture>"
+    assert client.aio.models.generate_content.await_count == 2
+    assert service.continuation_stats()["completed"] == 1
@@ -0,0 +1,188 @@
+"""
+Unit tests for generating a lecture and its audio together.
+"""
+
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from artificial_u.audio.speech_processor import SpeechProcessor
+from artificial_u.models.core import Lecture
+from artificial_u.services.audio_service import AudioService
+from artificial_u.services.tts_service import TTSService
+from artificial_u.utils import AudioProcessingError
+
+PARAGRAPHS = [
+    "Welcome to the first lecture of the course.",
+    "Today we look at how search algorithms work.",
+    "Next week we will move on to planning.",
+]
+
+
+def make_audio_service(log, upload_result=None):
+    """Create an AudioService whose lecture text streams one paragraph at a time."""
+
+    async def generate_lecture_stream(partial_attributes):
+        yield {"event": "progress", "data": {"stage": "generating"}}
+        for paragraph in PARAGRAPHS:
+            log.append("text")
+            yield {"event": "content", "data": {"text": paragraph + "\n\n"}}
+            await asyncio.sleep(0.02)
+        yield {
+            "event": "lecture",
+            "data": {"course_id": 1, "topic_id": 3, "content": "\n\n".join(PARAGRAPHS)},
+        }
+
+    async def text_to_speech(text, **kwargs):
+        log.append("audio")
+        return text.encode()
+
+    async def upload_audio_stream(chunks, object_name, content_type="audio/mpeg"):
+        uploaded = [chunk async for chunk in chunks]
+        log.append(b"".join(uploaded))
+        return upload_result or (True, f"http://storage/{object_name}")
+
+    repository_factory = MagicMock()
+    repository_factory.course.get.return_value = SimpleNamespace(id=1, code="CS101", professor_id=2)
+    repository_factory.topic.get.return_value = SimpleNamespace(id=3, course_id=1, week=1, order=2)
+    repository_factory.professor.get.return_value = SimpleNamespace(id=2, voice_id=5)
+    repository_factory.voice.get.return_value = SimpleNamespace(el_voice_id="v", name="Voice")
+
+    lecture_service = MagicMock()
+    lecture_service.generate_lecture_stream = generate_lecture_stream
+    lecture_service.create_lecture.side_effect = lambda **kwargs: Lecture(id=9, **kwargs)
+    lecture_service.update_course_summary = AsyncMock()
+
+    async_client = MagicMock()
+    async_client.text_to_speech = AsyncMock(side_effect=text_to_speech)
+    tts_service = TTSService(
+        client=MagicMock(),
+        async_client=async_client,
+        speech_processor=SpeechProcessor(),
+        max_concurrency=2,
+    )
+
+    storage_service = MagicMock()
+    storage_service.generate_audio_key.side_effect = (
+        lambda course_id, week_number, lecture_order, extension="mp3": (
+            f"{course_id}/week{week_number}/lecture{lecture_order}.{extension}"
+        )
+    )
+    storage_service.upload_audio_stream = upload_audio_stream
+    storage_service.upload_audio_file = AsyncMock(
+        side_effect=lambda data, object_name, content_type: (True, f"http://storage/{object_name}")
+    )
+
+    service = AudioService(
+        repository_factory=repository_factory,
+        tts_service=tts_service,
+        storage_service=storage_service,
+        lecture_service=lecture_service,
+    )
+    service.FIRST_CHUNK_SIZE = 10
+    service.MAX_CHUNK_SIZE = 60
+    return service, lecture_service, storage_service
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGenerateLectureWithAudio:
+    """Test the overlapped lecture text and audio pipeline."""
+
+    async def test_synthesizes_audio_before_text_is_finished(self):
+        """Test that audio starts while text streams and the lecture is saved with it."""
+        log = []
+        service, lecture_service, _ = make_audio_service(log)
+
+        events = [event async for event in service.generate_lecture_with_audio({"course_id": 1})]
+
+        last_text = max(i for i, entry in enumerate(log) if entry == "text")
+        assert log.index("audio") < last_text
+        assert log[-1] == b"".join(paragraph.encode() for paragraph in PARAGRAPHS)
+        audio_chunks = [event["data"]["chunk"] for event in events if event["event"] == "audio"]
+        assert audio_chunks == [1, 2, 3]
+        assert events[-1]["event"] == "lecture"
+        assert events[-1]["data"]["audio_url"] == "http://storage/CS101/week1/lecture2.mp3"
+        await service.wait_for_background_tasks()
+        lecture_service.update_course_summary.assert_awaited_once()
+
+    async def test_lecture_is_yielded_before_course_summary_update(self):
+        """Test that a slow course summary update does not hold back the lecture event."""
+        service, lecture_service, _ = make_audio_service([])
+        release = asyncio.Event()
+
+        async def update_course_summary(lecture):
+            await release.wait()
+
+        lecture_service.update_course_summary.side_effect = update_course_summary
+
+        async def first_lecture_event():
+            async for event in service.generate_lecture_with_audio({"course_id": 1}):
+                if event["event"] == "lecture":
+                    return event
+
+        event = await asyncio.wait_for(first_lecture_event(), 1)
+
+        assert event["data"]["id"] == 9
+        release.set()
+        await asyncio.wait_for(service.wait_for_background_tasks(), 1)
+        lecture_service.update_course_summary.assert_awaited_once()
+
+    async def test_database_calls_run_off_the_event_loop(self):
+        """Test that the entity lookups and the lecture save don't block the pipeline's loop."""
+        service, lecture_service, _ = make_audio_service([])
+        repository_factory = service.repository_factory
+        threads = []
+
+        def recorded(mock):
+            respond = mock.side_effect or (lambda *args, **kwargs: mock.return_value)
+
+            def record(*args, **kwargs):
+                threads.append(threading.get_ident())
+                return respond(*args, **kwargs)
+
+            mock.side_effect = record
+
+        for mock in (
+            repository_factory.course.get,
+            repository_factory.topic.get,
+            repository_factory.professor.get,
+            repository_factory.voice.get,
+            lecture_service.create_lecture,
+        ):
+            recorded(mock)
+
+        events = [event async for event in service.generate_lecture_with_audio({"course_id": 1})]
+
+        assert events[-1]["data"]["id"] == 9
+        assert len(threads) == 5 and threading.get_ident() not in threads
+
+    async def test_failed_upload_does_not_save_lecture(self):
+        """Test that the lecture is not saved when its audio cannot be stored."""
+        service, lecture_service, _ = make_audio_service([], upload_result=(False, None))
+
+        with pytest.raises(AudioProcessingError, match="upload"):
+            async for _ in service.generate_lecture_with_audio({"course_id": 1}):
+                pass
+
+        lecture_service.create_lecture.assert_not_called()
+
+    async def test_stores_chunk_manifest(self):
+        """Test that the manifest maps each chunk to its paragraph and byte range."""
+        service, lecture_service, storage_service = make_audio_service([])
+
+        events = [event async for event in service.generate_lecture_with_audio({"course_id": 1})]
+
+        assert (
+            events[-1]["data"]["audio_manifest_url"] == "http://storage/CS101/week1/lecture2.json"
+        )
+        data = storage_service.upload_audio_file.call_args.args[0]
+        chunks = json.loads(data)["chunks"]
+        content = "\n\n".join(PARAGRAPHS)
+        assert [content[c["text_start"] : c["text_end"]] for c in chunks] == PARAGRAPHS
+        offsets = [0, len(PARAGRAPHS[0]), len(PARAGRAPHS[0]) + len(PARAGRAPHS[1])]
+        assert [c["byte_offset"] for c in chunks] == offsets
@@ -0,0 +1,170 @@
+"""
+Unit tests for generating every lecture of a course in one batch.
+"""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from artificial_u.models.core import Course, Lecture, LectureGenerationContext, Topic
+from artificial_u.services.lecture_service import LectureService
+
+RESPONSE = "<lecture><content>{title} lecture.</content></lecture>"
+
+
+def make_batch_service(topics, lectures=(), fail_titles=()):
+    """Create a LectureService over the given topics whose model echoes each topic title."""
+    repository_factory = MagicMock()
+    repository_factory.lecture.get_generation_context.return_value = LectureGenerationContext(
+        course=Course(id=1, code="CS101", title="Intro"), topics=topics, lectures=list(lectures)
+    )
+    saved = []
+
+    def create(lecture):
+        lecture = lecture.model_copy(update={"id": 100 + len(saved)})
+        saved.append(lecture)
+        return lecture
+
+    repository_factory.lecture.create.side_effect = create
+    repository_factory.topic.get.side_effect = lambda topic_id: next(
+        (t for t in topics if t.id == topic_id), None
+    )
+    stored = {"summary": None}
+
+    def swap_lecture_summary(course_id, previous, summary):
+        if stored["summary"] != previous:
+            return False
+        stored["summary"] = summary
+        return True
+
+    repository_factory.course.get_with_lecture_summary.side_effect = lambda course_id: (
+        Course(id=1, code="CS101", title="Intro"),
+        stored["summary"],
+    )
+    repository_factory.course.swap_lecture_summary.side_effect = swap_lecture_summary
+
+    service = LectureService(
+        content_service=MagicMock(),
+        course_service=MagicMock(),
+        professor_service=MagicMock(),
+        repository_factory=repository_factory,
+    )
+    service.calls = []
+    service.running = 0
+    service.max_running = 0
+
+    async def generate(prompt_args):
+        title = prompt_args["topic_data"]["title"]
+        service.calls.append(prompt_args)
+        service.running += 1
+        service.max_running = max(service.max_running, service.running)
+        await asyncio.sleep(0.01)
+        service.running -= 1
+        if title in fail_titles:
+            raise ValueError(f"model failed on {title}")
+        return RESPONSE.format(title=title)
+
+    service._generate_and_parse_content = generate
+    return service, saved
+
+
+def topic(topic_id, week, order):
+    """Create a topic of course 1."""
+    return Topic(id=topic_id, title=f"W{week}.{order}", week=week, order=order, course_id=1)
+
+
+async def collect(stream):
+    """Collect every event from an async iterator."""
+    return [event async for event in stream]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGenerateCourseLectures:
+    """Test LectureService.generate_course_lectures."""
+
+    async def test_weeks_in_order_lectures_in_parallel(self):
+        """Test that a week's lectures run concurrently and see only earlier weeks."""
+        topics = [topic(1, 1, 1), topic(2, 1, 2), topic(3, 1, 3), topic(4, 2, 1)]
+        service, saved = make_batch_service(topics)
+
+        events = await collect(service.generate_course_lectures(1, concurrency=2))
+
+        assert service.max_running == 2
+        assert [lecture.topic_id for lecture in saved[3:]] == [4]
+        week_two = service.calls[-1]
+        assert week_two["topic_data"]["title"] == "W2.1"
+        assert sorted(e["title"] for e in week_two["existing_lectures"]) == [
+            "W1.1",
+            "W1.2",
+            "W1.3",
+        ]
+        assert all(call["existing_lectures"] == [] for call in service.calls[:3])
+        assert saved[0].content.strip().endswith("lecture.")
+        assert events[-1] == {
+            "event": "complete",
+            "data": {"generated": 4, "failed": 0, "skipped": 0},
+        }
+
+    async def test_skips_generated_topics_and_reports_failures(self):
+        """Test resuming a batch: existing lectures are context, failures don't stop it."""
+        topics = [topic(1, 1, 1), topic(2, 2, 1), topic(3, 3, 1)]
+        existing = [Lecture(id=7, course_id=1, topic_id=1, summary="Basics")]
+        service, saved = make_batch_service(topics, existing, fail_titles={"W2.1"})
+
+        events = await collect(service.generate_course_lectures(1))
+
+        assert events[0]["data"] == {
+            "stage": "scheduled",
+            "total": 2,
+            "skipped": 1,
+            "weeks": [2, 3],
+        }
+        errors = [e["data"] for e in events if e["event"] == "error"]
+        assert [(e["topic_id"], "W2.1" in e["detail"]) for e in errors] == [(2, True)]
+        assert [lecture.topic_id for lecture in saved] == [3]
+        assert service.calls[-1]["existing_lectures"] == [
+            {"title": "W1.1", "week": 1, "order": 1, "summary": "Basics"}
+        ]
+        assert events[-1]["data"] == {"generated": 1, "failed": 1, "skipped": 1}
+
+    async def test_database_calls_run_off_the_event_loop(self):
+        """Test that loading the schedule and saving lectures don't block the event loop."""
+        service, saved = make_batch_service([topic(1, 1, 1), topic(2, 1, 2)])
+        repository = service.repository_factory.lecture
+        context = repository.get_generation_context.return_value
+        create = repository.create.side_effect
+        threads = []
+
+        def record(result):
+            threads.append(threading.get_ident())
+            return result
+
+        repository.get_generation_context.side_effect = lambda course_id: record(context)
+        repository.create.side_effect = lambda lecture: record(create(lecture))
+
+        await collect(service.generate_course_lectures(1))
+
+        assert len(saved) == 2 and len(threads) == 3
+        assert threading.get_ident() not in threads
+
+    async def test_course_summary_is_updated_as_lectures_are_saved(self):
+        """Test that each saved lecture updates the summary the next week's prompts use."""
+        topics = [topic(1, 1, 1), topic(2, 1, 2), topic(3, 2, 1)]
+        service, saved = make_batch_service(topics)
+        summaries = []
+
+        async def summarize(**kwargs):
+            summaries.append(kwargs["prompt"])
+            return f"<course_summary>After {len(summaries)} lectures</course_summary>"
+
+        service.content_service.generate_text = summarize
+
+        await collect(service.generate_course_lectures(1))
+
+        assert len(summaries) == 3
+        assert service.calls[-1]["course_summary"] == "After 2 lectures"
+        swap = service.repository_factory.course.swap_lecture_summary
+        assert swap.call_args_list[-1].args == (1, "After 2 lectures", "After 3 lectures")
@@ -0,0 +1,273 @@
+"""
+Unit tests for loading the lecture generation context.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from artificial_u.models.core import (
+    Course,
+    Lecture,
+    LectureGenerationContext,
+    Professor,
+    Topic,
+)
+from artificial_u.services.lecture_service import LectureService
+from artificial_u.utils import DatabaseError
+
+
+@pytest.fixture
+def service():
+    """Create a LectureService whose repository returns a two-topic course."""
+    repository_factory = MagicMock()
+    repository_factory.lecture.get_generation_context.return_value = LectureGenerationContext(
+        course=Course(id=1, code="CS101", title="Intro", professor_id=5),
+        professor=Professor(id=5, name="Dr. Chen"),
+        topics=[
+            Topic(id=10, title="Bits", week=1, order=1, course_id=1),
+            Topic(id=11, title="Bytes", week=2, order=1, course_id=1),
+        ],
+        lectures=[Lecture(id=3, course_id=1, topic_id=10, revision=1, summary="On bits")],
+        course_summary="Bits so far",
+    )
+    return LectureService(
+        content_service=MagicMock(),
+        course_service=MagicMock(),
+        professor_service=MagicMock(),
+        repository_factory=repository_factory,
+        topic_service=MagicMock(),
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_context_is_loaded_with_one_repository_call(service):
+    """Test that course, professor, topics and lecture summaries come from one lookup."""
+    course, professor, topic, existing, topics, summary = (
+        await service._process_models_for_generation({"course_id": 1, "topic_id": 11})
+    )
+
+    assert (course["code"], professor["name"], topic["title"]) == ("CS101", "Dr. Chen", "Bytes")
+    assert existing == [{"title": "Bits", "week": 1, "order": 1, "summary": "On bits"}]
+    assert [t["title"] for t in topics] == ["Bits", "Bytes"]
+    assert summary == "Bits so far"
+    service.repository_factory.lecture.get_generation_context.assert_called_once_with(1)
+    service.repository_factory.lecture.list_by_course.assert_not_called()
+    service.course_service.get_course.assert_not_called()
+    assert not service.topic_service.method_calls
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_topic_of_another_course_is_rejected(service):
+    """Test that a topic outside the course's context is an error."""
+    with pytest.raises(DatabaseError):
+        await service._process_models_for_generation({"course_id": 1, "topic_id": 99})
+
+    service.repository_factory.lecture.get_generation_context.return_value = None
+    with pytest.raises(DatabaseError):
+        await service._process_models_for_generation({"course_id": 2, "topic_id": 10})
+
+
+def store_summary(service, summary):
+    """Back the course repository's summary methods with an in-memory summary."""
+    stored = {"summary": summary}
+    course = service.repository_factory.course
+
+    def swap_lecture_summary(course_id, previous, summary):
+        if stored["summary"] != previous:
+            return False
+        stored["summary"] = summary
+        return True
+
+    course.get_with_lecture_summary.side_effect = lambda course_id: (
+        Course(id=1, code="CS101", title="Intro", professor_id=5),
+        stored["summary"],
+    )
+    course.swap_lecture_summary.side_effect = swap_lecture_summary
+    service.repository_factory.topic.get.return_value = Topic(
+        id=11, title="Bytes", week=2, order=1, course_id=1
+    )
+    return stored
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_update_course_summary_folds_in_the_lecture(service):
+    """Test that a saved lecture is folded into the stored course summary."""
+    stored = store_summary(service, "Bits so far")
+    service.content_service.generate_text = AsyncMock(
+        return_value="<course_summary>Bits, then bytes.</course_summary>"
+    )
+    lecture = Lecture(id=4, course_id=1, topic_id=11, revision=1, content="Eight bits.")
+
+    assert await service.update_course_summary(lecture) == "Bits, then bytes."
+
+    call = service.content_service.generate_text.call_args.kwargs
+    assert call["purpose"] == "course_summary"
+    assert "Bits so far" in call["prompt"] and "Eight bits." in call["prompt"]
+    assert "lecture 1: Bytes" in call["prompt"]
+    assert stored["summary"] == "Bits, then bytes."
+    service.repository_factory.lecture.get_generation_context.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_update_course_summary_failure_is_not_raised(service):
+    """Test that a failed summary update leaves the stored summary alone."""
+    store_summary(service, "Bits so far")
+    service.content_service.generate_text = AsyncMock(return_value="no summary here")
+    lecture = Lecture(id=4, course_id=1, topic_id=11, revision=1, content="Eight bits.")
+
+    assert await service.update_course_summary(lecture) is None
+    service.repository_factory.course.swap_lecture_summary.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_summary_updates_are_not_lost(service):
+    """Test that concurrent updates of a course each build on the other's summary."""
+    stored = store_summary(service, None)
+
+    async def summarize(prompt, **kwargs):
+        await asyncio.sleep(0.01)
+        covered = [name for name in ("first", "second") if name in prompt]
+        return f"<course_summary>Covers {' and '.join(covered)}</course_summary>"
+
+    service.content_service.generate_text = summarize
+    lectures = [
+        Lecture(id=i, course_id=1, topic_id=11, revision=1, content=f"The {name} lecture.")
+        for i, name in enumerate(("first", "second"))
+    ]
+
+    await asyncio.gather(*(service.update_course_summary(lecture) for lecture in lectures))
+
+    assert stored["summary"] == "Covers first and second"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_summary_updates_are_serialized_across_services(service):
+    """Test that two services of the process (as built per API request) share course locks."""
+    stored = store_summary(service, None)
+    other = LectureService(
+        content_service=service.content_service,
+        course_service=MagicMock(),
+        professor_service=MagicMock(),
+        repository_factory=service.repository_factory,
+    )
+    prompts = []
+
+    async def summarize(prompt, **kwargs):
+        prompts.append(prompt)
+        await asyncio.sleep(0.01)
+        covered = [name for name in ("first", "second") if name in prompt]
+        return f"<course_summary>Covers {' and '.join(covered)}</course_summary>"
+
+    service.content_service.generate_text = summarize
+    first, second = (
+        Lecture(id=i, course_id=1, topic_id=11, revision=1, content=f"The {name} lecture.")
+        for i, name in enumerate(("first", "second"))
+    )
+
+    await asyncio.gather(service.update_course_summary(first), other.update_course_summary(second))
+
+    assert stored["summary"] == "Covers first and second"
+    assert len(prompts) == 2  # no fold was wasted on a compare-and-swap miss
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_lecture_saved_into_course_without_summary_rebuilds_it(service):
+    """Test that a course with older lectures but no summary is rebuilt, not folded from None."""
+    stored = store_summary(service, None)
+    repository = service.repository_factory
+    lecture = Lecture(id=4, course_id=1, topic_id=11, revision=1, summary="On bytes")
+    repository.lecture.list_by_course.return_value = [
+        Lecture(id=3, course_id=1, topic_id=10, revision=1, summary="On bits"),
+        lecture,
+    ]
+    repository.lecture.get_generation_context.return_value.lectures = [
+        Lecture(id=3, course_id=1, topic_id=10, revision=1, summary="On bits"),
+        lecture,
+    ]
+    prompts = []
+
+    async def summarize(prompt, **kwargs):
+        prompts.append(prompt)
+        return f"<course_summary>Summary {len(prompts)}</course_summary>"
+
+    service.content_service.generate_text = summarize
+
+    assert await service.update_course_summary(lecture) == "Summary 2"
+    assert "On bits" in prompts[0] and "<no_existing_lectures />" in prompts[0]
+    assert "Summary 1" in prompts[1] and "On bytes" in prompts[1]
+    assert stored["summary"] == "Summary 2"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_summary_changed_elsewhere_is_rebuilt_on(service):
+    """Test that a summary written by another process is folded into, not overwritten."""
+    stored = store_summary(service, "Bits so far")
+    prompts = []
+
+    async def summarize(prompt, **kwargs):
+        prompts.append(prompt)
+        if len(prompts) == 1:
+            stored["summary"] = "Bits and nibbles"  # another worker's update lands meanwhile
+        return "<course_summary>Bytes too</course_summary>"
+
+    service.content_service.generate_text = summarize
+    lecture = Lecture(id=4, course_id=1, topic_id=11, revision=1, content="Eight bits.")
+
+    assert await service.update_course_summary(lecture) == "Bytes too"
+    assert len(prompts) == 2
+    assert "Bits and nibbles" in prompts[1]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_rebuild_course_summary_folds_latest_revisions(service):
+    """Test that a rebuild folds each topic's latest lecture from scratch."""
+    stored = store_summary(service, None)
+    service.repository_factory.lecture.get_generation_context.return_value.lectures = [
+        Lecture(id=3, course_id=1, topic_id=10, revision=1, summary="Old bits"),
+        Lecture(id=5, course_id=1, topic_id=10, revision=2, summary="New bits"),
+        Lecture(id=6, course_id=1, topic_id=11, revision=1, summary="Bytes"),
+    ]
+    prompts = []
+
+    async def summarize(prompt, **kwargs):
+        prompts.append(prompt)
+        return f"<course_summary>Summary {len(prompts)}</course_summary>"
+
+    service.content_service.generate_text = summarize
+
+    assert await service.rebuild_course_summary(1) == "Summary 2"
+    assert "New bits" in prompts[0] and "Old bits" not in prompts[0]
+    assert "<no_existing_lectures />" in prompts[0]
+    assert "Summary 1" in prompts[1] and "Bytes" in prompts[1]
+    assert stored["summary"] == "Summary 2"
+
+
+@pytest.mark.unit
+def test_editing_or_deleting_a_lecture_clears_the_summary(service):
+    """Test that changes to a lecture's text clear its course summary, others don't."""
+    lecture = Lecture(id=4, course_id=1, topic_id=11, revision=1, content="Eight bits.")
+    repository = service.repository_factory
+    repository.lecture.get.return_value = lecture
+    repository.lecture.update.side_effect = lambda lecture: lecture
+    repository.lecture.delete.return_value = True
+
+    service.update_lecture(4, {"audio_url": "http://storage/lecture.mp3"})
+    repository.course.update_lecture_summary.assert_not_called()
+
+    service.update_lecture(4, {"content": "Eight bits make a byte."})
+    repository.course.update_lecture_summary.assert_called_once_with(1, None)
+
+    repository.course.update_lecture_summary.reset_mock()
+    assert service.delete_lecture(4)
+    repository.course.update_lecture_summary.assert_called_once_with(1, None)
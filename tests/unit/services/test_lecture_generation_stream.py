@@ -0,0 +1,175 @@
+"""
+Unit tests for streamed lecture generation and its SSE encoding.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from artificial_u.api.models.lectures import LectureGenerate
+from artificial_u.api.services.lecture_service import LectureApiService
+from artificial_u.services.content_service import GenerationUsage
+from artificial_u.services.lecture_service import LectureService
+from artificial_u.utils import ContentGenerationError
+
+RESPONSE = (
+    "<thinking>Outline first.</thinking>\n<output>\n<lecture>\n"
+    "<content>\nWelcome to week one.\nToday we cover search.\n</content>\n"
+    "</lecture>\n</output>"
+)
+
+
+def make_lecture_service(deltas):
+    """Create a core LectureService whose content service streams the given deltas."""
+
+    async def generate_text_stream(**kwargs):
+        for delta in deltas:
+            yield delta
+        yield GenerationUsage(backend="anthropic", model="claude-test", output_tokens=20)
+
+    content_service = MagicMock()
+    content_service.generate_text_stream = generate_text_stream
+    service = LectureService(
+        content_service=content_service,
+        course_service=MagicMock(),
+        professor_service=MagicMock(),
+        repository_factory=MagicMock(),
+    )
+    service._load_prompt_arguments = AsyncMock(return_value={})
+    return service
+
+
+async def collect(stream):
+    """Collect every item from an async iterator."""
+    return [item async for item in stream]
+
+
+def parse_sse(messages):
+    """Decode SSE messages into (event, data) pairs, skipping comments."""
+    events = []
+    for message in messages:
+        if message.startswith(":"):
+            continue
+        event_line, data_line = message.strip().split("\n")
+        events.append((event_line[len("event: ") :], json.loads(data_line[len("data: ") :])))
+    return events
+
+
+@pytest.fixture(autouse=True)
+def prompts(monkeypatch):
+    """Stub prompt construction, which is covered by the prompt tests."""
+    monkeypatch.setattr(
+        "artificial_u.services.lecture_service.get_lecture_prompt_parts",
+        lambda **kwargs: ("prefix ", "prompt"),
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGenerateLectureStream:
+    """Test LectureService.generate_lecture_stream events."""
+
+    async def test_streams_content_then_lecture(self):
+        """Test that content text streams before the final lecture event."""
+        deltas = [RESPONSE[i : i + 5] for i in range(0, len(RESPONSE), 5)]
+        service = make_lecture_service(deltas)
+
+        events = await collect(
+            service.generate_lecture_stream({"course_id": 1, "topic_id": 2, "revision": 1})
+        )
+
+        stages = [e["data"]["stage"] for e in events if e["event"] == "progress"]
+        assert stages == ["loading_context", "generating", "parsing"]
+        assert events[-2]["data"]["usage"]["output_tokens"] == 20
+
+        streamed = "".join(e["data"]["text"] for e in events if e["event"] == "content")
+        assert streamed == "Welcome to week one.\nToday we cover search."
+        assert events[-1] == {
+            "event": "lecture",
+            "data": {
+                "course_id": 1,
+                "topic_id": 2,
+                "revision": 1,
+                "content": streamed,
+                "summary": None,
+            },
+        }
+
+    async def test_unparseable_response_raises(self):
+        """Test that a response without lecture XML raises ContentGenerationError."""
+        service = make_lecture_service(["no xml here"])
+
+        with pytest.raises(ContentGenerationError):
+            await collect(service.generate_lecture_stream({"course_id": 1, "topic_id": 2}))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLectureApiServiceStream:
+    """Test LectureApiService.generate_lecture_stream SSE encoding."""
+
+    def make_api_service(self, events):
+        """Create an API service whose core service yields the given events."""
+        api_service = LectureApiService(
+            content_service=MagicMock(),
+            course_service=MagicMock(),
+            professor_service=MagicMock(),
+            repository_factory=MagicMock(),
+            storage_service=MagicMock(),
+            async_repository_factory=MagicMock(),
+        )
+
+        async def generate_lecture_stream(partial_attributes):
+            for event in events:
+                if isinstance(event, Exception):
+                    raise event
+                if isinstance(event, float):
+                    await asyncio.sleep(event)
+                    continue
+                yield event
+
+        api_service.core_service.generate_lecture_stream = generate_lecture_stream
+        return api_service
+
+    async def test_encodes_events_and_final_lecture(self):
+        """Test that events are SSE-encoded and the lecture matches the API model."""
+        lecture = {"course_id": 1, "topic_id": 2, "revision": 1, "content": "Hi"}
+        api_service = self.make_api_service(
+            [
+                {"event": "content", "data": {"text": "Hi"}},
+                {"event": "lecture", "data": lecture},
+            ]
+        )
+
+        messages = await collect(api_service.generate_lecture_stream(LectureGenerate()))
+        events = parse_sse(messages)
+
+        assert events[0] == ("content", {"text": "Hi"})
+        assert events[1][0] == "lecture"
+        assert events[1][1]["id"] == -1
+        assert events[1][1]["content"] == "Hi"
+
+    async def test_reports_errors_as_events(self):
+        """Test that generation failures become an error event."""
+        api_service = self.make_api_service(
+            [{"event": "progress", "data": {}}, ContentGenerationError("bad xml")]
+        )
+
+        events = parse_sse(await collect(api_service.generate_lecture_stream(LectureGenerate())))
+
+        assert events[-1][0] == "error"
+        assert "bad xml" in events[-1][1]["detail"]
+
+    async def test_sends_heartbeat_while_silent(self, monkeypatch):
+        """Test that keep-alive comments are sent while the model is silent."""
+        monkeypatch.setattr(
+            "artificial_u.api.services.lecture_service.SSE_HEARTBEAT_INTERVAL", 0.01
+        )
+        api_service = self.make_api_service([0.05, {"event": "content", "data": {"text": "x"}}])
+
+        messages = await collect(api_service.generate_lecture_stream(LectureGenerate()))
+
+        assert messages[0] == ": keep-alive\n\n"
+        assert parse_sse(messages) == [("content", {"text": "x"})]
@@ -0,0 +1,83 @@
+"""
+Unit tests for StorageService streamed uploads.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from artificial_u.services.storage_service import StorageService
+
+
+def make_service(part_size=4):
+    """Create a StorageService with a mock S3 client and a small part size."""
+    client = MagicMock()
+    client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+    client.upload_part.side_effect = lambda **kwargs: {"ETag": f"etag-{kwargs['PartNumber']}"}
+    with patch.object(StorageService, "_get_s3_client", return_value=client):
+        service = StorageService()
+    service.part_size = part_size
+    return service, client
+
+
+async def stream(*chunks, error=None):
+    """Yield the given chunks, then raise the given error if any."""
+    for chunk in chunks:
+        yield chunk
+    if error:
+        raise error
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestUploadStream:
+    """Test multipart uploads of streamed data."""
+
+    async def test_uploads_parts_of_the_configured_size(self):
+        """Test that chunks are regrouped into full parts plus a final remainder."""
+        service, client = make_service(part_size=4)
+
+        success, url = await service.upload_audio_stream(stream(b"ab", b"cdef", b"gh", b"i"), "k")
+
+        assert success and url
+        bodies = [call.kwargs["Body"] for call in client.upload_part.call_args_list]
+        assert bodies == [b"abcdef", b"ghi"]
+        parts = client.complete_multipart_upload.call_args.kwargs["MultipartUpload"]["Parts"]
+        assert parts == [
+            {"PartNumber": 1, "ETag": "etag-1"},
+            {"PartNumber": 2, "ETag": "etag-2"},
+        ]
+        client.put_object.assert_not_called()
+
+    async def test_small_stream_uses_single_put(self):
+        """Test that a stream shorter than one part skips the multipart upload."""
+        service, client = make_service(part_size=4)
+
+        success, _ = await service.upload_audio_stream(stream(b"ab"), "k")
+
+        assert success
+        assert client.put_object.call_args.kwargs["Body"] == b"ab"
+        assert client.put_object.call_args.kwargs["ContentType"] == "audio/mpeg"
+        client.create_multipart_upload.assert_not_called()
+
+    async def test_aborts_when_the_stream_fails(self):
+        """Test that a failing source aborts the upload and its error propagates."""
+        service, client = make_service(part_size=4)
+
+        with pytest.raises(RuntimeError, match="tts"):
+            await service.upload_audio_stream(
+                stream(b"abcd", b"ef", error=RuntimeError("tts")), "k"
+            )
+
+        client.abort_multipart_upload.assert_called_once_with(
+            Bucket=service.audio_bucket, Key="k", UploadId="upload-1"
+        )
+        client.complete_multipart_upload.assert_not_called()
+
+    async def test_aborts_when_a_part_fails(self):
+        """Test that a storage error aborts the upload and reports failure."""
+        service, client = make_service(part_size=4)
+        client.upload_part.side_effect = RuntimeError("storage down")
+
+        assert await service.upload_audio_stream(stream(b"abcd", b"efgh"), "k") == (False, None)
+        client.abort_multipart_upload.assert_called_once()
@@ -0,0 +1,244 @@
+"""
+Unit tests for TTSService chunk synthesis.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from artificial_u.audio.chunk_cache import ChunkAudioCache
+from artificial_u.audio.speech_processor import SpeechProcessor
+from artificial_u.services.tts_service import TTSService
+from artificial_u.utils import AudioProcessingError
+
+
+def make_client(side_effect=None, return_value=None):
+    """Create a mock async ElevenLabs client."""
+    client = MagicMock()
+    client.text_to_speech = AsyncMock(side_effect=side_effect, return_value=return_value)
+    return client
+
+
+def make_service(client, chunks, **kwargs):
+    """Create a TTSService whose speech processor yields the given chunks."""
+    speech_processor = MagicMock()
+    speech_processor.enhance_speech_markup.side_effect = lambda text: text
+    speech_processor.split_into_chunks.return_value = chunks
+    speech_processor.is_valid_chunk.side_effect = lambda chunk: bool(chunk.strip())
+    return TTSService(
+        client=MagicMock(),
+        async_client=client,
+        speech_processor=speech_processor,
+        **kwargs,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestConvertTextToSpeech:
+    """Test convert_text_to_speech concurrency, ordering and failures."""
+
+    async def test_preserves_chunk_order_when_finishing_out_of_order(self):
+        """Test that audio is joined in text order even if later chunks finish first."""
+        delays = {"one": 0.05, "two": 0.0, "three": 0.02}
+
+        async def text_to_speech(text, **kwargs):
+            await asyncio.sleep(delays[text])
+            return text.encode()
+
+        service = make_service(
+            make_client(text_to_speech), ["one", "two", "three"], max_concurrency=3
+        )
+
+        assert await service.convert_text_to_speech("ignored", el_voice_id="v") == b"onetwothree"
+
+    async def test_respects_concurrency_cap(self):
+        """Test that no more than max_concurrency chunks are in flight at once."""
+        in_flight = 0
+        peak = 0
+
+        async def text_to_speech(text, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return b"x"
+
+        service = make_service(
+            make_client(text_to_speech), [f"chunk {i}" for i in range(6)], max_concurrency=2
+        )
+
+        await service.convert_text_to_speech("ignored", el_voice_id="v")
+        assert peak == 2
+
+    async def test_raises_when_chunk_fails(self):
+        """Test that a chunk the client gives up on raises AudioProcessingError."""
+        client = make_client(side_effect=RuntimeError("boom"))
+        service = make_service(client, ["a", "b"], max_concurrency=2)
+
+        with pytest.raises(AudioProcessingError, match="chunk"):
+            await service.convert_text_to_speech("ignored", el_voice_id="v")
+
+    async def test_skips_invalid_chunks(self):
+        """Test that invalid chunks are not sent to the client."""
+        client = make_client(return_value=b"a")
+        service = make_service(client, ["valid", "  "], max_concurrency=1)
+
+        assert await service.convert_text_to_speech("ignored", el_voice_id="v") == b"a"
+        client.text_to_speech.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestStreamTextToSpeech:
+    """Test streamed chunk synthesis."""
+
+    async def test_yields_chunks_in_order_within_window(self):
+        """Test that audio streams in text order with at most max_concurrency chunks started."""
+        started = []
+
+        async def text_to_speech(text, **kwargs):
+            started.append(text)
+            await asyncio.sleep(0.01 if text == "one" else 0)
+            return text.encode()
+
+        service = make_service(
+            make_client(text_to_speech), ["one", "two", "three"], max_concurrency=2
+        )
+        stream = service.stream_text_to_speech("ignored", el_voice_id="v")
+
+        assert await anext(stream) == b"one"
+        assert started == ["one", "two"]
+        assert [chunk async for chunk in stream] == [b"two", b"three"]
+
+    async def test_closing_stream_cancels_pending_chunks(self):
+        """Test that a consumer stopping early cancels chunks still in flight."""
+        cancelled = []
+
+        async def text_to_speech(text, **kwargs):
+            try:
+                await asyncio.sleep(0 if text == "one" else 1)
+            except asyncio.CancelledError:
+                cancelled.append(text)
+                raise
+            return text.encode()
+
+        service = make_service(
+            make_client(text_to_speech), ["one", "two", "three"], max_concurrency=3
+        )
+        stream = service.stream_text_to_speech("ignored", el_voice_id="v")
+
+        assert await anext(stream) == b"one"
+        await stream.aclose()
+        await asyncio.sleep(0)
+        assert sorted(cancelled) == ["three", "two"]
+
+
+@pytest.mark.unit
+class TestChunkCache:
+    """Test the content-addressed TTS chunk cache."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_chunks_are_not_resynthesized(self, tmp_path):
+        """Test that only edited chunks are sent to ElevenLabs on regeneration."""
+        cache = ChunkAudioCache(str(tmp_path))
+        client = make_client(side_effect=lambda text, **kwargs: text.encode())
+
+        service = make_service(client, ["intro", "body"], chunk_cache=cache)
+        assert await service.convert_text_to_speech("ignored", el_voice_id="v") == b"introbody"
+        assert client.text_to_speech.call_count == 2
+
+        service.speech_processor.split_into_chunks.return_value = ["intro", "edited body"]
+        audio = await service.convert_text_to_speech("ignored", el_voice_id="v")
+
+        assert audio == b"introedited body"
+        assert client.text_to_speech.call_count == 3
+        stats = service.cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 3
+        assert stats["characters_saved"] == len("intro")
+
+    @pytest.mark.asyncio
+    async def test_editing_one_paragraph_keeps_other_chunks(self, tmp_path):
+        """Test that an edited paragraph does not shift the chunks after it."""
+        paragraphs = [f"Paragraph {i} explains one more idea of the lecture." for i in range(40)]
+        client = make_client(side_effect=lambda text, **kwargs: text.encode())
+        service = TTSService(
+            client=MagicMock(),
+            async_client=client,
+            speech_processor=SpeechProcessor(),
+            chunk_cache=ChunkAudioCache(str(tmp_path)),
+        )
+
+        await service.convert_text_to_speech("\n\n".join(paragraphs), "v", chunk_size=400)
+        first_run = client.text_to_speech.call_count
+        paragraphs[20] = "Paragraph 20 now explains its idea at much greater length. " * 2
+        await service.convert_text_to_speech("\n\n".join(paragraphs), "v", chunk_size=400)
+
+        assert first_run > 5
+        assert client.text_to_speech.call_count - first_run <= 2
+        assert service.cache_stats()["hits"] >= first_run - 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("cached", [True, False])
+    async def test_every_paragraph_is_synthesized(self, tmp_path, cached):
+        """Test that short paragraphs are merged into a chunk instead of dropped."""
+        paragraphs = []
+        for i in range(30):
+            paragraphs.append(f"Question {i}?")
+            paragraphs.append(f"Paragraph {i} explains one more idea of the lecture at length.")
+        client = make_client(side_effect=lambda text, **kwargs: text.encode())
+        service = TTSService(
+            client=MagicMock(),
+            async_client=client,
+            speech_processor=SpeechProcessor(),
+            chunk_cache=ChunkAudioCache(str(tmp_path)) if cached else None,
+        )
+
+        await service.convert_text_to_speech("\n\n".join(paragraphs), "v", chunk_size=400)
+
+        synthesized = [call.kwargs["text"] for call in client.text_to_speech.call_args_list]
+        for i, paragraph in enumerate(paragraphs):
+            assert any(paragraph in chunk for chunk in synthesized), f"paragraph {i} dropped"
+
+    def test_chunks_are_packed_greedily_without_cache(self):
+        """Test that content-defined cuts only apply when the chunk cache is on."""
+        processor = SpeechProcessor()
+        text = "\n\n".join(f"Paragraph {i} explains one more idea." for i in range(60))
+
+        greedy = processor.split_into_chunks(text, max_chunk_size=400)
+        content_defined = processor.split_into_chunks(
+            text, max_chunk_size=400, content_defined=True
+        )
+
+        assert len(greedy) < len(content_defined)
+        assert all(len(chunk) > 300 for chunk in greedy[:-1])
+        assert "".join(greedy) == text
+
+    def test_key_depends_on_voice_and_settings(self):
+        """Test that voice, model and settings all change the cache key."""
+        base = ChunkAudioCache.make_key("text", "voice", "model", {"stability": 0.5})
+        assert base == ChunkAudioCache.make_key("text", "voice", "model", {"stability": 0.5})
+        assert base != ChunkAudioCache.make_key("text", "other", "model", {"stability": 0.5})
+        assert base != ChunkAudioCache.make_key("text", "voice", "other", {"stability": 0.5})
+        assert base != ChunkAudioCache.make_key("text", "voice", "model", {"stability": 0.6})
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test size-based LRU eviction."""
+        cache = ChunkAudioCache(str(tmp_path), max_bytes=10)
+        cache.put("a" * 64, b"12345")
+        cache.put("b" * 64, b"12345")
+        assert cache.get("a" * 64) == b"12345"  # a is now most recently used
+
+        cache.put("c" * 64, b"12345")
+
+        assert cache.get("b" * 64) is None
+        assert cache.get("a" * 64) == b"12345"
+        assert cache.stats()["evictions"] == 1
+
+    def test_index_survives_restart(self, tmp_path):
+        """Test that cached chunks are found by a new cache instance."""
+        ChunkAudioCache(str(tmp_path)).put("d" * 64, b"audio")
+        assert ChunkAudioCache(str(tmp_path)).get("d" * 64) == b"audio"